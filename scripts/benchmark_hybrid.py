@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmark hybrid (BM25 + vector, RRF) retrieval on the Knowledge Base.
+
+The corpus is the policies, ADRs and concepts of a KB. With --seed-kb it is
+the seeded bootstrap KB; --memory uses the documents of a persisted memory
+index instead. Known-item queries are derived from that content:
+
+  code    the exact policy code (`P-ARCH-04`)
+  title   the entity title
+  arabic  an Arabic span of the body, typed without hamza and with ه for ة
+
+Reports hit@1, recall@k, MRR and QPS for vector-only, BM25-only and hybrid.
+
+Usage:
+  python scripts/benchmark_hybrid.py --seed-kb
+  python scripts/benchmark_hybrid.py --db data/kb.db --k 5 --json
+  python scripts/benchmark_hybrid.py --memory data/qdrant_memory
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.memory.interface import Document  # noqa: E402
+from src.core.memory.numpy_store import NumpyVectorStore  # noqa: E402
+
+_ARABIC_WORD = re.compile(r"[؀-ۿ]+")
+
+
+def kb_documents(db_path: str) -> List[Document]:
+    from src.core.kb.persistent import PersistentKnowledgeBase
+    from src.core.memory.sync import adr_document, policy_document
+
+    kb = PersistentKnowledgeBase(db_path, validate=False)
+    documents = [policy_document(p) for p in kb.policies.values()]
+    documents += [adr_document(a) for a in kb.adrs.values()]
+    documents += [
+        Document(id=c.id, content=f"Concept {c.name}: {c.definition}", metadata={"type": "concept", "title": c.name})
+        for c in kb.concepts.values()
+    ]
+    return documents
+
+
+def memory_documents(path: str) -> List[Document]:
+    store = NumpyVectorStore(path=path, ann_min_docs=0)
+    return [store.get(doc_id) for doc_id in store.ids()]
+
+
+def loose_arabic(text: str) -> str:
+    """How Arabic is commonly typed in a query box: bare alef, ه for ة, ي for ى."""
+    return text.translate(str.maketrans({"أ": "ا", "إ": "ا", "آ": "ا", "ة": "ه", "ى": "ي"}))
+
+
+def known_item_queries(documents: List[Document]) -> List[Tuple[str, str, str]]:
+    """(kind, query, expected id) triples."""
+    queries = []
+    for doc in documents:
+        metadata = doc.metadata or {}
+        if metadata.get("code"):
+            queries.append(("code", metadata["code"], doc.id))
+        if metadata.get("title"):
+            queries.append(("title", metadata["title"], doc.id))
+        words = _ARABIC_WORD.findall(doc.content)
+        if len(words) >= 6:
+            middle = len(words) // 2
+            queries.append(("arabic", loose_arabic(" ".join(words[middle - 2 : middle + 2])), doc.id))
+    return queries
+
+
+async def evaluate(store: NumpyVectorStore, queries: List[Tuple[str, str, str]], k: int) -> List[Dict]:
+    async def vector(q: str) -> List[str]:
+        return [r.document.id for r in await store.search(q, limit=k, exact=True)]
+
+    async def lexical(q: str) -> List[str]:
+        return [doc_id for doc_id, _ in store._lexical_index().search(q, k)]
+
+    async def hybrid(q: str) -> List[str]:
+        return [r.document.id for r in await store.search(q, limit=k, exact=True, hybrid=True)]
+
+    results = []
+    for method, run in (("vector", vector), ("bm25", lexical), ("hybrid", hybrid)):
+        by_kind: Dict[str, List[int]] = {}
+        start = time.perf_counter()
+        for kind, query, expected in queries:
+            ranked = await run(query)
+            rank = ranked.index(expected) + 1 if expected in ranked else 0
+            by_kind.setdefault(kind, []).append(rank)
+            by_kind.setdefault("all", []).append(rank)
+        seconds = time.perf_counter() - start
+        for kind, ranks in sorted(by_kind.items()):
+            results.append(
+                {
+                    "method": method,
+                    "queries": kind,
+                    "n": len(ranks),
+                    "hit_at_1": round(sum(1 for r in ranks if r == 1) / len(ranks), 4),
+                    "recall_at_k": round(sum(1 for r in ranks if r) / len(ranks), 4),
+                    "mrr": round(sum(1.0 / r for r in ranks if r) / len(ranks), 4),
+                    "qps": round(len(queries) / seconds, 1),
+                }
+            )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Known-item retrieval quality: vector vs BM25 vs hybrid.")
+    parser.add_argument("--db", default="data/kb.db", help="KB database")
+    parser.add_argument("--seed-kb", action="store_true", help="Use the seeded bootstrap KB (temporary database)")
+    parser.add_argument("--memory", default=None, help="Use the documents of a persisted memory directory")
+    parser.add_argument("--k", type=int, default=5, help="Top-k")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.memory:
+            documents = memory_documents(args.memory)
+        elif args.seed_kb:
+            documents = kb_documents(str(Path(tmp) / "kb.db"))
+        elif Path(args.db).exists():
+            documents = kb_documents(args.db)
+        else:
+            print(f"❌ KB not found: {args.db} (use --seed-kb for the bootstrap KB)")
+            return 1
+        if not documents:
+            print("❌ No documents to benchmark")
+            return 1
+
+        store = NumpyVectorStore(path=None, ann_min_docs=0)
+        asyncio.run(store.add_documents(documents))
+        queries = known_item_queries(documents)
+        results = asyncio.run(evaluate(store, queries, args.k))
+
+    if args.json:
+        print(json.dumps({"documents": len(documents), "k": args.k, "results": results}, indent=2))
+        return 0
+
+    print(f"📊 {len(documents)} documents, {len(queries)} known-item queries, k={args.k}")
+    for row in results:
+        print(
+            f"  {row['method']:<7} {row['queries']:<7} n={row['n']:<4} hit@1={row['hit_at_1']:.3f}  "
+            f"recall@{args.k}={row['recall_at_k']:.3f}  mrr={row['mrr']:.3f}  qps={row['qps']:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
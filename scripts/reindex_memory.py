@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Synchronise the vector memory with the Knowledge Base.
+
+By default only changes since the last sync watermark are applied: new or
+updated policies and ADRs, deleted entities, and appended intervention
+lines. --full ignores the watermark and reconciles everything.
+
+Stop the API server first; the memory index has a single writer.
+
+Usage:
+  python scripts/reindex_memory.py
+  python scripts/reindex_memory.py --full
+  python scripts/reindex_memory.py --db data/kb.db --memory data/qdrant_memory --json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.kb.storage import StorageBackend  # noqa: E402
+from src.core.memory.numpy_store import NumpyVectorStore  # noqa: E402
+from src.core.memory.sync import MemorySync  # noqa: E402
+
+
+async def run(args) -> dict:
+    memory = NumpyVectorStore(path=args.memory)
+    sync = MemorySync(StorageBackend(args.db), memory, lessons_path=args.lessons)
+    report = await sync.sync(full=args.full)
+    return {**report.to_dict(), "documents": len(memory), "watermark": sync.watermark().__dict__}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Incremental (or --full) memory reindex from the KB.")
+    parser.add_argument("--db", default="data/kb.db", help="KB database")
+    parser.add_argument("--memory", default=None, help="Memory directory (default: <db dir>/qdrant_memory)")
+    parser.add_argument("--lessons", default="data/logs/interventions.jsonl", help="Interventions JSONL")
+    parser.add_argument("--full", action="store_true", help="Ignore the watermark and reconcile everything")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"❌ KB not found: {args.db}")
+        return 1
+    args.memory = args.memory or str(Path(args.db).parent / "qdrant_memory")
+
+    result = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+
+    mode = "full" if result["full"] else "incremental"
+    print(f"🧠 Memory {mode} sync in {result['seconds']}s → {result['documents']} documents")
+    for source in result["scanned"]:
+        print(
+            f"  {source:<9} scanned={result['scanned'][source]:<6} "
+            f"upserted={result['upserted'].get(source, 0):<6} deleted={result['deleted'].get(source, 0)}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 import time
 from dataclasses import asdict
-from typing import Any, List
+from typing import Any, List, Optional
 
 from src.api.deps import get_icgl
 from src.core.kb.schemas import ADR, now, uid
@@ -28,26 +28,32 @@ async def run_analysis_task(adr: ADR, human_id: str, icgl: Any, manager: Any, sc
             icgl.kb.save_synthesis_state(adr.id, {"status": "blocked", "policy_report": policy_report.__dict__})
             return
 
-        # 1. Semantic Search (Historical Echo / S-11)
-        query = f"{adr.title} {adr.context} {adr.decision}"
-        matches = await icgl.memory.search(query, limit=4)
-        semantic = []
-        for m in matches:
-            if m.document.id != adr.id:
-                semantic.append(
-                    {
-                        "id": m.document.id,
-                        "title": m.document.metadata.get("title", "Unknown"),
-                        "score": round(m.score * 100, 1),
-                    }
-                )
+        from src.core.governance.budget import Priority, usage_scope
+        from src.core.memory.retrieval_cache import retrieval_scope
 
-        # 2. Sentinel Detailed Scan
-        alerts = await icgl.sentinel.scan_adr_detailed_async(adr, icgl.kb)
+        # Echo search, Sentinel drift checks and agent recalls share one retrieval cache.
+        # Background analysis is BATCH traffic: it waits for rate headroom behind chat and council calls.
+        with retrieval_scope(cycle_id=adr.id), usage_scope(adr_id=adr.id, priority=Priority.BATCH):
+            # 1. Semantic Search (Historical Echo / S-11)
+            query = f"{adr.title} {adr.context} {adr.decision}"
+            matches = await icgl.memory.search(query, limit=4)
+            semantic = []
+            for m in matches:
+                if m.document.id != adr.id:
+                    semantic.append(
+                        {
+                            "id": m.document.id,
+                            "title": m.document.metadata.get("title", "Unknown"),
+                            "score": round(m.score * 100, 1),
+                        }
+                    )
+
+            # 2. Sentinel Detailed Scan
+            alerts = await icgl.sentinel.scan_adr_detailed_async(adr, icgl.kb)
 
-        # 3. Agent Synthesis
-        problem = Problem(title=adr.title, context=adr.context, metadata={"decision": adr.decision})
-        synthesis = await icgl.registry.run_and_synthesize(problem, icgl.kb)
+            # 3. Agent Synthesis
+            problem = Problem(title=adr.title, context=adr.context, metadata={"decision": adr.decision})
+            synthesis = await icgl.registry.run_and_synthesize(problem, icgl.kb)
 
         icgl.kb.save_synthesis_state(
             adr.id,
@@ -59,15 +65,8 @@ async def run_analysis_task(adr: ADR, human_id: str, icgl: Any, manager: Any, sc
                     "all_concerns": synthesis.all_concerns,
                     "agent_results": [asdict(r) for r in synthesis.individual_results],
                     "semantic_matches": semantic[:3],
-                    "sentinel_alerts": [
-                        {
-                            "id": a.rule_id,
-                            "severity": a.severity.value,
-                            "message": a.message,
-                            "category": a.category.value,
-                        }
-                        for a in alerts
-                    ],
+                    "sentinel_alerts": _alert_dicts(alerts),
+                    "retrieval": synthesis.retrieval,
                     "mindmap": generate_consensus_mindmap(adr.title, synthesis),
                     "mediation": None,
                     "policy_report": policy_report.__dict__,
@@ -166,6 +165,140 @@ async def run_analysis_task(adr: ADR, human_id: str, icgl: Any, manager: Any, sc
             pass
 
 
+DELTA_REVIEW_PROMPT = """You review an edit to an architecture decision record (ADR) that the council already analysed.
+Given the diff of the edited fields and the council's consensus on the original, decide whether the edit
+changes what the proposal means: negates or reverses it, changes its scope, or adds or removes a constraint.
+Output JSON only: {"material": true | false, "summary": "...", "concerns": ["..."]}"""
+
+
+async def run_delta_analysis_task(
+    adr: ADR, base_id: str, similarity: float, human_id: str, icgl: Any, manager: Any, scp_manager: Any
+) -> None:
+    """
+    Cheap analysis of a near-duplicate proposal (an edited copy of `base_id`).
+    The policy gate and Sentinel run on the new text, and one reviewer pass reads the
+    edit; the council synthesis of the base proposal is reused and annotated with what
+    changed. A changed decision, or an edit the reviewer finds material (or cannot
+    judge), gets the full council analysis instead.
+    """
+    start_time = time.time()
+    logger.info(f"🔀 Starting Delta Analysis for {adr.id} (base {base_id})")
+    try:
+        base = icgl.kb.get_adr(base_id)
+        changes = _field_changes(base, adr) if base else {}
+        if base is None or "decision" in changes:
+            logger.info(f"🔀 Decision of {adr.id} differs from {base_id}; running full analysis")
+            await run_analysis_task(adr, human_id, icgl, manager, scp_manager)
+            return
+
+        from src.core.governance.budget import Priority, usage_scope
+
+        policy_report = icgl.enforcer.check_adr_compliance(adr)
+        if policy_report.status == "FAIL":
+            icgl.kb.save_synthesis_state(adr.id, {"status": "blocked", "policy_report": policy_report.__dict__})
+            return
+
+        base_synthesis = (icgl.kb.get_synthesis_state(base_id) or {}).get("synthesis") or {}
+        with usage_scope(adr_id=adr.id, priority=Priority.BATCH):
+            review = await _review_delta(adr, changes, base_synthesis, icgl)
+        if review is None or review["material"]:
+            logger.info(f"🔀 Edit of {base_id} is material (or unreviewed); running full analysis for {adr.id}")
+            await run_analysis_task(adr, human_id, icgl, manager, scp_manager)
+            return
+
+        alerts = await icgl.sentinel.scan_adr_detailed_async(adr, icgl.kb)
+
+        synthesis = {
+            **base_synthesis,
+            "all_concerns": list(base_synthesis.get("all_concerns", [])) + review["concerns"],
+            "sentinel_alerts": _alert_dicts(alerts),
+            "policy_report": policy_report.__dict__,
+            "delta": {
+                "base_adr_id": base_id,
+                "similarity": similarity,
+                "changes": changes,
+                "review": review,
+            },
+        }
+        duration = round((time.time() - start_time) * 1000)
+        icgl.kb.save_synthesis_state(
+            adr.id, {"adr": asdict(adr), "synthesis": synthesis, "delta_of": base_id, "latency_ms": duration}
+        )
+
+        adr.sentinel_signals = [str(a) for a in alerts]
+        icgl.kb.add_adr(adr)
+
+        from src.api.server import get_status  # Circular import handled by local import
+
+        current_status = await get_status()
+        await manager.broadcast({"type": "status_update", "status": current_status.data})
+        logger.info(f"✨ Delta Analysis Complete for {adr.id} ({duration}ms)")
+    except Exception as e:
+        logger.error(f"Delta Analysis Failure: {e}", exc_info=True)
+        icgl.kb.save_synthesis_state(adr.id, {"status": "failed", "error": str(e)})
+
+
+async def _review_delta(adr: ADR, changes: dict, base_synthesis: dict, icgl: Any) -> Optional[dict]:
+    """
+    One short JSON-mode LLM pass over the edit. Returns the verdict
+    ({"material", "summary", "concerns"}), or None when there is no provider or no usable reply.
+    """
+    provider = icgl.registry.get_llm_provider() if hasattr(icgl.registry, "get_llm_provider") else None
+    if provider is None:
+        return None
+
+    from src.core.core.llm import LLMRequest
+    from src.core.llm.prompts import JSONParser
+
+    diff = "\n\n".join(f"{name.upper()}:\n" + "\n".join(lines) for name, lines in changes.items())
+    consensus = "\n".join(f"- {r}" for r in base_synthesis.get("consensus_recommendations", [])[:5])
+    request = LLMRequest(
+        prompt=f"EDIT:\n{diff or '(whitespace only)'}\n\nCOUNCIL CONSENSUS ON THE ORIGINAL:\n{consensus or '- (none)'}",
+        system_prompt=DELTA_REVIEW_PROMPT,
+        temperature=0.0,
+        max_tokens=300,
+        json_mode=True,
+        agent_role="mediator",
+        metadata={"adr_id": adr.id, "delta_review": True},
+    )
+    try:
+        response = await provider.generate(request)
+    except Exception as e:
+        logger.warning(f"Delta review failed for {adr.id}: {e}")
+        return None
+    verdict = JSONParser.parse(response.content or "")
+    if not isinstance(verdict, dict) or not isinstance(verdict.get("material"), bool):
+        return None
+    concerns = verdict.get("concerns")
+    verdict["concerns"] = [str(c) for c in concerns] if isinstance(concerns, list) else []
+    return verdict
+
+
+def _alert_dicts(alerts) -> List[dict]:
+    return [
+        {
+            "id": a.rule_id,
+            "severity": a.severity.value,
+            "message": a.message,
+            "category": a.category.value,
+        }
+        for a in alerts
+    ]
+
+
+def _field_changes(base: ADR, adr: ADR, max_lines: int = 40) -> dict:
+    """Unified diff per changed ADR field (title, context, decision)."""
+    import difflib
+
+    changes = {}
+    for name in ("title", "context", "decision"):
+        before, after = getattr(base, name) or "", getattr(adr, name) or ""
+        if before != after:
+            diff = difflib.unified_diff(before.splitlines(), after.splitlines(), lineterm="", n=0)
+            changes[name] = list(diff)[2 : 2 + max_lines]  # drop the ---/+++ header
+    return changes
+
+
 def generate_consensus_mindmap(title: str, synthesis) -> str:
     """Generates Mermaid mindmap syntax from synthesis results."""
     lines: List[str] = ["mindmap", f"  root(({title}))"]
@@ -1,5 +1,7 @@
 import asyncio
 import json
+import os
+from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from fastapi.encoders import jsonable_encoder
@@ -7,13 +9,12 @@ from fastapi.encoders import jsonable_encoder
 from src.api.deps import get_icgl
 from src.api.schemas import (
     AITerminalResponse,
-    ChatRequest,
-    ChatResponse,
     FileWriteRequest,
     OperationResult,
     TerminalRequest,
 )
 from src.api.state import chat_ws_manager
+from src.core.chat.schemas import ChatRequest, ChatResponse
 from src.core.conversation import ConversationOrchestrator
 from src.core.utils.logging_config import get_logger
 
@@ -24,6 +25,13 @@ logger = get_logger(__name__)
 
 chat_orchestrator = ConversationOrchestrator(get_icgl, run_analysis_task)
 
+# Max silence between two chunks before the stream is abandoned (the LLM may run long, but must keep talking)
+STREAM_IDLE_TIMEOUT = float(os.getenv("ICGL_CHAT_STREAM_IDLE_TIMEOUT", "25"))
+# Chunks buffered between the LLM and a slow client before the producer is paused
+STREAM_QUEUE_SIZE = int(os.getenv("ICGL_CHAT_STREAM_QUEUE", "64"))
+
+_STREAM_END = object()
+
 
 @router.post("/", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest):
@@ -78,46 +86,110 @@ async def write_chat_file(req: FileWriteRequest) -> OperationResult:
         return OperationResult(status="error", result={"message": str(e)})
 
 
+def _block_frame(block: Any) -> dict:
+    field = block.get if isinstance(block, dict) else lambda name: getattr(block, name, None)
+    return {"type": "block", "block_type": field("type"), "title": field("title"), "content": field("data")}
+
+
+async def _forward_stream(websocket: WebSocket, chat_req: ChatRequest) -> None:
+    """
+    Pumps LLM chunks to the socket as they arrive.
+    A bounded queue decouples the producer from a slow client; whatever has piled up
+    is coalesced into a single frame so a lagging client receives fewer, larger frames.
+    Blocks (non-text items) are sent as `block` frames after the token stream ends.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+    async def _produce():
+        try:
+            async for chunk in chat_orchestrator.stream(chat_req):
+                if chunk:
+                    await queue.put(chunk)
+            await queue.put(_STREAM_END)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+
+    producer = asyncio.create_task(_produce())
+    blocks = []
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=STREAM_IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                await websocket.send_json({"type": "stream", "content": "⚠️ System Timeout."})
+                return
+
+            parts = []
+            done = False
+            while True:
+                if item is _STREAM_END:
+                    done = True
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if isinstance(item, str):
+                    parts.append(item)
+                else:
+                    blocks.append(item)
+                if queue.empty():
+                    break
+                item = queue.get_nowait()
+
+            if parts:
+                await websocket.send_json({"type": "stream", "content": "".join(parts)})
+            if done:
+                for block in blocks:
+                    await websocket.send_json(_block_frame(block))
+                return
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     logger.info(f"Incoming Chat WebSocket connection: {websocket.client}")
     await chat_ws_manager.connect(websocket)
     logger.info("Chat WebSocket connection accepted.")
+    receive_task = None
     try:
         await websocket.send_json({"type": "stream", "content": "Connected via Secure Uplink."})
         while True:
-            data_str = await websocket.receive_text()
+            if receive_task is None:
+                receive_task = asyncio.create_task(websocket.receive_text())
+            data_str = await receive_task
+            receive_task = None
             try:
                 data = json.loads(data_str)
                 user_content = data.get("content", "")
-                chat_req = ChatRequest(message=user_content)
+                chat_req = ChatRequest(message=user_content, history=data.get("history") or [])
                 await websocket.send_json({"type": "stream", "content": ""})
 
-                try:
-                    response = await asyncio.wait_for(chat_orchestrator.handle(chat_req), timeout=25.0)
-                except asyncio.TimeoutError:
-                    await websocket.send_json({"type": "stream", "content": "⚠️ System Timeout."})
-                    continue
-
-                for msg in response.messages:
-                    if msg.role == "assistant":
-                        if msg.content:
-                            await websocket.send_json({"type": "stream", "content": msg.content})
-                        if msg.blocks:
-                            for block in msg.blocks:
-                                await websocket.send_json(
-                                    {
-                                        "type": "block",
-                                        "block_type": block.type,
-                                        "title": block.title,
-                                        "content": block.data,
-                                    }
-                                )
+                # Keep listening while streaming so a disconnect cancels the LLM call immediately.
+                # A message received mid-stream is kept and handled on the next turn.
+                stream_task = asyncio.create_task(_forward_stream(websocket, chat_req))
+                receive_task = asyncio.create_task(websocket.receive_text())
+                await asyncio.wait({stream_task, receive_task}, return_when=asyncio.FIRST_COMPLETED)
+
+                if not stream_task.done() and receive_task.done() and receive_task.exception() is not None:
+                    logger.info("Chat client left mid-stream; cancelling generation.")
+                    stream_task.cancel()
+                    await asyncio.gather(stream_task, return_exceptions=True)
+                    raise receive_task.exception()
+
+                await stream_task
+            except WebSocketDisconnect:
+                raise
             except Exception as e:
                 logger.error(f"WS Handling Error: {e}")
                 await websocket.send_json({"type": "stream", "content": f"System Error: {str(e)}"})
     except WebSocketDisconnect:
         chat_ws_manager.disconnect(websocket)
+    finally:
+        if receive_task is not None and not receive_task.done():
+            receive_task.cancel()
 
 
 @router.websocket("/terminal/ws")
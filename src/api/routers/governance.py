@@ -1,3 +1,5 @@
+import os
+import time
 from dataclasses import asdict
 from typing import Any, Optional
 
@@ -19,7 +21,7 @@ from src.api.schemas import (
 from src.core.kb.schemas import ADR, uid
 from src.core.utils.logging_config import get_logger
 
-from ..background import run_analysis_task
+from ..background import run_analysis_task, run_delta_analysis_task
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -33,6 +35,7 @@ class ProposalRequest(BaseModel):
     context: str
     decision: str
     human_id: str = "bakheet"
+    force_full_analysis: bool = False  # skip near-duplicate reuse
 
 
 class SignRequest(BaseModel):
@@ -49,10 +52,47 @@ class SignRequest(BaseModel):
 async def propose_decision(
     req: ProposalRequest, background_tasks: BackgroundTasks, manager: Any = None, scp_manager: Any = None
 ) -> OperationResult:
-    """Creates a new ADR proposal and triggers analysis."""
+    """
+    Creates a new ADR proposal and triggers analysis.
+
+    Resubmissions are detected with a MinHash/LSH index over title/context/decision:
+    - a (near-)identical copy of an earlier proposal returns that proposal and its analysis;
+    - a lightly edited copy of an analysed proposal gets a delta analysis (policy gate,
+      Sentinel and one reviewer pass on the edit, council synthesis reused) instead of the
+      full council; a changed decision or a material edit still gets the full council.
+    """
     logger.info(f"📝 Proposal Received: {req.title}")
     try:
+        from src.core.memory.near_duplicates import proposal_text
+
         icgl = get_icgl()
+        text = proposal_text(req.title, req.context, req.decision)
+        started = time.perf_counter()
+        index = icgl.proposal_index()
+        matches = [] if req.force_full_analysis else index.find(text)
+        lookup_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        base_id, similarity, base_state, base = None, 0.0, {}, None
+        for match_id, match_similarity in matches:
+            state = icgl.kb.get_synthesis_state(match_id) or {}
+            match = icgl.kb.get_adr(match_id)
+            if match is not None and state.get("status") != "failed":
+                base_id, similarity, base_state, base = match_id, match_similarity, state, match
+                break
+
+        # Only an analysed proposal with the same decision can stand in for this one
+        reusable = (
+            base is not None
+            and "synthesis" in base_state
+            and (base.decision or "").strip() == (req.decision or "").strip()
+        )
+        if reusable and similarity >= float(os.getenv("ICGL_DUPLICATE_REUSE", 0.95)):
+            logger.info(f"♻️ Proposal duplicates {base_id} (similarity {similarity:.2f}); reusing its analysis")
+            return OperationResult(
+                status="Duplicate",
+                result={"adr_id": base_id, "duplicate_of": base_id, "similarity": similarity, "lookup_ms": lookup_ms},
+            )
+
         adr = ADR(
             id=uid(),
             title=req.title,
@@ -66,10 +106,23 @@ async def propose_decision(
         )
 
         icgl.kb.add_adr(adr)
+        index.add(adr.id, text)
+
+        if reusable:
+            logger.info(f"🔀 Proposal is an edit of {base_id} (similarity {similarity:.2f}); running delta analysis")
+            icgl.kb.save_synthesis_state(adr.id, {"status": "processing", "delta_of": base_id})
+            background_tasks.add_task(
+                run_delta_analysis_task, adr, base_id, similarity, req.human_id, icgl, manager, scp_manager
+            )
+            return OperationResult(
+                status="Delta Analysis Triggered",
+                result={"adr_id": adr.id, "delta_of": base_id, "similarity": similarity, "lookup_ms": lookup_ms},
+            )
+
         icgl.kb.save_synthesis_state(adr.id, {"status": "processing"})
 
         background_tasks.add_task(run_analysis_task, adr, req.human_id, icgl, manager, scp_manager)
-        return OperationResult(status="Analysis Triggered", result={"adr_id": adr.id})
+        return OperationResult(status="Analysis Triggered", result={"adr_id": adr.id, "lookup_ms": lookup_ms})
     except Exception as e:
         logger.error(f"Proposal Error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -171,6 +171,41 @@ async def sentinel_metrics() -> SentinelMetricsResp:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/llm-metrics", response_model=GenericDataResp)
+async def llm_metrics() -> GenericDataResp:
+    """Runtime metrics of the shared LLM provider (coalescing, in-flight waiters)."""
+    try:
+        icgl = get_icgl()
+        registry = getattr(icgl, "registry", None)
+        if registry and hasattr(registry, "llm_metrics"):
+            return GenericDataResp(data=registry.llm_metrics())
+        return GenericDataResp(data={})
+    except Exception as e:
+        logger.error(f"llm_metrics error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/memory-status", response_model=GenericDataResp)
+async def memory_status() -> GenericDataResp:
+    """Progress of the background memory warm-up and vector store stats."""
+    try:
+        icgl = get_icgl()
+        if hasattr(icgl, "memory_status"):
+            return GenericDataResp(data=icgl.memory_status())
+        return GenericDataResp(data={})
+    except Exception as e:
+        logger.error(f"memory_status error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/executor-metrics", response_model=GenericDataResp)
+async def executor_metrics() -> GenericDataResp:
+    """Utilisation of the agent work executor (I/O thread pool, CPU process pool)."""
+    from src.core.core.executor import get_executor
+
+    return GenericDataResp(data=get_executor().metrics())
+
+
 @router.get("/traffic", response_model=TrafficResp)
 async def system_traffic() -> TrafficResp:
     try:
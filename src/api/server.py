@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -20,8 +21,27 @@ load_dotenv(dotenv_path=env_path)
 
 logger = get_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """App lifecycle: warm the shared LLM pool and start system sampling on start; release them and the work executor on exit."""
+    from src.core.core.executor import get_executor
+    from src.core.core.telemetry import get_system_sampler
+    from src.core.llm.pool import get_client_pool
+
+    pool = get_client_pool()
+    await pool.startup()
+    sampler = get_system_sampler().start()
+    try:
+        yield
+    finally:
+        sampler.stop()
+        get_executor().shutdown()
+        await pool.shutdown()
+
+
 # Initialize FastAPI
-root_app = FastAPI(title="ICGL Root", version="1.3.0")
+root_app = FastAPI(title="ICGL Root", version="1.3.0", lifespan=lifespan)
 
 root_app.add_middleware(
     CORSMiddleware,
@@ -56,14 +56,13 @@ class EfficiencyAgent(Agent):
         Output specific, actionable reduction strategies.
         """
 
-        from src.core.llm.client import LLMClient, LLMConfig
+        from src.core.llm.client import LLMConfig
         from src.core.llm.prompts import JSONParser
 
-        client = LLMClient()
         config = LLMConfig(temperature=0.1, json_mode=True)
 
         try:
-            raw_json, usage = await client.generate_json(
+            raw_json, usage = await self._generate_json(
                 system_prompt=self.get_system_prompt(),
                 user_prompt=prompt,
                 config=config,
@@ -4,20 +4,31 @@ Consensus AI — Architect Agent
 
 Analyzes structural implications of decisions.
 Focuses on cohesion, coupling, and long-term maintainability.
-Uses Real LLM (via LLMClient) for intelligence, governed by strict JSON schemas.
+Streams its analysis from the injected LLM provider, governed by strict JSON schemas.
 """
 
+import os
 from typing import Any, Dict, Optional
 
-from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
+from src.core.agents.core.base import Agent, AgentResult, AgentRole, IntentContract, Problem
 from src.core.core.context import ContextBuilder  # Cycle 8
-from src.core.llm.client import LLMClient, LLMConfig
+from src.core.llm.context_assembly import (
+    LESSONS_TOKEN_BUDGET,
+    ContextAssembler,
+    agent_input_budget,
+    estimate_tokens,
+)
+from src.core.llm.client import LLMConfig
 from src.core.llm.prompts import (
     ARCHITECT_SYSTEM_PROMPT,
-    JSONParser,
+    ArchitectOutput,
     build_architect_user_prompt,
 )
 
+# Repository map injected into the system prompt (served from the shared in-memory RepoMap)
+REPO_MAP_DEPTH = 3
+REPO_MAP_TOKEN_BUDGET = int(os.getenv("ICGL_REPO_MAP_TOKEN_BUDGET", 1500))
+
 
 class ArchitectAgent(Agent):
     """
@@ -29,25 +40,36 @@ class ArchitectAgent(Agent):
     """
 
     def __init__(self, llm_provider=None):
-        # We ignore passed provider for now and use our robust LLMClient
         super().__init__(
             agent_id="agent-architect",
             role=AgentRole.ARCHITECT,
             llm_provider=llm_provider,
         )
-        self.llm_client = LLMClient()
         self.context_builder = ContextBuilder(".")
 
+    @staticmethod
+    def _with_map(repo_map: str) -> str:
+        return f"{ARCHITECT_SYSTEM_PROMPT}\n\n📡 REPOSITORY MAP:\n{repo_map}"
+
     def get_system_prompt(self) -> str:
         """
         Injects the Map into the default Architect Prompt.
+        Sync callers get the last rendered map; it is never scanned on the caller's thread.
         """
+        repo_map = self.context_builder.repo_map.cached(REPO_MAP_DEPTH, REPO_MAP_TOKEN_BUDGET)
+        return self._with_map(repo_map or "(Map not built yet)")
+
+    async def _build_llm_request(self, prompt: str, system_prompt: Optional[str] = None):
+        if system_prompt is None:
+            system_prompt = self._with_map(await self._render_map())
+        return await super()._build_llm_request(prompt, system_prompt)
+
+    async def _render_map(self) -> str:
+        """Builds/refreshes the shared map off the event loop."""
         try:
-            repo_map = self.context_builder.generate_map(max_depth=3)
+            return await self.context_builder.repo_map.arender(REPO_MAP_DEPTH, REPO_MAP_TOKEN_BUDGET)
         except Exception:
-            repo_map = "(Map generation failed)"
-
-        return f"{ARCHITECT_SYSTEM_PROMPT}\n\n📡 REPOSITORY MAP:\n{repo_map}"
+            return "(Map generation failed)"
 
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         """
@@ -61,11 +83,13 @@ class ArchitectAgent(Agent):
         # 1. Build Context (Read-Only)
         context = problem.context
         decision = problem.metadata.get("decision", "N/A")
+        intent = None
 
         # 1.1 Inject Technical Intent from Secretary (Cycle 14)
         if hasattr(self, "_pending_intent") and self._pending_intent:
             print(f"   🔗 [Architect] Using Technical Intent from Native Layer: {self._pending_intent[:40]}...")
-            context = f"STRICT TECHNICAL INTENT (FROM SECRETARY): {self._pending_intent}\n\n" + context
+            intent = f"STRICT TECHNICAL INTENT (FROM SECRETARY): {self._pending_intent}"
+            context = f"{intent}\n\n" + context
             # Clear it after consumption
             self._pending_intent = None
 
@@ -76,60 +100,63 @@ class ArchitectAgent(Agent):
             context=context,
             kb=kb,
         )
+
+        # 1.6 Fit everything into the Architect's input budget
+        # (intent > proposal context > steward memory > references; repeats are dropped).
+        # The system prompt with the repo map, the scaffold and the lessons allowance are
+        # taken off first, so the request builder does not compress this prompt a second time.
+        system_prompt = self._with_map(await self._render_map())
+        scaffold = build_architect_user_prompt(title=problem.title, context="", decision=decision)
+        assembler = ContextAssembler(
+            budget=agent_input_budget(self.role.value)
+            - estimate_tokens(system_prompt)
+            - estimate_tokens(scaffold)
+            - LESSONS_TOKEN_BUDGET
+        )
+        assembler.add("intent", intent, priority=100)
+        assembler.add("context", problem.context, priority=80, min_tokens=128)
         if steward_result and steward_result.confidence > 0.5:
             print("   🏛️ [Architect] Consulted Knowledge Steward for history.")
-            context += f"\n\nINSTITUTIONAL MEMORY (From Knowledge Steward):\n{steward_result.analysis}\n"
+            assembler.add(
+                "steward",
+                steward_result.analysis,
+                priority=60,
+                title="INSTITUTIONAL MEMORY (From Knowledge Steward)",
+            )
             if steward_result.references:
-                context += "Historical References:\n"
-                for ref in steward_result.references:
-                    context += f"- {ref}\n"
+                references = "\n".join(f"- {ref}" for ref in steward_result.references)
+                assembler.add("references", references, priority=40, title="Historical References")
+        assembled = assembler.assemble()
+        if assembled.compressed:
+            print(f"   ✂️ [Architect] Context fitted to {assembled.tokens}/{assembled.budget} tokens.")
 
         # 2. Construct Prompt
-        user_prompt = build_architect_user_prompt(title=problem.title, context=context, decision=decision)
+        user_prompt = build_architect_user_prompt(title=problem.title, context=assembled.text, decision=decision)
 
         # 3. Configure Safe Execution
         config = LLMConfig(
-            model="gpt-4-turbo-preview",
             temperature=0.0,  # Deterministic
             timeout=45.0,  # Explicit timeout
             max_tokens=2000,
             json_mode=True,
         )
 
-        # 4. Execute LLM Call (Exceptions caught by Base Class Shield)
-        if not self.llm_client.api_key:
+        # 4. Stream the analysis (Exceptions caught by Base Class Shield)
+        if not self.llm:
             return self._fallback_result("Missing OPENAI_API_KEY. Cannot run real agent.")
 
-        raw_json, usage = await self.llm_client.generate_json(
-            system_prompt=ARCHITECT_SYSTEM_PROMPT,
-            user_prompt=user_prompt,
+        parsed, _ = await self._ask_llm_structured(
+            user_prompt,
+            system_prompt=system_prompt,
+            output_type=ArchitectOutput,
+            on_field=self._on_field(problem),
             config=config,
         )
 
-        # Update Budget Tracking
-        current_tokens = problem.metadata.get("total_tokens", 0)
-        problem.metadata["total_tokens"] = current_tokens + usage.get("total_tokens", 0)
-        problem.metadata["last_agent_tokens"] = usage.get("total_tokens", 0)
-
-        # 5. Parse & Validate
-        parsed = JSONParser.parse_architect_output(raw_json)
-
-        # 6. Convert to Schema Objects
-        from src.core.agents.core.base import IntentContract
+        # 5. Convert to Schema Objects
         from src.core.kb.schemas import FileChange
 
-        intent = None
-        if hasattr(parsed, "intent_contract") and parsed.intent_contract:
-            ic = parsed.intent_contract
-            intent = IntentContract(
-                goal=ic.get("goal", ""),
-                risk_level=ic.get("risk_level", "medium"),
-                allowed_files=ic.get("allowed_files", []),
-                forbidden_zones=ic.get("forbidden_zones", []),
-                constraints=ic.get("constraints", []),
-                success_criteria=ic.get("success_criteria", []),
-                micro_examples=ic.get("micro_examples", []),
-            )
+        intent = self._intent_contract(parsed.intent_contract)
 
         file_changes_objs = []
         if hasattr(parsed, "file_changes") and parsed.file_changes:
@@ -176,6 +203,37 @@ class ArchitectAgent(Agent):
             else None,
         )
 
+    @staticmethod
+    def _intent_contract(ic: Optional[Dict[str, Any]]) -> Optional[IntentContract]:
+        if not ic:
+            return None
+        return IntentContract(
+            goal=ic.get("goal", ""),
+            risk_level=ic.get("risk_level", "medium"),
+            allowed_files=ic.get("allowed_files", []),
+            forbidden_zones=ic.get("forbidden_zones", []),
+            constraints=ic.get("constraints", []),
+            success_criteria=ic.get("success_criteria", []),
+            micro_examples=ic.get("micro_examples", []),
+        )
+
+    def _on_field(self, problem: Problem):
+        """
+        Streamed fields are published as they complete. The intent contract is set on the
+        problem right away, so agents that start after it (consultations, the Builder) get it
+        before the rest of the analysis is generated.
+        """
+        publish = self._publish_field(problem)
+
+        def on_field(name: str, value: Any) -> None:
+            publish(name, value)
+            if name == "intent_contract" and problem.intent is None:
+                problem.intent = self._intent_contract(value)
+                if problem.intent:
+                    print(f"   📜 [Architect] Intent contract ready: {problem.intent.goal[:50]}")
+
+        return on_field
+
     async def on_channel_message(self, message: Any) -> Optional[Dict[str, Any]]:
         """
         Receive Technical Intent from Secretary (Cycle 14).
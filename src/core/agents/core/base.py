@@ -19,7 +19,7 @@ Manifesto Reference:
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from src.core.memory.interface import VectorStore
@@ -207,7 +207,21 @@ class Agent(ABC):
             return None
 
         peer_problem = Problem(title=title, context=context, metadata=metadata or {})
-        return await self.registry.run_single_agent(peer_role, peer_problem, kb)
+
+        # Within a governance cycle: dedupe, fan-out/concurrency caps and cycle detection
+        from src.core.agents.infrastructure.consultation import get_consultation_coordinator
+
+        coordinator = get_consultation_coordinator()
+        if coordinator is None:
+            return await self.registry.run_single_agent(peer_role, peer_problem, kb)
+        return await coordinator.consult(
+            caller=self.role.value,
+            peer=peer_role,
+            title=title,
+            context=context,
+            metadata=metadata,
+            run=lambda: self.registry.run_single_agent(peer_role, peer_problem, kb),
+        )
 
     async def send_to_agent(
         self,
@@ -258,9 +272,12 @@ class Agent(ABC):
         except Exception as e:
             # Stability: Catch and Fallback
             print(f"🛡️ [Shield] Agent {self.agent_id} Failed: {e}")
-            result = self._fallback_result(str(e))
+            circuits = self._llm_circuit_state()
+            result = self._fallback_result(str(e), circuits=circuits)
             success = False
             error_msg = str(e)
+            if any(c.get("state") != "CLOSED" for c in circuits):
+                error_msg = f"LLM_CIRCUIT_OPEN: {error_msg}"
 
         # Observability: Record Metrics
         latency = (time.time() - start_t) * 1000
@@ -276,23 +293,44 @@ class Agent(ABC):
 
         return result
 
-    def _fallback_result(self, reason: str) -> AgentResult:
+    def _llm_circuit_state(self) -> List[Dict[str, Any]]:
+        """Snapshots of the circuit breakers guarding this agent's LLM provider."""
+        if not self.llm:
+            return []
+        try:
+            from src.core.core.resilience import find_circuit_breakers
+
+            return [breaker.snapshot() for breaker in find_circuit_breakers(self.llm)]
+        except Exception:
+            return []
+
+    def _fallback_result(self, reason: str, circuits: Optional[List[Dict[str, Any]]] = None) -> AgentResult:
         """Standardized 'Shield' fallback for agent failures."""
+        open_circuits = [c for c in (circuits or []) if c.get("state") != "CLOSED"]
+
+        analysis = (
+            f"🛡️ [Shield Fallback] The {self.role.value} agent encountered a critical failure "
+            f"during analysis: {reason}.\n\n"
+        )
+        concerns = ["Execution Failure", "Reliability Gap"]
+        if open_circuits:
+            names = ", ".join(f"{c['name']} ({c['state']}, retry in {c.get('retry_after', 0):.0f}s)" for c in open_circuits)
+            analysis += f"LLM provider circuit is not closed: {names}. Requests are being failed fast.\n\n"
+            concerns.append("LLM Provider Unavailable (circuit open)")
+        analysis += "To ensure system integrity, this agent is providing a conservative safety response."
+
         return AgentResult(
             agent_id=self.agent_id,
             role=self.role,
-            analysis=(
-                f"🛡️ [Shield Fallback] The {self.role.value} agent encountered a critical failure "
-                f"during analysis: {reason}.\n\n"
-                "To ensure system integrity, this agent is providing a conservative safety response."
-            ),
+            analysis=analysis,
             recommendations=[
                 "Manual review of the problem context is required.",
                 "Verify LLM provider health and network connectivity.",
                 "Check system logs for deep-dive diagnostics.",
             ],
-            concerns=["Execution Failure", "Reliability Gap"],
+            concerns=concerns,
             confidence=0.0,
+            metadata={"llm_circuits": circuits} if circuits else {},
         )
 
     async def _ask_llm(self, prompt: str, system_prompt: Optional[str] = None) -> str:
@@ -303,25 +341,145 @@ class Agent(ABC):
         if not self.llm:
             return f"[No LLM Configured] Mock analysis for prompt: {prompt[:50]}..."
 
+        req = await self._build_llm_request(prompt, system_prompt)
+
+        response = await self.llm.generate(req)
+        return response.content
+
+    async def _generate_json(
+        self, system_prompt: str, user_prompt: str, config: Optional[Any] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """
+        JSON-mode completion through the injected provider chain (routing, token
+        governance, coalescing). `config` (an LLMConfig) supplies temperature and
+        max_tokens; the model is picked by the router from this agent's role.
+
+        Returns:
+            (parsed object, or {} when the reply holds none; provider usage)
+        """
+        if not self.llm:
+            from src.core.llm.client import get_llm_client
+
+            return await get_llm_client().generate_json(
+                system_prompt=system_prompt, user_prompt=user_prompt, config=config
+            )
+
+        from src.core.core.llm import LLMRequest
+        from src.core.llm.prompts import JSONParser
+
+        request = LLMRequest(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=config.temperature if config is not None else 0.3,
+            agent_role=self.role.value,
+            json_mode=True,
+            metadata={"agent_id": self.agent_id},
+        )
+        if config is not None and config.max_tokens:
+            request.max_tokens = config.max_tokens
+        response = await self.llm.generate(request)
+        data = JSONParser.parse(response.content or "")
+        return (data if isinstance(data, dict) else {}), dict(response.usage or {})
+
+    async def _ask_llm_structured(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        output_type: Optional[type] = None,
+        on_field: Optional[Callable[[str, Any], Any]] = None,
+        config: Optional[Any] = None,
+    ) -> Tuple[Any, str]:
+        """
+        Streams a JSON-mode answer and parses it incrementally.
+        `on_field(name, value)` fires as each top-level field completes, so callers can
+        start downstream work before generation finishes. `config` (an LLMConfig)
+        supplies temperature and max_tokens.
+
+        Returns:
+            (typed output — e.g. SpecialistOutput — or dict when untyped, raw response text)
+        """
+        from src.core.llm.streaming_json import StreamingOutputParser, parse_json_stream
+
+        if not self.llm:
+            raw = await self._ask_llm(prompt, system_prompt)
+            parser = StreamingOutputParser(output_type)
+            parser.feed(raw)
+            return parser.finish(), raw
+
+        req = await self._build_llm_request(prompt, system_prompt)
+        req.json_mode = True
+        if config is not None:
+            req.temperature = config.temperature
+            if config.max_tokens:
+                req.max_tokens = config.max_tokens
+        return await parse_json_stream(self.llm.generate_stream(req), output_type=output_type, on_field=on_field)
+
+    def _publish_field(self, problem: Problem) -> Callable[[str, Any], None]:
+        """
+        `on_field` callback that exposes streamed fields as they complete, under
+        problem.metadata["partial_results"][agent_id], before this agent returns.
+        """
+        partial = problem.metadata.setdefault("partial_results", {}).setdefault(self.agent_id, {})
+
+        def on_field(name: str, value: Any) -> None:
+            partial[name] = value
+
+        return on_field
+
+    async def _build_llm_request(self, prompt: str, system_prompt: Optional[str] = None):
+        """
+        Builds the LLMRequest this agent would send for `prompt`
+        (system prompt + recalled lessons). Shared by `_ask_llm` and batch submission.
+        The combined input is fitted into this agent's token budget.
+        """
+        from src.core.llm.context_assembly import LESSONS_TOKEN_BUDGET, ContextAssembler, agent_input_budget
+
         # 1. Active Learning Retrieval
         # We search primarily using the prompt context
         lessons = await self.recall_lessons(prompt)
 
-        final_system_prompt = system_prompt or self.get_system_prompt()
-
+        assembler = ContextAssembler(budget=agent_input_budget(self.role.value))
+        # Instructions and output schema are all-or-nothing: never summarised
+        system = system_prompt or self.get_system_prompt()
+        assembler.add("system", system, priority=100, min_tokens=0, compressible=False)
+        assembler.add("prompt", prompt, priority=90, min_tokens=64)
         if lessons:
-            warning = "\n\n⚠️ CRITICAL MEMORY (PAST MISTAKES):\nThe following past proposals were REJECTED by the human. DO NOT REPEAT THEM:\n"
+            warning = "⚠️ CRITICAL MEMORY (PAST MISTAKES):\nThe following past proposals were REJECTED by the human. DO NOT REPEAT THEM:\n"
             for lesson in lessons:
                 warning += f"- {lesson}\n"
-            final_system_prompt += warning
+            assembler.add("lessons", warning, priority=60, max_tokens=LESSONS_TOKEN_BUDGET)
+        assembled = assembler.assemble()
+
+        final_system_prompt = assembled.sections.get("system", "")
+        if "lessons" in assembled.sections:
+            final_system_prompt += "\n\n" + assembled.sections["lessons"]
             print(f"   🎓 [{self.agent_id}] Recalled {len(lessons)} pertinent lessons.")
+        if assembled.compressed:
+            print(f"   ✂️ [{self.agent_id}] Prompt fitted to {assembled.tokens}/{assembled.budget} tokens.")
 
         from src.core.core.llm import LLMRequest
 
-        req = LLMRequest(prompt=prompt, system_prompt=final_system_prompt, temperature=0.3)
+        return LLMRequest(
+            prompt=assembled.sections.get("prompt", ""),
+            system_prompt=final_system_prompt,
+            temperature=0.3,
+            agent_role=self.role.value,
+            metadata={"agent_id": self.agent_id},
+        )
 
-        response = await self.llm.generate(req)
-        return response.content
+    RECALL_TYPES = ["adr", "concept", "policy", "manual"]
+
+    async def _search_memory(self, query: str, limit: int, doc_types: List[str]) -> List[str]:
+        """
+        Top-`limit` memory contents of the given types. The type filter runs in the index
+        and lexical (BM25) matches are fused in when the store supports it.
+        """
+        options: Dict[str, Any] = {"hybrid": True} if getattr(self.memory, "supports_hybrid", False) else {}
+        if getattr(self.memory, "supports_filters", False):
+            results = await self.memory.search(query, limit=limit, filter={"type": doc_types}, **options)
+        else:
+            results = await self.memory.search(query, limit=limit * 2, **options)  # Fetch more to filter
+        return [res.document.content for res in results if res.document.metadata.get("type") in doc_types][:limit]
 
     async def recall(self, query: str, limit: int = 5) -> List[str]:
         """
@@ -330,15 +488,7 @@ class Agent(ABC):
         if not hasattr(self, "memory") or not self.memory:
             return []
 
-        results = await self.memory.search(query, limit=limit)
-        # Filter out lessons to keep general recall clean?
-        # For now, let's just return unrelated content or everything.
-        # Ideally, we differentiating by metadata.
-        return [
-            res.document.content
-            for res in results
-            if res.document.metadata.get("type") in ["adr", "concept", "policy", "manual"]
-        ]
+        return await self._search_memory(query, limit, self.RECALL_TYPES)
 
     async def recall_lessons(self, query: str, limit: int = 3) -> List[str]:
         """
@@ -347,15 +497,7 @@ class Agent(ABC):
         if not hasattr(self, "memory") or not self.memory:
             return []
 
-        # Search all
-        results = await self.memory.search(query, limit=limit * 2)  # Fetch more to filter
-
-        lessons = []
-        for res in results:
-            if res.document.metadata.get("type") == "lesson":
-                lessons.append(res.document.content)
-
-        return lessons[:limit]
+        return await self._search_memory(query, limit, ["lesson"])
 
     def get_system_prompt(self) -> str:
         """
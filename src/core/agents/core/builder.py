@@ -12,76 +12,103 @@ from typing import Any, Dict, List
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
 from src.core.kb.schemas import FileChange as AgentFileChange
-from src.core.llm.client import LLMClient, LLMConfig
+from src.core.llm.client import LLMConfig
 from src.core.llm.prompts import BUILDER_SYSTEM_PROMPT, JSONParser
 
 
-class BuilderAgent(Agent):
-    def __init__(self, llm_provider=None):
-        super().__init__(agent_id="agent-builder", role=AgentRole.BUILDER, llm_provider=llm_provider)
-        self.llm_client = LLMClient()
+def learn_patterns(target_file_path: str) -> dict:
+    """Learn coding patterns from existing files in the target directory (blocking file I/O)."""
+    try:
+        target_path = Path(target_file_path)
+        target_dir = target_path.parent if target_path.suffix else target_path
 
-    def _learn_patterns(self, target_file_path: str) -> dict:
-        """Learn coding patterns from existing files in the target directory."""
-        try:
-            target_path = Path(target_file_path)
-            target_dir = target_path.parent if target_path.suffix else target_path
+        pattern_hints: Dict[str, Any] = {
+            "common_imports": [],
+            "naming_style": "unknown",
+            "has_docstrings": False,
+        }
+
+        if not target_dir.exists():
+            return pattern_hints
+
+        python_files = list(target_dir.glob("*.py"))[:3]
 
-            pattern_hints: Dict[str, Any] = {
-                "common_imports": [],
-                "naming_style": "unknown",
-                "has_docstrings": False,
-            }
+        for file_path in python_files:
+            try:
+                content = file_path.read_text(encoding="utf-8")
+
+                import_lines: List[str] = [
+                    line.strip() for line in content.split("\n") if line.strip().startswith(("import ", "from "))
+                ]
+                pattern_hints["common_imports"].extend(import_lines[:5])
 
-            if not target_dir.exists():
-                return pattern_hints
+                if '"""' in content or "'''" in content:
+                    pattern_hints["has_docstrings"] = True
 
-            python_files = list(target_dir.glob("*.py"))[:3]
+            except Exception:
+                continue
 
-            for file_path in python_files:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
+        pattern_hints["common_imports"] = list(set(pattern_hints["common_imports"]))[:10]
 
-                    import_lines: List[str] = [
-                        line.strip() for line in content.split("\n") if line.strip().startswith(("import ", "from "))
-                    ]
-                    pattern_hints["common_imports"].extend(import_lines[:5])
+        return pattern_hints
+    except Exception as e:
+        return {"error": str(e)}
 
-                    if '"""' in content or "'''" in content:
-                        pattern_hints["has_docstrings"] = True
 
-                except Exception:
-                    continue
+def verify_output(file_changes) -> tuple[bool, list[str]]:
+    """Verify generated code for syntax validity (CPU-bound: runs on the process pool)."""
+    issues = []
 
-            pattern_hints["common_imports"] = list(set(pattern_hints["common_imports"]))[:10]
+    for fc in file_changes:
+        if fc.get("action") == "DELETE":
+            continue
 
-            return pattern_hints
+        content = fc.get("content", "")
+        file_path = fc.get("path", "unknown")
+
+        if not file_path.endswith(".py"):
+            continue
+
+        try:
+            ast.parse(content)
+        except SyntaxError as e:
+            issues.append(f"{file_path}: Syntax error at line {e.lineno}: {e.msg}")
         except Exception as e:
-            return {"error": str(e)}
+            issues.append(f"{file_path}: Parse error: {str(e)}")
 
-    def _verify_output(self, file_changes) -> tuple[bool, list[str]]:
-        """Verify generated code for syntax validity."""
-        issues = []
+    is_valid = len(issues) == 0
+    return is_valid, issues
 
-        for fc in file_changes:
-            if fc.get("action") == "DELETE":
-                continue
 
-            content = fc.get("content", "")
-            file_path = fc.get("path", "unknown")
+class BuilderAgent(Agent):
+    def __init__(self, llm_provider=None):
+        super().__init__(agent_id="agent-builder", role=AgentRole.BUILDER, llm_provider=llm_provider)
 
-            if not file_path.endswith(".py"):
-                continue
+    def _learn_patterns(self, target_file_path: str) -> dict:
+        return learn_patterns(target_file_path)
 
-            try:
-                ast.parse(content)
-            except SyntaxError as e:
-                issues.append(f"{file_path}: Syntax error at line {e.lineno}: {e.msg}")
-            except Exception as e:
-                issues.append(f"{file_path}: Parse error: {str(e)}")
+    def _verify_output(self, file_changes) -> tuple[bool, list[str]]:
+        return verify_output(file_changes)
+
+    async def _learn_patterns_async(self, target_file_path: str) -> dict:
+        """Pattern learning on the I/O pool so file reads never block the event loop."""
+        from src.core.core.executor import ExecutorSaturated, ExecutorTimeout, get_executor
 
-        is_valid = len(issues) == 0
-        return is_valid, issues
+        try:
+            return await get_executor().run_io(learn_patterns, target_file_path, timeout=10.0)
+        except (ExecutorSaturated, ExecutorTimeout) as e:
+            return {"error": str(e)}
+
+    async def _verify_output_async(self, file_changes) -> tuple[bool, list[str]]:
+        """AST verification on the CPU pool; runs inline only when the pool is saturated."""
+        from src.core.core.executor import ExecutorSaturated, ExecutorTimeout, get_executor
+
+        try:
+            return await get_executor().run_cpu(verify_output, list(file_changes))
+        except ExecutorSaturated:
+            return verify_output(file_changes)
+        except ExecutorTimeout as e:
+            return False, [f"Verification timed out: {e}"]
 
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         decision = problem.metadata.get("decision", "N/A")
@@ -90,7 +117,7 @@ class BuilderAgent(Agent):
         target_files = problem.metadata.get("target_files", [])
         pattern_hints = {}
         if target_files:
-            pattern_hints = self._learn_patterns(target_files[0])
+            pattern_hints = await self._learn_patterns_async(target_files[0])
 
         pattern_text = ""
         if pattern_hints and "error" not in pattern_hints:
@@ -112,9 +139,9 @@ Follow these patterns in your generated code.
         If the decision doesn't require filesystem changes, return empty list.
         """
 
-        config = LLMConfig(model="gpt-4-turbo-preview", temperature=0.0, json_mode=True)
+        config = LLMConfig(temperature=0.0, json_mode=True)
 
-        if not self.llm_client.api_key:
+        if not self.llm:
             return self._fallback_result("Missing API Key for Builder.")
 
         # STEP 2: Generate code (with retry on verification failure)
@@ -122,7 +149,7 @@ Follow these patterns in your generated code.
         verification_issues = []
 
         for attempt in range(max_attempts):
-            raw_json, usage = await self.llm_client.generate_json(
+            raw_json, usage = await self._generate_json(
                 system_prompt=BUILDER_SYSTEM_PROMPT,
                 user_prompt=user_prompt,
                 config=config,
@@ -137,7 +164,7 @@ Follow these patterns in your generated code.
 
             # STEP 3: Verify output
             file_changes_list = parsed.file_changes if isinstance(parsed.file_changes, list) else []
-            is_valid, issues = self._verify_output(file_changes_list)
+            is_valid, issues = await self._verify_output_async(file_changes_list)
 
             if is_valid:
                 break  # Success!
@@ -45,25 +45,16 @@ class ExecutiveAgent(Agent):
         Output JSON only: {{ "mirror": "...", "risk_assessment": "...", "queue_summary": "..." }}
         """
 
-        # Mocking LLM response for resilience if key missing, or use real one
-        response_text = await self._ask_llm(prompt)
+        # Streamed JSON: fields are parsed as they complete; prose around the object is tolerated
+        data, response_text = await self._ask_llm_structured(prompt)
 
-        try:
-            # Basic parsing or fallback
-            import json
-
-            if "{" in response_text:
-                data = json.loads(response_text[response_text.find("{") : response_text.rfind("}") + 1])
-                mirror = data.get("mirror", "Understood.")
-                _queue_summary = data.get("queue_summary", problem.title)
-            else:
-                mirror = response_text
-                _queue_summary = problem.title
-        except Exception as e:
+        if data:
+            mirror = data.get("mirror", "Understood.")
+            _queue_summary = data.get("queue_summary", problem.title)
+        else:
             mirror = response_text
             _queue_summary = problem.title
-            # Log the exception for observability
-            print(f"[ExecutiveAgent] LLM parsing fallback due to: {e}")
+            print("[ExecutiveAgent] LLM parsing fallback: no JSON object in response")
 
         # 3. Add to Signing Queue (Persistence)
         # We interpret the problem as requiring actions.
@@ -7,7 +7,7 @@ Resolves conflicts بين نتائج الوكلاء عند انخفاض الثق
 """
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
-from src.core.llm.client import LLMClient, LLMConfig
+from src.core.llm.client import LLMConfig
 
 
 class MediatorAgent(Agent):
@@ -21,7 +21,6 @@ class MediatorAgent(Agent):
             role=AgentRole.MEDIATOR,
             llm_provider=llm_provider,
         )
-        self.llm_client = LLMClient()
 
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         other_results = problem.metadata.get("agent_results", [])
@@ -55,7 +54,7 @@ class MediatorAgent(Agent):
 
         # 3. Execute Mediation with Safety
         try:
-            raw_json, usage = await self.llm_client.generate_json(
+            raw_json, usage = await self._generate_json(
                 system_prompt="You are an expert mediator. Your goal is to identify and surface conflicts between LLM agents.",
                 user_prompt=mediation_prompt,
                 config=config,
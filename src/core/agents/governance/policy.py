@@ -6,7 +6,7 @@ Checks compliance with all system policies (Rule of Law).
 """
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
-from src.core.llm.client import LLMClient, LLMConfig
+from src.core.llm.client import LLMConfig
 
 
 class PolicyAgent(Agent):
@@ -17,7 +17,6 @@ class PolicyAgent(Agent):
 
     def __init__(self, llm_provider=None):
         super().__init__(agent_id="agent-policy", role=AgentRole.POLICY, llm_provider=llm_provider)
-        self.llm_client = LLMClient()
 
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         # 1. Load Purpose Directive (Purpose Gate)
@@ -51,7 +50,7 @@ class PolicyAgent(Agent):
 
         # 5. Execute Analysis
         try:
-            raw_json, usage = await self.llm_client.generate_json(
+            raw_json, usage = await self._generate_json(
                 system_prompt="You are the Sovereign Purpose Gate. Your mission is HARD REALISM. Audit proposals against the Core Purpose Directive. Be ruthless about complexity and transparency.",
                 user_prompt=f"Perform a PURPOSE AUDIT for the following proposal:\n\n{context}",
                 config=config,
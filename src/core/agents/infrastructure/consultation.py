@@ -0,0 +1,277 @@
+"""
+Consensus AI — Consultation Coordinator
+========================================
+
+Cycle-scoped control over peer consultations (`Agent.consult_peer`).
+
+Within one governance cycle:
+- Identical consultations (same peer, same question) run once; every caller
+  awaits the same shared task.
+- Total fan-out and concurrent consultations are capped.
+- Cycles (Architect -> Steward -> Architect) are detected on the call path
+  and refused instead of recursing until the depth counter runs out.
+- Joining a shared consultation that is itself (transitively) waiting on the
+  joiner would deadlock. A wait-for graph over the in-flight consultation keys
+  catches these cross-path cycles, and such a join is refused the same way.
+- Every edge (who asked whom, and what happened) is recorded, so the
+  consultation DAG can be attached to the cycle's trace.
+
+Usage:
+    with consultation_scope(cycle_id="adr-42") as coordinator:
+        synthesis = await registry.run_and_synthesize(problem, kb)
+    trace = coordinator.graph()
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+_current_coordinator: contextvars.ContextVar[Optional["ConsultationCoordinator"]] = contextvars.ContextVar(
+    "icgl_consultation_coordinator", default=None
+)
+# Agents currently on the consultation call path of this task
+_consult_path: contextvars.ContextVar[Tuple[str, ...]] = contextvars.ContextVar("icgl_consult_path", default=())
+# Key of the consultation running in this task (shared with its child tasks)
+_current_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("icgl_consult_key", default=None)
+# Concurrency slot held by the consultation running in this task (shared with its child tasks)
+_held_slot: contextvars.ContextVar[Optional["_Slot"]] = contextvars.ContextVar("icgl_consult_slot", default=None)
+
+
+@dataclass
+class ConsultationLimits:
+    """Per-cycle consultation limits."""
+
+    max_consultations: int = 24
+    max_concurrency: int = 4
+    max_depth: int = 3
+
+    @classmethod
+    def from_env(cls) -> "ConsultationLimits":
+        return cls(
+            max_consultations=int(os.getenv("ICGL_MAX_CONSULTATIONS", 24)),
+            max_concurrency=int(os.getenv("ICGL_CONSULTATION_CONCURRENCY", 4)),
+            max_depth=int(os.getenv("ICGL_MAX_CONSULTATION_DEPTH", 3)),
+        )
+
+
+class _Slot:
+    """A concurrency slot; released while its holder waits on nested consultations."""
+
+    __slots__ = ("held",)
+
+    def __init__(self):
+        self.held = True
+
+
+def _peer_id(peer: Any) -> str:
+    return str(getattr(peer, "value", peer))
+
+
+def consultation_key(peer: str, title: str, context: str, metadata: Optional[Dict[str, Any]] = None) -> str:
+    """Identity of a consultation: the same peer asked the same question."""
+    payload = json.dumps([peer, title, context, metadata or {}], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ConsultationCoordinator:
+    """Deduplicates, limits and records peer consultations for one cycle."""
+
+    def __init__(self, cycle_id: Optional[str] = None, limits: Optional[ConsultationLimits] = None):
+        self.cycle_id = cycle_id
+        self.limits = limits or ConsultationLimits.from_env()
+        self._semaphore = asyncio.Semaphore(max(1, self.limits.max_concurrency))
+        self._tasks: Dict[str, "asyncio.Task[Any]"] = {}
+        # Wait-for graph: consultation key -> keys it is awaiting (with waiter counts)
+        self._waits: Dict[str, Dict[str, int]] = {}
+        self._edges: List[Dict[str, Any]] = []
+        self._running = 0  # consultations currently holding a concurrency slot
+        self._stats: Dict[str, int] = {
+            "executed": 0,
+            "deduplicated": 0,
+            "cycles": 0,
+            "capped": 0,
+            "depth_limited": 0,
+            "errors": 0,
+            "peak_concurrency": 0,
+        }
+
+    async def consult(
+        self,
+        caller: str,
+        peer: Any,
+        title: str,
+        context: str,
+        run: Callable[[], Awaitable[Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Any]:
+        """
+        Runs (or joins) the consultation of `peer` by `caller`.
+        Returns None when the consultation is refused (cycle, depth or fan-out cap).
+        """
+        peer_id = _peer_id(peer)
+        path = _consult_path.get() or (caller,)
+        key = consultation_key(peer_id, title, context, metadata)
+        edge: Dict[str, Any] = {
+            "from": caller,
+            "to": peer_id,
+            "key": key[:12],
+            "depth": len(path),
+            "title": title[:80],
+        }
+        self._edges.append(edge)
+
+        if peer_id in path:
+            edge["status"] = "cycle"
+            edge["path"] = list(path) + [peer_id]
+            self._stats["cycles"] += 1
+            print(f"   🔁 [Consultation] Cycle refused: {' -> '.join(edge['path'])}")
+            return None
+        if len(path) > self.limits.max_depth:
+            edge["status"] = "depth_limited"
+            self._stats["depth_limited"] += 1
+            return None
+
+        waiter = _current_key.get()
+        task = self._tasks.get(key)
+        if task is not None and waiter is not None and not task.done() and self._waits_on(key, waiter):
+            edge["status"] = "cycle"
+            edge["path"] = list(path) + [peer_id]
+            edge["wait_cycle"] = True
+            self._stats["cycles"] += 1
+            print(f"   🔁 [Consultation] Join refused: {peer_id} is already waiting on {caller}.")
+            return None
+        if task is not None:
+            edge["status"] = "deduplicated"
+            self._stats["deduplicated"] += 1
+        else:
+            if self._stats["executed"] >= self.limits.max_consultations:
+                edge["status"] = "capped"
+                self._stats["capped"] += 1
+                print(f"   ⚠️ [Consultation] Fan-out cap ({self.limits.max_consultations}) reached; skipping {peer_id}.")
+                return None
+            edge["status"] = "executed"
+            self._stats["executed"] += 1
+            task = asyncio.ensure_future(self._run(key, path + (peer_id,), run, edge))
+            self._tasks[key] = task
+
+        return await self._await_nested(task, waiter, key)
+
+    def _waits_on(self, key: str, target: str) -> bool:
+        """Whether consultation `key` is (transitively) waiting on `target`."""
+        seen: Set[str] = set()
+        stack = [key]
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            if node in seen:
+                continue
+            seen.add(node)
+            stack.extend(self._waits.get(node, ()))
+        return False
+
+    async def _run(
+        self, key: str, path: Tuple[str, ...], run: Callable[[], Awaitable[Any]], edge: Dict[str, Any]
+    ) -> Any:
+        _consult_path.set(path)
+        _current_key.set(key)
+        await self._semaphore.acquire()
+        slot = _Slot()
+        _held_slot.set(slot)
+        self._take_slot()
+        started = time.perf_counter()
+        try:
+            return await run()
+        except Exception as e:
+            edge["error"] = type(e).__name__
+            self._stats["errors"] += 1
+            raise
+        finally:
+            edge["ms"] = round((time.perf_counter() - started) * 1000, 1)
+            if slot.held:
+                slot.held = False
+                self._give_slot()
+
+    async def _await_nested(self, task: "asyncio.Task[Any]", waiter: Optional[str], key: str) -> Any:
+        """
+        Awaits a consultation result. A consultation that waits on its own nested
+        consultations gives its slot back meanwhile, so nesting cannot deadlock
+        the concurrency cap. The wait is recorded in the wait-for graph.
+        """
+        slot = _held_slot.get()
+        released = False
+        if slot is not None and slot.held and not task.done():
+            slot.held = False
+            self._give_slot()
+            released = True
+        if waiter is not None:
+            waits = self._waits.setdefault(waiter, {})
+            waits[key] = waits.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if waiter is not None:
+                waits[key] -= 1
+                if not waits[key]:
+                    del waits[key]
+                if not waits:
+                    self._waits.pop(waiter, None)
+            if released:
+                await self._semaphore.acquire()
+                slot.held = True
+                self._take_slot()
+
+    def _take_slot(self) -> None:
+        self._running += 1
+        self._stats["peak_concurrency"] = max(self._stats["peak_concurrency"], self._running)
+
+    def _give_slot(self) -> None:
+        self._running -= 1
+        self._semaphore.release()
+
+    def graph(self) -> Dict[str, Any]:
+        """The consultation DAG of this cycle (nodes, edges, outcome counters)."""
+        nodes: List[str] = []
+        for edge in self._edges:
+            for node in (edge["from"], edge["to"]):
+                if node not in nodes:
+                    nodes.append(node)
+        return {
+            "cycle_id": self.cycle_id,
+            "limits": {
+                "max_consultations": self.limits.max_consultations,
+                "max_concurrency": self.limits.max_concurrency,
+                "max_depth": self.limits.max_depth,
+            },
+            "nodes": nodes,
+            "edges": [dict(e) for e in self._edges],
+            "stats": dict(self._stats),
+        }
+
+
+def get_consultation_coordinator() -> Optional[ConsultationCoordinator]:
+    """The coordinator of the cycle running in this task, if any."""
+    return _current_coordinator.get()
+
+
+@contextmanager
+def consultation_scope(
+    cycle_id: Optional[str] = None, limits: Optional[ConsultationLimits] = None
+) -> Iterator[ConsultationCoordinator]:
+    """Opens a consultation scope (or joins the enclosing one) for the current task."""
+    existing = _current_coordinator.get()
+    if existing is not None:
+        yield existing
+        return
+    coordinator = ConsultationCoordinator(cycle_id=cycle_id, limits=limits)
+    token = _current_coordinator.set(coordinator)
+    try:
+        yield coordinator
+    finally:
+        _current_coordinator.reset(token)
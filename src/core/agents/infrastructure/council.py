@@ -0,0 +1,470 @@
+"""
+Consensus AI — Adaptive Council Selection
+==========================================
+
+Picks the smallest council likely to reach the same consensus as the full
+agent pool, instead of running every registered agent on every ADR.
+
+Inputs:
+- Historical agent metrics (`agent_metrics`: success, confidence, latency).
+- ADR features: prompt size, topic keywords, Sentinel alerts.
+
+Policy (epsilon-greedy):
+- Core roles always sit on the council.
+- Remaining seats go to the highest value agents: relevance to the ADR times
+  historical reliability, discounted by latency. Agents with few recorded
+  runs get an optimistic prior so they are not starved.
+- With probability `epsilon` one unselected agent is added (exploration), so
+  metrics keep flowing for agents the policy would otherwise never pick.
+
+`replay_runs` evaluates a selector offline against past `runs/*.json`:
+estimated tokens and latency saved versus consensus lost.
+
+Usage:
+    selector = CouncilSelector()
+    stats = selector.load_stats(kb)
+    selection = selector.select(candidates, AdrFeatures.from_problem(problem), stats)
+    allowed_agents = selection.agents
+"""
+
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.core.llm.context_assembly import estimate_tokens
+
+# Roles that always sit on the council (when registered)
+DEFAULT_CORE_ROLES = ("architect", "policy", "sentinel")
+
+# Topic keywords (lowercase stems, English and Arabic) that make a role relevant
+ROLE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "builder": ("implement", "code", "refactor", "endpoint", "api", "module", "file", "تنفيذ", "كود"),
+    "failure": ("failure", "outage", "rollback", "recover", "fault", "crash", "downtime", "فشل", "تعطل"),
+    "guardian": ("concept", "principle", "invariant", "risk", "safety", "مبدأ", "مخاطر"),
+    "security": ("security", "auth", "secret", "encrypt", "vulnerab", "permission", "token", "أمن", "صلاحي"),
+    "performance": ("performance", "latency", "throughput", "cache", "scale", "optimi", "أداء"),
+    "database_architect": ("database", "schema", "sql", "migration", "index", "قاعدة بيانات"),
+    "devops": ("deploy", "docker", "pipeline", "infra", "kubernetes", "release", "نشر"),
+    "testing": ("test", "coverage", "regression", "اختبار"),
+    "efficiency": ("cost", "budget", "efficien", "usage", "تكلفة"),
+    "researcher": ("research", "evaluate", "compare", "benchmark", "بحث"),
+    "chaos": ("chaos", "resilien", "fault injection"),
+    "hr": ("team", "hiring", "staff", "onboard"),
+    "archivist": ("archive", "history", "document", "أرشيف"),
+    "knowledge_steward": ("knowledge", "memory", "lesson", "معرفة"),
+}
+
+# Sentinel alert category -> roles that should weigh in
+ALERT_ROLES: Dict[str, Tuple[str, ...]] = {
+    "Safety": ("guardian", "security", "failure"),
+    "Authority": ("policy", "guardian"),
+    "Cost": ("efficiency", "performance"),
+    "Drift": ("guardian", "knowledge_steward", "archivist"),
+    "Integrity": ("validator", "verifier", "builder"),
+}
+
+# Mirrors the registry's auto-mediation trigger
+MEDIATION_CONFIDENCE = 0.7
+MEDIATION_CONCERNS = 3
+
+
+def consensus_recommendations(recommendation_lists: Iterable[Sequence[str]]) -> List[str]:
+    """Recommendations made by 2+ agents; without any, the first three distinct ones."""
+    counts: Dict[str, Dict[str, Any]] = {}
+    for recommendations in recommendation_lists:
+        for rec in recommendations:
+            entry = counts.setdefault(rec.lower(), {"text": rec, "count": 0})
+            entry["count"] += 1
+    consensus = [str(r["text"]) for r in counts.values() if r["count"] >= 2]
+    if not consensus:
+        consensus = [str(r["text"]) for r in list(counts.values())[:3]]
+    return consensus
+
+
+@dataclass
+class AdrFeatures:
+    """What the selector knows about the ADR under review."""
+
+    tokens: int = 0
+    topics: Set[str] = field(default_factory=set)  # roles whose keywords matched
+    alert_count: int = 0
+    critical_alerts: int = 0
+    alert_categories: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_text(cls, text: str, alerts: Optional[List[Dict[str, Any]]] = None) -> "AdrFeatures":
+        lowered = text.lower()
+        topics = {role for role, words in ROLE_KEYWORDS.items() if any(w in lowered for w in words)}
+        alerts = alerts or []
+        return cls(
+            tokens=estimate_tokens(text),
+            topics=topics,
+            alert_count=len(alerts),
+            critical_alerts=sum(1 for a in alerts if str(a.get("severity", "")).upper() == "CRITICAL"),
+            alert_categories={str(a.get("category")) for a in alerts if a.get("category")},
+        )
+
+    @classmethod
+    def from_problem(cls, problem: Any) -> "AdrFeatures":
+        """Features of a registry Problem; Sentinel alerts are read from `metadata['sentinel_alerts']`."""
+        metadata = getattr(problem, "metadata", {}) or {}
+        text = "\n".join(str(p) for p in (problem.title, problem.context, metadata.get("decision", "")) if p)
+        return cls.from_text(text, metadata.get("sentinel_alerts"))
+
+
+@dataclass
+class AgentStats:
+    """Historical performance of one role (aggregated `agent_metrics`)."""
+
+    role: str
+    runs: int = 0
+    success_rate: float = 1.0
+    mean_confidence: float = 0.5
+    mean_latency_ms: float = 0.0
+
+    def reliability(self, prior: float = 0.6, prior_weight: int = 3) -> float:
+        """Success-weighted confidence, smoothed toward an optimistic prior while runs are few."""
+        observed = self.success_rate * self.mean_confidence
+        return (observed * self.runs + prior * prior_weight) / (self.runs + prior_weight)
+
+
+@dataclass
+class CouncilSelection:
+    """Outcome of one selection."""
+
+    agents: List[str]
+    target_size: int
+    scores: Dict[str, float] = field(default_factory=dict)
+    reasons: Dict[str, str] = field(default_factory=dict)
+    explored: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "agents": list(self.agents),
+            "target_size": self.target_size,
+            "scores": {k: round(v, 4) for k, v in self.scores.items()},
+            "reasons": dict(self.reasons),
+            "explored": list(self.explored),
+            "skipped": list(self.skipped),
+        }
+
+
+def _env_roles(name: str, default: Sequence[str]) -> Tuple[str, ...]:
+    raw = os.getenv(name)
+    if raw is None:
+        return tuple(default)
+    return tuple(r.strip().lower() for r in raw.split(",") if r.strip())
+
+
+class CouncilSelector:
+    """
+    Epsilon-greedy council selection over historical agent metrics.
+
+    Args:
+        core_roles: Roles always selected (ICGL_COUNCIL_CORE, comma separated).
+        epsilon: Exploration probability per selection (ICGL_COUNCIL_EPSILON).
+        min_size / max_size: Council size bounds (ICGL_COUNCIL_MIN / ICGL_COUNCIL_MAX).
+        latency_scale_ms: Latency at which an agent's value is halved.
+        stats_ttl: Seconds the metric aggregates are cached by `load_stats`.
+    """
+
+    def __init__(
+        self,
+        core_roles: Optional[Sequence[str]] = None,
+        epsilon: Optional[float] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        latency_scale_ms: float = 15000.0,
+        stats_ttl: float = 60.0,
+        seed: Optional[int] = None,
+    ):
+        self.core_roles = tuple(core_roles) if core_roles is not None else _env_roles("ICGL_COUNCIL_CORE", DEFAULT_CORE_ROLES)
+        self.epsilon = epsilon if epsilon is not None else float(os.getenv("ICGL_COUNCIL_EPSILON", 0.1))
+        self.min_size = min_size if min_size is not None else int(os.getenv("ICGL_COUNCIL_MIN", 3))
+        max_env = os.getenv("ICGL_COUNCIL_MAX")
+        self.max_size = max_size if max_size is not None else (int(max_env) if max_env else None)
+        self.latency_scale_ms = latency_scale_ms
+        self.stats_ttl = stats_ttl
+        self._rng = random.Random(seed)
+        self._stats_cache: Optional[Tuple[float, Dict[str, AgentStats]]] = None
+
+    # --- Inputs ---
+
+    def load_stats(self, kb: Any, since: Optional[str] = None) -> Dict[str, AgentStats]:
+        """Per-role stats from the KB's agent metrics (cached for `stats_ttl` seconds)."""
+        now_t = time.monotonic()
+        if since is None and self._stats_cache and now_t - self._stats_cache[0] < self.stats_ttl:
+            return self._stats_cache[1]
+        rows: List[Dict[str, Any]] = []
+        try:
+            if hasattr(kb, "get_agent_metric_summary"):
+                rows = kb.get_agent_metric_summary(since=since)
+            elif hasattr(kb, "load_agent_metric_summary"):
+                rows = kb.load_agent_metric_summary(since=since)
+        except Exception as e:
+            print(f"[Council] ⚠️ Agent metrics unavailable ({e}); using priors.")
+        stats = stats_from_rows(rows)
+        if since is None:
+            self._stats_cache = (now_t, stats)
+        return stats
+
+    def target_size(self, features: AdrFeatures, n_candidates: int) -> int:
+        """Bigger or riskier ADRs get more seats."""
+        size = self.min_size
+        size += min(2, features.tokens // 1500)
+        if features.alert_count:
+            size += 1
+        if features.critical_alerts:
+            size += 1
+        upper = n_candidates if self.max_size is None else min(n_candidates, self.max_size)
+        return max(min(size, upper), min(self.min_size, n_candidates))
+
+    def score(self, role: str, features: AdrFeatures, stats: Optional[AgentStats]) -> float:
+        """Expected value of seating `role`: relevance x reliability, discounted by latency."""
+        relevance = 0.2
+        if role in features.topics:
+            relevance += 1.0
+        for category in features.alert_categories:
+            if role in ALERT_ROLES.get(category, ()):
+                relevance += 1.0 + (0.5 if features.critical_alerts else 0.0)
+        stats = stats or AgentStats(role=role)
+        latency_penalty = 1.0 + stats.mean_latency_ms / self.latency_scale_ms
+        return relevance * (0.5 + stats.reliability()) / latency_penalty
+
+    # --- Policy ---
+
+    def select(
+        self,
+        candidates: Sequence[str],
+        features: AdrFeatures,
+        stats: Optional[Dict[str, AgentStats]] = None,
+        explore: bool = True,
+    ) -> CouncilSelection:
+        """
+        Chooses a council among `candidates` (role values).
+
+        Args:
+            explore: False disables exploration (used by the offline evaluator).
+        """
+        stats = stats or {}
+        roles = list(dict.fromkeys(c.lower() for c in candidates))
+        target = self.target_size(features, len(roles))
+        scores = {role: self.score(role, features, stats.get(role)) for role in roles}
+
+        chosen: List[str] = []
+        reasons: Dict[str, str] = {}
+        for role in roles:
+            if role in self.core_roles:
+                chosen.append(role)
+                reasons[role] = "core"
+
+        ranked = sorted((r for r in roles if r not in chosen), key=lambda r: (-scores[r], r))
+        for role in ranked:
+            if len(chosen) >= target:
+                break
+            chosen.append(role)
+            reasons[role] = "relevant" if role in features.topics else "reliable"
+
+        explored: List[str] = []
+        rest = [r for r in ranked if r not in chosen]
+        if explore and rest and self._rng.random() < self.epsilon:
+            pick = self._rng.choice(rest)
+            chosen.append(pick)
+            reasons[pick] = "explore"
+            explored.append(pick)
+
+        return CouncilSelection(
+            agents=chosen,
+            target_size=target,
+            scores=scores,
+            reasons=reasons,
+            explored=explored,
+            skipped=[r for r in roles if r not in chosen],
+        )
+
+
+def stats_from_rows(rows: Iterable[Dict[str, Any]]) -> Dict[str, AgentStats]:
+    """Folds `load_agent_metric_summary` rows into per-role stats (several agent ids may share a role)."""
+    stats: Dict[str, AgentStats] = {}
+    for row in rows:
+        role = str(row.get("role") or row.get("agent_id", "")).lower()
+        runs = int(row.get("runs") or 0)
+        if not role or runs <= 0:
+            continue
+        current = stats.get(role)
+        if current is None:
+            stats[role] = AgentStats(
+                role=role,
+                runs=runs,
+                success_rate=float(row.get("success_rate") or 0.0),
+                mean_confidence=float(row.get("mean_confidence") or 0.0),
+                mean_latency_ms=float(row.get("mean_latency_ms") or 0.0),
+            )
+            continue
+        total = current.runs + runs
+
+        def merge(a: float, b: float) -> float:
+            return (a * current.runs + b * runs) / total
+
+        current.success_rate = merge(current.success_rate, float(row.get("success_rate") or 0.0))
+        current.mean_confidence = merge(current.mean_confidence, float(row.get("mean_confidence") or 0.0))
+        current.mean_latency_ms = merge(current.mean_latency_ms, float(row.get("mean_latency_ms") or 0.0))
+        current.runs = total
+    return stats
+
+
+# --- Offline evaluation ---
+
+
+@dataclass
+class ReplayReport:
+    """Estimated effect of a selector on past runs (full council vs selected council)."""
+
+    runs: int = 0
+    tokens_full: int = 0
+    tokens_selected: int = 0
+    latency_full_ms: float = 0.0
+    latency_selected_ms: float = 0.0
+    consensus_recall: float = 1.0  # mean share of the full council's consensus kept
+    confidence_delta: float = 0.0  # mean |confidence(full) - confidence(selected)|
+    mediation_flips: int = 0  # runs where the auto-mediation trigger changes
+    agents_full: int = 0
+    agents_selected: int = 0
+    per_run: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_full - self.tokens_selected
+
+    @property
+    def latency_saved_ms(self) -> float:
+        return self.latency_full_ms - self.latency_selected_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "agents_full": self.agents_full,
+            "agents_selected": self.agents_selected,
+            "tokens_full": self.tokens_full,
+            "tokens_selected": self.tokens_selected,
+            "tokens_saved": self.tokens_saved,
+            "tokens_saved_pct": round(100.0 * self.tokens_saved / self.tokens_full, 1) if self.tokens_full else 0.0,
+            "latency_full_ms": round(self.latency_full_ms, 1),
+            "latency_selected_ms": round(self.latency_selected_ms, 1),
+            "latency_saved_ms": round(self.latency_saved_ms, 1),
+            "consensus_recall": round(self.consensus_recall, 4),
+            "confidence_delta": round(self.confidence_delta, 4),
+            "mediation_flips": self.mediation_flips,
+            "per_run": self.per_run,
+        }
+
+
+def _needs_mediation(results: List[Dict[str, Any]]) -> bool:
+    if not results:
+        return False
+    confidence = sum(float(r.get("confidence") or 0.0) for r in results) / len(results)
+    concerns = {c for r in results for c in r.get("concerns") or []}
+    return confidence < MEDIATION_CONFIDENCE or len(concerns) > MEDIATION_CONCERNS
+
+
+def _agent_tokens(prompt_tokens: int, result: Dict[str, Any]) -> int:
+    output = "\n".join(
+        [str(result.get("analysis") or "")]
+        + [str(x) for x in result.get("recommendations") or []]
+        + [str(x) for x in result.get("concerns") or []]
+    )
+    return prompt_tokens + estimate_tokens(output)
+
+
+def replay_run(
+    run: Dict[str, Any], selector: CouncilSelector, stats: Optional[Dict[str, AgentStats]] = None
+) -> Optional[Dict[str, Any]]:
+    """Replays one run artifact; None when it has no agent results."""
+    stats = stats or {}
+    results = [r for r in (run.get("synthesis") or {}).get("agent_results") or [] if r.get("role") != "mediator"]
+    if not results:
+        return None
+    adr = run.get("adr") or {}
+    text = "\n".join(str(adr.get(k) or "") for k in ("title", "context", "decision"))
+    alerts = [{"category": None, "severity": None} for _ in adr.get("sentinel_signals") or []]
+    features = AdrFeatures.from_text(text, alerts)
+
+    selection = selector.select([str(r.get("role")) for r in results], features, stats, explore=False)
+    chosen = set(selection.agents)
+    selected = [r for r in results if str(r.get("role")).lower() in chosen]
+
+    def latency(rows: List[Dict[str, Any]]) -> float:
+        # Council agents run concurrently: the slowest member sets the wall time
+        known = [stats[str(r.get("role")).lower()].mean_latency_ms for r in rows if str(r.get("role")).lower() in stats]
+        return max(known, default=0.0)
+
+    full_consensus = consensus_recommendations(r.get("recommendations") or [] for r in results)
+    selected_consensus = consensus_recommendations(r.get("recommendations") or [] for r in selected)
+    full_set = {c.lower() for c in full_consensus}
+    recall = len(full_set & {c.lower() for c in selected_consensus}) / len(full_set) if full_set else 1.0
+
+    def confidence(rows: List[Dict[str, Any]]) -> float:
+        return sum(float(r.get("confidence") or 0.0) for r in rows) / len(rows) if rows else 0.0
+
+    prompt_tokens = features.tokens
+    return {
+        "adr_id": adr.get("id"),
+        "agents_full": len(results),
+        "agents_selected": len(selected),
+        "selected": selection.agents,
+        "tokens_full": sum(_agent_tokens(prompt_tokens, r) for r in results),
+        "tokens_selected": sum(_agent_tokens(prompt_tokens, r) for r in selected),
+        "latency_full_ms": latency(results),
+        "latency_selected_ms": latency(selected),
+        "consensus_recall": recall,
+        "confidence_delta": abs(confidence(results) - confidence(selected)),
+        "mediation_flip": _needs_mediation(results) != _needs_mediation(selected),
+    }
+
+
+def replay_runs(
+    runs_dir: str = "runs",
+    selector: Optional[CouncilSelector] = None,
+    stats: Optional[Dict[str, AgentStats]] = None,
+) -> ReplayReport:
+    """
+    Offline evaluation: replays every `runs_dir/*.json` artifact through `selector`
+    (exploration off) and estimates tokens/latency saved against consensus lost.
+    Tokens are estimated from the ADR text (prompt) and each agent's output;
+    latency uses the per-role mean from `stats` when available.
+    """
+    selector = selector or CouncilSelector()
+    report = ReplayReport()
+    recalls: List[float] = []
+    deltas: List[float] = []
+    for path in sorted(Path(runs_dir).glob("*.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                run = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[Council] ⚠️ Skipping unreadable run {path.name}: {e}")
+            continue
+        row = replay_run(run, selector, stats)
+        if row is None:
+            continue
+        row["file"] = path.name
+        report.runs += 1
+        report.agents_full += row["agents_full"]
+        report.agents_selected += row["agents_selected"]
+        report.tokens_full += row["tokens_full"]
+        report.tokens_selected += row["tokens_selected"]
+        report.latency_full_ms += row["latency_full_ms"]
+        report.latency_selected_ms += row["latency_selected_ms"]
+        report.mediation_flips += int(row["mediation_flip"])
+        recalls.append(row["consensus_recall"])
+        deltas.append(row["confidence_delta"])
+        report.per_run.append(row)
+    if recalls:
+        report.consensus_recall = sum(recalls) / len(recalls)
+        report.confidence_delta = sum(deltas) / len(deltas)
+    return report
@@ -18,10 +18,15 @@ Usage:
 import asyncio
 import os
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
-from src.core.core.llm import OpenAIProvider
+from src.core.agents.infrastructure.consultation import consultation_scope
+from src.core.agents.infrastructure.council import AdrFeatures, CouncilSelector, consensus_recommendations
+from src.core.core.coalescing import CoalescingProvider
+from src.core.core.llm import LLMResponse, OpenAIProvider, default_batch_concurrency
+from src.core.core.llm_router import RoutingProvider, routes_from_env
+from src.core.core.resilience import ResilientProvider, RetryPolicy, get_circuit_breaker
 
 if TYPE_CHECKING:
     pass
@@ -45,6 +50,9 @@ class SynthesizedResult:
     all_concerns: List[str]
     overall_confidence: float
     mediation: Optional[Dict[str, Any]] = None
+    consultation_graph: Optional[Dict[str, Any]] = None
+    council: Optional[Dict[str, Any]] = None
+    retrieval: Optional[Dict[str, Any]] = None
     file_changes: List[Any] = field(
         default_factory=list
     )  # Using Any to avoid circular import issues at runtime if needed
@@ -99,6 +107,10 @@ class AgentRegistry:
         self._agents: Dict[AgentRole, Agent] = {}
         self._llm_provider = self._init_llm_provider()
         self.router = None  # Injected by ICGL/Server
+        # Adaptive council: pick a minimal council from agent metrics when no allow-list is given
+        self.council_selector: Optional[CouncilSelector] = None
+        if os.getenv("ICGL_ADAPTIVE_COUNCIL", "").lower() in {"1", "true", "yes"}:
+            self.council_selector = CouncilSelector()
 
     def set_router(self, router: Any) -> None:
         """Sets the router and injects it into all registered agents."""
@@ -111,16 +123,135 @@ class AgentRegistry:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY missing. Real LLM provider is mandatory; no mock fallback.")
-        try:
-            print("[AgentRegistry] 🧠 Initializing OpenAI Provider...")
-            return OpenAIProvider(api_key=api_key)
-        except Exception as e:
-            raise RuntimeError(f"Failed to initialize OpenAI provider: {e}")
+
+        def build_route_provider(name: str, model: str):
+            try:
+                print(f"[AgentRegistry] 🧠 Initializing OpenAI Provider ({model})...")
+                provider = OpenAIProvider(model=model, api_key=api_key)
+            except Exception as e:
+                raise RuntimeError(f"Failed to initialize OpenAI provider: {e}")
+
+            # Resilience: classified retries + per-route circuit breaker (fast-fail while open)
+            return ResilientProvider(
+                provider,
+                name=f"openai:{name}",
+                retry_policy=RetryPolicy(
+                    max_retries=int(os.getenv("ICGL_LLM_MAX_RETRIES", 3)),
+                    base_delay=float(os.getenv("ICGL_LLM_BACKOFF_BASE", 0.5)),
+                    max_delay=float(os.getenv("ICGL_LLM_BACKOFF_MAX", 20.0)),
+                ),
+                breaker=get_circuit_breaker(
+                    f"openai:{name}",
+                    failure_threshold=int(os.getenv("ICGL_LLM_BREAKER_THRESHOLD", 5)),
+                    recovery_timeout=float(os.getenv("ICGL_LLM_BREAKER_COOLDOWN", 30.0)),
+                ),
+                attempt_timeout=float(os.getenv("ICGL_LLM_ATTEMPT_TIMEOUT", 60.0)),
+            )
+
+        # Routing: per-request model choice (role, prompt size, JSON mode, live p95/error rate)
+        routes = routes_from_env(build_route_provider)
+        if len(routes) == 1:
+            provider = routes[0].provider
+        else:
+            provider = RoutingProvider(
+                routes,
+                decision_log=os.getenv("ICGL_LLM_ROUTING_LOG", "data/logs/llm_routing.jsonl") or None,
+            )
+
+        # Single-flight: identical in-flight prompts from different agents share one call
+        if os.getenv("ICGL_DISABLE_LLM_COALESCING", "").lower() not in {"1", "true", "yes"}:
+            provider = CoalescingProvider(provider)
+
+        # Token governance: real usage accounting + sliding-window TPM/RPM with priority admission.
+        # Outside the coalescer, so each caller is admitted at its own priority and billed to its own agent/ADR.
+        if os.getenv("ICGL_DISABLE_TOKEN_GOVERNOR", "").lower() not in {"1", "true", "yes"}:
+            from src.core.governance.budget import GovernedProvider, get_token_governor
+
+            provider = GovernedProvider(provider, get_token_governor())
+        return provider
 
     def get_llm_provider(self):
         """Expose the underlying LLM provider (for mediator or external agents)."""
         return self._llm_provider
 
+    def token_governor(self):
+        """The TokenGovernor in front of the LLM chain, if governance is enabled."""
+        provider = self._llm_provider
+        for _ in range(16):
+            if provider is None:
+                return None
+            governor = getattr(provider, "governor", None)
+            if governor is not None:
+                return governor
+            provider = getattr(provider, "inner", None)
+        return None
+
+    def llm_headroom(self) -> Dict[str, Any]:
+        """Remaining LLM rate headroom (tokens/requests in the current window)."""
+        governor = self.token_governor()
+        return governor.headroom() if governor is not None else {}
+
+    def llm_metrics(self) -> Dict[str, Any]:
+        """Runtime metrics of the shared LLM provider chain."""
+        from src.core.llm.pool import get_client_pool
+
+        provider = self._llm_provider
+        metrics = dict(provider.metrics()) if provider is not None and hasattr(provider, "metrics") else {}
+        metrics["client_pool"] = get_client_pool().stats()
+        return metrics
+
+    async def batch_generate(
+        self, prompts: Dict[str, str], max_concurrency: Optional[int] = None
+    ) -> Dict[str, Union[LLMResponse, Exception]]:
+        """
+        Submits a whole council's prompts as one provider batch.
+
+        Args:
+            prompts: agent id or role value -> prompt. Each prompt is wrapped with
+                that agent's system prompt and recalled lessons.
+            max_concurrency: in-flight cap for the batch (default ICGL_LLM_BATCH_CONCURRENCY).
+
+        Returns:
+            The same keys mapped to an LLMResponse, or to the exception for that item.
+        """
+        results: Dict[str, Union[LLMResponse, Exception]] = {}
+        agents: Dict[str, Agent] = {}
+        for key in prompts:
+            agent = self.get_agent(key)
+            if agent is None:
+                results[key] = KeyError(f"Unknown agent: {key}")
+            else:
+                agents[key] = agent
+
+        # Lesson recall is I/O per agent: build the requests concurrently under the batch cap
+        semaphore = asyncio.Semaphore(max_concurrency or default_batch_concurrency())
+
+        async def build(key: str) -> Any:
+            async with semaphore:
+                return await agents[key]._build_llm_request(prompts[key])
+
+        keys: List[str] = []
+        requests = []
+        built = await asyncio.gather(*(build(key) for key in agents), return_exceptions=True)
+        for key, request in zip(agents, built):
+            if isinstance(request, Exception):
+                results[key] = request
+            else:
+                keys.append(key)
+                requests.append(request)
+
+        if requests:
+            from src.core.governance.budget import Priority
+
+            for request in requests:
+                request.metadata.setdefault("priority", Priority.BATCH)
+            if self._llm_provider is None:
+                raise RuntimeError("No LLM provider configured for batch generation.")
+            responses = await self._llm_provider.generate_many(requests, max_concurrency=max_concurrency)
+            results.update(zip(keys, responses))
+
+        return {key: results[key] for key in prompts}
+
     def register(self, agent: Agent) -> None:
         """
         Registers an agent by its role.
@@ -219,7 +350,33 @@ class AgentRegistry:
         """
         Cycle 15: Run only the ALLOWED agents (The Council).
         Includes Phase 10 Consultation Budgeting.
+        Peer consultations made during the run share one cycle-scoped coordinator;
+        its DAG is attached to the result as `consultation_graph`. Memory searches
+        share one cycle retrieval cache; its hit ratios are attached as `retrieval`.
         """
+        from src.core.governance.budget import usage_scope
+        from src.core.memory.retrieval_cache import retrieval_scope
+
+        adr_id = problem.metadata.get("adr_id")
+        with (
+            consultation_scope(cycle_id=adr_id) as coordinator,
+            usage_scope(adr_id=adr_id) as usage,
+            retrieval_scope(cycle_id=adr_id) as retrieval,
+        ):
+            synthesis = await self._run_and_synthesize_dynamic(problem, kb, allowed_agents, precomputed_results)
+        synthesis.consultation_graph = coordinator.graph()
+        synthesis.council = problem.metadata.get("council_selection")
+        synthesis.retrieval = retrieval.stats()
+        problem.metadata["total_tokens"] = max(problem.metadata.get("total_tokens", 0), usage.total_tokens)
+        return synthesis
+
+    async def _run_and_synthesize_dynamic(
+        self,
+        problem: Problem,
+        kb,
+        allowed_agents: Optional[List[str]] = None,
+        precomputed_results: Optional[List[AgentResult]] = None,
+    ) -> SynthesizedResult:
         # --- PHASE 10: Consultation Budgeting ---
         current_depth = problem.metadata.get("consultation_depth", 0)
         max_depth = int(os.getenv("ICGL_MAX_CONSULTATION_DEPTH", 3))
@@ -228,12 +385,13 @@ class AgentRegistry:
             print(f"[Registry] ⚠️ Max consultation depth ({max_depth}) reached. Terminating recursion.")
             return self._synthesize(precomputed_results or [])
 
-        # Check Token Budget (Phase 12 Refactor)
-        from src.core.governance.budget import TokenBudget
+        # Check Token Budget (Phase 12 Refactor) against real recorded usage
+        from src.core.governance.budget import Priority, TokenBudget, current_usage_scope
 
         budget = TokenBudget()
 
-        current_tokens = problem.metadata.get("total_tokens", 0)
+        scope = current_usage_scope()
+        current_tokens = max(problem.metadata.get("total_tokens", 0), scope.total_tokens if scope else 0)
 
         if not budget.check_usage(current_tokens):
             status = budget.get_status(current_tokens)
@@ -242,10 +400,22 @@ class AgentRegistry:
 
         # Increment depth for downstream consultations
         problem.metadata["consultation_depth"] = current_depth + 1
+
+        # Admission control: batch cycles wait for rate headroom instead of crowding out chat/council calls
+        governor = self.token_governor()
+        if governor is not None and scope is not None and scope.priority == Priority.BATCH:
+            estimate = max(1, len(allowed_agents or self._agents)) * governor.average_request_tokens()
+            estimate = min(estimate, governor.tokens_per_minute)
+            if not governor.can_admit(estimate, Priority.BATCH):
+                print(f"[Registry] ⏳ Waiting for LLM headroom (~{estimate} tokens) before batch cycle...")
+                await governor.wait_for_headroom(estimate, Priority.BATCH)
         # ----------------------------------------
 
         results = precomputed_results or []
 
+        if allowed_agents is None and self.council_selector is not None:
+            allowed_agents = self._select_council(problem, kb)
+
         if allowed_agents is None:
             # Fallback to run all
             new_results = await self.run_all(problem, kb)
@@ -332,6 +502,21 @@ class AgentRegistry:
 
         return synthesis
 
+    def _select_council(self, problem: Problem, kb) -> Optional[List[str]]:
+        """Adaptive council for this problem (role values), recorded in problem.metadata."""
+        candidates = [role.value for role in self._agents if role != AgentRole.MEDIATOR]
+        if not candidates:
+            return None
+        stats = self.council_selector.load_stats(kb)
+        selection = self.council_selector.select(candidates, AdrFeatures.from_problem(problem), stats)
+        problem.metadata["council_selection"] = selection.to_dict()
+        explored = f" (exploring: {', '.join(selection.explored)})" if selection.explored else ""
+        print(
+            f"[AgentRegistry] 🎯 Adaptive council {len(selection.agents)}/{len(candidates)}: "
+            f"{', '.join(selection.agents)}{explored}"
+        )
+        return selection.agents
+
     def _synthesize(self, results: List[AgentResult]) -> SynthesizedResult:
         """Combines agent results into a synthesized output."""
         if not results:
@@ -342,22 +527,8 @@ class AgentRegistry:
                 overall_confidence=0.0,
             )
 
-        # Collect all recommendations and find consensus
-        all_recommendations: Dict[str, Dict[str, Any]] = {}
-        for result in results:
-            for rec in result.recommendations:
-                rec_lower = rec.lower()
-                if rec_lower not in all_recommendations:
-                    all_recommendations[rec_lower] = {"text": rec, "count": 0}
-                count = all_recommendations[rec_lower].get("count", 0)
-                all_recommendations[rec_lower]["count"] = int(count or 0) + 1
-
-        # Consensus = recommended by 2+ agents
-        consensus: List[str] = [str(r["text"]) for r in all_recommendations.values() if int(r.get("count", 0)) >= 2]
-
-        # If no consensus, take top recommendations
-        if not consensus:
-            consensus = [str(r["text"]) for r in list(all_recommendations.values())[:3]]
+        # Consensus = recommended by 2+ agents (else the top recommendations)
+        consensus = consensus_recommendations(result.recommendations for result in results)
 
         # Collect all concerns
         all_concerns = []
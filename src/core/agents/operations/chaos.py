@@ -58,15 +58,14 @@ class ChaosAgent(Agent):
         - A 'Fragility Score' (1-100).
         """
 
-        from src.core.llm.client import LLMClient, LLMConfig
+        from src.core.llm.client import LLMConfig
         from src.core.llm.prompts import JSONParser
 
         # Configure Execution
-        client = LLMClient()
         config = LLMConfig(temperature=0.7, json_mode=True)
 
         try:
-            raw_json, usage = await client.generate_json(
+            raw_json, usage = await self._generate_json(
                 system_prompt=self.get_system_prompt(),
                 user_prompt=prompt,
                 config=config,
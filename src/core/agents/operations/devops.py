@@ -9,9 +9,8 @@ Ensures that code changes are compatible with the target runtime and infrastruct
 import os
 from typing import Any, Optional
 
-import psutil
-
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
+from src.core.core.telemetry import get_system_sampler
 
 
 class DevOpsAgent(Agent):
@@ -61,14 +60,13 @@ class DevOpsAgent(Agent):
         3. Identify any CI/CD automation gaps that this change might create/fix.
         """
 
-        from src.core.llm.client import LLMClient, LLMConfig
+        from src.core.llm.client import LLMConfig
         from src.core.llm.prompts import JSONParser
 
-        client = LLMClient()
         config = LLMConfig(temperature=0.3, json_mode=True)
 
         try:
-            raw_json, usage = await client.generate_json(
+            raw_json, usage = await self._generate_json(
                 system_prompt=self.get_system_prompt(),
                 user_prompt=prompt,
                 config=config,
@@ -99,10 +97,10 @@ class DevOpsAgent(Agent):
         try:
             os_name = os.name
             cpu_count = os.cpu_count()
-            mem = psutil.virtual_memory()
+            reading = get_system_sampler().snapshot()
 
-            report = f"OS: {os_name} | CPUs: {cpu_count} | Mem Total: {mem.total / (1024**3):.1f}GB"
-            report += f" | Available: {mem.available / (1024**3):.1f}GB"
+            report = f"OS: {os_name} | CPUs: {cpu_count} | Mem Total: {reading.get('memory_total', 0) / (1024**3):.1f}GB"
+            report += f" | Available: {reading.get('memory_available', 0) / (1024**3):.1f}GB"
             return report
         except Exception as e:
             return f"Env snapshot failed: {str(e)}"
@@ -7,8 +7,8 @@ Uses 'Pre-Mortem' reasoning.
 """
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
-from src.core.llm.client import LLMClient, LLMConfig
-from src.core.llm.prompts import FAILURE_SYSTEM_PROMPT
+from src.core.llm.client import LLMConfig
+from src.core.llm.prompts import FAILURE_SYSTEM_PROMPT, SpecialistOutput
 
 
 class FailureAgent(Agent):
@@ -19,7 +19,6 @@ class FailureAgent(Agent):
 
     def __init__(self, llm_provider=None):
         super().__init__(agent_id="agent-failure", role=AgentRole.FAILURE)
-        self.llm_client = LLMClient()
 
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         # 1. Setup Context
@@ -37,16 +36,13 @@ class FailureAgent(Agent):
 
         # 3. Execute Analysis with Safety
         try:
-            raw_json, usage = await self.llm_client.generate_json(
+            parsed, _ = await self._ask_llm_structured(
+                prompt=f"Please analyze this Intent Contract from a FAILURE perspective:\n\n{context}",
                 system_prompt=FAILURE_SYSTEM_PROMPT,
-                user_prompt=f"Please analyze this Intent Contract from a FAILURE perspective:\n\n{context}",
+                output_type=SpecialistOutput,
+                on_field=self._publish_field(problem),
                 config=config,
             )
-
-            # Update Budget Tracking
-            current_tokens = problem.metadata.get("total_tokens", 0)
-            problem.metadata["total_tokens"] = current_tokens + usage.get("total_tokens", 0)
-            problem.metadata["last_agent_tokens"] = usage.get("total_tokens", 0)
         except Exception as e:
             return AgentResult(
                 agent_id=self.agent_id,
@@ -56,20 +52,20 @@ class FailureAgent(Agent):
                 concerns=[f"LLM Error: {str(e)}"],
             )
 
-        # 4. Parse & Return
+        # 4. Return Result
         return AgentResult(
             agent_id=self.agent_id,
             role=self.role,
-            analysis=raw_json.get("analysis", ""),
-            recommendations=raw_json.get("recommendations") or ["Consider failure mitigations"],
-            concerns=raw_json.get("concerns") or ["No specific failure modes identified"],
-            confidence=max(0.0, min(1.0, raw_json.get("confidence", 0.8))),
-            understanding=raw_json.get("understanding"),  # Layer 2
-            risk_pre_mortem=raw_json.get("risk_pre_mortem") or [],  # Layer 4
-            trigger=raw_json.get("trigger"),
-            impact=raw_json.get("impact"),
-            risks_structured=raw_json.get("risks_structured") or [],
-            alternatives=raw_json.get("alternatives") or [],
-            effort=raw_json.get("effort"),
-            execution_plan=raw_json.get("execution_plan"),
+            analysis=parsed.analysis,
+            recommendations=parsed.recommendations or ["Consider failure mitigations"],
+            concerns=parsed.concerns or ["No specific failure modes identified"],
+            confidence=max(0.0, min(1.0, parsed.confidence or 0.8)),
+            understanding=parsed.understanding,  # Layer 2
+            risk_pre_mortem=parsed.risk_pre_mortem,  # Layer 4
+            trigger=parsed.trigger,
+            impact=parsed.impact,
+            risks_structured=parsed.risks_structured,
+            alternatives=parsed.alternatives,
+            effort=parsed.effort,
+            execution_plan=parsed.execution_plan,
         )
@@ -6,15 +6,20 @@ The Monitor Agent tracks system health, resource usage, uptime,
 and performance metrics for the ICGL system.
 """
 
+import os
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-import psutil
-
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
+from src.core.core.telemetry import get_system_sampler
+from src.core.core.timeseries import TimeSeriesStore
 from src.core.kb.schemas import now
 
 
+HEALTH_METRICS = ["cpu_percent", "memory_percent", "disk_percent", "issues", "status"]
+STATUS_CODES = {"unknown": -1, "healthy": 0, "degraded": 1, "critical": 2}
+
+
 class HealthStatus:
     """Represents system health status."""
 
@@ -46,7 +51,12 @@ class MonitorAgent(Agent):
             role=AgentRole.MONITOR,
             llm_provider=llm_provider,
         )
-        self.health_history: List[HealthStatus] = []
+        # Bounded multi-resolution history (constant memory over long uptimes)
+        self.health_history = TimeSeriesStore(
+            "monitor.health",
+            HEALTH_METRICS,
+            db_path=os.getenv("ICGL_MONITOR_HISTORY_DB") or None,
+        )
         self.start_time = datetime.now()
         self.alert_thresholds = {
             "cpu": 80.0,  # percent
@@ -100,7 +110,7 @@ Uptime: {self._format_uptime(health.uptime_seconds)}
 """
 
         # Record health snapshot
-        self.health_history.append(health)
+        self._record_health(health)
 
         return AgentResult(
             agent_id=self.agent_id,
@@ -125,16 +135,13 @@ Uptime: {self._format_uptime(health.uptime_seconds)}
         health = HealthStatus()
 
         try:
-            # CPU usage
-            health.cpu_percent = psutil.cpu_percent(interval=1)
-
-            # Memory usage
-            memory = psutil.virtual_memory()
-            health.memory_percent = memory.percent
-
-            # Disk usage
-            disk = psutil.disk_usage("/")
-            health.disk_percent = disk.percent
+            # CPU / memory / disk from the background sampler (instant, no blocking syscalls)
+            reading = get_system_sampler().snapshot()
+            if not reading:
+                raise RuntimeError(get_system_sampler().stats().get("last_error") or "no telemetry reading")
+            health.cpu_percent = reading["cpu_percent"]
+            health.memory_percent = reading["memory_percent"]
+            health.disk_percent = reading["disk_percent"]
 
             # Uptime
             uptime = datetime.now() - self.start_time
@@ -250,32 +257,44 @@ Provide a brief assessment (2-3 sentences) of:
 
         return "\n".join(issues)
 
+    def _record_health(self, health: HealthStatus) -> None:
+        self.health_history.record(
+            {
+                "cpu_percent": health.cpu_percent,
+                "memory_percent": health.memory_percent,
+                "disk_percent": health.disk_percent,
+                "issues": len(health.issues),
+                "status": STATUS_CODES.get(health.status, -1),
+            }
+        )
+
     def get_health_report(self, hours: int = 24) -> Dict[str, Any]:
         """Generate health report for the last N hours."""
-        cutoff = datetime.now() - timedelta(hours=hours)
-        recent_health = [h for h in self.health_history if datetime.fromisoformat(h.timestamp) > cutoff]
+        seconds = hours * 3600
+        cpu = self.health_history.trend("cpu_percent", seconds)
 
-        if not recent_health:
+        if not cpu.get("samples"):
             return {
                 "period": f"Last {hours} hours",
                 "data_points": 0,
                 "message": "No data available",
             }
 
-        # Calculate averages
-        avg_cpu = sum(h.cpu_percent for h in recent_health) / len(recent_health)
-        avg_memory = sum(h.memory_percent for h in recent_health) / len(recent_health)
-
-        # Count issues
-        total_issues = sum(len(h.issues) for h in recent_health)
+        memory = self.health_history.trend("memory_percent", seconds)
+        issues = self.health_history.trend("issues", seconds)
+        last = self.health_history.last() or {}
+        status_names = {code: name for name, code in STATUS_CODES.items()}
 
         return {
             "period": f"Last {hours} hours",
-            "data_points": len(recent_health),
-            "avg_cpu_percent": round(avg_cpu, 2),
-            "avg_memory_percent": round(avg_memory, 2),
-            "total_issues": total_issues,
-            "current_status": recent_health[-1].status if recent_health else "unknown",
+            "data_points": cpu["samples"],
+            "avg_cpu_percent": round(cpu["mean"], 2),
+            "avg_memory_percent": round(memory.get("mean", 0.0), 2),
+            "total_issues": int(round(issues.get("mean", 0.0) * issues.get("samples", 0))),
+            "current_status": status_names.get(int(last.get("status", -1)), "unknown"),
+            "cpu_trend_per_hour": cpu["slope_per_hour"],
+            "memory_trend_per_hour": memory.get("slope_per_hour", 0.0),
+            "cpu_anomalies": self.health_history.anomalies("cpu_percent", seconds)[-5:],
         }
 
     def set_alert_threshold(self, metric: str, threshold: float) -> bool:
@@ -287,9 +306,14 @@ Provide a brief assessment (2-3 sentences) of:
 
     def get_current_metrics(self) -> Dict[str, float]:
         """Get current resource metrics."""
+        reading = get_system_sampler().snapshot()
         return {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_percent": psutil.disk_usage("/").percent,
+            "cpu_percent": reading.get("cpu_percent", 0.0),
+            "memory_percent": reading.get("memory_percent", 0.0),
+            "disk_percent": reading.get("disk_percent", 0.0),
             "uptime_seconds": (datetime.now() - self.start_time).total_seconds(),
         }
+
+    def get_metric_trends(self, seconds: float = 60.0) -> Dict[str, Any]:
+        """Short-window aggregates (avg/min/max, IO rates) from the background sampler."""
+        return get_system_sampler().aggregate(seconds)
@@ -7,7 +7,7 @@ Automated test generation agent for comprehensive code testing.
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
 from src.core.kb.schemas import FileChange
-from src.core.llm.client import LLMClient, LLMConfig
+from src.core.llm.client import LLMConfig
 from src.core.llm.prompts import TESTING_SYSTEM_PROMPT
 
 
@@ -20,7 +20,6 @@ class TestingAgent(Agent):
 
     def __init__(self, llm_provider=None):
         super().__init__(agent_id="agent-testing", role=AgentRole.TESTING, llm_provider=llm_provider)
-        self.llm_client = LLMClient()
 
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         """
@@ -65,17 +64,16 @@ class TestingAgent(Agent):
 
         # Configure LLM
         config = LLMConfig(
-            model="gpt-4-turbo-preview",
             temperature=0.2,  # Slightly higher for test creativity
             json_mode=True,
             timeout=60.0,
         )
 
-        if not self.llm_client.api_key:
+        if not self.llm:
             return self._fallback_result("Missing API Key for Testing.")
 
         # Generate tests
-        raw_json = await self.llm_client.generate_json(
+        raw_json, _ = await self._generate_json(
             system_prompt=TESTING_SYSTEM_PROMPT, user_prompt=user_prompt, config=config
         )
 
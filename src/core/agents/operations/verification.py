@@ -6,7 +6,7 @@ Comprehensive code verification agent for deep analysis beyond basic syntax chec
 """
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
-from src.core.llm.client import LLMClient, LLMConfig
+from src.core.llm.client import LLMConfig
 from src.core.llm.prompts import VERIFICATION_SYSTEM_PROMPT
 
 
@@ -23,7 +23,6 @@ class VerificationAgent(Agent):
             role=AgentRole.VERIFICATION,
             llm_provider=llm_provider,
         )
-        self.llm_client = LLMClient()
 
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         """
@@ -63,17 +62,16 @@ class VerificationAgent(Agent):
 
         # Configure LLM
         config = LLMConfig(
-            model="gpt-4-turbo-preview",
             temperature=0.1,  # Low for consistency
             json_mode=True,
             timeout=60.0,
         )
 
-        if not self.llm_client.api_key:
+        if not self.llm:
             return self._fallback_result("Missing API Key for Verification.")
 
         # Call LLM
-        raw_json = await self.llm_client.generate_json(
+        raw_json, _ = await self._generate_json(
             system_prompt=VERIFICATION_SYSTEM_PROMPT,
             user_prompt=user_prompt,
             config=config,
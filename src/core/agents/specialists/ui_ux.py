@@ -81,14 +81,13 @@ class UIUXAgent(Agent):
         - If changes are needed, explicitly state 'DESIGN MANDATE FOR BUILDER: [details]'.
         """
 
-        from src.core.llm.client import LLMClient, LLMConfig
+        from src.core.llm.client import LLMConfig
         from src.core.llm.prompts import JSONParser
 
-        client = LLMClient()
         config = LLMConfig(temperature=0.2, json_mode=True)
 
         try:
-            raw_json, usage = await client.generate_json(
+            raw_json, usage = await self._generate_json(
                 system_prompt=prompt,  # Using prompt as system here since it's pre-formatted
                 user_prompt=f"Perform UI Audit for: {problem.title}",
                 config=config,
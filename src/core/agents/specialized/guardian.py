@@ -7,8 +7,8 @@ Prevents "Definition Drift".
 """
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
-from src.core.llm.client import LLMClient, LLMConfig
-from src.core.llm.prompts import SPECIALIST_SYSTEM_PROMPT
+from src.core.llm.client import LLMConfig
+from src.core.llm.prompts import SPECIALIST_SYSTEM_PROMPT, SpecialistOutput
 
 
 class ConceptGuardian(Agent):
@@ -20,7 +20,6 @@ class ConceptGuardian(Agent):
 
     def __init__(self, llm_provider=None):
         super().__init__(agent_id="agent-guardian", role=AgentRole.GUARDIAN)
-        self.llm_client = LLMClient()
 
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         # 1. Recall Relevant Concepts
@@ -39,20 +38,17 @@ class ConceptGuardian(Agent):
 
         # 4. Execute Analysis with Safety
         try:
-            raw_json, usage = await self.llm_client.generate_json(
-                system_prompt=SPECIALIST_SYSTEM_PROMPT,
-                user_prompt=(
+            parsed, _ = await self._ask_llm_structured(
+                prompt=(
                     f"You are the Concept Guardian. Analyze this Intent Contract for semantic integrity:\n\n"
                     f"{context}\n\n"
                     f"Does this proposal redefine existing concepts? Does it introduce 'Definition Drift'?"
                 ),
+                system_prompt=SPECIALIST_SYSTEM_PROMPT,
+                output_type=SpecialistOutput,
+                on_field=self._publish_field(problem),
                 config=config,
             )
-
-            # Update Budget Tracking
-            current_tokens = problem.metadata.get("total_tokens", 0)
-            problem.metadata["total_tokens"] = current_tokens + usage.get("total_tokens", 0)
-            problem.metadata["last_agent_tokens"] = usage.get("total_tokens", 0)
         except Exception as e:
             return AgentResult(
                 agent_id=self.agent_id,
@@ -66,16 +62,16 @@ class ConceptGuardian(Agent):
         return AgentResult(
             agent_id=self.agent_id,
             role=self.role,
-            analysis=raw_json.get("analysis", ""),
-            recommendations=raw_json.get("recommendations", []),
-            concerns=raw_json.get("concerns", []),
-            confidence=raw_json.get("confidence", 0.9),
-            understanding=raw_json.get("understanding"),  # Layer 2
-            risk_pre_mortem=raw_json.get("risk_pre_mortem", []),  # Layer 4
-            trigger=raw_json.get("trigger"),
-            impact=raw_json.get("impact"),
-            risks_structured=raw_json.get("risks_structured", []),
-            alternatives=raw_json.get("alternatives", []),
-            effort=raw_json.get("effort"),
-            execution_plan=raw_json.get("execution_plan"),
+            analysis=parsed.analysis,
+            recommendations=parsed.recommendations,
+            concerns=parsed.concerns,
+            confidence=parsed.confidence or 0.9,
+            understanding=parsed.understanding,  # Layer 2
+            risk_pre_mortem=parsed.risk_pre_mortem,  # Layer 4
+            trigger=parsed.trigger,
+            impact=parsed.impact,
+            risks_structured=parsed.risks_structured,
+            alternatives=parsed.alternatives,
+            effort=parsed.effort,
+            execution_plan=parsed.execution_plan,
         )
@@ -8,9 +8,8 @@ Responsible for architectural safety, real-time metrics, and drift monitoring.
 
 from typing import Any, Optional
 
-import psutil
-
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
+from src.core.core.telemetry import get_system_sampler
 
 
 class GuardianSentinelAgent(Agent):
@@ -44,14 +43,22 @@ class GuardianSentinelAgent(Agent):
                 justification="Current scope is limited to local system resources (CPU/Mem/Disk). Network issues remain 'blind spots' for the Sentinel.",
             )
 
-        # 1. Operational Check (Performance Guard)
-        cpu = psutil.cpu_percent(interval=0.1)
-        mem = psutil.virtual_memory().percent
-        disk = psutil.disk_usage("/").percent
+        # 1. Operational Check (Performance Guard) — readings from the background sampler, no blocking syscalls
+        sampler = get_system_sampler()
+        reading = sampler.snapshot()
+        trend = sampler.aggregate(60)
+        cpu = reading.get("cpu_percent", 0.0)
+        mem = reading.get("memory_percent", 0.0)
+        disk = reading.get("disk_percent", 0.0)
 
         # IO Stats
-        io = psutil.disk_io_counters()
-        io_report = f"Read: {io.read_bytes / 1024 / 1024:.1f}MB, Write: {io.write_bytes / 1024 / 1024:.1f}MB"
+        io_report = (
+            f"Read: {reading.get('io_read_bytes', 0) / 1024 / 1024:.1f}MB, "
+            f"Write: {reading.get('io_write_bytes', 0) / 1024 / 1024:.1f}MB"
+        )
+        cpu_trend = trend.get("cpu_percent", {})
+        if cpu_trend:
+            io_report += f" | CPU last {trend['window_seconds']:.0f}s: avg {cpu_trend['avg']}% / max {cpu_trend['max']}%"
 
         # 2. Risk Detection Thresholds
         concerns = []
@@ -18,7 +18,7 @@ from typing import Optional
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
 from src.core.kb.docs_schemas import DocumentSnapshot, RewritePlan
 from src.core.kb.schemas import now
-from src.core.llm.client import LLMClient, LLMConfig
+from src.core.llm.client import LLMConfig
 from src.core.llm.prompts import DOCUMENTATION_SYSTEM_PROMPT
 from src.core.utils.logging_config import get_logger
 
@@ -48,7 +48,6 @@ class DocumentationAgent(Agent):
             role=AgentRole.DOCUMENTATION,
             llm_provider=llm_provider,
         )
-        self.llm_client = LLMClient()
         logger.info("DocumentationAgent initialized")
 
     async def analyze_docs(self, snapshot: DocumentSnapshot, focus_areas: Optional[list[str]] = None) -> RewritePlan:
@@ -69,7 +68,7 @@ class DocumentationAgent(Agent):
         logger.info(f"Analyzing {snapshot.total_files} documentation files")
 
         # Check API key
-        if not self.llm_client.api_key:
+        if not self.llm:
             raise ValueError("OPENAI_API_KEY not set - cannot run DocumentationAgent")
 
         # Build context from snapshot
@@ -152,10 +151,9 @@ Generate COMPLETE, DETAILED, PROFESSIONAL content as JSON.
 
         # LLM configuration
         config = LLMConfig(
-            model="gpt-4-turbo-preview",
             temperature=0.2,  # Low temp for consistency
             json_mode=True,
-            max_tokens=4096,  # Maximum for this model
+            max_tokens=4096,  # Full rewrite plans are long
             timeout=120.0,  # Large docs need more time
         )
 
@@ -163,7 +161,7 @@ Generate COMPLETE, DETAILED, PROFESSIONAL content as JSON.
 
         try:
             # Generate analysis
-            raw_json = await self.llm_client.generate_json(
+            raw_json, _ = await self._generate_json(
                 system_prompt=DOCUMENTATION_SYSTEM_PROMPT,
                 user_prompt=user_prompt,
                 config=config,
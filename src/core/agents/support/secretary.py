@@ -7,7 +7,10 @@ and executive leadership, managing coordination, event logging, and stakeholder
 communication.
 """
 
-from typing import Any, Dict, List, Optional
+import os
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 
 from src.core.agents.core.base import Agent, AgentResult, AgentRole, Problem
 from src.core.kb.schemas import now
@@ -61,14 +64,10 @@ class SecretaryAgent(Agent):
             role=AgentRole.SECRETARY,
             llm_provider=llm_provider,
         )
-        self.relay_log: List[RelayLogEntry] = []
+        # Bounded relay log: the oldest entries fall off in O(1)
+        self.relay_log: Deque[RelayLogEntry] = deque(maxlen=int(os.getenv("ICGL_RELAY_LOG_SIZE", 100)))
         self.active_coordinations: Dict[str, Dict[str, Any]] = {}
 
-        # Cycle 14: Use Real LLM for Native Understanding
-        from src.core.llm.client import LLMClient
-
-        self.llm_client = LLMClient()
-
     async def _analyze(self, problem: Problem, kb) -> AgentResult:
         """
         Native Understanding Layer (Cycle 14) + Relay Logging.
@@ -90,11 +89,14 @@ class SecretaryAgent(Agent):
                 confidence=1.0,
             )
 
+        from src.core.llm.context_assembly import agent_input_budget, estimate_tokens, fit_text
         from src.core.llm.prompts import SECRETARY_SYSTEM_PROMPT
 
-        # 1. Ask LLM for Interpretation
+        # 1. Ask LLM for Interpretation (context fitted to the Secretary's small input budget)
+        context_budget = agent_input_budget(self.role.value) - estimate_tokens(SECRETARY_SYSTEM_PROMPT)
+        context_budget -= estimate_tokens(problem.title) + 16
         response_json = await self._ask_llm_json(
-            prompt=f"User Input: {problem.title}\nContext: {problem.context}",
+            prompt=f"User Input: {problem.title}\nContext: {fit_text(problem.context, max(context_budget, 64))}",
             system_prompt=SECRETARY_SYSTEM_PROMPT,
         )
 
@@ -138,14 +140,13 @@ class SecretaryAgent(Agent):
         )
 
     async def _ask_llm_json(self, prompt: str, system_prompt: str) -> Dict[str, Any]:
-        """Helper for JSON responses using Real LLMClient."""
+        """JSON-mode helper; routed through the shared provider chain as the secretary role."""
         from src.core.llm.client import LLMConfig
 
-        config = LLMConfig(model="gpt-4-turbo-preview", temperature=0.3, timeout=30.0, json_mode=True)
+        config = LLMConfig(temperature=0.3, timeout=30.0, json_mode=True)
 
         try:
-            # Use the real LLM Client directly
-            result, usage = await self.llm_client.generate_json(
+            result, usage = await self._generate_json(
                 system_prompt=system_prompt, user_prompt=prompt, config=config
             )
 
@@ -273,13 +274,9 @@ Rules:
         )
         self.relay_log.append(entry)
 
-        # Keep only last 100 entries to prevent memory bloat
-        if len(self.relay_log) > 100:
-            self.relay_log = self.relay_log[-100:]
-
     def get_executive_report(self, last_n_events: int = 10) -> str:
         """Generate executive report from recent relay log entries."""
-        recent_entries = self.relay_log[-last_n_events:]
+        recent_entries = list(islice(reversed(self.relay_log), last_n_events))[::-1]
 
         if not recent_entries:
             return "No recent events to report."
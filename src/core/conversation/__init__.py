@@ -1,11 +1,72 @@
+from typing import Any, AsyncIterator, Optional
+
+CHAT_SYSTEM_PROMPT = (
+    "You are the ICGL governance assistant. Answer the operator concisely and accurately. "
+    "Never claim a decision was approved unless a human signature exists."
+)
+
+# Number of previous turns replayed into the prompt for context
+CHAT_HISTORY_TURNS = 6
+
+
 class ConversationOrchestrator:
     def __init__(self, get_engine_fn, run_task_fn):
         self.composer = self
+        self.get_engine_fn = get_engine_fn
+        self.run_task_fn = run_task_fn
 
     async def handle(self, request):
         from ..chat.schemas import ChatResponse
 
         return ChatResponse(messages=[{"role": "assistant", "content": "System is recovering..."}])
 
+    async def stream(self, request) -> AsyncIterator[Any]:
+        """
+        Streams the assistant reply as token chunks (str) as they arrive from the LLM.
+        Falls back to the buffered `handle` path when no streaming provider is available;
+        that path also yields the blocks of its assistant messages (any non-str item).
+        """
+        provider = self._llm_provider()
+        if provider is None:
+            response = await self.handle(request)
+            for msg in response.messages:
+                field = msg.get if isinstance(msg, dict) else lambda name: getattr(msg, name, None)
+                if field("role") not in (None, "assistant"):
+                    continue
+                if field("content"):
+                    yield field("content")
+                for block in field("blocks") or []:
+                    yield block
+            return
+
+        from ..core.llm import LLMRequest
+        from ..governance.budget import Priority
+
+        llm_request = LLMRequest(
+            prompt=self._build_prompt(request),
+            system_prompt=CHAT_SYSTEM_PROMPT,
+            # Chat is interactive: it is admitted ahead of council and batch traffic
+            metadata={"priority": Priority.INTERACTIVE, "agent_id": "chat"},
+        )
+        async for chunk in provider.generate_stream(llm_request):
+            yield chunk
+
+    def _llm_provider(self) -> Optional[Any]:
+        try:
+            engine = self.get_engine_fn()
+        except Exception:
+            return None
+        registry = getattr(engine, "registry", None)
+        provider = registry.get_llm_provider() if registry and hasattr(registry, "get_llm_provider") else None
+        return provider if provider is not None and hasattr(provider, "generate_stream") else None
+
+    def _build_prompt(self, request) -> str:
+        lines = []
+        for turn in (request.history or [])[-CHAT_HISTORY_TURNS:]:
+            if isinstance(turn, dict) and turn.get("content"):
+                lines.append(f"{turn.get('role', 'user')}: {turn['content']}")
+        lines.append(f"user: {request.message}")
+        return "\n".join(lines)
+
     def error(self, msg):
         return {"error": msg}
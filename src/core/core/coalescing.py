@@ -0,0 +1,174 @@
+"""
+ICGL Core — Single-Flight LLM Coalescing
+========================================
+
+"Ask once, answer everyone."
+When several agents (or concurrent governance cycles) issue the exact same
+generation request at the same moment, only one call reaches the network.
+Every other caller awaits the shared in-flight result.
+
+Cancellation semantics:
+- Each caller awaits a shielded view of the shared call, so cancelling one
+  caller (including the one that started the call) never cancels the others.
+- The underlying call is only cancelled once every waiter has given up.
+
+Callers that joined another caller's call get a copy of the response with
+`coalesced=True`. Put this layer inside the GovernedProvider: every caller is
+then admitted at its own priority, and its share of the usage is attributed to
+its own agent and ADR without booking the rate window twice.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from .llm import LLMProvider, LLMRequest, LLMResponse
+
+
+def request_key(request: LLMRequest) -> str:
+    """Stable identity of a generation request (everything that shapes the output)."""
+    payload = json.dumps(
+        [
+            request.system_prompt,
+            request.prompt,
+            request.temperature,
+            request.max_tokens,
+            list(request.stop_sequences),
+            request.json_mode,
+            # The role can select a different model when routing is enabled
+            request.agent_role,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    """A single in-flight generation shared by one or more waiters."""
+
+    __slots__ = ("key", "task", "waiters", "started_at")
+
+    def __init__(self, key: str, task: "asyncio.Task[LLMResponse]"):
+        self.key = key
+        self.task = task
+        self.waiters = 0
+        self.started_at = time.time()
+
+
+class CoalescingProvider(LLMProvider):
+    """
+    Single-flight layer in front of another LLMProvider.
+
+    Usage:
+        provider = CoalescingProvider(OpenAIProvider())
+        response = await provider.generate(request)  # duplicates share one call
+    """
+
+    def __init__(self, inner: LLMProvider):
+        self.inner = inner
+        self._flights: Dict[str, _Flight] = {}
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "leaders": 0,
+            "coalesced": 0,
+            "cancelled_waiters": 0,
+            "abandoned_flights": 0,
+            "max_waiters": 0,
+            "batch_deduplicated": 0,
+        }
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        key = request_key(request)
+        self._stats["requests"] += 1
+
+        flight = self._flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = self._start_flight(key, request)
+            self._stats["leaders"] += 1
+        else:
+            self._stats["coalesced"] += 1
+
+        flight.waiters += 1
+        self._stats["max_waiters"] = max(self._stats["max_waiters"], flight.waiters)
+
+        try:
+            response = await asyncio.shield(flight.task)
+            return response if leader else dataclasses.replace(response, coalesced=True)
+        except asyncio.CancelledError:
+            self._stats["cancelled_waiters"] += 1
+            raise
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller gave up: nobody is left to consume the result. Unregister
+                # first, so a caller arriving in the same tick starts a fresh flight.
+                self._stats["abandoned_flights"] += 1
+                if self._flights.get(flight.key) is flight:
+                    del self._flights[flight.key]
+                flight.task.cancel()
+
+    async def generate_many(
+        self, requests: Sequence[LLMRequest], max_concurrency: Optional[int] = None
+    ) -> List[Union[LLMResponse, Exception]]:
+        """
+        Duplicates inside one batch are collapsed before submission, so they never
+        occupy more than one concurrency slot; every position still gets its result.
+        """
+        unique: Dict[str, int] = {}
+        batch: List[LLMRequest] = []
+        positions: List[int] = []
+        for request in requests:
+            key = request_key(request)
+            if key not in unique:
+                unique[key] = len(batch)
+                batch.append(request)
+            positions.append(unique[key])
+
+        self._stats["batch_deduplicated"] += len(requests) - len(batch)
+        results = await super().generate_many(batch, max_concurrency=max_concurrency)
+        return [results[i] for i in positions]
+
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Streams are consumed incrementally by a single caller, so they are never coalesced."""
+        async for chunk in self.inner.generate_stream(request):
+            yield chunk
+
+    def _start_flight(self, key: str, request: LLMRequest) -> _Flight:
+        task = asyncio.ensure_future(self.inner.generate(request))
+        flight = _Flight(key, task)
+        self._flights[key] = flight
+
+        def _done(t: "asyncio.Task[LLMResponse]") -> None:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            # Mark the outcome as retrieved; waiters (if any) re-raise it themselves.
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(_done)
+        return flight
+
+    def in_flight(self) -> Dict[str, int]:
+        """Waiter count per in-flight request key."""
+        return {key: flight.waiters for key, flight in self._flights.items()}
+
+    def metrics(self) -> Dict[str, Any]:
+        now_t = time.time()
+        metrics = dict(self.inner.metrics())
+        metrics["coalescing"] = {
+            **self._stats,
+            "in_flight": [
+                {
+                    "key": key[:12],
+                    "waiters": flight.waiters,
+                    "age_ms": round((now_t - flight.started_at) * 1000, 1),
+                }
+                for key, flight in self._flights.items()
+            ],
+        }
+        return metrics
+
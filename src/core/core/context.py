@@ -1,63 +1,354 @@
+"""
+ICGL Core — Repository Map
+==========================
+
+"The Cartographer": maps the repository structure to give agents context.
+
+The tree is scanned once and kept in memory. Afterwards it is kept current
+cheaply:
+- Polling mode compares each scanned directory's mtime, at most once per
+  refresh interval. A directory's mtime changes whenever an entry inside it is
+  created, removed or renamed, which is exactly what the map renders.
+- On Linux with `inotify_simple` installed, kernel events mark directories
+  dirty instead, so no stat walk is needed at all. Watches of directories
+  that are removed or renamed away are dropped with them.
+
+Renderings are cached per (depth, token budget) and tagged with the tree
+version, so on a hot cache a prompt costs one dict lookup. `arender` does
+refreshes and cold builds off the event loop; `cached` only reads the last
+rendering.
+"""
+
+import asyncio
 import os
+import threading
+import time
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.core.llm.context_assembly import estimate_tokens
+
+DEFAULT_IGNORE_DIRS = {
+    ".git",
+    "__pycache__",
+    "venv",
+    ".venv",
+    "node_modules",
+    ".pytest_cache",
+    ".gemini",
+    "dist",
+    "build",
+    ".idea",
+    ".vscode",
+}
+DEFAULT_IGNORE_FILES = {".DS_Store", "package-lock.json", "yarn.lock"}
+
+
+class _DirNode:
+    """One scanned directory: its sorted children and the mtime they were read at."""
+
+    __slots__ = ("path", "mtime_ns", "dirs", "files", "scanned", "wd")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.wd: Optional[int] = None  # inotify watch descriptor
+        self.mtime_ns = 0
+        self.dirs: Dict[str, "_DirNode"] = {}
+        self.files: List[str] = []
+        self.scanned = False
+
+
+class RepoMap:
+    """
+    In-memory, incrementally maintained repository tree.
+
+    Usage:
+        repo_map = get_repo_map()
+        text = repo_map.render(max_depth=3, token_budget=1500)
+    """
+
+    def __init__(
+        self,
+        root_path: str = ".",
+        ignore_dirs: Optional[Set[str]] = None,
+        ignore_files: Optional[Set[str]] = None,
+        refresh_interval: float = 2.0,
+        use_inotify: Optional[bool] = None,
+    ):
+        self.root = Path(root_path).resolve()
+        self.ignore_dirs = set(ignore_dirs if ignore_dirs is not None else DEFAULT_IGNORE_DIRS)
+        self.ignore_files = set(ignore_files if ignore_files is not None else DEFAULT_IGNORE_FILES)
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.RLock()
+        self._root_node = _DirNode(self.root)
+        self._version = 0
+        self._last_check = 0.0
+        self._render_cache: Dict[Tuple[int, Optional[int]], Tuple[int, str]] = {}
+        self._stats = {"scans": 0, "refresh_checks": 0, "renders": 0, "cache_hits": 0}
+
+        self._inotify = None
+        self._watches: Dict[int, _DirNode] = {}
+        if use_inotify is None:
+            use_inotify = os.getenv("ICGL_REPO_MAP_INOTIFY", "1").lower() in {"1", "true", "yes"}
+        if use_inotify:
+            self._init_inotify()
+
+    # --- Change tracking ---
+
+    def _init_inotify(self) -> None:
+        try:
+            from inotify_simple import INotify, flags
+
+            self._inotify = INotify()
+            self._inotify_mask = (
+                flags.CREATE | flags.DELETE | flags.MOVED_FROM | flags.MOVED_TO | flags.DELETE_SELF
+            )
+            self._gone_mask = flags.DELETE_SELF | flags.IGNORED
+        except Exception:
+            # Not Linux, or inotify_simple not installed: mtime polling it is
+            self._inotify = None
+
+    def _watch(self, node: _DirNode) -> None:
+        if self._inotify is None:
+            return
+        try:
+            wd = self._inotify.add_watch(str(node.path), self._inotify_mask)
+            self._watches[wd] = node
+            node.wd = wd
+        except OSError as e:
+            # Typically fs.inotify.max_user_watches exhausted: fall back to polling
+            print(f"[RepoMap] ⚠️ inotify watch failed ({e}); falling back to mtime polling.")
+            self._close_inotify()
+
+    def _unwatch(self, node: _DirNode) -> None:
+        """Drops the watches of a directory that left the tree, and of its subtree."""
+        if node.wd is not None:
+            self._watches.pop(node.wd, None)
+            if self._inotify is not None:
+                try:
+                    self._inotify.rm_watch(node.wd)
+                except OSError:
+                    pass  # Already removed by the kernel along with the directory
+            node.wd = None
+        for child in node.dirs.values():
+            self._unwatch(child)
+
+    def _close_inotify(self) -> None:
+        if self._inotify is not None:
+            try:
+                self._inotify.close()
+            except Exception:
+                pass
+        self._inotify = None
+        for node in self._watches.values():
+            node.wd = None
+        self._watches.clear()
+
+    def _drain_inotify(self) -> bool:
+        """Applies pending kernel events. Returns False if inotify is unavailable."""
+        if self._inotify is None:
+            return False
+        try:
+            events = self._inotify.read(timeout=0)
+        except Exception:
+            self._close_inotify()
+            return False
+        for event in events:
+            node = self._watches.get(event.wd)
+            if node is None:
+                continue
+            if event.mask & self._gone_mask:
+                # The watched directory itself is gone; its parent's event updates the listing
+                self._watches.pop(event.wd, None)
+                node.wd = None
+            elif node.scanned:
+                self._rescan(node)
+        return True
+
+    def _poll_mtimes(self, node: _DirNode) -> None:
+        if not node.scanned:
+            return
+        try:
+            mtime_ns = os.stat(node.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns != node.mtime_ns:
+            self._rescan(node)
+        for child in list(node.dirs.values()):
+            self._poll_mtimes(child)
+
+    def refresh(self, force: bool = False) -> None:
+        """Brings the in-memory tree up to date with the filesystem."""
+        with self._lock:
+            if not self._root_node.scanned:
+                self._scan(self._root_node)
+                return
+            if self._drain_inotify():
+                return
+            now_t = time.monotonic()
+            if not force and now_t - self._last_check < self.refresh_interval:
+                return
+            self._last_check = now_t
+            self._stats["refresh_checks"] += 1
+            self._poll_mtimes(self._root_node)
+
+    # --- Scanning ---
+
+    def _scan(self, node: _DirNode) -> None:
+        """Reads one directory (no recursion; children are scanned on demand)."""
+        dirs: Dict[str, _DirNode] = {}
+        files: List[str] = []
+        try:
+            node.mtime_ns = os.stat(node.path).st_mtime_ns
+            with os.scandir(node.path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name in self.ignore_dirs or name in self.ignore_files:
+                        continue
+                    if name.startswith("."):  # Ignore hidden files generally
+                        continue
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        # Keep already-scanned subtrees; only the listing changed
+                        dirs[name] = node.dirs.get(name) or _DirNode(Path(entry.path))
+                    else:
+                        files.append(name)
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            pass
+
+        for name, child in node.dirs.items():
+            if dirs.get(name) is not child:
+                self._unwatch(child)
+        node.dirs = {name: dirs[name] for name in sorted(dirs)}
+        node.files = sorted(files)
+        if not node.scanned:
+            self._watch(node)
+        node.scanned = True
+        self._stats["scans"] += 1
+
+    def _rescan(self, node: _DirNode) -> None:
+        self._scan(node)
+        self._version += 1
+
+    def _ensure_scanned(self, node: _DirNode, depth: int, max_depth: int) -> None:
+        if depth > max_depth:
+            return
+        if not node.scanned:
+            self._scan(node)
+        for child in node.dirs.values():
+            self._ensure_scanned(child, depth + 1, max_depth)
+
+    # --- Rendering ---
+
+    def _render_lines(self, node: _DirNode, depth: int, max_depth: int, lines: List[str]) -> None:
+        if depth > max_depth:
+            return
+        indent = "  " * (depth + 1)
+        for name, child in node.dirs.items():
+            lines.append(f"{indent}📂 {name}/")
+            self._render_lines(child, depth + 1, max_depth, lines)
+        # Files only above the depth limit, to keep token usage down
+        if depth < max_depth:
+            for name in node.files:
+                lines.append(f"{indent}📄 {name}")
+
+    def render(self, max_depth: int = 3, token_budget: Optional[int] = None) -> str:
+        """
+        Tree-like rendering of the repo.
+
+        When the full map at `max_depth` exceeds `token_budget`, shallower depths are
+        tried first (a complete shallow map beats a truncated deep one); as a last
+        resort the listing is cut with an explicit marker.
+        """
+        self.refresh()
+        key = (max_depth, token_budget)
+        with self._lock:
+            cached = self._render_cache.get(key)
+            if cached is not None and cached[0] == self._version:
+                self._stats["cache_hits"] += 1
+                return cached[1]
+
+            self._stats["renders"] += 1
+            self._ensure_scanned(self._root_node, 0, max_depth)
+            text = self._render_budgeted(max_depth, token_budget)
+            self._render_cache[key] = (self._version, text)
+            return text
+
+    async def arender(self, max_depth: int = 3, token_budget: Optional[int] = None) -> str:
+        """Async `render`: cold builds and refresh checks run off the event loop."""
+        return await asyncio.to_thread(self.render, max_depth, token_budget)
+
+    def cached(self, max_depth: int = 3, token_budget: Optional[int] = None) -> Optional[str]:
+        """Last rendering for (depth, budget), possibly stale; never touches the filesystem."""
+        with self._lock:
+            cached = self._render_cache.get((max_depth, token_budget))
+            return cached[1] if cached is not None else None
+
+    def _render_budgeted(self, max_depth: int, token_budget: Optional[int]) -> str:
+        lines: List[str] = []
+        for depth in range(max_depth, -1, -1):
+            lines = ["PROJECT ROOT"]
+            self._render_lines(self._root_node, 0, depth, lines)
+            text = "\n".join(lines)
+            if token_budget is None or estimate_tokens(text) <= token_budget:
+                return text
+
+        # Even the top level is too large: cut deterministically
+        kept: List[str] = []
+        used = 0
+        for line in lines:
+            cost = estimate_tokens(line + "\n")
+            if used + cost > token_budget:
+                break
+            kept.append(line)
+            used += cost
+        kept.append(f"  … ({len(lines) - len(kept)} more entries)")
+        return "\n".join(kept)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                **self._stats,
+                "version": self._version,
+                "mode": "inotify" if self._inotify is not None else "mtime",
+                "cached_renderings": len(self._render_cache),
+            }
+
+
+_repo_maps: Dict[Path, RepoMap] = {}
+_repo_maps_lock = threading.Lock()
+
+
+def get_repo_map(root_path: str = ".") -> RepoMap:
+    """Shared RepoMap per root, so every agent reads the same in-memory tree."""
+    root = Path(root_path).resolve()
+    with _repo_maps_lock:
+        repo_map = _repo_maps.get(root)
+        if repo_map is None:
+            repo_map = RepoMap(
+                str(root),
+                refresh_interval=float(os.getenv("ICGL_REPO_MAP_REFRESH", 2.0)),
+            )
+            _repo_maps[root] = repo_map
+        return repo_map
+
 
 class ContextBuilder:
     """
     The Cartographer: Maps the repository structure to provide context to Agents.
+    Thin facade over the shared RepoMap.
     """
-    
+
     def __init__(self, root_path: str = "."):
-        self.root = Path(root_path).resolve()
-        self.ignore_dirs = {
-            ".git", "__pycache__", "venv", ".venv", "node_modules", 
-            ".pytest_cache", ".gemini", "dist", "build", ".idea", ".vscode"
-        }
-        self.ignore_files = {
-            ".DS_Store", "package-lock.json", "yarn.lock"
-        }
-
-    def generate_map(self, max_depth: int = 3) -> str:
+        self.repo_map = get_repo_map(root_path)
+        self.root = self.repo_map.root
+
+    def generate_map(self, max_depth: int = 3, token_budget: Optional[int] = None) -> str:
         """
         Generates a tree-like string representation of the repo.
         """
-        lines = ["PROJECT ROOT"]
-        self._scan_dir(self.root, 0, max_depth, lines)
-        return "\n".join(lines)
-
-    def _scan_dir(self, current_path: Path, depth: int, max_depth: int, lines: List[str]):
-         if depth > max_depth:
-             return
-             
-         try:
-             # Sort: Dirs first, then files
-             items = sorted(os.listdir(current_path))
-             dirs = []
-             files = []
-             
-             for item in items:
-                 if item in self.ignore_dirs or item in self.ignore_files:
-                     continue
-                 if item.startswith("."): # Ignore hidden files generally
-                     continue
-                     
-                 full_path = current_path / item
-                 if full_path.is_dir():
-                     dirs.append(item)
-                 else:
-                     files.append(item)
-            
-             # Process Dirs
-             for d in dirs:
-                 indent = "  " * (depth + 1)
-                 lines.append(f"{indent}📂 {d}/")
-                 self._scan_dir(current_path / d, depth + 1, max_depth, lines)
-                 
-             # Process Files (only if not too deep to optimize token usage)
-             if depth < max_depth:
-                 for f in files:
-                     indent = "  " * (depth + 1)
-                     lines.append(f"{indent}📄 {f}")
-                     
-         except PermissionError:
-             pass
+        return self.repo_map.render(max_depth=max_depth, token_budget=token_budget)
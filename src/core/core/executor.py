@@ -0,0 +1,259 @@
+"""
+ICGL Core — Work Executor
+=========================
+
+Runs blocking agent work off the event loop.
+
+- `run_io`: thread pool for blocking I/O (file reads, directory scans).
+- `run_cpu`: process pool for CPU-heavy work (AST parsing, validation), so it
+  scales across cores instead of contending for the GIL. Functions and
+  arguments must be picklable (module-level functions).
+- Each pool admits at most `workers` tasks at a time. Up to `max_queue`
+  further callers wait for a slot; beyond that, `ExecutorSaturated` is
+  raised right away (backpressure instead of an unbounded backlog).
+- Every task has a timeout (`ExecutorTimeout`). A timed-out task that is
+  already running cannot be interrupted; its slot is freed once it finishes.
+- `metrics()` reports in-flight and queued tasks, outcomes, mean task time
+  and utilisation per pool.
+
+Configuration (env):
+    ICGL_EXECUTOR_IO_WORKERS   thread pool size (default min(32, cpus + 4))
+    ICGL_EXECUTOR_CPU_WORKERS  process pool size (default cpus)
+    ICGL_EXECUTOR_QUEUE        callers allowed to wait per pool (64)
+    ICGL_EXECUTOR_TIMEOUT      default per-task timeout in seconds (30)
+    ICGL_EXECUTOR_PROCESSES    "0" runs CPU work on threads instead of processes
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+class ExecutorSaturated(RuntimeError):
+    """Raised when a pool's wait queue is full."""
+
+
+class ExecutorTimeout(TimeoutError):
+    """Raised when a task exceeds its timeout."""
+
+
+class _Pool:
+    """One bounded pool: admission slots, wait queue and counters."""
+
+    def __init__(self, name: str, workers: int, max_queue: int, factory: Callable[[], Executor]):
+        self.name = name
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._factory = factory
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiting = 0
+        self._waiters: "list[asyncio.Future[None]]" = []
+        self._handed: "set[asyncio.Future[None]]" = set()
+        self._started = time.monotonic()
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "rejected": 0,
+            "peak_in_flight": 0,
+            "peak_queued": 0,
+        }
+        self._busy_seconds = 0.0
+
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._factory()
+            return self._executor
+
+    # --- Admission (loop-agnostic: waiters are futures of their own loop) ---
+
+    async def _acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < self.workers:
+                self._take()
+                return
+            if self._waiting >= self.max_queue:
+                self._stats["rejected"] += 1
+                raise ExecutorSaturated(
+                    f"{self.name} pool saturated ({self.workers} running, {self._waiting} queued)"
+                )
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            self._waiting += 1
+            self._stats["peak_queued"] = max(self._stats["peak_queued"], self._waiting)
+        try:
+            await waiter  # the slot is handed over by _release
+        except BaseException:
+            with self._lock:
+                handed = waiter in self._handed
+                self._handed.discard(waiter)
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    self._waiting -= 1
+            if handed:
+                # Slot was handed over concurrently with cancellation: give it back
+                self._release()
+            raise
+        with self._lock:
+            self._handed.discard(waiter)
+
+    def _take(self) -> None:
+        self._in_flight += 1
+        self._stats["peak_in_flight"] = max(self._stats["peak_in_flight"], self._in_flight)
+
+    def _release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.pop(0)
+                self._waiting -= 1
+                if waiter.done():
+                    continue
+                # Hand the slot straight to the next waiter (in_flight unchanged)
+                self._handed.add(waiter)
+                waiter.get_loop().call_soon_threadsafe(_grant, waiter)
+                return
+            self._in_flight -= 1
+
+    # --- Execution ---
+
+    async def run(self, fn: Callable[..., Any], args: tuple, timeout: Optional[float]) -> Any:
+        await self._acquire()
+        with self._lock:
+            self._stats["submitted"] += 1
+        started = time.monotonic()
+        try:
+            future = self.executor().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+
+        def _done(_f) -> None:
+            with self._lock:
+                self._busy_seconds += time.monotonic() - started
+                if _f.cancelled() or _f.exception() is not None:
+                    self._stats["failed"] += 1
+                else:
+                    self._stats["completed"] += 1
+            self._release()
+
+        # The slot is held until the worker actually finishes, even after a timeout
+        future.add_done_callback(_done)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            with self._lock:
+                self._stats["timed_out"] += 1
+            raise ExecutorTimeout(f"{getattr(fn, '__name__', fn)} exceeded {timeout}s on the {self.name} pool")
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            uptime = max(1e-9, time.monotonic() - self._started)
+            done = self._stats["completed"] + self._stats["failed"]
+            return {
+                **self._stats,
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": self._waiting,
+                "mean_task_ms": round(1000 * self._busy_seconds / done, 2) if done else 0.0,
+                "utilization": round(min(1.0, self._busy_seconds / (self.workers * uptime)), 4),
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _grant(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class WorkExecutor:
+    """
+    Async front-end over a thread pool (I/O) and a process pool (CPU).
+
+    Usage:
+        executor = get_executor()
+        issues = await executor.run_cpu(verify_python_sources, files, timeout=10)
+        hints = await executor.run_io(scan_patterns, "src/core")
+    """
+
+    def __init__(
+        self,
+        io_workers: Optional[int] = None,
+        cpu_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        default_timeout: Optional[float] = None,
+        use_processes: Optional[bool] = None,
+    ):
+        cpus = os.cpu_count() or 1
+        io_workers = io_workers or int(os.getenv("ICGL_EXECUTOR_IO_WORKERS", min(32, cpus + 4)))
+        cpu_workers = cpu_workers or int(os.getenv("ICGL_EXECUTOR_CPU_WORKERS", cpus))
+        max_queue = max_queue if max_queue is not None else int(os.getenv("ICGL_EXECUTOR_QUEUE", 64))
+        self.default_timeout = (
+            default_timeout if default_timeout is not None else float(os.getenv("ICGL_EXECUTOR_TIMEOUT", 30.0))
+        )
+        if use_processes is None:
+            use_processes = os.getenv("ICGL_EXECUTOR_PROCESSES", "1").lower() in {"1", "true", "yes"}
+        self.use_processes = use_processes
+
+        self.io = _Pool(
+            "io", io_workers, max_queue, lambda: ThreadPoolExecutor(io_workers, thread_name_prefix="icgl-io")
+        )
+        self.cpu = _Pool("cpu", cpu_workers, max_queue, self._cpu_factory(cpu_workers))
+
+    def _cpu_factory(self, workers: int) -> Callable[[], Executor]:
+        def factory() -> Executor:
+            if self.use_processes:
+                try:
+                    return ProcessPoolExecutor(max_workers=workers)
+                except (OSError, NotImplementedError, PermissionError) as e:
+                    # e.g. no /dev/shm semaphores in sandboxed environments
+                    print(f"[Executor] ⚠️ Process pool unavailable ({e}); CPU work falls back to threads.")
+                    self.use_processes = False
+            return ThreadPoolExecutor(workers, thread_name_prefix="icgl-cpu")
+
+        return factory
+
+    async def run_io(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """Runs blocking I/O `fn(*args)` on the thread pool."""
+        return await self.io.run(fn, args, timeout if timeout is not None else self.default_timeout)
+
+    async def run_cpu(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """Runs CPU-bound `fn(*args)` on the process pool (picklable callables only)."""
+        return await self.cpu.run(fn, args, timeout if timeout is not None else self.default_timeout)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "io": self.io.metrics(),
+            "cpu": {**self.cpu.metrics(), "mode": "process" if self.use_processes else "thread"},
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        self.io.shutdown(wait)
+        self.cpu.shutdown(wait)
+
+
+_executor: Optional[WorkExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> WorkExecutor:
+    """The process-wide work executor (pools start lazily on first task)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = WorkExecutor()
+        return _executor
@@ -10,10 +10,12 @@ Manifesto Reference:
 - "Intelligence Layer must be pluggable and sovereign."
 """
 
+import asyncio
 import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
 
 
 @dataclass
@@ -25,6 +27,11 @@ class LLMRequest:
     temperature: float = 0.7
     max_tokens: int = 2000
     stop_sequences: List[str] = field(default_factory=list)
+    # Routing hints: who is asking and whether a JSON object is required
+    agent_role: Optional[str] = None
+    json_mode: bool = False
+    # Accounting attribution (agent_id, adr_id, priority); never sent to the provider
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -35,6 +42,93 @@ class LLMResponse:
     raw_response: Any = None
     usage: Dict[str, int] = field(default_factory=dict)
     provider: str = "unknown"
+    coalesced: bool = False  # Served from another caller's in-flight call (no call of its own)
+
+
+class LLMProviderError(Exception):
+    """
+    Classified failure of an LLM provider call.
+
+    Attributes:
+        retryable: Whether repeating the same request may succeed (429, 5xx, timeouts).
+        status_code: HTTP status returned by the provider, if any.
+        retry_after: Server-requested wait (seconds) before retrying, if any.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        provider: str = "unknown",
+        retryable: bool = False,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message)
+        self.provider = provider
+        self.retryable = retryable
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504}
+RETRYABLE_ERROR_NAMES = {"APIConnectionError", "APITimeoutError", "ConnectError", "ReadTimeout", "RemoteProtocolError"}
+
+
+def _parse_retry_after(response: Any) -> Optional[float]:
+    """Extracts a retry-after hint (seconds) from an HTTP response, if present."""
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_ms = headers.get("retry-after-ms")
+    if retry_ms:
+        try:
+            return float(retry_ms) / 1000.0
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        from datetime import datetime, timezone
+        from email.utils import parsedate_to_datetime
+
+        try:
+            when = parsedate_to_datetime(retry_after)
+            return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
+def classify_llm_error(exc: BaseException, provider: str = "unknown") -> LLMProviderError:
+    """Maps an arbitrary provider/client exception onto a classified LLMProviderError."""
+    if isinstance(exc, LLMProviderError):
+        return exc
+
+    status = getattr(exc, "status_code", None)
+    retry_after = _parse_retry_after(getattr(exc, "response", None))
+
+    if isinstance(status, int):
+        retryable = status in RETRYABLE_STATUS_CODES or status >= 500
+    else:
+        status = None
+        retryable = isinstance(exc, (TimeoutError, ConnectionError)) or type(exc).__name__ in RETRYABLE_ERROR_NAMES
+
+    return LLMProviderError(
+        f"{type(exc).__name__}: {exc}",
+        provider=provider,
+        retryable=retryable,
+        status_code=status,
+        retry_after=retry_after,
+    )
+
+
+def default_batch_concurrency() -> int:
+    """Max in-flight requests per `generate_many` batch (ICGL_LLM_BATCH_CONCURRENCY)."""
+    return int(os.getenv("ICGL_LLM_BATCH_CONCURRENCY", 8))
 
 
 class LLMProvider(ABC):
@@ -45,19 +139,71 @@ class LLMProvider(ABC):
         """Generates text from the LLM."""
         pass
 
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """
+        Streams the response as text chunks, as they are produced.
+        Default: providers without native streaming yield the full response once.
+        """
+        response = await self.generate(request)
+        if response.content:
+            yield response.content
+
+    async def generate_many(
+        self, requests: Sequence[LLMRequest], max_concurrency: Optional[int] = None
+    ) -> List[Union[LLMResponse, Exception]]:
+        """
+        Generates a batch of requests with bounded concurrency.
+
+        Results are returned in request order. A failing item yields its exception
+        in place of a response instead of failing the whole batch.
+        """
+        limit = max(1, max_concurrency or default_batch_concurrency())
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _one(request: LLMRequest) -> Union[LLMResponse, Exception]:
+            async with semaphore:
+                try:
+                    return await self.generate(request)
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*[_one(r) for r in requests]))
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Runtime metrics for this provider.
+        Wrapping providers extend the dict returned by their inner provider.
+        """
+        return {"provider": self.__class__.__name__}
+
 
 class MockProvider(LLMProvider):
     """
     Mock provider for testing or when no API key is present.
     """
 
-    def __init__(self, fixed_response: Optional[str] = None):
+    def __init__(self, fixed_response: Optional[str] = None, chunk_delay: float = 0.0, latency: float = 0.0):
         self.fixed_response = fixed_response
+        self.chunk_delay = chunk_delay
+        # Simulated network latency (seconds) per call, e.g. to exercise latency-aware routing
+        self.latency = latency
+
+    def _content(self, request: LLMRequest) -> str:
+        return self.fixed_response or f"[MOCK] Processed: {request.prompt[:50]}..."
 
     async def generate(self, request: LLMRequest) -> LLMResponse:
-        return LLMResponse(
-            content=self.fixed_response or f"[MOCK] Processed: {request.prompt[:50]}...", provider="mock"
-        )
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return LLMResponse(content=self._content(request), provider="mock")
+
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Streams the mock response word by word (whitespace preserved)."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for token in re.findall(r"\s*\S+\s*", self._content(request)):
+            if self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+            yield token
 
 
 class OpenAIProvider(LLMProvider):
@@ -66,18 +212,31 @@ class OpenAIProvider(LLMProvider):
     Requires OPENAI_API_KEY environment variable.
     """
 
-    def __init__(self, model: str = "gpt-4o", api_key: str = None):
-        try:
-            from openai import AsyncOpenAI
+    def __init__(self, model: str = "gpt-4o", api_key: str = None, base_url: Optional[str] = None):
+        from src.core.llm.pool import get_client_pool
 
-            self.model = model
-            self.client = AsyncOpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+        self.model = model
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.base_url = base_url
+        self._pool = get_client_pool()
+        try:
+            # Fail fast on a broken install; the client itself is drawn from the shared pool per call
+            self._pool.openai(self.api_key, self.base_url)
         except ImportError:
-            raise ImportError("openai package is not installed. Run `pip install openai`.")
+            raise
         except Exception as e:
             # Fallback handling or re-raise depending on strictness
             raise ValueError(f"Failed to initialize OpenAI client: {e}")
 
+    @property
+    def client(self):
+        """Shared AsyncOpenAI (keep-alive connections reused across agents; retries stay with ResilientProvider)."""
+        return self._pool.openai(self.api_key, self.base_url)
+
+    @staticmethod
+    def _format_kwargs(request: LLMRequest) -> Dict[str, Any]:
+        return {"response_format": {"type": "json_object"}} if request.json_mode else {}
+
     async def generate(self, request: LLMRequest) -> LLMResponse:
         try:
             response = await self.client.chat.completions.create(
@@ -89,6 +248,7 @@ class OpenAIProvider(LLMProvider):
                 temperature=request.temperature,
                 max_tokens=request.max_tokens,
                 stop=request.stop_sequences if request.stop_sequences else None,
+                **self._format_kwargs(request),
             )
 
             content = response.choices[0].message.content
@@ -100,4 +260,35 @@ class OpenAIProvider(LLMProvider):
 
             return LLMResponse(content=content, raw_response=response, usage=usage, provider="openai")
         except Exception as e:
-            return LLMResponse(content=f"Error generating response: {str(e)}", provider="openai-error")
+            # Never disguise a failure as content: agents would parse it as an analysis
+            raise classify_llm_error(e, provider="openai") from e
+
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": request.system_prompt},
+                    {"role": "user", "content": request.prompt},
+                ],
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+                stop=request.stop_sequences if request.stop_sequences else None,
+                stream=True,
+                **self._format_kwargs(request),
+            )
+        except Exception as e:
+            raise classify_llm_error(e, provider="openai") from e
+
+        try:
+            async for event in stream:
+                if not event.choices:
+                    continue
+                delta = event.choices[0].delta.content
+                if delta:
+                    yield delta
+        except Exception as e:
+            raise classify_llm_error(e, provider="openai") from e
+        finally:
+            # Releases the HTTP connection when the consumer stops early (e.g. client disconnect)
+            await stream.close()
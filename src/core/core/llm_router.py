@@ -0,0 +1,391 @@
+"""
+ICGL Core — Cost & Latency Aware Model Routing
+==============================================
+
+"Right model for the job."
+Routes every generation request to one of several LLM providers (models),
+choosing per request from:
+- the calling agent's role (cheap models for trivial classifiers),
+- the prompt size (context-window limits),
+- whether JSON mode is required,
+- live health: rolling p95 latency and error rate per route.
+
+Failed calls fall through to configured fallbacks, then to any other eligible
+route. Every decision is kept in memory (see `metrics()`) and, when a log path
+is configured, appended as one JSON line for offline analysis. Log lines are
+buffered and written in batches on the I/O executor, never on the event loop.
+Prompt sizes use the same token estimate as context assembly and the governor.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+
+from src.core.llm.context_assembly import estimate_tokens
+
+from .llm import LLMProvider, LLMRequest, LLMResponse
+from .resilience import CircuitOpenError, CircuitState
+
+
+def _prompt_tokens(request: LLMRequest) -> int:
+    return estimate_tokens(request.system_prompt) + estimate_tokens(request.prompt)
+
+
+@dataclass
+class ModelRoute:
+    """
+    One routable model/provider.
+
+    Attributes:
+        name: Route identifier used in fallbacks and logs.
+        provider: The (typically resilience-wrapped) provider serving this route.
+        cost: Relative cost per 1k tokens; cheaper eligible routes are preferred.
+        roles: Agent roles allowed on this route (None = every role).
+        max_prompt_tokens: Largest prompt this route accepts (None = unlimited).
+        supports_json: Whether the route can honour `json_mode` requests.
+        fallbacks: Route names tried, in order, if this route fails.
+        max_p95_ms: Route is considered degraded above this p95 latency.
+        max_error_rate: Route is considered degraded above this error rate.
+    """
+
+    name: str
+    provider: LLMProvider
+    cost: float = 1.0
+    roles: Optional[Set[str]] = None
+    max_prompt_tokens: Optional[int] = None
+    supports_json: bool = True
+    fallbacks: List[str] = field(default_factory=list)
+    max_p95_ms: Optional[float] = None
+    max_error_rate: float = 0.5
+
+    def accepts(self, request: LLMRequest, prompt_tokens: int) -> Optional[str]:
+        """Returns the reason this route cannot serve the request, or None if it can."""
+        if self.roles is not None and (request.agent_role or "") not in self.roles:
+            return "role"
+        if self.max_prompt_tokens is not None and prompt_tokens > self.max_prompt_tokens:
+            return "prompt_size"
+        if request.json_mode and not self.supports_json:
+            return "json_mode"
+        return None
+
+
+class RouteStats:
+    """Rolling latency / outcome window for one route."""
+
+    def __init__(self, window: int = 50, min_samples: int = 5):
+        self.min_samples = min_samples
+        self._samples: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self.calls = 0
+        self.failures = 0
+
+    def record(self, latency_ms: float, ok: bool) -> None:
+        self._samples.append((latency_ms, ok))
+        self.calls += 1
+        if not ok:
+            self.failures += 1
+
+    @property
+    def warmed_up(self) -> bool:
+        return len(self._samples) >= self.min_samples
+
+    def p95_ms(self) -> Optional[float]:
+        if not self._samples:
+            return None
+        latencies = sorted(lat for lat, _ in self._samples)
+        return latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+
+    def error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    def snapshot(self) -> Dict[str, Any]:
+        p95 = self.p95_ms()
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "window": len(self._samples),
+            "p95_ms": round(p95, 1) if p95 is not None else None,
+            "error_rate": round(self.error_rate(), 3),
+        }
+
+
+class RoutingProvider(LLMProvider):
+    """
+    Picks a route per request and falls back on failure.
+
+    Usage:
+        router = RoutingProvider([
+            ModelRoute("mini", mini_provider, cost=0.15, roles={"secretary"}),
+            ModelRoute("gpt-4o", full_provider, cost=2.5),
+        ])
+        response = await router.generate(LLMRequest(prompt=..., agent_role="secretary"))
+    """
+
+    def __init__(
+        self,
+        routes: List[ModelRoute],
+        stats_window: int = 50,
+        min_samples: int = 5,
+        decision_log: Optional[str] = None,
+        history: int = 200,
+    ):
+        if not routes:
+            raise ValueError("RoutingProvider needs at least one route.")
+        self.routes: Dict[str, ModelRoute] = {r.name: r for r in routes}
+        self.stats: Dict[str, RouteStats] = {r.name: RouteStats(stats_window, min_samples) for r in routes}
+        self.decision_log = Path(decision_log) if decision_log else None
+        self.decisions: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._log_buffer: List[str] = []
+        self._log_flush: Optional[asyncio.Task] = None
+        self._counters: Dict[str, int] = {"routed": 0, "fallbacks": 0, "exhausted": 0}
+
+    # --- Selection ---
+
+    def _is_healthy(self, route: ModelRoute) -> bool:
+        stats = self.stats[route.name]
+        breaker = getattr(route.provider, "breaker", None)
+        if breaker is not None and breaker.state == CircuitState.OPEN:
+            return False
+        if not stats.warmed_up:
+            return True
+        if stats.error_rate() > route.max_error_rate:
+            return False
+        p95 = stats.p95_ms()
+        if route.max_p95_ms is not None and p95 is not None and p95 > route.max_p95_ms:
+            return False
+        return True
+
+    def _rank_key(self, route: ModelRoute) -> Tuple[float, float, float]:
+        stats = self.stats[route.name]
+        return (route.cost, stats.error_rate(), stats.p95_ms() or 0.0)
+
+    def plan(self, request: LLMRequest) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Ordered list of route names to try for this request, plus the reason each
+        excluded route was rejected. Healthy routes come first (cheapest, then
+        most reliable, then fastest); the primary's fallbacks follow; degraded
+        eligible routes are kept last as a final resort.
+        """
+        prompt_tokens = _prompt_tokens(request)
+        rejected: Dict[str, str] = {}
+        eligible: List[ModelRoute] = []
+        for route in self.routes.values():
+            reason = route.accepts(request, prompt_tokens)
+            if reason:
+                rejected[route.name] = reason
+            else:
+                eligible.append(route)
+
+        healthy = sorted((r for r in eligible if self._is_healthy(r)), key=self._rank_key)
+        degraded = sorted((r for r in eligible if not self._is_healthy(r)), key=self._rank_key)
+        for route in degraded:
+            rejected.setdefault(route.name, "unhealthy")
+
+        order: List[str] = []
+        if healthy:
+            order.append(healthy[0].name)
+            for name in healthy[0].fallbacks:
+                if name in self.routes and name not in order and name not in rejected:
+                    order.append(name)
+        for route in healthy + degraded:
+            if route.name not in order:
+                order.append(route.name)
+        return order, rejected
+
+    # --- Generation ---
+
+    def _record_failure(self, name: str, latency_ms: float, error: Exception) -> None:
+        # An open circuit fails fast without calling the model: that is not a latency or
+        # error sample of the route, and counting it would keep the route marked unhealthy.
+        if isinstance(error, CircuitOpenError):
+            return
+        self.stats[name].record(latency_ms, ok=False)
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        order, rejected = self.plan(request)
+        if not order:
+            self._counters["exhausted"] += 1
+            self._log_decision(request, order, rejected, attempts=[], chosen=None)
+            raise RuntimeError(f"No LLM route can serve this request: {rejected}")
+
+        attempts: List[Dict[str, Any]] = []
+        last_error: Optional[Exception] = None
+        for name in order:
+            route = self.routes[name]
+            started = time.perf_counter()
+            try:
+                response = await route.provider.generate(request)
+            except Exception as e:
+                latency_ms = (time.perf_counter() - started) * 1000
+                self._record_failure(name, latency_ms, e)
+                attempts.append({"route": name, "ok": False, "ms": round(latency_ms, 1), "error": type(e).__name__})
+                last_error = e
+                continue
+
+            latency_ms = (time.perf_counter() - started) * 1000
+            self.stats[name].record(latency_ms, ok=True)
+            attempts.append({"route": name, "ok": True, "ms": round(latency_ms, 1)})
+            self._counters["routed"] += 1
+            if len(attempts) > 1:
+                self._counters["fallbacks"] += 1
+            self._log_decision(request, order, rejected, attempts, chosen=name)
+            return response
+
+        self._counters["exhausted"] += 1
+        self._log_decision(request, order, rejected, attempts, chosen=None)
+        assert last_error is not None
+        raise last_error
+
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Streams from the first route that produces output; falls back only before the first chunk."""
+        order, rejected = self.plan(request)
+        attempts: List[Dict[str, Any]] = []
+        last_error: Optional[Exception] = None
+        for name in order:
+            started = time.perf_counter()
+            emitted = False
+            try:
+                async for chunk in self.routes[name].provider.generate_stream(request):
+                    emitted = True
+                    yield chunk
+            except Exception as e:
+                latency_ms = (time.perf_counter() - started) * 1000
+                self._record_failure(name, latency_ms, e)
+                attempts.append({"route": name, "ok": False, "ms": round(latency_ms, 1), "error": type(e).__name__})
+                last_error = e
+                if emitted:
+                    self._log_decision(request, order, rejected, attempts, chosen=None)
+                    raise
+                continue
+
+            latency_ms = (time.perf_counter() - started) * 1000
+            self.stats[name].record(latency_ms, ok=True)
+            attempts.append({"route": name, "ok": True, "ms": round(latency_ms, 1)})
+            self._counters["routed"] += 1
+            self._log_decision(request, order, rejected, attempts, chosen=name)
+            return
+
+        self._counters["exhausted"] += 1
+        self._log_decision(request, order, rejected, attempts, chosen=None)
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError(f"No LLM route can serve this request: {rejected}")
+
+    # --- Observability ---
+
+    def _log_decision(
+        self,
+        request: LLMRequest,
+        order: List[str],
+        rejected: Dict[str, str],
+        attempts: List[Dict[str, Any]],
+        chosen: Optional[str],
+    ) -> None:
+        entry = {
+            "ts": time.time(),
+            "agent_role": request.agent_role,
+            "json_mode": request.json_mode,
+            "prompt_tokens_est": _prompt_tokens(request),
+            "plan": order,
+            "rejected": rejected,
+            "attempts": attempts,
+            "chosen": chosen,
+        }
+        self.decisions.append(entry)
+        if self.decision_log is None:
+            return
+        self._log_buffer.append(json.dumps(entry, ensure_ascii=False))
+        if self._log_flush is None or self._log_flush.done():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                lines, self._log_buffer = self._log_buffer, []
+                self._write_log(lines)
+                return
+            self._log_flush = loop.create_task(self._drain_log())
+
+    async def flush_log(self) -> None:
+        """Waits until every buffered decision record is written."""
+        task = self._log_flush
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            await asyncio.shield(task)
+        await self._drain_log()
+
+    async def _drain_log(self) -> None:
+        from .executor import get_executor
+
+        while self._log_buffer:
+            lines, self._log_buffer = self._log_buffer, []
+            try:
+                await get_executor().run_io(self._write_log, lines)
+            except Exception as e:
+                print(f"[LLMRouter] ⚠️ Failed to write routing log: {e}")
+
+    def _write_log(self, lines: List[str]) -> None:
+        try:
+            self.decision_log.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.decision_log, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            print(f"[LLMRouter] ⚠️ Failed to write routing log: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        routes: Dict[str, Any] = {}
+        for name, route in self.routes.items():
+            routes[name] = {
+                "cost": route.cost,
+                "healthy": self._is_healthy(route),
+                **self.stats[name].snapshot(),
+                "provider": route.provider.metrics(),
+            }
+        return {
+            "provider": self.__class__.__name__,
+            "routing": {**self._counters, "routes": routes, "recent": list(self.decisions)[-10:]},
+        }
+
+
+def routes_from_env(build_provider) -> List[ModelRoute]:
+    """
+    Builds the default route table from the environment.
+
+    ICGL_LLM_MODEL            primary model (default gpt-4o)
+    ICGL_LLM_FAST_MODEL       cheap model for trivial roles (unset = single route)
+    ICGL_LLM_FAST_ROLES       comma-separated roles allowed on the fast model
+    ICGL_LLM_FAST_MAX_TOKENS  prompt-size ceiling for the fast model
+    ICGL_LLM_MAX_P95_MS       p95 latency above which a route counts as degraded
+
+    `build_provider(name, model)` returns the (wrapped) provider for one route.
+    """
+    primary_model = os.getenv("ICGL_LLM_MODEL", "gpt-4o")
+    fast_model = os.getenv("ICGL_LLM_FAST_MODEL", "")
+    max_p95 = os.getenv("ICGL_LLM_MAX_P95_MS")
+    max_p95_ms = float(max_p95) if max_p95 else None
+
+    routes = [
+        ModelRoute(
+            name=primary_model,
+            provider=build_provider(primary_model, primary_model),
+            cost=float(os.getenv("ICGL_LLM_MODEL_COST", 2.5)),
+            max_p95_ms=max_p95_ms,
+        )
+    ]
+    if fast_model and fast_model != primary_model:
+        roles = os.getenv("ICGL_LLM_FAST_ROLES", "secretary,monitor,visibility,documentation,archivist")
+        routes.append(
+            ModelRoute(
+                name=fast_model,
+                provider=build_provider(fast_model, fast_model),
+                cost=float(os.getenv("ICGL_LLM_FAST_MODEL_COST", 0.15)),
+                roles={r.strip() for r in roles.split(",") if r.strip()},
+                max_prompt_tokens=int(os.getenv("ICGL_LLM_FAST_MAX_TOKENS", 8000)),
+                fallbacks=[primary_model],
+                max_p95_ms=max_p95_ms,
+            )
+        )
+    return routes
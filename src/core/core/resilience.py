@@ -3,11 +3,22 @@ ICGL Resilience Layer
 =====================
 
 "The Shield of the System."
-Provides validation boundaries and failure containment.
+Provides validation boundaries and failure containment:
+- FailureContainer: exception boundaries with safe fallbacks.
+- CircuitBreaker / RetryPolicy / ResilientProvider: LLM provider protection
+  (classified retries, jittered backoff, fast-fail while a provider is down).
 """
 
+import asyncio
 import functools
-from typing import Any, Callable, Optional
+import random
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from .llm import LLMProvider, LLMRequest, LLMResponse, classify_llm_error
 from .observability import SystemObserver
 
 class FailureContainer:
@@ -52,3 +63,283 @@ class FailureContainer:
                     return fallback_factory()
             return wrapper
         return decorator
+
+
+class CircuitState(str, Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised (without touching the network) while a provider circuit is open."""
+
+    def __init__(self, name: str, retry_after: float, snapshot: Optional[Dict[str, Any]] = None):
+        super().__init__(f"Circuit '{name}' is OPEN; provider calls suspended for {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+        self.snapshot = snapshot or {}
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker.
+
+    CLOSED    -> calls flow; `failure_threshold` consecutive transient failures open it.
+    OPEN      -> calls fail fast until `recovery_timeout` elapses.
+    HALF_OPEN -> up to `half_open_max_calls` probes; success closes, failure re-opens.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._stats = {"opened": 0, "rejected": 0, "successes": 0, "failures": 0}
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self._current_state() != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def before_call(self) -> None:
+        """Admits a call or raises CircuitOpenError."""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return
+            if state == CircuitState.HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+                self._half_open_in_flight += 1
+                return
+            self._stats["rejected"] += 1
+            wait = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(self.name, wait, self.snapshot())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._stats["successes"] += 1
+            self._consecutive_failures = 0
+            if self._state == CircuitState.HALF_OPEN:
+                print(f"🛡️ [Circuit:{self.name}] Probe succeeded. Circuit CLOSED.")
+            self._state = CircuitState.CLOSED
+            self._half_open_in_flight = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._stats["failures"] += 1
+            self._consecutive_failures += 1
+            state = self._current_state()
+            if state == CircuitState.HALF_OPEN or (
+                state == CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self._half_open_in_flight = 0
+                self._stats["opened"] += 1
+                print(f"🛡️ [Circuit:{self.name}] OPEN after {self._consecutive_failures} consecutive failures.")
+
+    def release_probe(self) -> None:
+        """Returns a half-open probe slot when the call ended without a verdict (e.g. non-retryable error)."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            retry_after = 0.0
+            if state == CircuitState.OPEN:
+                retry_after = max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+            return {
+                "name": self.name,
+                "state": state.value,
+                "consecutive_failures": self._consecutive_failures,
+                "retry_after": round(retry_after, 2),
+                **self._stats,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """Gets (or creates) the process-wide circuit breaker for a provider."""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(name, **kwargs)
+        return _breakers[name]
+
+
+def find_circuit_breakers(provider: Any) -> List[CircuitBreaker]:
+    """Collects the circuit breakers guarding a (possibly wrapped or routed) LLM provider chain."""
+    breakers: List[CircuitBreaker] = []
+    depth = 0
+    while provider is not None and depth < 16:
+        breaker = getattr(provider, "breaker", None)
+        if isinstance(breaker, CircuitBreaker):
+            breakers.append(breaker)
+        # Routing providers fan out to one chain per route
+        routes = getattr(provider, "routes", None)
+        if isinstance(routes, dict):
+            for route in routes.values():
+                for found in find_circuit_breakers(getattr(route, "provider", None)):
+                    if found not in breakers:
+                        breakers.append(found)
+        provider = getattr(provider, "inner", None)
+        depth += 1
+    return breakers
+
+
+@dataclass
+class RetryPolicy:
+    """Jittered exponential backoff ("full jitter") that honours server retry-after hints."""
+
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    max_retry_after: float = 60.0
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        backoff = random.uniform(0.0, min(self.max_delay, self.base_delay * (2**attempt)))
+        if retry_after is not None:
+            return min(self.max_retry_after, max(retry_after, backoff))
+        return backoff
+
+
+class ResilientProvider(LLMProvider):
+    """
+    Wraps an LLMProvider with classified retries and a circuit breaker.
+
+    Only retryable failures (429, 5xx, timeouts, connection errors) are retried
+    and counted against the breaker. While the breaker is open, new requests
+    fail fast with CircuitOpenError instead of reaching the provider.
+    """
+
+    def __init__(
+        self,
+        inner: LLMProvider,
+        name: str = "llm",
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        attempt_timeout: Optional[float] = 60.0,
+    ):
+        self.inner = inner
+        self.name = name
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or get_circuit_breaker(name)
+        self.attempt_timeout = attempt_timeout
+        self._stats = {"calls": 0, "retries": 0, "fast_failed": 0, "failed": 0}
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self._stats["calls"] += 1
+        attempt = 0
+        while True:
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self._stats["fast_failed"] += 1
+                raise
+
+            try:
+                call = self.inner.generate(request)
+                if self.attempt_timeout:
+                    response = await asyncio.wait_for(call, timeout=self.attempt_timeout)
+                else:
+                    response = await call
+            except asyncio.CancelledError:
+                self.breaker.release_probe()
+                raise
+            except Exception as e:
+                error = classify_llm_error(e, provider=self.name)
+                if not error.retryable:
+                    self.breaker.release_probe()
+                    self._stats["failed"] += 1
+                    raise error from e
+
+                self.breaker.record_failure()
+                if attempt >= self.retry_policy.max_retries or self.breaker.state == CircuitState.OPEN:
+                    self._stats["failed"] += 1
+                    raise error from e
+
+                wait = self.retry_policy.delay(attempt, error.retry_after)
+                attempt += 1
+                self._stats["retries"] += 1
+                print(f"🛡️ [Shield:{self.name}] {error} — retry {attempt}/{self.retry_policy.max_retries} in {wait:.2f}s")
+                await asyncio.sleep(wait)
+                continue
+
+            self.breaker.record_success()
+            return response
+
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """
+        Streams through the breaker. Retries are only attempted before the first
+        chunk has been emitted; a failure mid-stream is surfaced to the consumer.
+        """
+        self._stats["calls"] += 1
+        attempt = 0
+        while True:
+            try:
+                self.breaker.before_call()
+            except CircuitOpenError:
+                self._stats["fast_failed"] += 1
+                raise
+
+            emitted = False
+            try:
+                async for chunk in self.inner.generate_stream(request):
+                    emitted = True
+                    yield chunk
+            except (asyncio.CancelledError, GeneratorExit):
+                self.breaker.release_probe()
+                raise
+            except Exception as e:
+                error = classify_llm_error(e, provider=self.name)
+                if not error.retryable:
+                    self.breaker.release_probe()
+                    self._stats["failed"] += 1
+                    raise error from e
+
+                self.breaker.record_failure()
+                if emitted or attempt >= self.retry_policy.max_retries or self.breaker.state == CircuitState.OPEN:
+                    self._stats["failed"] += 1
+                    raise error from e
+
+                wait = self.retry_policy.delay(attempt, error.retry_after)
+                attempt += 1
+                self._stats["retries"] += 1
+                await asyncio.sleep(wait)
+                continue
+
+            self.breaker.record_success()
+            return
+
+    def metrics(self) -> Dict[str, Any]:
+        metrics = dict(self.inner.metrics())
+        metrics["resilience"] = {**self._stats, "circuit": self.breaker.snapshot()}
+        return metrics
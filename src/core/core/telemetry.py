@@ -0,0 +1,196 @@
+"""
+ICGL Core — System Telemetry Sampler
+====================================
+
+Samples CPU, memory, disk and disk IO on a background thread so agents never
+make blocking system calls on the event loop.
+
+- One daemon thread per process samples at a fixed rate
+  (ICGL_TELEMETRY_INTERVAL seconds, default 1.0).
+- Readings go into a fixed-size ring buffer (ICGL_TELEMETRY_CAPACITY
+  readings, default 600).
+- CPU is measured with `psutil.cpu_percent(interval=None)`, i.e. utilisation
+  since the previous sample, so no call ever sleeps.
+- `snapshot()` returns the latest reading instantly. `aggregate(seconds)`
+  summarises a short window (avg/min/max, IO rates) for trend-aware checks.
+
+Usage:
+    sampler = get_system_sampler()
+    now = sampler.snapshot()          # {"cpu_percent": ..., "memory_percent": ..., ...}
+    last_minute = sampler.aggregate(60)
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class SystemReading:
+    """One telemetry sample."""
+
+    timestamp: float
+    cpu_percent: float
+    memory_percent: float
+    disk_percent: float
+    memory_total: int = 0
+    memory_available: int = 0
+    io_read_bytes: int = 0
+    io_write_bytes: int = 0
+
+
+class SystemSampler:
+    """
+    Background system sampler with a ring buffer of recent readings.
+
+    The thread starts lazily on first use (or explicitly via `start()`); it is
+    a daemon, so it never keeps the process alive.
+    """
+
+    def __init__(self, interval: float = 1.0, capacity: int = 600, disk_path: str = "/"):
+        self.interval = max(0.05, interval)
+        self.disk_path = disk_path
+        self._readings: Deque[SystemReading] = deque(maxlen=max(2, capacity))
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._errors = 0
+        self._last_error: Optional[str] = None
+
+    # --- Lifecycle ---
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "SystemSampler":
+        with self._start_lock:
+            if self.running:
+                return self
+            self._stop.clear()
+            # Prime the CPU counter and take a first reading so snapshots are never empty
+            self.sample()
+            self._thread = threading.Thread(target=self._run, name="icgl-telemetry", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    # --- Sampling ---
+
+    def sample(self) -> Optional[SystemReading]:
+        """Takes one reading (non-blocking) and appends it to the ring buffer."""
+        try:
+            import psutil
+
+            memory = psutil.virtual_memory()
+            try:
+                disk_percent = psutil.disk_usage(self.disk_path).percent
+            except OSError:
+                disk_percent = 0.0
+            try:
+                io = psutil.disk_io_counters()
+            except Exception:
+                io = None
+            reading = SystemReading(
+                timestamp=time.time(),
+                cpu_percent=psutil.cpu_percent(interval=None),
+                memory_percent=memory.percent,
+                disk_percent=disk_percent,
+                memory_total=int(memory.total),
+                memory_available=int(memory.available),
+                io_read_bytes=int(io.read_bytes) if io else 0,
+                io_write_bytes=int(io.write_bytes) if io else 0,
+            )
+        except Exception as e:
+            self._errors += 1
+            self._last_error = str(e)
+            return None
+        with self._lock:
+            self._readings.append(reading)
+        return reading
+
+    # --- Reads (never block on system calls) ---
+
+    def latest(self) -> Optional[SystemReading]:
+        if not self.running:
+            self.start()
+        with self._lock:
+            return self._readings[-1] if self._readings else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest reading as a dict, plus its age in seconds. Empty if sampling failed."""
+        reading = self.latest()
+        if reading is None:
+            return {}
+        data = asdict(reading)
+        data["age_seconds"] = round(max(0.0, time.time() - reading.timestamp), 3)
+        return data
+
+    def window(self, seconds: float) -> List[SystemReading]:
+        """Readings from the last `seconds` (oldest first)."""
+        if not self.running:
+            self.start()
+        cutoff = time.time() - seconds
+        with self._lock:
+            return [r for r in self._readings if r.timestamp >= cutoff]
+
+    def aggregate(self, seconds: float = 60.0) -> Dict[str, Any]:
+        """avg/min/max of CPU, memory and disk plus disk IO rates over the last `seconds`."""
+        readings = self.window(seconds)
+        if not readings:
+            return {"samples": 0, "window_seconds": seconds}
+        summary: Dict[str, Any] = {"samples": len(readings), "window_seconds": seconds}
+        for metric in ("cpu_percent", "memory_percent", "disk_percent"):
+            values = [getattr(r, metric) for r in readings]
+            summary[metric] = {
+                "avg": round(sum(values) / len(values), 2),
+                "min": min(values),
+                "max": max(values),
+            }
+        span = readings[-1].timestamp - readings[0].timestamp
+        if span > 0:
+            summary["io_read_bytes_per_s"] = round((readings[-1].io_read_bytes - readings[0].io_read_bytes) / span, 1)
+            summary["io_write_bytes_per_s"] = round((readings[-1].io_write_bytes - readings[0].io_write_bytes) / span, 1)
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._readings)
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "capacity": self._readings.maxlen,
+            "readings": size,
+            "errors": self._errors,
+            "last_error": self._last_error,
+        }
+
+
+_sampler: Optional[SystemSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_system_sampler() -> SystemSampler:
+    """The process-wide sampler (started on first read)."""
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = SystemSampler(
+                interval=float(os.getenv("ICGL_TELEMETRY_INTERVAL", 1.0)),
+                capacity=int(os.getenv("ICGL_TELEMETRY_CAPACITY", 600)),
+            )
+        return _sampler
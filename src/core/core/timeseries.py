@@ -0,0 +1,362 @@
+"""
+ICGL Core — Bounded Time-Series Store
+=====================================
+
+Compact, constant-memory metric history for long-running agents.
+
+- Columns are preallocated `array('d')` buffers used as rings: appending
+  overwrites the oldest point, so memory never grows after start-up.
+- Three resolutions are kept: raw points, 1-minute buckets and 1-hour
+  buckets (mean and max per metric). Long windows are answered from the
+  coarse rings, so months of uptime fit in a few hundred KB.
+- Optional SQLite persistence stores the finished 1-minute and 1-hour
+  buckets and trims them to the ring span, so disk use is bounded as well.
+  History is reloaded on start.
+- Trend and anomaly queries run vectorized with NumPy when it is installed
+  (zero-copy views over the arrays), else in plain Python.
+
+Usage:
+    store = TimeSeriesStore("monitor.health", ["cpu_percent", "memory_percent"])
+    store.record({"cpu_percent": 12.5, "memory_percent": 40.1})
+    store.trend("cpu_percent", seconds=3600)
+    store.anomalies("cpu_percent", seconds=86400)
+"""
+
+import math
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: pure-Python fallbacks below
+    np = None
+
+# name -> bucket width in seconds (0 = raw points)
+RESOLUTIONS: Tuple[Tuple[str, int], ...] = (("raw", 0), ("1m", 60), ("1h", 3600))
+
+
+class RingSeries:
+    """Fixed-capacity columnar ring: one timestamp column plus one float column per field."""
+
+    def __init__(self, fields: Sequence[str], capacity: int):
+        self.fields = list(fields)
+        self.capacity = max(1, capacity)
+        self._index = {name: i for i, name in enumerate(self.fields)}
+        self._t = array("d", bytes(8 * self.capacity))
+        self._cols = [array("d", bytes(8 * self.capacity)) for _ in self.fields]
+        self._head = 0  # next write slot
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, values: Sequence[float]) -> None:
+        slot = self._head
+        self._t[slot] = timestamp
+        for column, value in zip(self._cols, values):
+            column[slot] = value
+        self._head = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _ordered(self, column: array) -> List[float]:
+        if self._size < self.capacity:
+            return column[: self._size].tolist()
+        return column[self._head :].tolist() + column[: self._head].tolist()
+
+    def _ordered_np(self, column: array):
+        view = np.frombuffer(column, dtype=np.float64)
+        if self._size < self.capacity:
+            return view[: self._size]
+        return np.concatenate((view[self._head :], view[: self._head]))
+
+    def first_timestamp(self) -> Optional[float]:
+        if not self._size:
+            return None
+        return self._t[0] if self._size < self.capacity else self._t[self._head]
+
+    def select(self, field: str, since: Optional[float] = None):
+        """(timestamps, values) in time order, as NumPy arrays when available, else lists."""
+        column = self._cols[self._index[field]]
+        if np is not None:
+            t, v = self._ordered_np(self._t), self._ordered_np(column)
+            if since is not None:
+                mask = t >= since
+                t, v = t[mask], v[mask]
+            return t, v
+        t, v = self._ordered(self._t), self._ordered(column)
+        if since is not None:
+            keep = [i for i, ts in enumerate(t) if ts >= since]
+            t, v = [t[i] for i in keep], [v[i] for i in keep]
+        return t, v
+
+    def last(self) -> Optional[Tuple[float, List[float]]]:
+        if not self._size:
+            return None
+        slot = (self._head - 1) % self.capacity
+        return self._t[slot], [column[slot] for column in self._cols]
+
+    def nbytes(self) -> int:
+        return (len(self._cols) + 1) * self.capacity * 8
+
+
+class _Bucket:
+    """Running mean/max of one downsampling bucket."""
+
+    __slots__ = ("start", "count", "sums", "maxes")
+
+    def __init__(self, start: float):
+        self.start = start
+        self.count = 0
+        self.sums: List[float] = []
+        self.maxes: List[float] = []
+
+    def add(self, values: Sequence[float]) -> None:
+        if not self.count:
+            self.sums = list(values)
+            self.maxes = list(values)
+        else:
+            self.sums = [s + v for s, v in zip(self.sums, values)]
+            self.maxes = [max(m, v) for m, v in zip(self.maxes, values)]
+        self.count += 1
+
+    def row(self) -> List[float]:
+        return [s / self.count for s in self.sums] + self.maxes
+
+
+class TimeSeriesStore:
+    """
+    Multi-resolution, bounded metric history.
+
+    Args:
+        name: Series name (SQLite key).
+        metrics: Metric names recorded on every `record`.
+        capacities: Points kept per resolution (raw, 1m, 1h); defaults keep
+            ~1 day of raw samples at 1/min, 1 day of minutes, 90 days of hours.
+        db_path: Optional SQLite file for bucket persistence.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        metrics: Sequence[str],
+        capacities: Optional[Dict[str, int]] = None,
+        db_path: Optional[str] = None,
+    ):
+        self.name = name
+        self.metrics = list(metrics)
+        caps = {"raw": 1440, "1m": 1440, "1h": 24 * 90}
+        caps.update(capacities or {})
+        self._lock = threading.Lock()
+        self._series: Dict[str, RingSeries] = {"raw": RingSeries(self.metrics, caps["raw"])}
+        bucket_fields = self.metrics + [f"{m}:max" for m in self.metrics]
+        for resolution, width in RESOLUTIONS[1:]:
+            self._series[resolution] = RingSeries(bucket_fields, caps[resolution])
+        self._buckets: Dict[str, Optional[_Bucket]] = {r: None for r, w in RESOLUTIONS if w}
+        self.db_path = Path(db_path) if db_path else None
+        if self.db_path is not None:
+            self._init_db()
+            self._load()
+
+    # --- Writes ---
+
+    def record(self, values: Dict[str, float], timestamp: Optional[float] = None) -> None:
+        """Appends one point (missing metrics are stored as NaN)."""
+        t = time.time() if timestamp is None else timestamp
+        row = [float(values.get(m, math.nan)) for m in self.metrics]
+        finished: List[Tuple[str, float, List[float]]] = []
+        with self._lock:
+            self._series["raw"].append(t, row)
+            for resolution, width in RESOLUTIONS[1:]:
+                start = t - (t % width)
+                bucket = self._buckets[resolution]
+                if bucket is not None and bucket.start != start:
+                    self._series[resolution].append(bucket.start, bucket.row())
+                    finished.append((resolution, bucket.start, bucket.row()))
+                    bucket = None
+                if bucket is None:
+                    bucket = self._buckets[resolution] = _Bucket(start)
+                bucket.add(row)
+        if finished and self.db_path is not None:
+            self._persist(finished)
+
+    # --- Reads ---
+
+    def _resolution_for(self, seconds: Optional[float]) -> str:
+        """Finest resolution whose ring still covers the requested window."""
+        if seconds is None:
+            return "raw"
+        since = time.time() - seconds
+        for resolution, _ in RESOLUTIONS:
+            series = self._series[resolution]
+            first = series.first_timestamp()
+            if first is not None and (first <= since or len(series) < series.capacity):
+                return resolution
+        return RESOLUTIONS[-1][0]
+
+    def query(self, metric: str, seconds: Optional[float] = None, resolution: Optional[str] = None, agg: str = "mean"):
+        """
+        (timestamps, values) for `metric` over the last `seconds`.
+        `agg="max"` reads bucket maxima from the 1m/1h rings.
+        """
+        with self._lock:
+            resolution = resolution or self._resolution_for(seconds)
+            field = metric if agg == "mean" or resolution == "raw" else f"{metric}:max"
+            since = None if seconds is None else time.time() - seconds
+            return self._series[resolution].select(field, since)
+
+    def last(self) -> Optional[Dict[str, float]]:
+        with self._lock:
+            point = self._series["raw"].last()
+        if point is None:
+            return None
+        return {"timestamp": point[0], **dict(zip(self.metrics, point[1]))}
+
+    def trend(self, metric: str, seconds: Optional[float] = None) -> Dict[str, float]:
+        """Mean/min/max/last plus least-squares slope (units per hour) over the window."""
+        t, v = self.query(metric, seconds)
+        if np is not None:
+            mask = ~np.isnan(v)
+            t, v = t[mask], v[mask]
+            n = int(v.size)
+            if not n:
+                return {"samples": 0}
+            slope = float(np.polyfit(t - t[0], v, 1)[0]) * 3600 if n >= 2 and t[-1] > t[0] else 0.0
+            return {
+                "samples": n,
+                "mean": round(float(v.mean()), 3),
+                "min": float(v.min()),
+                "max": float(v.max()),
+                "last": float(v[-1]),
+                "slope_per_hour": round(slope, 4),
+            }
+        pairs = [(a, b) for a, b in zip(t, v) if not math.isnan(b)]
+        if not pairs:
+            return {"samples": 0}
+        n = len(pairs)
+        mean_t = sum(a for a, _ in pairs) / n
+        mean_v = sum(b for _, b in pairs) / n
+        var_t = sum((a - mean_t) ** 2 for a, _ in pairs)
+        slope = sum((a - mean_t) * (b - mean_v) for a, b in pairs) / var_t * 3600 if var_t else 0.0
+        values = [b for _, b in pairs]
+        return {
+            "samples": n,
+            "mean": round(mean_v, 3),
+            "min": min(values),
+            "max": max(values),
+            "last": values[-1],
+            "slope_per_hour": round(slope, 4),
+        }
+
+    def anomalies(self, metric: str, seconds: Optional[float] = None, threshold: float = 3.5) -> List[Dict[str, float]]:
+        """Points whose robust z-score (median/MAD) exceeds `threshold`."""
+        t, v = self.query(metric, seconds)
+        if np is not None:
+            mask = ~np.isnan(v)
+            t, v = t[mask], v[mask]
+            if v.size < 5:
+                return []
+            median = np.median(v)
+            mad = np.median(np.abs(v - median))
+            if mad == 0:
+                return []
+            z = 0.6745 * (v - median) / mad
+            hits = np.nonzero(np.abs(z) > threshold)[0]
+            return [{"timestamp": float(t[i]), "value": float(v[i]), "z": round(float(z[i]), 2)} for i in hits]
+        pairs = [(a, b) for a, b in zip(t, v) if not math.isnan(b)]
+        if len(pairs) < 5:
+            return []
+        values = sorted(b for _, b in pairs)
+        median = _median(values)
+        mad = _median(sorted(abs(b - median) for b in values))
+        if mad == 0:
+            return []
+        out = []
+        for a, b in pairs:
+            z = 0.6745 * (b - median) / mad
+            if abs(z) > threshold:
+                out.append({"timestamp": a, "value": b, "z": round(z, 2)})
+        return out
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                resolution: {"points": len(series), "capacity": series.capacity, "bytes": series.nbytes()}
+                for resolution, series in self._series.items()
+            }
+
+    # --- Persistence ---
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _init_db(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS timeseries_buckets (
+                    series TEXT NOT NULL,
+                    resolution TEXT NOT NULL,
+                    ts REAL NOT NULL,
+                    metric TEXT NOT NULL,
+                    mean REAL,
+                    max REAL,
+                    PRIMARY KEY (series, resolution, ts, metric)
+                )
+                """
+            )
+
+    def _persist(self, finished: List[Tuple[str, float, List[float]]]) -> None:
+        n = len(self.metrics)
+        rows = [
+            (self.name, resolution, start, metric, values[i], values[n + i])
+            for resolution, start, values in finished
+            for i, metric in enumerate(self.metrics)
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany("INSERT OR REPLACE INTO timeseries_buckets VALUES (?, ?, ?, ?, ?, ?)", rows)
+                # Keep disk bounded to what the rings can hold
+                for resolution, width in RESOLUTIONS[1:]:
+                    horizon = time.time() - self._series[resolution].capacity * width
+                    conn.execute(
+                        "DELETE FROM timeseries_buckets WHERE series = ? AND resolution = ? AND ts < ?",
+                        (self.name, resolution, horizon),
+                    )
+        except sqlite3.Error as e:
+            print(f"[TimeSeries] ⚠️ Failed to persist {self.name}: {e}")
+
+    def _load(self) -> None:
+        try:
+            with self._connect() as conn:
+                for resolution, _ in RESOLUTIONS[1:]:
+                    series = self._series[resolution]
+                    cursor = conn.execute(
+                        "SELECT ts, metric, mean, max FROM timeseries_buckets "
+                        "WHERE series = ? AND resolution = ? ORDER BY ts DESC LIMIT ?",
+                        (self.name, resolution, series.capacity * len(self.metrics)),
+                    )
+                    points: Dict[float, Dict[str, Tuple[float, float]]] = {}
+                    for ts, metric, mean, peak in cursor:
+                        points.setdefault(ts, {})[metric] = (mean, peak)
+                    for ts in sorted(points)[-series.capacity :]:
+                        row = points[ts]
+                        means = [_nan(row.get(m, (None, None))[0]) for m in self.metrics]
+                        maxes = [_nan(row.get(m, (None, None))[1]) for m in self.metrics]
+                        series.append(ts, means + maxes)
+        except sqlite3.Error as e:
+            print(f"[TimeSeries] ⚠️ Failed to load {self.name}: {e}")
+
+
+def _nan(value: Optional[float]) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _median(sorted_values: List[float]) -> float:
+    n = len(sorted_values)
+    mid = n // 2
+    return sorted_values[mid] if n % 2 else (sorted_values[mid - 1] + sorted_values[mid]) / 2
@@ -2,16 +2,462 @@
 ICGL Governance — Budget Management
 ==================================
 
-Stubs for budget tracking and economic guardianship.
+Token accounting and economic guardianship.
+
+- TokenGovernor: records real prompt/completion tokens (per agent, per ADR,
+  per provider), enforces sliding-window tokens/min and requests/min limits,
+  and admits waiting calls by priority, so interactive chat pre-empts council
+  cycles, which pre-empt batch re-analysis.
+- Daily aggregates are flushed to the KB (`token_usage_daily`).
+- GovernedProvider puts the governor in front of an LLM provider chain.
+- TokenBudget / BudgetManager keep their original interface for callers.
 """
 
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+import atexit
+import contextvars
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+from src.core.core.llm import LLMProvider, LLMRequest, LLMResponse
+
+
+class Priority(IntEnum):
+    """Admission priority (lower value is admitted first)."""
+
+    INTERACTIVE = 0
+    COUNCIL = 1
+    BATCH = 2
+
+
+@dataclass
+class UsageScope:
+    """Attribution for LLM calls made inside `usage_scope` (and its child tasks)."""
+
+    adr_id: Optional[str] = None
+    priority: Priority = Priority.COUNCIL
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    requests: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+_usage_scope: contextvars.ContextVar[Optional[UsageScope]] = contextvars.ContextVar("icgl_usage_scope", default=None)
+
+
+@contextmanager
+def usage_scope(adr_id: Optional[str] = None, priority: Optional[Priority] = None) -> Iterator[UsageScope]:
+    """
+    Attributes every LLM call in this block to `adr_id` at `priority`.
+    Nested scopes inherit what they do not override; totals are per scope.
+    """
+    parent = _usage_scope.get()
+    scope = UsageScope(
+        adr_id=adr_id if adr_id is not None else (parent.adr_id if parent else None),
+        priority=priority if priority is not None else (parent.priority if parent else Priority.COUNCIL),
+    )
+    token = _usage_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _usage_scope.reset(token)
+
+
+def current_usage_scope() -> Optional[UsageScope]:
+    return _usage_scope.get()
+
+
+@dataclass
+class Ticket:
+    """An admitted call: its reservation in the sliding window."""
+
+    entry: List[float]
+    estimated: int
+    priority: Priority
+    prompt_estimate: int = 0  # booked when the provider reports no usage
+    admitted_at: float = field(default_factory=time.monotonic)
+    settled: bool = False
+
+
+def _empty_aggregate() -> Dict[str, int]:
+    return {"prompt_tokens": 0, "completion_tokens": 0, "requests": 0}
+
+
+def estimate_prompt_tokens(request: LLMRequest) -> int:
+    from src.core.llm.context_assembly import estimate_tokens
+
+    return estimate_tokens(request.system_prompt) + estimate_tokens(request.prompt)
+
+
+def estimate_request_tokens(request: LLMRequest) -> int:
+    """
+    Reservation for one call: prompt estimate + max completion tokens.
+    (Provider rate limiters count max_tokens too; the reservation is
+    replaced by the real usage once the response arrives.)
+    """
+    return estimate_prompt_tokens(request) + int(request.max_tokens or 0)
+
+
+class TokenGovernor:
+    """
+    Sliding-window rate governor with priority admission.
+
+    Usage:
+        governor = TokenGovernor(tokens_per_minute=90_000, requests_per_minute=500)
+        ticket = await governor.acquire(estimated_tokens=1200, priority=Priority.INTERACTIVE)
+        ...call the LLM...
+        governor.record(ticket, response.usage, agent_id="agent-architect", provider="openai")
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: int = 90_000,
+        requests_per_minute: int = 500,
+        window_seconds: float = 60.0,
+        storage: Any = None,
+        flush_interval: float = 30.0,
+    ):
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self.window_seconds = window_seconds
+        self.storage = storage
+        self.flush_interval = flush_interval
+
+        self._entries: Deque[List[float]] = deque()  # [admitted_at, tokens]
+        self._window_tokens = 0.0
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self._lock = threading.Lock()
+        self._daily: Dict[Tuple[str, str, str], Dict[str, int]] = {}
+        self._pending: Dict[Tuple[str, str, str], Dict[str, int]] = {}
+        self._last_flush = time.monotonic()
+        self._stats: Dict[str, int] = {
+            "admitted": 0,
+            "queued": 0,
+            "recorded_tokens": 0,
+            "estimated_tokens": 0,  # part of recorded_tokens booked from the prompt estimate
+            "released": 0,
+            "coalesced_tokens": 0,  # attributed to callers that shared another call (not in recorded_tokens)
+        }
+        self._completed_requests = 0
+
+    # --- Sliding window ---
+
+    def _prune(self, now_t: float) -> None:
+        horizon = now_t - self.window_seconds
+        while self._entries and self._entries[0][0] <= horizon:
+            self._window_tokens -= self._entries.popleft()[1]
+
+    def _can_admit(self, estimated: int, now_t: float) -> bool:
+        self._prune(now_t)
+        if not self._entries:
+            return True  # An oversized call must still be able to run alone
+        if len(self._entries) >= self.requests_per_minute:
+            return False
+        return self._window_tokens + estimated <= self.tokens_per_minute
+
+    def _reserve(self, estimated: int, priority: Priority, now_t: float) -> Ticket:
+        entry = [now_t, float(estimated)]
+        self._entries.append(entry)
+        self._window_tokens += estimated
+        self._stats["admitted"] += 1
+        return Ticket(entry=entry, estimated=estimated, priority=priority)
+
+    def _adjust(self, ticket: Ticket, tokens: int) -> None:
+        # Entries already outside the window no longer count
+        if self._entries and ticket.entry[0] >= self._entries[0][0]:
+            self._window_tokens += tokens - ticket.entry[1]
+        ticket.entry[1] = float(tokens)
+
+    # --- Admission ---
+
+    async def acquire(self, estimated_tokens: int, priority: Priority = Priority.COUNCIL) -> Ticket:
+        """Waits until the call fits the window; higher priorities are admitted first."""
+        now_t = time.monotonic()
+        if not self._waiters and self._can_admit(estimated_tokens, now_t):
+            return self._reserve(estimated_tokens, priority, now_t)
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), estimated_tokens, future))
+        self._stats["queued"] += 1
+        self._pump()
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(future.result())
+            raise
+
+    def _pump(self) -> None:
+        """Admits queued calls in priority order while the window has room."""
+        now_t = time.monotonic()
+        while self._waiters:
+            priority, _, estimated, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_admit(estimated, now_t):
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(self._reserve(estimated, Priority(priority), now_t))
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._waiters and self._entries:
+            # Room frees up when the oldest entry leaves the window
+            delay = max(0.001, self._entries[0][0] + self.window_seconds - now_t)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._pump)
+
+    # --- Accounting ---
+
+    def record(
+        self,
+        ticket: Ticket,
+        usage: Optional[Dict[str, int]],
+        agent_id: Optional[str] = None,
+        adr_id: Optional[str] = None,
+        provider: Optional[str] = None,
+        shared: bool = False,
+    ) -> None:
+        """
+        Replaces the reservation with real usage and attributes it. When the provider
+        reports no usage, only the prompt estimate is booked (never the max_tokens
+        reservation) and it is counted under `estimated_tokens`.
+
+        `shared` marks a caller served by another caller's in-flight call: the usage is
+        attributed to its scope, agent and ADR, but its reservation is freed instead of
+        booking the same call into the rate window (and the provider totals) again.
+        """
+        usage = usage or {}
+        prompt = int(usage.get("prompt_tokens", 0) or 0)
+        completion = int(usage.get("completion_tokens", 0) or 0)
+        if not prompt and not completion:
+            prompt = int(usage.get("total_tokens", 0) or 0)
+            if not prompt:
+                prompt = ticket.prompt_estimate
+                self._stats["estimated_tokens"] += prompt
+        total = prompt + completion
+
+        if not ticket.settled:
+            ticket.settled = True
+            self._adjust(ticket, 0 if shared else total)
+        if shared:
+            self._stats["coalesced_tokens"] += total
+            provider = None
+        else:
+            self._stats["recorded_tokens"] += total
+        self._completed_requests += 1
+
+        scope = _usage_scope.get()
+        if scope is not None:
+            scope.prompt_tokens += prompt
+            scope.completion_tokens += completion
+            scope.requests += 1
+            adr_id = adr_id or scope.adr_id
+
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        with self._lock:
+            for scope_name, key in (("agent", agent_id), ("adr", adr_id), ("provider", provider)):
+                if not key:
+                    continue
+                for bucket in (self._daily, self._pending):
+                    agg = bucket.setdefault((day, scope_name, key), _empty_aggregate())
+                    agg["prompt_tokens"] += prompt
+                    agg["completion_tokens"] += completion
+                    agg["requests"] += 1
+
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        self._pump_if_running()
+
+    def release(self, ticket: Ticket) -> None:
+        """Frees the token reservation of a call that produced no usage (it still counts as a request)."""
+        if ticket.settled:
+            return
+        ticket.settled = True
+        self._adjust(ticket, 0)
+        self._stats["released"] += 1
+        self._pump_if_running()
+
+    def _pump_if_running(self) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._pump()
+
+    def flush(self) -> None:
+        """Persists pending daily aggregates to the KB."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending or self.storage is None:
+            return
+        rows = [{"day": day, "scope": scope, "key": key, **agg} for (day, scope, key), agg in pending.items()]
+        try:
+            self.storage.add_token_usage(rows)
+        except Exception as e:
+            print(f"[TokenGovernor] ⚠️ Failed to persist token usage: {e}")
+            with self._lock:
+                for (day, scope, key), agg in pending.items():
+                    merged = self._pending.setdefault((day, scope, key), _empty_aggregate())
+                    for name, value in agg.items():
+                        merged[name] += value
+
+    # --- Introspection ---
+
+    def average_request_tokens(self) -> int:
+        if not self._completed_requests:
+            return 2000
+        return max(1, self._stats["recorded_tokens"] // self._completed_requests)
+
+    def headroom(self) -> Dict[str, Any]:
+        """Remaining capacity in the current window, plus queue depth per priority."""
+        self._prune(time.monotonic())
+        queued: Dict[str, int] = {p.name.lower(): 0 for p in Priority}
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                queued[Priority(priority).name.lower()] += 1
+        tokens_left = max(0, int(self.tokens_per_minute - self._window_tokens))
+        requests_left = max(0, self.requests_per_minute - len(self._entries))
+        return {
+            "tokens": tokens_left,
+            "requests": requests_left,
+            "tokens_per_minute": self.tokens_per_minute,
+            "requests_per_minute": self.requests_per_minute,
+            "utilization": round(1 - tokens_left / self.tokens_per_minute, 3) if self.tokens_per_minute else 1.0,
+            "queued": queued,
+            "avg_request_tokens": self.average_request_tokens(),
+        }
+
+    def can_admit(self, estimated_tokens: int, priority: Priority = Priority.COUNCIL) -> bool:
+        """Non-blocking admission check: would a call of this size run now without queueing?"""
+        ahead = any(p <= priority and not f.done() for p, _, _, f in self._waiters)
+        return not ahead and self._can_admit(estimated_tokens, time.monotonic())
+
+    async def wait_for_headroom(self, estimated_tokens: int, priority: Priority = Priority.BATCH) -> None:
+        """Waits until `estimated_tokens` would be admitted (without reserving them)."""
+        ticket = await self.acquire(estimated_tokens, priority)
+        self._entries.remove(ticket.entry)
+        self._window_tokens -= ticket.entry[1]
+        ticket.settled = True
+        self._pump()
+
+    def usage_today(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        out: Dict[str, Dict[str, Dict[str, int]]] = {}
+        with self._lock:
+            for (d, scope, key), agg in self._daily.items():
+                if d == day:
+                    out.setdefault(scope, {})[key] = dict(agg)
+        return out
+
+    def metrics(self) -> Dict[str, Any]:
+        return {**self._stats, "headroom": self.headroom(), "today": self.usage_today()}
+
+
+class GovernedProvider(LLMProvider):
+    """
+    Admits every call through the TokenGovernor and records its real usage.
+
+    Usage:
+        provider = GovernedProvider(ResilientProvider(OpenAIProvider()), get_token_governor())
+    """
+
+    def __init__(self, inner: LLMProvider, governor: TokenGovernor):
+        self.inner = inner
+        self.governor = governor
+
+    def _attribution(self, request: LLMRequest) -> Tuple[Priority, Optional[str], Optional[str]]:
+        scope = _usage_scope.get()
+        metadata = request.metadata or {}
+        priority = metadata.get("priority")
+        if priority is None:
+            priority = scope.priority if scope else Priority.COUNCIL
+        adr_id = metadata.get("adr_id") or (scope.adr_id if scope else None)
+        return Priority(priority), metadata.get("agent_id"), adr_id
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        priority, agent_id, adr_id = self._attribution(request)
+        ticket = await self.governor.acquire(estimate_request_tokens(request), priority)
+        ticket.prompt_estimate = estimate_prompt_tokens(request)
+        try:
+            response = await self.inner.generate(request)
+        except BaseException:
+            self.governor.release(ticket)
+            raise
+        self.governor.record(
+            ticket,
+            response.usage,
+            agent_id=agent_id,
+            adr_id=adr_id,
+            provider=response.provider,
+            shared=response.coalesced,
+        )
+        return response
+
+    async def generate_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        from src.core.llm.context_assembly import estimate_tokens
+
+        priority, agent_id, adr_id = self._attribution(request)
+        ticket = await self.governor.acquire(estimate_request_tokens(request), priority)
+        completion = 0
+        try:
+            async for chunk in self.inner.generate_stream(request):
+                completion += estimate_tokens(chunk)
+                yield chunk
+        finally:
+            if not completion:
+                self.governor.release(ticket)
+            else:
+                # Streams carry no usage block: record the local estimate
+                usage = {"prompt_tokens": estimate_prompt_tokens(request), "completion_tokens": completion}
+                self.governor.record(ticket, usage, agent_id=agent_id, adr_id=adr_id, provider="stream")
+
+    def metrics(self) -> Dict[str, Any]:
+        metrics = dict(self.inner.metrics())
+        metrics["governor"] = self.governor.metrics()
+        return metrics
+
+
+_governor: Optional[TokenGovernor] = None
+
+
+def get_token_governor() -> TokenGovernor:
+    """
+    Process-wide governor (limits from ICGL_LLM_TPM / ICGL_LLM_RPM).
+    Daily aggregates are persisted once a KB storage is attached (see ICGL).
+    """
+    global _governor
+    if _governor is None:
+        _governor = TokenGovernor(
+            tokens_per_minute=int(os.getenv("ICGL_LLM_TPM", 90_000)),
+            requests_per_minute=int(os.getenv("ICGL_LLM_RPM", 500)),
+        )
+        atexit.register(_governor.flush)
+    return _governor
 
 
 class TokenBudget:
-    def __init__(self):
-        self.limit = 1000000
+    """Per-cycle token ceiling, checked against real usage (ICGL_CYCLE_TOKEN_LIMIT)."""
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit or int(os.getenv("ICGL_CYCLE_TOKEN_LIMIT", 1000000))
         self.used = 0
 
     def check_usage(self, current_tokens: int) -> bool:
@@ -31,12 +477,20 @@ class TokenBudget:
 
 
 class BudgetManager:
+    """Manual usage recording; forwards to the governor's daily aggregates."""
+
     def __init__(self):
         self.total_tokens = 0
         self.budget_limit = 1000000
 
     def record_usage(self, agent_id: str, tokens: int):
         self.total_tokens += tokens
+        governor = get_token_governor()
+        governor.record(
+            Ticket(entry=[time.monotonic(), 0.0], estimated=tokens, priority=Priority.COUNCIL, settled=True),
+            {"total_tokens": tokens},
+            agent_id=agent_id,
+        )
 
 
 budget_manager = BudgetManager()
@@ -9,7 +9,8 @@ Manifesto Reference:
 - "ICGL: Every important decision flows through governance before execution."
 """
 
-from typing import Optional
+import asyncio
+from typing import Any, Dict, Optional
 
 from src.core.agents.core.base import Problem
 from src.core.agents.infrastructure.registry import AgentRegistry, SynthesizedResult
@@ -17,8 +18,7 @@ from src.core.core.observability import SystemObserver
 from src.core.core.runtime_guard import RuntimeIntegrityGuard
 from src.core.hdal import HDAL
 from src.core.kb import PersistentKnowledgeBase
-from src.core.kb.schemas import ADR, HumanDecision, LearningLog, now, uid
-from src.core.memory.qdrant_adapter import Document
+from src.core.kb.schemas import ADR, HumanDecision, LearningLog, now
 from src.core.policies import PolicyEnforcer
 from src.core.sentinel import Sentinel
 
@@ -51,7 +51,9 @@ class ICGL:
         self.enforcer = PolicyEnforcer(self.kb)
         self.observer = SystemObserver(self.kb)
         self.hdal = HDAL()
-        self._memory_bootstrapped = False
+        self._memory_task: Optional[asyncio.Task] = None
+        self.memory_progress: Dict[str, Any] = {"status": "pending", "indexed": 0, "total": 0}
+        self._proposal_index = None  # MinHash/LSH over ADR text, built on first use
 
         # 2.1 Initialize Engineer (New in Cycle 5) - optional via env
         import os
@@ -67,14 +69,20 @@ class ICGL:
         # If db_path is data/kb.db, we use data/qdrant_memory
         import os
 
-        from src.core.memory.qdrant_adapter import QdrantAdapter
+        from src.core.memory.numpy_store import NumpyVectorStore
 
         mem_path = os.path.join(os.path.dirname(db_path), "qdrant_memory")
-        self.memory = QdrantAdapter(path=mem_path)
+        self.memory = NumpyVectorStore(path=mem_path)
+        self.sentinel.vector_store = self.memory  # enables S-11 semantic drift checks
 
         # 4. Initialize Agent Pool
         self.registry = AgentRegistry()
         self._register_internal_agents()
+
+        # 4.1 Token usage aggregates persist into this KB
+        governor = self.registry.token_governor()
+        if governor is not None and governor.storage is None:
+            governor.storage = self.kb.storage
         # Verify decision chain integrity
         ok, broken_at = self.observer.verify_merkle_chain()
         if not ok:
@@ -121,10 +129,10 @@ class ICGL:
         4. Human Sovereign Decision (HDAL)
         5. Knowledge Base Update
         """
-        # Ensure memory is ready
+        # Ensure memory is loaded; KB warm-up continues in the background
         if self.memory:
             await self.memory.initialize()
-            await self._bootstrap_memory()
+            self.start_memory_bootstrap()
 
         print(f"\n[ICGL] 🔁 Starting Governance Cycle for: {adr.title}")
 
@@ -163,9 +171,19 @@ class ICGL:
         # For now, we trust Sentinel Agent to populate them in its result,
         # BUT we also want to show them explicitly.
         # Let's run a dedicated scan for the UI Context.
-        sentinel_alerts = await self.sentinel.scan_adr_detailed_async(adr, self.kb)
+        from src.core.memory.retrieval_cache import retrieval_scope
+
+        # Sentinel drift checks and agent recalls share one retrieval cache for the cycle
+        with retrieval_scope(cycle_id=adr.id):
+            sentinel_alerts = await self.sentinel.scan_adr_detailed_async(adr, self.kb)
 
-        synthesis: SynthesizedResult = await self.registry.run_and_synthesize(problem, self.kb)
+            # Alert profile feeds adaptive council selection
+            problem.metadata["sentinel_alerts"] = [
+                {"category": a.category.value, "severity": a.severity.value, "rule_id": a.rule_id}
+                for a in sentinel_alerts
+            ]
+
+            synthesis: SynthesizedResult = await self.registry.run_and_synthesize(problem, self.kb)
         print(f"   ✅ Analysis Complete. Confidence: {synthesis.overall_confidence:.0%}")
 
         # ---------------------------------------------------------
@@ -204,7 +222,7 @@ class ICGL:
 
         # 🧠 Synchronize Memory (Cycle 2/3/8)
         # We index the ADR content and the Decision Rationale
-        from src.core.memory.qdrant_adapter import Document
+        from src.core.memory.interface import Document
 
         memory_content = (
             f"ADR: {adr.title}\nContext: {adr.context}\nDecision: {decision.action}\nRationale: {decision.rationale}"
@@ -213,7 +231,13 @@ class ICGL:
             Document(
                 id=f"adr-{adr.id}",
                 content=memory_content,
-                metadata={"type": "adr", "status": adr.status, "action": decision.action},
+                metadata={
+                    "type": "adr",
+                    "adr_id": adr.id,
+                    "title": adr.title,
+                    "status": adr.status,
+                    "action": decision.action,
+                },
             )
         )
 
@@ -269,49 +293,70 @@ class ICGL:
         print(f"[ICGL] ✅ Cycle #{log.cycle} Completed Successfully.")
         return decision
 
-    async def _bootstrap_memory(self):
-        """Ingest KB and lessons into memory once per engine lifecycle."""
-        if self._memory_bootstrapped or not self.memory or getattr(self.memory, "mock_mode", False):
-            self._memory_bootstrapped = True
-            return
-        # Index policies
-        for policy in self.kb.policies.values():
-            await self.memory.add_document(
-                Document(
-                    id=policy.id,
-                    content=f"Policy {policy.code}: {policy.title}. Rule: {policy.rule}. Severity: {policy.severity}",
-                    metadata={"type": "policy", "code": policy.code},
-                )
-            )
-        # Index ADRs
-        for adr in self.kb.adrs.values():
-            await self.memory.add_document(
-                Document(
-                    id=adr.id,
-                    content=f"ADR {adr.title}. Status: {adr.status}. Decision: {adr.decision}. Context: {adr.context}",
-                    metadata={"type": "adr", "status": adr.status},
-                )
-            )
-        # Index lessons/interventions
-        import json
-        from pathlib import Path
-
-        lessons_path = Path("data/logs/interventions.jsonl")
-        if lessons_path.exists():
-            with open(lessons_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        data = json.loads(line)
-                        await self.memory.add_document(
-                            Document(
-                                id=f"lesson-{data.get('id', uid())}",
-                                content=f"Human {data.get('human_action')} proposal: {data.get('original_recommendation')} Reason: {data.get('reason')}",
-                                metadata={"type": "lesson", "adr_id": data.get("adr_id")},
-                            )
-                        )
-                    except Exception:
-                        continue
-        self._memory_bootstrapped = True
+    def start_memory_bootstrap(self) -> Optional["asyncio.Task"]:
+        """
+        Schedules memory warm-up in the background (once per engine lifecycle; a failed
+        warm-up is retried on the next call).
+        Governance keeps serving meanwhile; progress is in `memory_status()`.
+        """
+        if self.memory is None or getattr(self.memory, "mock_mode", False):
+            self.memory_progress["status"] = "ready"
+            return None
+        task = self._memory_task
+        if task is not None:
+            if task.done():
+                if self.memory_progress["status"] == "ready":
+                    return task
+            elif not task.get_loop().is_closed():
+                return task
+        # First call, a failed warm-up (retried), or the loop that owned an unfinished warm-up has gone away
+        self._memory_task = asyncio.get_running_loop().create_task(self._bootstrap_memory())
+        return self._memory_task
+
+    async def wait_for_memory(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the warm-up started by `start_memory_bootstrap`; True when memory is ready."""
+        task = self.start_memory_bootstrap()
+        if task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return self.memory_progress["status"] == "ready"
+
+    def memory_status(self) -> Dict[str, Any]:
+        stats = self.memory.stats() if self.memory is not None and hasattr(self.memory, "stats") else {}
+        return {**self.memory_progress, "store": stats}
+
+    def proposal_index(self):
+        """
+        Near-duplicate index over ADR title/context/decision (see `src.core.memory.near_duplicates`).
+        Built from the KB on first use; ADRs added since are indexed on the next call.
+        """
+        from src.core.memory.near_duplicates import NearDuplicateIndex, proposal_text
+
+        if self._proposal_index is None:
+            self._proposal_index = NearDuplicateIndex()
+        index = self._proposal_index
+        if len(index) != len(self.kb.adrs):
+            for adr in list(self.kb.adrs.values()):
+                if adr.id not in index:
+                    index.add(adr.id, proposal_text(adr.title, adr.context, adr.decision))
+        return index
+
+    async def _bootstrap_memory(self, full: bool = False):
+        """Syncs KB policies, ADRs and lessons into memory (only changes since the last sync)."""
+        from src.core.memory.sync import MemorySync
+
+        progress = self.memory_progress
+        progress.update(status="running", indexed=0, total=0, started_at=now(), finished_at=None, error=None)
+        try:
+            report = await MemorySync(self.kb.storage, self.memory).sync(full=full, progress=progress)
+            progress.update(status="ready", finished_at=now(), last_sync=report.to_dict())
+            changed = sum(report.upserted.values()) + sum(report.deleted.values())
+            print(f"[ICGL] 🧠 Memory synced: {changed} changes ({'full' if report.full else 'incremental'}).")
+        except Exception as e:
+            progress.update(status="failed", error=str(e), finished_at=now())
+            print(f"[ICGL] ⚠️ Memory sync failed: {e}")
 
     def _log_run_json(self, adr, synthesis, decision, log):
         """Saves detailed run artifacts to JSON."""
@@ -329,6 +374,9 @@ class ICGL:
                 "consensus_recommendations": synthesis.consensus_recommendations,
                 "all_concerns": synthesis.all_concerns,
                 "agent_results": [asdict(r) for r in synthesis.individual_results],
+                "consultation_graph": getattr(synthesis, "consultation_graph", None),
+                "council": getattr(synthesis, "council", None),
+                "retrieval": getattr(synthesis, "retrieval", None),
             },
             "decision": asdict(decision),
         }
@@ -242,6 +242,11 @@ class PersistentKnowledgeBase:
     # Registration APIs (with auto-persistence)
     # =========================================================================
 
+    @property
+    def storage(self) -> StorageBackend:
+        """Underlying SQLite backend (for subsystems persisting their own tables)."""
+        return self._storage
+
     def add_concept(self, concept: Concept) -> None:
         """Registers and persists a concept."""
         if self._validator:
@@ -333,6 +338,10 @@ class PersistentKnowledgeBase:
         """Persists an agent performance metric."""
         self._storage.save_agent_metric(metric)
 
+    def get_agent_metric_summary(self, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Per-agent aggregates of recorded agent metrics."""
+        return self._storage.load_agent_metric_summary(since=since)
+
     def record_decision_ledger(self, node_hash: str, prev_hash: str, payload: str, timestamp: str) -> int:
         """Appends a node to the Merkle Sovereign Ledger."""
         return self._storage.append_merkle_node(node_hash, prev_hash, payload, timestamp)
@@ -16,7 +16,7 @@ Features:
 import json  # noqa: E402
 import sqlite3  # noqa: E402
 from pathlib import Path  # noqa: E402
-from typing import TYPE_CHECKING, Any, Dict, List, Optional  # noqa: E402
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple  # noqa: E402
 
 if TYPE_CHECKING:
     from .schemas import RoadmapItem
@@ -205,6 +205,17 @@ class StorageBackend:
                     timestamp TEXT NOT NULL
                 );
 
+                -- Token Usage (daily aggregates per agent / ADR / provider)
+                CREATE TABLE IF NOT EXISTS token_usage_daily (
+                    day TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                    completion_tokens INTEGER NOT NULL DEFAULT 0,
+                    requests INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, scope, key)
+                );
+
                 -- Merkle Sovereign Ledger
                 CREATE TABLE IF NOT EXISTS merkle_ledger (
                     node_index INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -370,18 +381,22 @@ class StorageBackend:
         policies = {}
         with self._get_connection() as conn:
             for row in conn.execute("SELECT * FROM policies"):
-                policy = Policy(
-                    id=row["id"],
-                    code=row["code"],
-                    title=row["title"],
-                    rule=row["rule"],
-                    severity=row["severity"],
-                    enforced_by=json.loads(row["enforced_by"]),
-                    created_at=row["created_at"],
-                )
+                policy = self._policy_from_row(row)
                 policies[policy.id] = policy
         return policies
 
+    @staticmethod
+    def _policy_from_row(row: sqlite3.Row) -> Policy:
+        return Policy(
+            id=row["id"],
+            code=row["code"],
+            title=row["title"],
+            rule=row["rule"],
+            severity=row["severity"],
+            enforced_by=json.loads(row["enforced_by"]),
+            created_at=row["created_at"],
+        )
+
     # =========================================================================
     # Signal Operations
     # =========================================================================
@@ -458,21 +473,25 @@ class StorageBackend:
         adrs = {}
         with self._get_connection() as conn:
             for row in conn.execute("SELECT * FROM adrs"):
-                adr = ADR(
-                    id=row["id"],
-                    title=row["title"],
-                    status=row["status"],
-                    context=row["context"],
-                    decision=row["decision"],
-                    consequences=json.loads(row["consequences"]),
-                    related_policies=json.loads(row["related_policies"]),
-                    sentinel_signals=json.loads(row["sentinel_signals"]),
-                    human_decision_id=row["human_decision_id"],
-                    created_at=row["created_at"],
-                )
+                adr = self._adr_from_row(row)
                 adrs[adr.id] = adr
         return adrs
 
+    @staticmethod
+    def _adr_from_row(row: sqlite3.Row) -> ADR:
+        return ADR(
+            id=row["id"],
+            title=row["title"],
+            status=row["status"],
+            context=row["context"],
+            decision=row["decision"],
+            consequences=json.loads(row["consequences"]),
+            related_policies=json.loads(row["related_policies"]),
+            sentinel_signals=json.loads(row["sentinel_signals"]),
+            human_decision_id=row["human_decision_id"],
+            created_at=row["created_at"],
+        )
+
     # =========================================================================
     # Human Decision Operations
     # =========================================================================
@@ -622,6 +641,59 @@ class StorageBackend:
             )
             conn.commit()
 
+    def load_agent_metric_summary(self, since: Optional[str] = None, task_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Per-agent aggregates of agent_metrics (runs, success rate, mean confidence and latency)."""
+        query = """
+            SELECT agent_id, role, COUNT(*) AS runs,
+                   AVG(success) AS success_rate,
+                   AVG(confidence_score) AS mean_confidence,
+                   AVG(latency_ms) AS mean_latency_ms,
+                   MAX(latency_ms) AS max_latency_ms,
+                   MAX(timestamp) AS last_seen
+            FROM agent_metrics WHERE 1=1"""
+        params: List[Any] = []
+        if since:
+            query += " AND timestamp >= ?"
+            params.append(since)
+        if task_type:
+            query += " AND task_type = ?"
+            params.append(task_type)
+        query += " GROUP BY agent_id, role ORDER BY agent_id"
+        with self._get_connection() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def add_token_usage(self, rows: List[Dict[str, Any]]) -> None:
+        """Adds token usage deltas to the daily aggregates (additive upsert)."""
+        if not rows:
+            return
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO token_usage_daily (day, scope, key, prompt_tokens, completion_tokens, requests)
+                VALUES (:day, :scope, :key, :prompt_tokens, :completion_tokens, :requests)
+                ON CONFLICT(day, scope, key) DO UPDATE SET
+                    prompt_tokens = prompt_tokens + excluded.prompt_tokens,
+                    completion_tokens = completion_tokens + excluded.completion_tokens,
+                    requests = requests + excluded.requests
+            """,
+                rows,
+            )
+            conn.commit()
+
+    def load_token_usage(self, day: Optional[str] = None, scope: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Loads daily token aggregates, optionally filtered by day (YYYY-MM-DD) and scope."""
+        query = "SELECT * FROM token_usage_daily WHERE 1=1"
+        params: List[Any] = []
+        if day:
+            query += " AND day = ?"
+            params.append(day)
+        if scope:
+            query += " AND scope = ?"
+            params.append(scope)
+        query += " ORDER BY day DESC, scope, prompt_tokens + completion_tokens DESC"
+        with self._get_connection() as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
     def append_merkle_node(self, node_hash: str, prev_hash: str, payload: str, timestamp: str) -> int:
         """Appends a node to the Merkle Sovereign Ledger."""
         with self._get_connection() as conn:
@@ -748,6 +820,40 @@ class StorageBackend:
                 states[row["adr_id"]] = json.loads(row["state_data"])
             return states
 
+    # =========================================================================
+    # Change Tracking (memory sync)
+    # =========================================================================
+
+    _CHANGE_TRACKED = {"policies": "_policy_from_row", "adrs": "_adr_from_row"}
+
+    def load_changes_since(
+        self, table: str, rowid: int = 0, ids: Optional[Set[str]] = None
+    ) -> Tuple[int, List[Any]]:
+        """
+        Entities of `table` written after `rowid` (plus any in `ids`), and the
+        table's current max rowid.
+
+        `INSERT OR REPLACE` gives every save a fresh rowid, so max(rowid) is a
+        change watermark for tables without an updated_at column.
+        """
+        builder = getattr(self, self._CHANGE_TRACKED[table])
+        with self._get_connection() as conn:
+            max_rowid = conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0]
+            rows = list(conn.execute(f"SELECT * FROM {table} WHERE rowid > ? ORDER BY rowid", (rowid,)))
+            wanted = set(ids or ()) - {row["id"] for row in rows}
+            for start in range(0, len(wanted), 500):
+                chunk = sorted(wanted)[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(conn.execute(f"SELECT * FROM {table} WHERE id IN ({placeholders})", chunk))
+        return int(max_rowid), [builder(row) for row in rows]
+
+    def load_entity_ids(self, table: str) -> Set[str]:
+        """All ids of a change-tracked table (deletion detection)."""
+        if table not in self._CHANGE_TRACKED:
+            raise ValueError(f"Table {table!r} is not change-tracked")
+        with self._get_connection() as conn:
+            return {row[0] for row in conn.execute(f"SELECT id FROM {table}")}
+
     def get_stats(self) -> Dict[str, int]:
         """Returns counts for all entity types."""
         with self._get_connection() as conn:
@@ -1,5 +1,9 @@
-from dataclasses import dataclass
-from typing import Optional
+import threading
+from dataclasses import astuple, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.core.llm import LLMProvider, LLMRequest, OpenAIProvider
+from src.core.llm.prompts import JSONParser
 
 
 @dataclass
@@ -13,18 +17,66 @@ class LLMConfig:
 
 
 class LLMClient:
-    def __init__(self, config: Optional[LLMConfig] = None, *args, **kwargs):
-        self.api_key: Optional[str] = None
+    """
+    Convenience facade for callers outside the agent registry. Calls go to `provider`,
+    by default an OpenAIProvider (drawing its connections from the shared pool) that is
+    built on first use, so constructing a client needs no API key.
+    """
+
+    def __init__(self, config: Optional[LLMConfig] = None, provider: Optional[LLMProvider] = None):
         self.config = config or LLMConfig()
+        self._provider = provider
+        self._lock = threading.Lock()
+
+    @property
+    def provider(self) -> LLMProvider:
+        with self._lock:
+            if self._provider is None:
+                if self.config.provider != "openai":
+                    raise ValueError(f"Unsupported LLM provider: {self.config.provider}")
+                self._provider = OpenAIProvider(model=self.config.model)
+            return self._provider
+
+    def _request(
+        self, prompt: str, system_prompt: Optional[str], config: Optional[LLMConfig], json_mode: bool
+    ) -> LLMRequest:
+        config = config or self.config
+        request = LLMRequest(prompt=prompt, temperature=config.temperature, json_mode=json_mode or config.json_mode)
+        if system_prompt:
+            request.system_prompt = system_prompt
+        if config.max_tokens:
+            request.max_tokens = config.max_tokens
+        return request
+
+    async def acomplete(
+        self, prompt: str, system_prompt: Optional[str] = None, config: Optional[LLMConfig] = None
+    ) -> str:
+        response = await self.provider.generate(self._request(prompt, system_prompt, config, json_mode=False))
+        return response.content or ""
+
+    async def generate_json(
+        self, system_prompt: str, user_prompt: str, config: Optional[LLMConfig] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """JSON-mode completion; returns (parsed object, or {} when the reply holds none; usage)."""
+        response = await self.provider.generate(self._request(user_prompt, system_prompt, config, json_mode=True))
+        data = JSONParser.parse(response.content or "")
+        return (data if isinstance(data, dict) else {}), dict(response.usage or {})
 
-    async def acomplete(self, *args, **kwargs):
-        return "Stubbed LLM response"
 
-    async def generate_json(self, *args, **kwargs) -> tuple[dict, dict]:
-        return {}, {"total_tokens": 0}
+_shared_clients: Dict[Tuple, LLMClient] = {}
+_shared_lock = threading.Lock()
 
-    async def generate_tests(self, code: str):
-        return "Stubbed test generation report"
 
-    async def analyze_code(self, code: str):
-        return "Stubbed code analysis report"
+def get_llm_client(config: Optional[LLMConfig] = None) -> LLMClient:
+    """
+    Shared LLMClient per config, so agents stop constructing their own clients.
+    HTTP connections come from the process-wide pool (src.core.llm.pool).
+    """
+    config = config or LLMConfig()
+    key = astuple(config)
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = LLMClient(config)
+            _shared_clients[key] = client
+        return client
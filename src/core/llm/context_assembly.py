@@ -0,0 +1,273 @@
+"""
+ICGL LLM — Context Assembly
+===========================
+
+Builds agent prompts under a token budget instead of pasting every input verbatim.
+
+- A local token estimator (no network, no tokenizer download).
+- Prompts are made of prioritized sections. Higher priorities are filled first;
+  sections that cannot get their minimum share are dropped.
+- Oversized sections are compressed deterministically: first an extractive
+  summary (headings, bullets, lead sentence of each paragraph), then a
+  head + tail cut with an explicit omission marker.
+- Paragraphs repeated across sections (e.g. the steward echoing the ADR
+  context) are kept only in the highest-priority section.
+
+Same inputs always give the same prompt, so cached/coalesced requests still match.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+_WORD_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?؟])\s+")
+_KEEP_LINE_RE = re.compile(r"^\s*(#|[-*•]\s|\d+[.)]\s|[A-Z][A-Z _]{2,}:)")
+
+OMISSION_MARKER = "[… {n} tokens omitted …]"
+
+# Default input budget (tokens) per agent call; roles can be overridden below or via env
+DEFAULT_INPUT_BUDGET = 6000
+ROLE_INPUT_BUDGETS: Dict[str, int] = {
+    "secretary": 2000,
+    "monitor": 2000,
+    "visibility": 2000,
+    "architect": 8000,
+    "builder": 12000,
+}
+# Cap on recalled lessons appended to an agent's system prompt (ICGL_LESSONS_TOKEN_BUDGET)
+LESSONS_TOKEN_BUDGET = int(os.getenv("ICGL_LESSONS_TOKEN_BUDGET", 400))
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """
+    Local token estimate, close to BPE tokenizers on mixed English/Arabic/code text.
+    Common Latin words are 1 token; longer words add ~1 per 6 chars; non-Latin
+    scripts tokenize denser (~1 per 2 chars). Punctuation counts as 1.
+    """
+    if not text:
+        return 0
+    total = 0
+    for piece in _WORD_RE.findall(text):
+        if piece.isascii():
+            total += 1 + (len(piece) - 1) // 6
+        else:
+            total += 1 + (len(piece) - 1) // 2
+    return total
+
+
+def agent_input_budget(role: Optional[str]) -> int:
+    """Input token budget for one LLM call of `role` (ICGL_AGENT_INPUT_BUDGET[_<ROLE>])."""
+    if role:
+        override = os.getenv(f"ICGL_AGENT_INPUT_BUDGET_{role.upper()}")
+        if override:
+            return int(override)
+        if role in ROLE_INPUT_BUDGETS and not os.getenv("ICGL_AGENT_INPUT_BUDGET"):
+            return ROLE_INPUT_BUDGETS[role]
+    return int(os.getenv("ICGL_AGENT_INPUT_BUDGET", DEFAULT_INPUT_BUDGET))
+
+
+def _normalize(paragraph: str) -> str:
+    return " ".join(paragraph.lower().split())
+
+
+def _paragraphs(text: str) -> List[str]:
+    return [p for p in re.split(r"\n\s*\n", text) if p.strip()]
+
+
+def _cut_to_tokens(text: str, max_tokens: int, from_end: bool = False) -> str:
+    """Longest prefix (or suffix) of `text` within `max_tokens`, cut on a whitespace boundary."""
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    words = re.split(r"(\s+)", text)
+    if from_end:
+        words.reverse()
+    kept: List[str] = []
+    used = 0
+    for word in words:
+        cost = estimate_tokens(word)
+        if used + cost > max_tokens:
+            break
+        kept.append(word)
+        used += cost
+    if from_end:
+        kept.reverse()
+    return "".join(kept).strip()
+
+
+def summarize_extractive(text: str) -> str:
+    """Keeps structural lines (headings, bullets, LABELS:) and the lead sentence of each paragraph."""
+    out: List[str] = []
+    for paragraph in _paragraphs(text):
+        lines = paragraph.strip().splitlines()
+        structural = [ln for ln in lines if _KEEP_LINE_RE.match(ln)]
+        if structural:
+            out.append("\n".join(structural))
+        else:
+            out.append(_SENTENCE_END_RE.split(paragraph.strip(), maxsplit=1)[0])
+    return "\n\n".join(out)
+
+
+def truncate_middle(text: str, max_tokens: int) -> str:
+    """Keeps the head (2/3) and tail (1/3) of `text` with an omission marker in between."""
+    total = estimate_tokens(text)
+    if total <= max_tokens:
+        return text
+    marker_cost = estimate_tokens(OMISSION_MARKER.format(n=total))
+    room = max(0, max_tokens - marker_cost)
+    head = _cut_to_tokens(text, room * 2 // 3)
+    tail = _cut_to_tokens(text, room - estimate_tokens(head), from_end=True)
+    omitted = max(0, total - estimate_tokens(head) - estimate_tokens(tail))
+    return "\n".join(p for p in (head, OMISSION_MARKER.format(n=omitted), tail) if p)
+
+
+def fit_text(text: str, max_tokens: int) -> str:
+    """Compresses one text into `max_tokens`: unchanged, summarized, or head+tail truncated."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    summary = summarize_extractive(text)
+    if estimate_tokens(summary) <= max_tokens:
+        return summary
+    return truncate_middle(text, max_tokens)
+
+
+@dataclass
+class ContextSection:
+    """
+    One block of prompt input.
+
+    Attributes:
+        name: Identifier used in the assembly report.
+        text: The content.
+        priority: Higher is filled first and wins dedupe ties.
+        title: Optional header rendered above the content.
+        min_tokens: Below this share the section is dropped rather than mangled.
+        max_tokens: Hard cap for this section regardless of remaining budget.
+        compressible: False = all-or-nothing (e.g. instructions, output schema).
+    """
+
+    name: str
+    text: str
+    priority: int = 50
+    title: Optional[str] = None
+    min_tokens: int = 32
+    max_tokens: Optional[int] = None
+    compressible: bool = True
+
+
+@dataclass
+class AssembledContext:
+    """Result of an assembly: the text plus what happened to each section."""
+
+    text: str
+    tokens: int
+    budget: int
+    report: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    dropped: List[str] = field(default_factory=list)
+    sections: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def compressed(self) -> bool:
+        return bool(self.dropped) or any(r["final"] < r["original"] for r in self.report.values())
+
+
+class ContextAssembler:
+    """
+    Token-budgeted prompt builder.
+
+    Usage:
+        assembler = ContextAssembler(budget=agent_input_budget("architect"))
+        assembler.add("context", problem.context, priority=80, title="CONTEXT")
+        assembler.add("steward", steward.analysis, priority=60, title="INSTITUTIONAL MEMORY")
+        prompt = assembler.assemble().text
+    """
+
+    def __init__(self, budget: int, separator: str = "\n\n"):
+        self.budget = budget
+        self.separator = separator
+        self.sections: List[ContextSection] = []
+
+    def add(self, name: str, text: Optional[str], priority: int = 50, **kwargs) -> "ContextAssembler":
+        if text and text.strip():
+            self.sections.append(ContextSection(name=name, text=text.strip(), priority=priority, **kwargs))
+        return self
+
+    def assemble(self) -> AssembledContext:
+        # Stable priority order: ties keep insertion order
+        ranked = sorted(enumerate(self.sections), key=lambda item: (-item[1].priority, item[0]))
+
+        seen: Set[str] = set()
+        fitted: Dict[int, str] = {}
+        parts: Dict[str, str] = {}
+        report: Dict[str, Dict[str, int]] = {}
+        dropped: List[str] = []
+        remaining = self.budget
+        separator_cost = estimate_tokens(self.separator)
+
+        # Floor kept free for each section, so top priorities cannot starve the rest
+        floors = [
+            min(section.min_tokens, estimate_tokens(section.text))
+            + estimate_tokens(f"{section.title}:\n" if section.title else "")
+            + separator_cost
+            for _, section in ranked
+        ]
+
+        for position, (index, section) in enumerate(ranked):
+            original = estimate_tokens(section.text)
+            reserved = sum(floors[position + 1 :])
+
+            # Dedupe: drop paragraphs already present in a higher-priority section
+            paragraphs = _paragraphs(section.text)
+            kept_paragraphs = []
+            norms: Set[str] = set()
+            for paragraph in paragraphs:
+                norm = _normalize(paragraph)
+                if norm in seen or norm in norms:
+                    continue
+                norms.add(norm)
+                kept_paragraphs.append(paragraph.strip())
+            text = section.text if len(kept_paragraphs) == len(paragraphs) else "\n\n".join(kept_paragraphs)
+
+            header = f"{section.title}:\n" if section.title else ""
+            overhead = estimate_tokens(header) + (separator_cost if fitted else 0)
+            allowance = remaining - overhead
+            if allowance - reserved >= section.min_tokens:
+                allowance -= reserved
+            if section.max_tokens is not None:
+                allowance = min(allowance, section.max_tokens)
+
+            if not text:
+                report[section.name] = {"original": original, "final": 0}
+                continue
+
+            size = estimate_tokens(text)
+            if size > allowance and not section.compressible and size <= remaining - overhead:
+                # All-or-nothing sections may take the floors kept for lower priorities
+                allowance = size if section.max_tokens is None else min(size, section.max_tokens)
+            if size > allowance:
+                if not section.compressible or allowance < section.min_tokens:
+                    dropped.append(section.name)
+                    report[section.name] = {"original": original, "final": 0}
+                    continue
+                text = fit_text(text, allowance)
+
+            seen.update(norms)
+            final = estimate_tokens(text)
+            fitted[index] = header + text
+            parts[section.name] = text
+            remaining -= final + overhead
+            report[section.name] = {"original": original, "final": final}
+
+        # Render in the caller's order so prompts read naturally
+        text = self.separator.join(fitted[i] for i in sorted(fitted))
+        return AssembledContext(
+            text=text,
+            tokens=estimate_tokens(text),
+            budget=self.budget,
+            report=report,
+            dropped=dropped,
+            sections=parts,
+        )
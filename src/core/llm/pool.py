@@ -0,0 +1,200 @@
+"""
+ICGL LLM — Shared Client Pool
+=============================
+
+One process-wide pool of LLM API clients instead of a client per agent or
+per call.
+
+- SDK clients are keyed by provider config (provider, API key, base URL) and
+  created once; every agent and provider draws from the same instances.
+- All of them share one `httpx.AsyncClient`, so keep-alive connections (and
+  their TLS sessions) are reused across agents, with a bounded connection
+  limit for the whole process.
+- HTTP connections belong to the event loop that opened them: the pool
+  rebuilds itself transparently when used from a different loop (tests,
+  `asyncio.run` in scripts) instead of failing with a closed loop.
+- `startup()` / `shutdown()` are the app lifecycle hooks: warm a connection
+  before the first request, close every socket on exit.
+
+Configuration (env):
+    ICGL_LLM_MAX_CONNECTIONS   total connections across all clients (32)
+    ICGL_LLM_MAX_KEEPALIVE     idle keep-alive connections kept (16)
+    ICGL_LLM_KEEPALIVE_EXPIRY  seconds an idle connection is kept (30)
+    ICGL_LLM_HTTP_TIMEOUT      request timeout in seconds (60)
+    ICGL_LLM_HTTP2             "1" to negotiate HTTP/2 (needs `h2`)
+    ICGL_LLM_POOL_WARMUP       "0" to skip the startup warm-up request
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """HTTP limits shared by every pooled client."""
+
+    max_connections: int = 32
+    max_keepalive: int = 16
+    keepalive_expiry: float = 30.0
+    timeout: float = 60.0
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> "PoolLimits":
+        return cls(
+            max_connections=int(os.getenv("ICGL_LLM_MAX_CONNECTIONS", 32)),
+            max_keepalive=int(os.getenv("ICGL_LLM_MAX_KEEPALIVE", 16)),
+            keepalive_expiry=float(os.getenv("ICGL_LLM_KEEPALIVE_EXPIRY", 30.0)),
+            timeout=float(os.getenv("ICGL_LLM_HTTP_TIMEOUT", 60.0)),
+            http2=os.getenv("ICGL_LLM_HTTP2", "").lower() in {"1", "true", "yes"},
+        )
+
+
+def _key_fingerprint(api_key: Optional[str]) -> str:
+    # Never keep raw keys in pool keys / stats
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:12]
+
+
+class LLMClientPool:
+    """
+    Process-wide pool of SDK clients over one shared HTTP connection pool.
+
+    Usage:
+        pool = get_client_pool()
+        client = pool.openai()            # shared AsyncOpenAI
+        await pool.startup()              # app start: warm connections
+        await pool.shutdown()             # app stop: close sockets
+    """
+
+    def __init__(self, limits: Optional[PoolLimits] = None):
+        self.limits = limits or PoolLimits.from_env()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http: Any = None
+        self._clients: Dict[Tuple[str, str, Optional[str]], Any] = {}
+        self._stats = {"http_clients": 0, "clients_created": 0, "client_hits": 0, "rebuilds": 0, "warmups": 0}
+
+    # --- HTTP layer ---
+
+    def _current_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _build_http(self) -> Any:
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=self.limits.max_connections,
+            max_keepalive_connections=self.limits.max_keepalive,
+            keepalive_expiry=self.limits.keepalive_expiry,
+        )
+        http2 = self.limits.http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                print("[LLMPool] ⚠️ ICGL_LLM_HTTP2 set but `h2` is not installed; using HTTP/1.1.")
+                http2 = False
+        self._stats["http_clients"] += 1
+        return httpx.AsyncClient(limits=limits, timeout=self.limits.timeout, http2=http2)
+
+    def _ensure_loop(self) -> None:
+        """Drops clients bound to another (or a closed) event loop. Caller holds the lock."""
+        loop = self._current_loop()
+        if loop is None or loop is self._loop:
+            return
+        if self._loop is not None:
+            # Sockets of a finished loop cannot be awaited closed from here; let them be collected
+            self._stats["rebuilds"] += 1
+            self._clients.clear()
+            self._http = None
+        self._loop = loop
+
+    def http(self) -> Any:
+        """The shared httpx.AsyncClient for the current event loop."""
+        with self._lock:
+            self._ensure_loop()
+            if self._http is None:
+                self._http = self._build_http()
+            return self._http
+
+    # --- SDK clients ---
+
+    def openai(self, api_key: Optional[str] = None, base_url: Optional[str] = None) -> Any:
+        """Shared AsyncOpenAI for (api_key, base_url). Retries stay with the resilience layer."""
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        key = ("openai", _key_fingerprint(api_key), base_url)
+        with self._lock:
+            self._ensure_loop()
+            client = self._clients.get(key)
+            if client is not None:
+                self._stats["client_hits"] += 1
+                return client
+            if self._http is None:
+                self._http = self._build_http()
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                raise ImportError("openai package is not installed. Run `pip install openai`.")
+            client = AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0, http_client=self._http)
+            self._clients[key] = client
+            self._stats["clients_created"] += 1
+            return client
+
+    # --- Lifecycle ---
+
+    async def startup(self, warmup: Optional[bool] = None) -> None:
+        """App startup hook: binds the pool to the serving loop and warms one connection."""
+        self.http()
+        if warmup is None:
+            warmup = os.getenv("ICGL_LLM_POOL_WARMUP", "1").lower() in {"1", "true", "yes"}
+        if not warmup or not os.getenv("OPENAI_API_KEY"):
+            return
+        try:
+            client = self.openai()
+            # Cheap authenticated GET: opens the TCP+TLS connection the first council call will reuse
+            await asyncio.wait_for(client.models.list(), timeout=5.0)
+            self._stats["warmups"] += 1
+            print("[LLMPool] 🔥 LLM connection pool warmed.")
+        except Exception as e:
+            print(f"[LLMPool] ⚠️ Warm-up skipped: {e}")
+
+    async def shutdown(self) -> None:
+        """App shutdown hook: closes pooled clients and their connections."""
+        with self._lock:
+            http, self._http = self._http, None
+            self._clients.clear()
+            self._loop = None
+        if http is not None:
+            try:
+                await http.aclose()
+            except Exception as e:
+                print(f"[LLMPool] ⚠️ Error closing HTTP pool: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "clients": len(self._clients),
+                "limits": asdict(self.limits),
+            }
+
+
+_pool: Optional[LLMClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> LLMClientPool:
+    """The process-wide LLM client pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = LLMClientPool()
+        return _pool
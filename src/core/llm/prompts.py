@@ -31,6 +31,14 @@ class SpecialistOutput:
     metadata: Dict[str, Any] = field(default_factory=dict)
     file_changes: List[Dict[str, Any]] = field(default_factory=list)
     confidence_score: float = 0.0  # Builder uses this instead of confidence sometimes
+    understanding: Optional[Dict[str, Any]] = None  # Layer 2
+    risk_pre_mortem: List[Dict[str, Any]] = field(default_factory=list)  # Layer 4
+    trigger: Optional[str] = None
+    impact: Optional[str] = None
+    risks_structured: List[Dict[str, Any]] = field(default_factory=list)
+    alternatives: List[Dict[str, Any]] = field(default_factory=list)
+    effort: Optional[Dict[str, Any]] = None
+    execution_plan: Optional[str] = None
 
 
 ARCHITECT_SYSTEM_PROMPT = """
@@ -109,14 +117,12 @@ class JSONParser:
             text = text.strip()
             return json.loads(text)
         except Exception:
-            # Fallback: try to find anything that looks like a dict
-            try:
-                match = re.search(r"\{.*\}", text, re.DOTALL)
-                if match:
-                    return json.loads(match.group(0))
-            except Exception:
-                pass
-            return {}
+            # Fallback: scan for the first well-formed object (skips prose, stops at its closing brace)
+            from src.core.llm.streaming_json import IncrementalJSONParser
+
+            parser = IncrementalJSONParser()
+            parser.feed(text)
+            return dict(parser.finish())
 
     @staticmethod
     def parse_architect_output(data: Any) -> ArchitectOutput:
@@ -130,6 +136,8 @@ class JSONParser:
         return ArchitectOutput(
             analysis=data.get("analysis", ""),
             recommendations=data.get("recommendations", []),
+            risks=data.get("risks", []),
+            file_changes=data.get("file_changes", []),
             risks_structured=data.get("risks_structured", []),
             alternatives=data.get("alternatives", []),
             effort=data.get("effort", {}),
@@ -161,6 +169,14 @@ class JSONParser:
             metadata=data.get("metadata", {}),
             file_changes=data.get("file_changes", []),
             confidence_score=float(data.get("confidence_score", 0.0) or data.get("confidence", 0.0)),
+            understanding=data.get("understanding"),
+            risk_pre_mortem=data.get("risk_pre_mortem", []),
+            trigger=data.get("trigger"),
+            impact=data.get("impact"),
+            risks_structured=data.get("risks_structured", []),
+            alternatives=data.get("alternatives", []),
+            effort=data.get("effort"),
+            execution_plan=data.get("execution_plan"),
         )
 
 
@@ -0,0 +1,314 @@
+"""
+ICGL LLM — Incremental JSON Parsing
+===================================
+
+Parses a JSON object out of a streamed LLM response while it is still being
+generated.
+
+- Chunks are consumed as they arrive; surrounding prose and markdown fences
+  are skipped until the object starts.
+- Each top-level field is emitted as soon as its value closes (a string's
+  closing quote, a list's `]`), so `analysis` or `recommendations` can be
+  used before generation finishes.
+- A `{` in leading prose that does not open a JSON object is skipped and the
+  scan resumes at the next candidate.
+- Typed views validate each field against `ArchitectOutput` /
+  `SpecialistOutput` before it is handed to an agent.
+
+Usage:
+    parser = StreamingOutputParser(SpecialistOutput)
+    async for chunk in provider.generate_stream(request):
+        for name, value in parser.feed(chunk):
+            ...  # start downstream work early
+    output = parser.finish()
+"""
+
+import asyncio
+import dataclasses
+import json
+import typing
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type
+
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONParser:
+    """
+    Streaming parser for one top-level JSON object.
+
+    `feed(chunk)` returns the (name, value) pairs of the top-level fields that
+    completed within that chunk; `fields` holds everything parsed so far.
+    """
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.errors: List[str] = []
+        self.complete = False
+        self._chunks: List[str] = []
+        self._text = ""  # text from the current root '{' on
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect = "key"  # key | colon | value | value_in | comma
+        self._kind: Optional[str] = None  # string | container | scalar
+        self._key: Optional[str] = None
+        self._token_start = 0
+
+    @property
+    def raw(self) -> str:
+        """Everything fed so far (prose and fences included)."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        self._chunks.append(chunk)
+        if self.complete:
+            return []
+        self._text += chunk
+        emitted: List[Tuple[str, Any]] = []
+        self._scan(emitted)
+        return emitted
+
+    def finish(self) -> Dict[str, Any]:
+        """Fields parsed so far; a scalar still pending at end of stream is flushed."""
+        if not self.complete and self._started and self._expect == "value_in" and self._kind == "scalar":
+            emitted: List[Tuple[str, Any]] = []
+            self._emit(self._text[self._token_start :].strip(), emitted)
+        return self.fields
+
+    # --- Scanner ---
+
+    def _seek(self) -> bool:
+        start = self._text.find("{")
+        if start < 0:
+            self._text = ""
+            self._pos = 0
+            return False
+        self._text = self._text[start:]
+        self._pos = 1
+        self._started = True
+        self._depth = 1
+        self._in_string = False
+        self._escape = False
+        self._expect = "key"
+        return True
+
+    def _restart(self) -> None:
+        """The current '{' did not open an object with fields: look for the next one."""
+        self._started = False
+        self._text = self._text[1:]
+        self._pos = 0
+
+    def _emit(self, raw: str, emitted: List[Tuple[str, Any]]) -> None:
+        key = self._key or ""
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            self.errors.append(key)
+        else:
+            self.fields[key] = value
+            emitted.append((key, value))
+        self._key = None
+        self._kind = None
+        self._expect = "comma"
+
+    def _scan(self, emitted: List[Tuple[str, Any]]) -> None:
+        while not self.complete:
+            if not self._started and not self._seek():
+                return
+            text = self._text
+            restarted = False
+            while self._pos < len(text):
+                i = self._pos
+                ch = text[i]
+                self._pos += 1
+
+                if self._in_string:
+                    if self._escape:
+                        self._escape = False
+                    elif ch == "\\":
+                        self._escape = True
+                    elif ch == '"':
+                        self._in_string = False
+                        if self._depth == 1:
+                            if self._expect == "key":
+                                try:
+                                    self._key = json.loads(text[self._token_start : i + 1])
+                                except ValueError:
+                                    self._key = text[self._token_start + 1 : i]
+                                self._expect = "colon"
+                            elif self._expect == "value_in":
+                                self._emit(text[self._token_start : i + 1], emitted)
+                    continue
+
+                if self._depth > 1:
+                    if ch == '"':
+                        self._in_string = True
+                    elif ch in "{[":
+                        self._depth += 1
+                    elif ch in "}]":
+                        self._depth -= 1
+                        if self._depth == 1:
+                            self._emit(text[self._token_start : i + 1], emitted)
+                    continue
+
+                # Top level of the root object
+                expect = self._expect
+                if expect == "value_in":  # inside a bare scalar (number, true, false, null)
+                    if ch in _WHITESPACE or ch in ",}":
+                        self._emit(text[self._token_start : i].strip(), emitted)
+                        expect = self._expect
+                    else:
+                        continue
+                if ch in _WHITESPACE:
+                    continue
+                if ch == "}" and expect in ("key", "comma"):
+                    self.complete = True
+                    return
+                if expect == "key":
+                    if ch == '"':
+                        self._in_string = True
+                        self._token_start = i
+                    elif ch == ",":
+                        continue
+                    elif not self.fields:
+                        # e.g. "{x}" in prose before the real object
+                        self._restart()
+                        restarted = True
+                        break
+                    else:
+                        self.errors.append(f"unexpected {ch!r} at top level")
+                elif expect == "colon":
+                    if ch == ":":
+                        self._expect = "value"
+                    elif not self.fields:
+                        self._restart()
+                        restarted = True
+                        break
+                elif expect == "value":
+                    self._token_start = i
+                    self._expect = "value_in"
+                    if ch == '"':
+                        self._kind = "string"
+                        self._in_string = True
+                    elif ch in "{[":
+                        self._kind = "container"
+                        self._depth += 1
+                    else:
+                        self._kind = "scalar"
+                elif expect == "comma" and ch == ",":
+                    self._expect = "key"
+            if not restarted:
+                return
+
+
+# --- Typed outputs ---
+
+
+def _accepts(annotation: Any, value: Any) -> bool:
+    """Loose runtime check of `value` against a dataclass field annotation."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        args = typing.get_args(annotation)
+        return any(value is None if a is type(None) else _accepts(a, value) for a in args)
+    if origin in (list, List):
+        return isinstance(value, list)
+    if origin in (dict, Dict):
+        return isinstance(value, dict)
+    if annotation is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if annotation is bool:
+        return isinstance(value, bool)
+    if annotation is str:
+        return isinstance(value, str)
+    return True
+
+
+class StreamingOutputParser:
+    """
+    Typed view over IncrementalJSONParser for ArchitectOutput / SpecialistOutput.
+
+    Fields whose value does not match the output schema are dropped (and listed
+    in `errors`) instead of reaching the agent.
+    """
+
+    def __init__(self, output_type: Optional[Type] = None):
+        from src.core.llm.prompts import ArchitectOutput, JSONParser, SpecialistOutput
+
+        self.output_type = output_type
+        self.parser = IncrementalJSONParser()
+        self.errors: List[str] = []
+        self._types: Dict[str, Any] = {}
+        if output_type is not None:
+            hints = typing.get_type_hints(output_type)
+            self._types = {f.name: hints.get(f.name, Any) for f in dataclasses.fields(output_type)}
+        self._builders: Dict[Type, Callable[[Dict[str, Any]], Any]] = {
+            ArchitectOutput: JSONParser.parse_architect_output,
+            SpecialistOutput: JSONParser.parse_specialist_output,
+        }
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        return self.parser.fields
+
+    @property
+    def raw(self) -> str:
+        return self.parser.raw
+
+    def _validate(self, pairs: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+        valid = []
+        for name, value in pairs:
+            annotation = self._types.get(name)
+            if annotation is not None and not _accepts(annotation, value):
+                self.parser.fields.pop(name, None)
+                self.errors.append(f"{name}: expected {annotation}, got {type(value).__name__}")
+                continue
+            valid.append((name, value))
+        return valid
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Newly completed, schema-valid top-level fields."""
+        return self._validate(self.parser.feed(chunk))
+
+    def snapshot(self) -> Any:
+        """Typed output built from the fields completed so far (dict when untyped)."""
+        data = dict(self.parser.fields)
+        builder = self._builders.get(self.output_type)
+        if builder is not None:
+            return builder(data)
+        if self.output_type is not None:
+            return self.output_type(**{k: v for k, v in data.items() if k in self._types})
+        return data
+
+    def finish(self) -> Any:
+        """Final typed output. Falls back to whole-text parsing when no object was found."""
+        before = set(self.parser.fields)
+        self.parser.finish()
+        self._validate([(k, v) for k, v in self.parser.fields.items() if k not in before])
+        if not self.parser.fields and not self.parser.complete:
+            from src.core.llm.prompts import JSONParser
+
+            data = JSONParser.parse(self.parser.raw)
+            if isinstance(data, dict):
+                self.parser.fields.update(data)
+        return self.snapshot()
+
+
+async def parse_json_stream(
+    chunks: AsyncIterator[str],
+    output_type: Optional[Type] = None,
+    on_field: Optional[Callable[[str, Any], Any]] = None,
+) -> Tuple[Any, str]:
+    """
+    Consumes a chunk stream, calling `on_field(name, value)` (sync or async) as
+    each top-level field completes. Returns (typed output or dict, raw text).
+    """
+    parser = StreamingOutputParser(output_type)
+    async for chunk in chunks:
+        for name, value in parser.feed(chunk):
+            if on_field is not None:
+                outcome = on_field(name, value)
+                if asyncio.iscoroutine(outcome):
+                    await outcome
+    return parser.finish(), parser.raw
@@ -0,0 +1,263 @@
+"""
+ICGL Memory — Embedding Engine
+==============================
+
+Pluggable text embedders for the vector store.
+
+- `HashingEmbedder` (default) works offline and is deterministic. It hashes
+  character n-grams (3–5, word-boundary padded, so it copes with Arabic
+  morphology and codes like `P-ARCH-04`) together with word unigrams into a
+  fixed-width float32 vector. Term weights are sublinear (1 + log tf). A
+  whole batch is accumulated with one vectorised `np.add.at`.
+- `OpenAIEmbedder` is the optional remote backend (e.g.
+  `text-embedding-3-small`). It draws its client from the shared LLM pool.
+- `CachedEmbedder` stores document vectors in SQLite, keyed by the SHA-256
+  of (embedder name, text). Re-indexing unchanged ADRs and policies therefore
+  embeds nothing, and only cache misses of a batch reach the inner embedder.
+  Cache reads and writes run on the I/O executor. Search queries
+  (`aembed_query`) skip the cache: they rarely repeat, and a round trip costs
+  more than hashing them. The table is capped at ICGL_EMBEDDING_CACHE_MAX
+  rows; the oldest writes are evicted first.
+
+Configuration (env):
+    ICGL_EMBEDDER          "hash" (default) | "openai"
+    ICGL_EMBEDDING_DIM     dimension of the hashing embedder (512)
+    ICGL_EMBEDDING_MODEL   remote model (text-embedding-3-small)
+    ICGL_EMBEDDING_CACHE   "0" disables the SQLite cache
+    ICGL_EMBEDDING_CACHE_MAX  rows kept in the cache (50000)
+
+Usage:
+    embedder = get_embedder(cache_dir="data/qdrant_memory")
+    vectors = await embedder.aembed(["ADR: adopt caching", "Policy P-ARCH-04"])
+"""
+
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_WORD = re.compile(r"\w+(?:-\w+)*", re.UNICODE)
+
+
+class Embedder(ABC):
+    """Maps texts to float32 vectors of a fixed dimension."""
+
+    name: str = "embedder"
+    dim: int = 0
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """(len(texts), dim) float32 matrix. Rows need not be normalised."""
+
+    async def aembed(self, texts: Sequence[str]) -> np.ndarray:
+        return self.embed(texts)
+
+    async def aembed_query(self, text: str) -> np.ndarray:
+        """(1, dim) vector for a search query."""
+        return await self.aembed([text])
+
+    def stats(self) -> Dict[str, Any]:
+        return {"name": self.name, "dim": self.dim}
+
+
+class HashingEmbedder(Embedder):
+    """Signed feature hashing of character n-grams + words (offline, deterministic)."""
+
+    def __init__(self, dim: int = 512, ngram_range: tuple = (3, 5), word_weight: float = 1.0):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.word_weight = word_weight
+        self.name = f"hash-ngram-v1-{dim}-{ngram_range[0]}{ngram_range[1]}"
+
+    def features(self, text: str) -> Counter:
+        counts: Counter = Counter()
+        low, high = self.ngram_range
+        for word in _WORD.findall((text or "").lower()):
+            counts["w:" + word] += self.word_weight
+            padded = f"<{word}>"
+            for n in range(low, high + 1):
+                for i in range(max(1, len(padded) - n + 1)):
+                    counts[padded[i : i + n]] += 1.0
+        return counts
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[int] = []
+        cols: List[int] = []
+        weights: List[float] = []
+        for row, text in enumerate(texts):
+            for feature, tf in self.features(text).items():
+                h = zlib.crc32(feature.encode("utf-8"))
+                rows.append(row)
+                cols.append(h % self.dim)
+                # Top bit picks the sign so collisions cancel out instead of piling up
+                weights.append((1.0 + math.log(tf)) * (-1.0 if h & 0x80000000 else 1.0))
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if rows:
+            np.add.at(out, (np.asarray(rows), np.asarray(cols)), np.asarray(weights, dtype=np.float32))
+        return out
+
+
+class OpenAIEmbedder(Embedder):
+    """Remote embeddings through the pooled OpenAI client."""
+
+    def __init__(self, model: str = "text-embedding-3-small", dim: int = 1536, batch_size: int = 256):
+        self.model = model
+        self.dim = dim
+        self.batch_size = batch_size
+        self.name = f"openai-{model}"
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        raise RuntimeError("OpenAIEmbedder is async-only; use `await embedder.aembed(texts)`.")
+
+    async def aembed(self, texts: Sequence[str]) -> np.ndarray:
+        from src.core.llm.pool import get_client_pool
+
+        client = get_client_pool().openai()
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for start in range(0, len(texts), self.batch_size):
+            batch = [t or " " for t in texts[start : start + self.batch_size]]
+            response = await client.embeddings.create(model=self.model, input=batch)
+            for item in response.data:
+                out[start + item.index] = np.asarray(item.embedding, dtype=np.float32)[: self.dim]
+        return out
+
+
+class EmbeddingCache:
+    """SQLite cache of vectors keyed by content hash, holding at most `max_rows` rows."""
+
+    def __init__(self, db_path: str, max_rows: int = 50000):
+        self.db_path = db_path
+        self.max_rows = max_rows
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    embedder TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    @staticmethod
+    def key(embedder_name: str, text: str) -> str:
+        return hashlib.sha256(f"{embedder_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: Sequence[str], dim: int) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(keys))
+        with self._lock, self._connect() as conn:
+            for start in range(0, len(unique), 500):
+                chunk = unique[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for key, stored_dim, blob in conn.execute(
+                    f"SELECT key, dim, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ):
+                    if stored_dim == dim:
+                        found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, embedder_name: str, items: Dict[str, np.ndarray]) -> None:
+        if not items:
+            return
+        rows = [(k, embedder_name, int(v.shape[0]), np.asarray(v, dtype=np.float32).tobytes()) for k, v in items.items()]
+        with self._lock, self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO embeddings (key, embedder, dim, vector) VALUES (?, ?, ?, ?)", rows)
+            if self.max_rows > 0:
+                # Rowids grow with each write (a replace gets a new one), so this drops the oldest writes
+                conn.execute(
+                    "DELETE FROM embeddings WHERE rowid <= (SELECT MAX(rowid) FROM embeddings) - ?", (self.max_rows,)
+                )
+
+    def count(self) -> int:
+        with self._lock, self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+class CachedEmbedder(Embedder):
+    """
+    Wraps an embedder with the content-hash cache; only misses are embedded (in one batch).
+    Queries bypass the cache.
+    """
+
+    def __init__(self, inner: Embedder, cache: EmbeddingCache):
+        self.inner = inner
+        self.cache = cache
+        self.name = inner.name
+        self.dim = inner.dim
+        self.hits = 0
+        self.misses = 0
+
+    def _split(self, texts: Sequence[str]):
+        keys = [EmbeddingCache.key(self.name, t) for t in texts]
+        cached = self.cache.get_many(keys, self.dim)
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+        self.hits += len(texts) - sum(1 for k in keys if k not in cached)
+        self.misses += len(missing)
+        return keys, cached, missing
+
+    def _assemble(self, keys: List[str], cached: Dict[str, np.ndarray], missing: Dict[str, str], fresh: np.ndarray):
+        fresh_by_key = dict(zip(missing, fresh))
+        self.cache.put_many(self.name, fresh_by_key)
+        out = np.zeros((len(keys), self.dim), dtype=np.float32)
+        for row, key in enumerate(keys):
+            out[row] = cached[key] if key in cached else fresh_by_key[key]
+        return out
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        keys, cached, missing = self._split(texts)
+        fresh = self.inner.embed(list(missing.values())) if missing else np.zeros((0, self.dim), np.float32)
+        return self._assemble(keys, cached, missing, fresh)
+
+    async def aembed(self, texts: Sequence[str]) -> np.ndarray:
+        from src.core.core.executor import get_executor
+
+        executor = get_executor()
+        keys, cached, missing = await executor.run_io(self._split, texts)
+        fresh = await self.inner.aembed(list(missing.values())) if missing else np.zeros((0, self.dim), np.float32)
+        return await executor.run_io(self._assemble, keys, cached, missing, fresh)
+
+    async def aembed_query(self, text: str) -> np.ndarray:
+        return await self.inner.aembed_query(text)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            **self.inner.stats(),
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+def get_embedder(cache_dir: Optional[str] = None) -> Embedder:
+    """Embedder configured from env, wrapped in the SQLite cache when `cache_dir` is given."""
+    backend = os.getenv("ICGL_EMBEDDER", "hash").lower()
+    if backend == "openai":
+        embedder: Embedder = OpenAIEmbedder(model=os.getenv("ICGL_EMBEDDING_MODEL", "text-embedding-3-small"))
+    else:
+        embedder = HashingEmbedder(dim=int(os.getenv("ICGL_EMBEDDING_DIM", 512)))
+    if cache_dir and os.getenv("ICGL_EMBEDDING_CACHE", "1").lower() in {"1", "true", "yes"}:
+        cache = EmbeddingCache(
+            os.path.join(cache_dir, "embeddings.db"), max_rows=int(os.getenv("ICGL_EMBEDDING_CACHE_MAX", 50000))
+        )
+        embedder = CachedEmbedder(embedder, cache)
+    return embedder
@@ -1,10 +1,34 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence
+
+
+@dataclass
+class Document:
+    id: str
+    content: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SearchResult:
+    """One hit: the stored document and its cosine similarity to the query."""
+
+    document: Document
+    score: float
 
 
 class VectorStore(ABC):
     """Abstract interface for Vector Stores."""
 
+    # True when `search(..., filter=...)` evaluates metadata predicates inside the index
+    supports_filters: bool = False
+    # True when `search(..., hybrid=True)` fuses a lexical (BM25) ranking into the vector ranking
+    supports_hybrid: bool = False
+
+    async def initialize(self) -> None:
+        """Loads persisted state. Optional for stores without persistence."""
+
     @abstractmethod
     async def search(self, query: str, limit: int = 4) -> List[Any]:
         """Search for similar documents."""
@@ -14,3 +38,9 @@ class VectorStore(ABC):
     async def add_document(self, document: Any) -> None:
         """Add a document to the store."""
         pass
+
+    async def add_documents(self, documents: Sequence[Any]) -> int:
+        """Add (upsert) a batch. Stores override this with a vectorised path."""
+        for document in documents:
+            await self.add_document(document)
+        return len(documents)
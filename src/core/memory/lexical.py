@@ -0,0 +1,144 @@
+"""
+ICGL Memory — Lexical Index
+===========================
+
+BM25 inverted index for the hybrid retriever. Embeddings blur exact
+identifiers such as `P-ARCH-04` or `S-11`, and they are weak on short
+Arabic queries. Term matching catches both.
+
+- `normalize_text` makes Arabic spelling variants compare equal:
+  - NFKC, then casefold;
+  - diacritics (tashkeel) and tatweel are dropped;
+  - أ/إ/آ/ٱ → ا, ى → ي, ة → ه, ؤ → و, ئ → ي;
+  - Arabic-Indic and Persian digits become ASCII.
+- `tokenize` keeps hyphenated codes whole (`p-arch-04`) and also emits their
+  parts. Arabic words get a light stem: the definite-article prefixes
+  (ال, وال, بال, كال, فال, لل) and one common suffix are stripped.
+- `BM25Index` is keyed by document id. Adding an existing id replaces it,
+  so upserts and deletes cost one document, not a rebuild.
+- `reciprocal_rank_fusion` merges ranked id lists (RRF, k=60 by default).
+"""
+
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Container, Dict, List, Optional, Sequence, Tuple
+
+_DIACRITICS = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]")
+_CHAR_MAP = str.maketrans(
+    {
+        "أ": "ا",
+        "إ": "ا",
+        "آ": "ا",
+        "ٱ": "ا",
+        "ى": "ي",
+        "ة": "ه",
+        "ؤ": "و",
+        "ئ": "ي",
+        **{chr(0x0660 + d): str(d) for d in range(10)},
+        **{chr(0x06F0 + d): str(d) for d in range(10)},
+    }
+)
+_TOKEN = re.compile(r"\w+(?:-\w+)*", re.UNICODE)
+_ARABIC = re.compile("[\u0600-\u06ff]")
+_PREFIXES = ("وال", "بال", "كال", "فال", "لل", "ال")
+_SUFFIXES = ("ها", "ان", "ات", "ون", "ين", "يه", "ه", "ي")
+
+
+def normalize_text(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "")
+    return _DIACRITICS.sub("", text).translate(_CHAR_MAP).casefold()
+
+
+def _stem(word: str) -> str:
+    for prefix in _PREFIXES:
+        if word.startswith(prefix) and len(word) - len(prefix) >= 3:
+            word = word[len(prefix) :]
+            break
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    tokens: List[str] = []
+    for token in _TOKEN.findall(normalize_text(text)):
+        if "-" in token:
+            tokens.append(token)
+            tokens.extend(part for part in token.split("-") if part)
+        elif _ARABIC.search(token):
+            tokens.append(_stem(token))
+        else:
+            tokens.append(token)
+    return tokens
+
+
+class BM25Index:
+    """Incremental Okapi BM25 over document ids."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: Dict[str, Dict[str, int]] = {}  # term -> doc id -> tf
+        self._lengths: Dict[str, int] = {}
+        self._terms: Dict[str, Tuple[str, ...]] = {}
+        self._total_length = 0
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Indexes (or re-indexes) one document."""
+        self.remove(doc_id)
+        counts = Counter(tokenize(text))
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        length = sum(counts.values())
+        self._lengths[doc_id] = length
+        self._terms[doc_id] = tuple(counts)
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        terms = self._terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(doc_id)
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def search(self, query: str, limit: int, allowed: Optional[Container[str]] = None) -> List[Tuple[str, float]]:
+        """Top-`limit` (doc id, BM25 score), best first; `allowed` restricts the ids considered."""
+        n = len(self._lengths)
+        if n == 0 or limit <= 0:
+            return []
+        avg_length = self._total_length / n or 1.0
+        scores: Dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1.0 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                if allowed is not None and doc_id not in allowed:
+                    continue
+                norm = tf + self.k1 * (1.0 - self.b + self.b * self._lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1.0) / norm
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def stats(self) -> Dict[str, Any]:
+        return {"documents": len(self._lengths), "terms": len(self._postings)}
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = 60) -> List[Tuple[str, float]]:
+    """Fuses ranked id lists: score(d) = Σ 1 / (k + rank). Best first; ties keep first-seen order."""
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, doc_id in enumerate(ranking, start=1):
+            fused[doc_id] = fused.get(doc_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: -item[1])
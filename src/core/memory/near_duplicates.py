@@ -0,0 +1,121 @@
+"""
+ICGL Memory — Near-Duplicate Detection
+======================================
+
+MinHash signatures with LSH banding, used to recognise resubmitted
+proposals (lightly edited copies of an earlier ADR) at ingest.
+
+- Text is tokenised with the lexical analyser (`src.core.memory.lexical`),
+  so Arabic spelling variants and case do not count as edits. Word
+  3-shingles are hashed with crc32.
+- Signature: `num_perm` universal hashes h(x) = (a·x + b) mod p with p > 2³²,
+  minimised over the shingles. This is one vectorised NumPy expression per
+  document. The share of equal signature slots estimates the Jaccard
+  similarity of the shingle sets.
+- LSH: the signature is cut into `bands` bands of `rows` slots each. Documents
+  that share any band bucket become candidates. Only those candidates are
+  compared, so a lookup costs a few dict probes regardless of corpus size.
+  The default 32×4 banding catches pairs above ~0.5 Jaccard with high
+  probability. Candidates are then kept only if their estimate reaches
+  `threshold`.
+
+Configuration (env):
+    ICGL_DUPLICATE_THRESHOLD  minimum estimated Jaccard for a near duplicate (0.8)
+"""
+
+import os
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.core.memory.lexical import tokenize
+
+_PRIME = np.uint64(4294967311)  # smallest prime above 2**32: a·x + b stays below 2**64
+
+
+def proposal_text(title: str, context: str, decision: str) -> str:
+    """The ADR fields compared for resubmissions."""
+    return f"{title}\n{context}\n{decision}"
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    tokens = tokenize(text)
+    if len(tokens) < k:
+        return set(tokens)
+    return {"\x1f".join(tokens[i : i + k]) for i in range(len(tokens) - k + 1)}
+
+
+class NearDuplicateIndex:
+    """MinHash/LSH index over document ids (see module docstring)."""
+
+    def __init__(self, threshold: Optional[float] = None, num_perm: int = 128, bands: int = 32, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold if threshold is not None else float(os.getenv("ICGL_DUPLICATE_THRESHOLD", 0.8))
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**32, num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, 2**32, num_perm, dtype=np.uint64)[:, None]
+        self._signatures: Dict[str, Optional[np.ndarray]] = {}  # None: no tokens, never matches
+        self._buckets: Dict[Tuple[int, bytes], Set[str]] = {}
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of the text, or None when it has no tokens."""
+        grams = shingles(text)
+        if not grams:
+            return None
+        hashes = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+        return ((self._a * hashes[None, :] + self._b) % _PRIME).min(axis=1)
+
+    def _bands(self, signature: np.ndarray):
+        for band, chunk in enumerate(signature.reshape(self.bands, self.rows)):
+            yield band, chunk.tobytes()
+
+    def add(self, doc_id: str, text: str) -> None:
+        """Indexes (or re-indexes) one document."""
+        self.remove(doc_id)
+        signature = self.signature(text)
+        self._signatures[doc_id] = signature
+        if signature is None:
+            return
+        for key in self._bands(signature):
+            self._buckets.setdefault(key, set()).add(doc_id)
+
+    def remove(self, doc_id: str) -> None:
+        signature = self._signatures.pop(doc_id, None)
+        if signature is None:
+            return
+        for key in self._bands(signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(doc_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def find(self, text: str, threshold: Optional[float] = None) -> List[Tuple[str, float]]:
+        """(doc id, estimated Jaccard) of indexed near duplicates of `text`, most similar first."""
+        signature = self.signature(text)
+        if signature is None:
+            return []
+        candidates: Set[str] = set()
+        for key in self._bands(signature):
+            candidates |= self._buckets.get(key, set())
+        threshold = self.threshold if threshold is None else threshold
+        matches = []
+        for doc_id in candidates:
+            similarity = float(np.mean(self._signatures[doc_id] == signature))
+            if similarity >= threshold:
+                matches.append((doc_id, round(similarity, 4)))
+        return sorted(matches, key=lambda match: -match[1])
+
+    def stats(self) -> Dict[str, int]:
+        return {"documents": len(self._signatures), "buckets": len(self._buckets), "bands": self.bands}
@@ -0,0 +1,664 @@
+"""
+ICGL Memory — Local Vector Store
+================================
+
+Offline `VectorStore` backed by NumPy. It replaces the Qdrant stub, whose
+`search` always returned `[]`.
+
+- Embeddings are L2-normalised, so cosine similarity is a matrix-vector
+  product. Top-k selection uses `argpartition`, so only the k winners are
+  sorted.
+- Rows are stored int8-quantised with a per-row scale, next to their float32
+  originals, in memory-mapped shards (`src.core.memory.quantized`). A query
+  scans the codes, which are about ¼ of the float32 bytes. It then re-scores
+  the best `limit × ICGL_RESCORE_FACTOR` candidates exactly against their
+  float32 rows, so the returned scores are exact cosines.
+  `ICGL_VECTOR_QUANTIZATION=none` scans the float32 shards instead.
+- Metadata filters (`{"type": "lesson"}`, `{"status": ["ACCEPTED", ...]}`)
+  are evaluated inside the index. Posting sets per value of the filter
+  fields (type, status, adr_id, source) give the allowed rows directly.
+  Only those rows are scored, so filtered top-k is exact without
+  over-fetching. Keys outside the filter fields are checked row by row
+  within the allowed set.
+- `search(..., hybrid=True)` fuses the cosine ranking with a BM25 ranking
+  (`src.core.memory.lexical`, Arabic-aware) by reciprocal rank fusion.
+  Exact codes like `P-ARCH-04` are found even when the embedding misses
+  them. Results are ordered by the fused rank, while `score` stays the
+  cosine similarity so thresholds keep their meaning. The lexical index is
+  built on the first hybrid query and then updated with every upsert and
+  delete.
+- Past `ICGL_ANN_MIN_DOCS` documents, an IVF index (`src.core.memory.ann`)
+  narrows each query to the rows of its nearest lists. The index is built
+  and rebuilt on a background thread; until it is ready, search stays exact.
+- Storage lives under the memory directory (`data/qdrant_memory`):
+  - `<collection>.shards/` holds the vector shards. New rows are appended,
+    and an upsert overwrites its row in place. An index written by earlier
+    versions as a single `<collection>.f32` file is migrated into shards on
+    load.
+  - `<collection>.docs.jsonl` is an append-only document log. The last entry
+    per row wins, and the log is compacted when it grows stale.
+  - A delete moves the last row into the freed slot, logs a tombstone for the
+    old last row and truncates the last shard, so rows stay dense.
+  - `<collection>.meta.json` records the dimension, the embedder and the
+    shard size. An index built by a different embedder is discarded and
+    rebuilt.
+- Inside a `retrieval_scope` (`src.core.memory.retrieval_cache`), searches
+  and query embeddings are memoised for the cycle. `version` counts writes,
+  so cached results never outlive an upsert or delete.
+- Embeddings come from `src.core.memory.embeddings` (offline hashing by
+  default, cached in SQLite by content hash).
+
+Configuration (env):
+    ICGL_VECTOR_QUANTIZATION  "int8" (default) | "none"
+    ICGL_SHARD_ROWS           rows per vector shard (65536)
+    ICGL_RESCORE_FACTOR       int8 candidates per result re-scored in float32 (4)
+    ICGL_HYBRID_POOL          candidates taken from each ranking before fusion (50)
+    ICGL_RRF_K                reciprocal rank fusion constant (60)
+
+Usage:
+    store = NumpyVectorStore(path="data/qdrant_memory")
+    await store.add_document(Document(id="adr-1", content="...", metadata={"type": "adr"}))
+    for res in await store.search("caching policy", limit=3, filter={"type": "adr"}):
+        print(res.document.id, res.score)
+"""
+
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.core.core.executor import get_executor
+from src.core.memory.ann import IVFIndex, top_k
+from src.core.memory.embeddings import Embedder, get_embedder
+from src.core.memory.interface import Document, SearchResult, VectorStore
+from src.core.memory.lexical import BM25Index, reciprocal_rank_fusion
+from src.core.memory.quantized import RowsView, VectorShards
+from src.core.memory.retrieval_cache import current_retrieval_cache
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _runs(rows: Sequence[int]):
+    """Contiguous [start, end) spans of the sorted rows (batched appends become one write)."""
+    ordered = sorted(set(rows))
+    start = prev = ordered[0]
+    for row in ordered[1:]:
+        if row != prev + 1:
+            yield start, prev + 1
+            start = row
+        prev = row
+    yield start, prev + 1
+
+
+FILTER_FIELDS = ("type", "status", "adr_id", "source")
+
+
+def _hashable(value: Any) -> bool:
+    return isinstance(value, (str, int, float, bool, type(None)))
+
+
+def _matches(value: Any, expected: Any) -> bool:
+    if isinstance(expected, (list, tuple, set, frozenset)):
+        return value in expected
+    return value == expected
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    Exact cosine search over an in-process float32 matrix with file persistence.
+
+    `path=None` keeps everything in memory (tests, ephemeral engines).
+    """
+
+    supports_filters = True
+    supports_hybrid = True
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        embedder: Optional[Embedder] = None,
+        collection: str = "icgl_memory",
+        ann_min_docs: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        filter_fields: Sequence[str] = FILTER_FIELDS,
+        quantization: Optional[str] = None,
+        shard_rows: Optional[int] = None,
+    ):
+        self.path = Path(path) if path else None
+        self.embedder = embedder or get_embedder(cache_dir=path)
+        self.dim = self.embedder.dim
+        self.embedder_name = self.embedder.name
+        self.collection = collection
+        # Vector storage
+        self.quantization = (quantization or os.getenv("ICGL_VECTOR_QUANTIZATION", "int8")).lower()
+        self.shard_rows = shard_rows or int(os.getenv("ICGL_SHARD_ROWS", 65536))
+        self.rescore_factor = max(1, int(os.getenv("ICGL_RESCORE_FACTOR", 4)))
+        self._shards = self._new_shards()
+        self._count = 0
+        self._docs: List[Document] = []
+        self._rows: Dict[str, int] = {}
+        # Prefilter postings: field -> value -> rows
+        self.filter_fields = tuple(filter_fields)
+        self._postings: Dict[str, Dict[Any, Set[int]]] = {f: {} for f in self.filter_fields}
+        self._log_entries = 0
+        self._lock = threading.RLock()
+        self._loaded = False
+        self.version = 0  # bumped by every write
+        # Identifies this physical index; sync watermarks are only valid for the index they were taken on
+        self.index_id = uuid.uuid4().hex
+        # IVF tier
+        self.ann_min_docs = ann_min_docs if ann_min_docs is not None else int(os.getenv("ICGL_ANN_MIN_DOCS", 20000))
+        self.nprobe = nprobe or int(os.getenv("ICGL_ANN_NPROBE", 8))
+        self.ann_nlist = int(os.getenv("ICGL_ANN_NLIST", 0)) or None
+        self.ann_growth = float(os.getenv("ICGL_ANN_REBUILD_GROWTH", 2.0))
+        self._ann: Optional[IVFIndex] = None
+        self._ann_thread: Optional[threading.Thread] = None
+        self._ann_pending: List[int] = []
+        # Lexical tier (built lazily, maintained incrementally)
+        self._lexical: Optional[BM25Index] = None
+        self.hybrid_pool = int(os.getenv("ICGL_HYBRID_POOL", 50))
+        self.rrf_k = int(os.getenv("ICGL_RRF_K", 60))
+
+    # --- Files ---
+
+    def _file(self, suffix: str) -> Path:
+        return self.path / f"{self.collection}.{suffix}"
+
+    @property
+    def _legacy_vectors_path(self) -> Path:
+        return self._file("f32")  # single-file float32 layout of earlier versions
+
+    @property
+    def _shards_dir(self) -> Path:
+        return self._file("shards")
+
+    @property
+    def _docs_path(self) -> Path:
+        return self._file("docs.jsonl")
+
+    @property
+    def _meta_path(self) -> Path:
+        return self._file("meta.json")
+
+    def _new_shards(self) -> VectorShards:
+        return VectorShards(
+            self.dim,
+            directory=self._shards_dir if self.path else None,
+            shard_rows=self.shard_rows,
+            quantized=self.quantization == "int8",
+        )
+
+    def _write_meta(self) -> None:
+        meta = {"dim": self.dim, "embedder": self.embedder_name, "index_id": self.index_id, "shard_rows": self.shard_rows}
+        self._meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+    # --- Lifecycle ---
+
+    async def initialize(self) -> None:
+        self.load()
+
+    def load(self) -> None:
+        """Maps persisted vectors and replays the document log (idempotent)."""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if self.path is None or not self._docs_path.exists():
+                return
+            try:
+                meta = json.loads(self._meta_path.read_text(encoding="utf-8")) if self._meta_path.exists() else {}
+                if meta.get("dim", self.dim) != self.dim or meta.get("embedder", self.embedder_name) != self.embedder_name:
+                    print(f"[Memory] ⚠️ Index at {self.path} was built with {meta}; starting a fresh index.")
+                    self._reset_files()
+                    return
+                self.index_id = meta.get("index_id", self.index_id)
+                if meta.get("shard_rows"):
+                    self.shard_rows = int(meta["shard_rows"])  # an existing index keeps its shard size
+                    self._shards = self._new_shards()
+                legacy = self._legacy_vectors_path.exists() and not self._shards_dir.exists()
+                if legacy:
+                    file_rows = self._legacy_vectors_path.stat().st_size // (4 * self.dim)
+                else:
+                    file_rows = self._shards.available_rows()
+                docs: Dict[int, Document] = {}
+                with open(self._docs_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # torn write at the tail
+                        self._log_entries += 1
+                        row = entry.get("row", -1)
+                        if entry.get("deleted"):
+                            docs.pop(row, None)
+                        elif 0 <= row < file_rows:
+                            docs[row] = Document(
+                                id=entry["id"], content=entry.get("content", ""), metadata=entry.get("metadata") or {}
+                            )
+                # Only a contiguous prefix of rows with both a vector and a document is valid
+                count = 0
+                while count in docs:
+                    count += 1
+                if legacy:
+                    self._migrate_legacy(count)
+                else:
+                    self._shards.open(count)
+                if meta.get("index_id") != self.index_id or meta.get("shard_rows") != self.shard_rows:
+                    self._write_meta()
+                self._count = count
+                self._docs = [docs[r] for r in range(count)]
+                self._rows = {doc.id: r for r, doc in enumerate(self._docs)}
+                for row, doc in enumerate(self._docs):
+                    self._post(row, doc, add=True)
+                self._maybe_build_ann()
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[Memory] ⚠️ Could not load vector index from {self.path}: {e}")
+                self._count, self._docs, self._rows = 0, [], {}
+                self._postings = {f: {} for f in self.filter_fields}
+                self._shards = self._new_shards()
+
+    def _migrate_legacy(self, count: int, chunk: int = 8192) -> None:
+        """Copies the single-file float32 vectors into quantised shards, then removes the old file."""
+        if count:
+            legacy = np.memmap(self._legacy_vectors_path, dtype=np.float32, mode="r", shape=(count, self.dim))
+            for start in range(0, count, chunk):
+                end = min(start + chunk, count)
+                self._shards.write(range(start, end), legacy[start:end])
+            self._shards.flush()
+            del legacy
+        else:
+            self._shards.open(0)
+        self._legacy_vectors_path.unlink()
+        print(f"[Memory] 🗜️ Migrated {count} vectors into {self.quantization} shards at {self._shards_dir}.")
+
+    def _reset_files(self) -> None:
+        for p in (self._legacy_vectors_path, self._docs_path, self._meta_path):
+            p.unlink(missing_ok=True)
+        self._shards.remove_files()
+
+    # --- Writes ---
+
+    async def add_document(self, document: Document) -> None:
+        """Inserts or replaces (by id) one document."""
+        await self.add_documents([document])
+
+    async def add_documents(self, documents: Sequence[Document]) -> int:
+        """
+        Upserts a batch: one embedding call, one write per file.
+        Documents whose content and metadata are unchanged are skipped.
+        Returns the number of rows written.
+        """
+        executor = get_executor()
+        changed = await executor.run_io(self._changed_documents, documents)
+        if not changed:
+            return 0
+        vectors = normalize_rows(await self.embedder.aembed([doc.content for doc in changed]))
+        return await executor.run_io(self._write_documents, changed, vectors)
+
+    def _changed_documents(self, documents: Sequence[Document]) -> List[Document]:
+        with self._lock:
+            self.load()
+            latest: Dict[str, Document] = {}
+            for doc in documents:
+                latest[doc.id] = doc  # last one wins within a batch
+            return [doc for doc in latest.values() if not self._unchanged(doc)]
+
+    def _write_documents(self, changed: List[Document], vectors: np.ndarray) -> int:
+        with self._lock:
+            rows: List[int] = []
+            for doc in changed:
+                row = self._rows.get(doc.id)
+                if row is None:
+                    row = self._count
+                    self._count += 1
+                    self._docs.append(doc)
+                    self._rows[doc.id] = row
+                else:
+                    self._post(row, self._docs[row], add=False)
+                    self._docs[row] = doc
+                self._post(row, doc, add=True)
+                if self._lexical is not None:
+                    self._lexical.add(doc.id, doc.content)
+                rows.append(row)
+            self._shards.write(rows, vectors)
+            self.version += 1
+            self._persist_rows(rows)
+            for row in rows:
+                self._index_row(row)
+            self._maybe_build_ann()
+        return len(rows)
+
+    async def delete(self, ids: Sequence[str]) -> int:
+        """Removes documents by id; returns how many existed."""
+        return await get_executor().run_io(self._delete, ids)
+
+    def _delete(self, ids: Sequence[str]) -> int:
+        with self._lock:
+            self.load()
+            rows = sorted({self._rows[i] for i in ids if i in self._rows}, reverse=True)
+            if not rows:
+                return 0
+            moved: List[int] = []
+            for row in rows:  # highest first, so a moved row is never deleted later
+                last = self._count - 1
+                if self._ann is not None:
+                    self._ann.remove(row)
+                    self._ann.remove(last)
+                self._post(row, self._docs[row], add=False)
+                if self._lexical is not None:
+                    self._lexical.remove(self._docs[row].id)
+                del self._rows[self._docs[row].id]
+                if row != last:
+                    self._post(last, self._docs[last], add=False)
+                    self._shards.move(last, row)
+                    self._docs[row] = self._docs[last]
+                    self._rows[self._docs[row].id] = row
+                    self._post(row, self._docs[row], add=True)
+                    moved.append(row)
+                self._docs.pop()
+                self._count -= 1
+            moved = [r for r in moved if r < self._count]
+            self.version += 1
+            self._persist_delete(moved, first_freed=self._count, freed=len(rows))
+            for row in moved:
+                self._index_row(row)
+        return len(rows)
+
+    def _persist_delete(self, moved: List[int], first_freed: int, freed: int) -> None:
+        if self.path is not None:
+            if moved:
+                self._persist_rows(moved)
+            with open(self._docs_path, "a", encoding="utf-8") as f:
+                f.write(
+                    "".join(json.dumps({"row": r, "deleted": True}) + "\n" for r in range(first_freed, first_freed + freed))
+                )
+            self._log_entries += freed
+        self._shards.truncate(self._count)
+
+    def ids(self, filter: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Ids of stored documents, optionally restricted by metadata."""
+        with self._lock:
+            self.load()
+            if not filter:
+                return [doc.id for doc in self._docs]
+            return [self._docs[r].id for r in self._filter_rows(filter)]
+
+    def _unchanged(self, doc: Document) -> bool:
+        row = self._rows.get(doc.id)
+        if row is None:
+            return False
+        current = self._docs[row]
+        return current.content == doc.content and (current.metadata or {}) == (doc.metadata or {})
+
+    def _persist_rows(self, rows: List[int]) -> None:
+        if self.path is None or not rows:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        if not self._meta_path.exists():
+            self._write_meta()
+        # Vectors first, then the log entries that make the rows visible on reload
+        self._shards.flush()
+        lines = []
+        for row in rows:
+            doc = self._docs[row]
+            lines.append(
+                json.dumps({"row": row, "id": doc.id, "content": doc.content, "metadata": doc.metadata or {}}) + "\n"
+            )
+        with open(self._docs_path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+        self._log_entries += len(rows)
+        if self._log_entries > 2 * self._count + 100:
+            self._compact_log()
+
+    def _compact_log(self) -> None:
+        tmp = self._docs_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for row, doc in enumerate(self._docs):
+                f.write(
+                    json.dumps({"row": row, "id": doc.id, "content": doc.content, "metadata": doc.metadata or {}})
+                    + "\n"
+                )
+        os.replace(tmp, self._docs_path)
+        self._log_entries = self._count
+
+    # --- ANN tier ---
+
+    def _index_row(self, row: int) -> None:
+        if self._ann is not None:
+            self._ann.add(row, self._shards.floats([row])[0])
+        if self._ann_thread is not None:
+            self._ann_pending.append(row)  # replayed into the index being built
+
+    def _maybe_build_ann(self) -> None:
+        if self.ann_min_docs <= 0 or self._count < self.ann_min_docs:
+            return
+        if self._ann_thread is not None:
+            return
+        if self._ann is not None and self._count < self._ann.trained_size * self.ann_growth:
+            return
+        self.rebuild_index(wait=False)
+
+    def rebuild_index(self, wait: bool = True) -> None:
+        """(Re)trains the IVF index on a snapshot of the vectors; searches stay served meanwhile."""
+        with self._lock:
+            if self._ann_thread is not None:
+                thread = self._ann_thread
+            else:
+                snapshot = RowsView(self._count, self._read_rows)
+                self._ann_pending = []
+                thread = threading.Thread(target=self._build_ann, args=(snapshot,), name="icgl-ann-build", daemon=True)
+                self._ann_thread = thread
+                thread.start()
+        if wait:
+            thread.join()
+
+    def _read_rows(self, rows: np.ndarray) -> np.ndarray:
+        """float32 rows for the background IVF build; rows deleted meanwhile read as zeros."""
+        with self._lock:
+            out = np.zeros((len(rows), self.dim), dtype=np.float32)
+            live = rows < self._count
+            out[live] = self._shards.floats(rows[live])
+            return out
+
+    def _build_ann(self, snapshot: RowsView) -> None:
+        try:
+            index = IVFIndex.build(snapshot, nlist=self.ann_nlist, nprobe=self.nprobe) if len(snapshot) else None
+        except Exception as e:
+            print(f"[Memory] ⚠️ ANN build failed: {e}")
+            index = None
+        with self._lock:
+            if index is not None:
+                # Rows appended, upserted or moved by deletes while training
+                index.truncate(self._count)
+                for row in self._ann_pending:
+                    if row < self._count:
+                        index.add(row, self._shards.floats([row])[0])
+                self._ann = index
+                print(f"[Memory] 🧭 IVF index ready ({index.nlist} lists over {len(index)} rows).")
+            self._ann_pending = []
+            self._ann_thread = None
+
+    # --- Reads ---
+
+    def _post(self, row: int, doc: Document, add: bool) -> None:
+        """Adds/removes `row` in the postings of the document's filter-field values."""
+        metadata = doc.metadata or {}
+        for field in self.filter_fields:
+            value = metadata.get(field)
+            if not _hashable(value):
+                continue
+            postings = self._postings[field]
+            if add:
+                postings.setdefault(value, set()).add(row)
+                continue
+            rows = postings.get(value)
+            if rows is not None:
+                rows.discard(row)
+                if not rows:
+                    del postings[value]
+
+    def _filter_rows(self, filter: Dict[str, Any]) -> np.ndarray:
+        """Sorted rows matching every predicate (value or list of allowed values)."""
+        allowed: Optional[Set[int]] = None
+        residual: Dict[str, Any] = {}
+        for key, expected in filter.items():
+            values = list(expected) if isinstance(expected, (list, tuple, set, frozenset)) else [expected]
+            postings = self._postings.get(key)
+            if postings is None or not all(_hashable(v) for v in values):
+                residual[key] = expected
+                continue
+            matched: Set[int] = set()
+            for value in values:
+                matched |= postings.get(value, set())
+            allowed = matched if allowed is None else allowed & matched
+            if not allowed:
+                return np.zeros(0, dtype=np.int64)
+        rows = range(self._count) if allowed is None else sorted(allowed)
+        if residual:
+            rows = [
+                r for r in rows if all(_matches((self._docs[r].metadata or {}).get(k), v) for k, v in residual.items())
+            ]
+        return np.fromiter(rows, dtype=np.int64)
+
+    def _lexical_index(self) -> BM25Index:
+        if self._lexical is None:
+            lexical = BM25Index()
+            for doc in self._docs:
+                lexical.add(doc.id, doc.content)
+            self._lexical = lexical
+        return self._lexical
+
+    def _dense(
+        self, query_vector: np.ndarray, limit: int, allowed: Optional[np.ndarray], exact: bool
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-`limit` (rows, cosine scores) among `allowed` rows (all when None)."""
+        candidates = allowed
+        # Small filtered sets are scanned exactly; the IVF tier only pays off on large ones
+        if self._ann is not None and not exact and (allowed is None or allowed.size > self.ann_min_docs):
+            probed = self._ann.candidates(query_vector)
+            if allowed is not None:
+                probed = probed[np.isin(probed, allowed, assume_unique=True)]
+            if probed.size >= limit:
+                candidates = probed  # else: probed lists are too sparse, stay exact
+        scores = self._shards.scan(query_vector, candidates)
+        if self._shards.quantized:
+            # Shortlist on the int8 scores, then rank by exact float32 cosine
+            pool = top_k(scores, limit * self.rescore_factor)
+            rows = candidates[pool] if candidates is not None else pool
+            exact_scores = self._shards.floats(rows) @ query_vector
+            top = top_k(exact_scores, limit)
+            return rows[top], exact_scores[top]
+        top = top_k(scores, limit)
+        rows = candidates[top] if candidates is not None else top
+        return rows, scores[top]
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 4,
+        filter: Optional[Dict[str, Any]] = None,
+        exact: bool = False,
+        hybrid: bool = False,
+    ) -> List[SearchResult]:
+        """
+        Top-`limit` documents by cosine similarity, optionally restricted by metadata.
+        Uses the IVF tier when it is ready, unless `exact` is set. `hybrid` fuses in
+        the BM25 ranking (see module docstring).
+        """
+        cache = current_retrieval_cache()
+        if cache is None:
+            return await self._search(query, limit, filter, exact, hybrid)
+        options = {"limit": limit, "filter": filter, "exact": exact, "hybrid": hybrid}
+        results = await cache.search(self, query, options, lambda: self._search(query, limit, filter, exact, hybrid))
+        return list(results)
+
+    async def _embed_query(self, query: str) -> np.ndarray:
+        async def embed() -> np.ndarray:
+            return normalize_rows(await self.embedder.aembed_query(query))[0]
+
+        cache = current_retrieval_cache()
+        return await cache.embedding(self.embedder_name, query, embed) if cache is not None else await embed()
+
+    async def _search(
+        self, query: str, limit: int, filter: Optional[Dict[str, Any]], exact: bool, hybrid: bool
+    ) -> List[SearchResult]:
+        query_vector = await self._embed_query(query)
+        # Scans, BM25 and a first-use load() run off the loop; the lock is shared with the ANN build thread
+        return await get_executor().run_io(self._search_sync, query, query_vector, limit, filter, exact, hybrid)
+
+    def _search_sync(
+        self,
+        query: str,
+        query_vector: np.ndarray,
+        limit: int,
+        filter: Optional[Dict[str, Any]],
+        exact: bool,
+        hybrid: bool,
+    ) -> List[SearchResult]:
+        with self._lock:
+            self.load()
+            if self._count == 0 or limit <= 0:
+                return []
+            allowed = self._filter_rows(filter) if filter else None
+            if allowed is not None and allowed.size == 0:
+                return []
+            pool = max(limit, self.hybrid_pool) if hybrid else limit
+            rows, scores = self._dense(query_vector, pool, allowed, exact)
+            if not hybrid:
+                return [SearchResult(document=self._docs[r], score=float(s)) for r, s in zip(rows, scores)]
+
+            allowed_ids = None if allowed is None else {self._docs[r].id for r in allowed}
+            lexical = self._lexical_index().search(query, pool, allowed=allowed_ids)
+            cosine = {self._docs[r].id: float(s) for r, s in zip(rows, scores)}
+            # Lexical ranking first: RRF ties go to the exact term match
+            fused = reciprocal_rank_fusion([[doc_id for doc_id, _ in lexical], list(cosine)], k=self.rrf_k)
+            results = []
+            for doc_id, _ in fused[:limit]:
+                row = self._rows[doc_id]
+                score = cosine.get(doc_id)
+                if score is None:
+                    score = float(self._shards.floats([row])[0] @ query_vector)
+                results.append(SearchResult(document=self._docs[row], score=score))
+            return results
+
+    def vectors(self) -> np.ndarray:
+        """float32 copy of all stored vectors, in row order (tools and benchmarks)."""
+        with self._lock:
+            self.load()
+            return self._shards.floats(np.arange(self._count))
+
+    def get(self, doc_id: str) -> Optional[Document]:
+        with self._lock:
+            self.load()
+            row = self._rows.get(doc_id)
+            return self._docs[row] if row is not None else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.load()
+            return self._count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": self._count,
+                "dim": self.dim,
+                "embedder": self.embedder.stats(),
+                "bytes": self._shards.stats()["scan_bytes"],
+                "mmapped": self.path is not None and self._count > 0,
+                "storage": self._shards.stats(),
+                "path": str(self.path) if self.path else None,
+                "ann": self._ann.stats() if self._ann is not None else None,
+                "ann_building": self._ann_thread is not None,
+                "filter_fields": {f: len(v) for f, v in self._postings.items()},
+                "lexical": self._lexical.stats() if self._lexical is not None else None,
+            }
@@ -1,12 +1,4 @@
-from dataclasses import dataclass
-from typing import Any, Dict
-
-
-@dataclass
-class Document:
-    id: str
-    content: str
-    metadata: Dict[str, Any] = None
+from src.core.memory.interface import Document
 
 
 class QdrantAdapter:
@@ -0,0 +1,334 @@
+"""
+ICGL Memory — Quantized Vector Shards
+=====================================
+
+Row-addressed vector storage for the vector store. It keeps memory flat as
+ADR revisions, lessons and chat turns accumulate.
+
+- Every row is stored twice. Both copies live in fixed-size shards of
+  `shard_rows` rows under `<collection>.shards/`, opened with `np.memmap`:
+  - int8 codes with one float32 scale per row (`NNNNN.i8`, `NNNNN.scale`),
+    using symmetric scalar quantisation (scale = max|v| / 127);
+  - the float32 original (`NNNNN.f32`).
+- With `quantized=True`, queries scan only the codes (¼ of the float32
+  bytes) to pick candidates. The float32 originals of those candidates alone
+  are then read back for exact re-scoring. The float32 shards are paged in
+  per candidate row, so resident memory is about the size of the codes.
+- Shards grow append-only. An upsert overwrites its row in place. A delete
+  moves the last row into the hole and truncates the last shard.
+- Without a directory, shards are plain in-memory arrays (tests, ephemeral
+  stores).
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_CHUNK = 16384  # rows dequantised per step while scanning
+
+
+def quantize(vectors: np.ndarray):
+    """(int8 codes, float32 per-row scales) with vectors ≈ codes * scales[:, None]."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+class _Shard:
+    """One shard: codes, scales and float32 rows, file-backed (memmap) or in memory."""
+
+    KINDS = (("codes", "i8", np.int8, True), ("scales", "scale", np.float32, False), ("floats", "f32", np.float32, True))
+
+    def __init__(self, dim: int, directory: Optional[Path], number: int):
+        self.dim = dim
+        self.directory = directory
+        self.number = number
+        self.rows = 0
+        self.arrays: Dict[str, np.ndarray] = {}
+        self._buffers: Dict[str, np.ndarray] = {}  # in-memory shards: capacity-doubling backing arrays
+        self._map(0)
+
+    def path(self, suffix: str) -> Path:
+        return self.directory / f"{self.number:05d}.{suffix}"
+
+    def file_rows(self) -> int:
+        """Rows fully present in all three files."""
+        rows = []
+        for _, suffix, dtype, wide in self.KINDS:
+            p = self.path(suffix)
+            width = np.dtype(dtype).itemsize * (self.dim if wide else 1)
+            rows.append(p.stat().st_size // width if p.exists() else 0)
+        return min(rows)
+
+    def _map(self, rows: int) -> None:
+        for name, suffix, dtype, wide in self.KINDS:
+            shape = (rows, self.dim) if wide else (rows,)
+            if self.directory is None:
+                buffer = self._buffers.get(name)
+                if buffer is None or len(buffer) < rows:
+                    grown = np.zeros((max(rows, 2 * self.rows, 64),) + shape[1:], dtype=dtype)
+                    if buffer is not None:
+                        grown[: self.rows] = buffer[: self.rows]
+                    buffer = self._buffers[name] = grown
+                array = buffer[:rows]
+            elif rows == 0:
+                array = np.zeros(shape, dtype=dtype)
+            else:
+                array = np.memmap(self.path(suffix), dtype=dtype, mode="r+", shape=shape)
+            self.arrays[name] = array
+        self.rows = rows
+
+    def resize(self, rows: int) -> None:
+        """Grows or shrinks the shard (files are extended/truncated to exactly `rows`)."""
+        if rows == self.rows:
+            return
+        if self.directory is not None:
+            self.flush()
+            self.arrays = {}  # drop the maps before the files change size
+            for _, suffix, dtype, wide in self.KINDS:
+                width = np.dtype(dtype).itemsize * (self.dim if wide else 1)
+                p = self.path(suffix)
+                with open(p, "r+b" if p.exists() else "wb") as f:
+                    f.truncate(rows * width)
+        self._map(rows)
+
+    def flush(self) -> None:
+        for array in self.arrays.values():
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def remove_files(self) -> None:
+        self.arrays = {}
+        for _, suffix, _, _ in self.KINDS:
+            self.path(suffix).unlink(missing_ok=True)
+
+
+class VectorShards:
+    """Quantised, sharded row storage (see module docstring)."""
+
+    def __init__(self, dim: int, directory: Optional[Path] = None, shard_rows: int = 65536, quantized: bool = True):
+        self.dim = dim
+        self.directory = Path(directory) if directory else None
+        self.shard_rows = max(1, shard_rows)
+        self.quantized = quantized
+        self.count = 0
+        self._shards: List[_Shard] = []
+
+    # --- Lifecycle ---
+
+    def available_rows(self) -> int:
+        """Contiguous rows present on disk (shards before the last must be full)."""
+        if self.directory is None or not self.directory.exists():
+            return 0
+        rows, number = 0, 0
+        while True:
+            shard = _Shard(self.dim, self.directory, number)
+            if not shard.path("f32").exists():
+                return rows
+            present = shard.file_rows()
+            rows += present
+            if present < self.shard_rows:
+                return rows
+            number += 1
+
+    def open(self, count: int) -> None:
+        """Maps the first `count` rows of the persisted shards (dropping any tail beyond)."""
+        self._shards = []
+        full, tail = divmod(count, self.shard_rows)
+        for number in range(full + (1 if tail else 0)):
+            self._shard(number).resize(self.shard_rows if number < full else tail)
+        self.count = count
+        if self.directory is not None:
+            number = len(self._shards)
+            while _Shard(self.dim, self.directory, number).path("f32").exists():
+                _Shard(self.dim, self.directory, number).remove_files()  # rows past the valid prefix
+                number += 1
+
+    def remove_files(self) -> None:
+        if self.directory is not None and self.directory.exists():
+            for p in self.directory.iterdir():
+                p.unlink()
+            self.directory.rmdir()
+        self._shards, self.count = [], 0
+
+    def _shard(self, number: int) -> _Shard:
+        while len(self._shards) <= number:
+            if self.directory is not None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+            shard = _Shard(self.dim, self.directory, len(self._shards))
+            if self.directory is not None:
+                existing = shard.file_rows()
+                if existing:
+                    shard._map(min(existing, self.shard_rows))
+            self._shards.append(shard)
+        return self._shards[number]
+
+    def _grow(self, count: int) -> None:
+        if count <= self.count:
+            return
+        for number in range(self.count // self.shard_rows, (count + self.shard_rows - 1) // self.shard_rows):
+            shard = self._shard(number)
+            rows = min(self.shard_rows, count - number * self.shard_rows)
+            if shard.rows < rows:
+                shard.resize(rows)
+        self.count = count
+
+    # --- Writes ---
+
+    def write(self, rows: Sequence[int], vectors: np.ndarray) -> None:
+        """Stores normalised float32 `vectors` at `rows` (existing rows or appends)."""
+        if not len(rows):
+            return
+        rows = np.asarray(rows, dtype=np.int64)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self._grow(int(rows.max()) + 1)
+        codes, scales = quantize(vectors)
+        for number, sel, offsets in self._by_shard(rows):
+            arrays = self._shards[number].arrays
+            arrays["codes"][offsets] = codes[sel]
+            arrays["scales"][offsets] = scales[sel]
+            arrays["floats"][offsets] = vectors[sel]
+
+    def move(self, source: int, target: int) -> None:
+        src = self._shards[source // self.shard_rows].arrays
+        dst = self._shards[target // self.shard_rows].arrays
+        for name in ("codes", "scales", "floats"):
+            dst[name][target % self.shard_rows] = src[name][source % self.shard_rows]
+
+    def truncate(self, count: int) -> None:
+        """Drops rows >= count; emptied shards are deleted."""
+        keep = (count + self.shard_rows - 1) // self.shard_rows
+        for shard in self._shards[keep:]:
+            if self.directory is not None:
+                shard.remove_files()
+        self._shards = self._shards[:keep]
+        if keep:
+            self._shards[-1].resize(count - (keep - 1) * self.shard_rows)
+        self.count = count
+
+    def flush(self) -> None:
+        for shard in self._shards:
+            shard.flush()
+
+    # --- Reads ---
+
+    def _by_shard(self, rows: np.ndarray):
+        numbers = rows // self.shard_rows
+        for number in np.unique(numbers):
+            sel = np.flatnonzero(numbers == number)
+            yield int(number), sel, rows[sel] - number * self.shard_rows
+
+    def floats(self, rows: Sequence[int]) -> np.ndarray:
+        """float32 originals of `rows` (only these rows are paged in)."""
+        rows = np.asarray(rows, dtype=np.int64)
+        out = np.empty((len(rows), self.dim), dtype=np.float32)
+        for number, sel, offsets in self._by_shard(rows):
+            out[sel] = self._shards[number].arrays["floats"][offsets]
+        return out
+
+    def _scan_rows(self, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+        if not self.quantized:
+            return self.floats(rows) @ query
+        out = np.empty(len(rows), dtype=np.float32)
+        for number, sel, offsets in self._by_shard(rows):
+            arrays = self._shards[number].arrays
+            out[sel] = (arrays["codes"][offsets].astype(np.float32) @ query) * arrays["scales"][offsets]
+        return out
+
+    def scan(self, query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Scan-tier scores against `query` for `rows` (all rows when None): approximate
+        (int8 codes × scale) when quantized, exact otherwise.
+        """
+        if rows is not None:
+            out = np.empty(len(rows), dtype=np.float32)
+            for start in range(0, len(rows), _CHUNK):
+                out[start : start + _CHUNK] = self._scan_rows(rows[start : start + _CHUNK], query)
+            return out
+        parts = []
+        for shard in self._shards:
+            arrays = shard.arrays
+            for start in range(0, shard.rows, _CHUNK):
+                end = min(start + _CHUNK, shard.rows)
+                if self.quantized:
+                    parts.append((arrays["codes"][start:end].astype(np.float32) @ query) * arrays["scales"][start:end])
+                else:
+                    parts.append(arrays["floats"][start:end] @ query)
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32)
+
+    def stats(self) -> Dict[str, Any]:
+        float_bytes = self.count * self.dim * 4
+        code_bytes = self.count * (self.dim + 4)
+        return {
+            "quantization": "int8" if self.quantized else "none",
+            "shards": len(self._shards),
+            "shard_rows": self.shard_rows,
+            "scan_bytes": code_bytes if self.quantized else float_bytes,
+            "float32_bytes": float_bytes,
+            "mmapped": self.directory is not None and self.count > 0,
+        }
+
+
+class RowsView:
+    """
+    Read-only float32 rows [0, count) for building the IVF index off the store's lock.
+    Each read goes through `read(rows)`, which takes the lock and zero-fills rows
+    deleted since the view was taken.
+    """
+
+    def __init__(self, count: int, read: Callable[[np.ndarray], np.ndarray]):
+        self.count = count
+        self._read = read
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, key) -> np.ndarray:
+        rows = np.arange(self.count)[key] if isinstance(key, slice) else np.asarray(key, dtype=np.int64)
+        return self._read(rows)
+
+
+def quantization_benchmark(
+    vectors: np.ndarray,
+    queries: np.ndarray,
+    k: int = 10,
+    rescore_factors: Sequence[int] = (1, 4),
+    threshold: float = 0.88,
+) -> List[Dict[str, Any]]:
+    """
+    int8 scanning against exact float32 search over the same normalised rows: recall@k, agreement on
+    which hits clear a drift threshold, and the worst top-k score error. Factor 1 is the bare int8
+    scan; larger factors re-score k × factor candidates in float32.
+    """
+    from src.core.memory.ann import top_k
+
+    codes, scales = quantize(vectors)
+    approx = codes.astype(np.float32) * scales[:, None]
+    results: List[Dict[str, Any]] = []
+    for factor in rescore_factors:
+        hits = agree = 0
+        error = 0.0
+        for q in queries:
+            truth = top_k(vectors @ q, k)
+            exact_scores = vectors[truth] @ q
+            pool = top_k(approx @ q, k * factor)
+            pool_scores = vectors[pool] @ q if factor > 1 else approx[pool] @ q
+            order = top_k(pool_scores, k)
+            found, found_scores = pool[order], pool_scores[order]
+            hits += len(set(truth.tolist()) & set(found.tolist()))
+            n = min(len(found_scores), len(exact_scores))
+            error = max(error, float(np.abs(exact_scores[:n] - found_scores[:n]).max()))
+            agree += set(truth[exact_scores >= threshold].tolist()) == set(found[found_scores >= threshold].tolist())
+        results.append(
+            {
+                "method": "int8 scan" if factor == 1 else f"int8 + float32 rescore x{factor}",
+                "recall_at_k": round(hits / (k * len(queries)), 4),
+                "drift_agreement": round(agree / len(queries), 4),
+                "max_score_error": round(error, 5),
+                "memory_ratio": round(vectors.nbytes / (codes.nbytes + scales.nbytes), 2),
+            }
+        )
+    return results
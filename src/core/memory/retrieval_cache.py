@@ -0,0 +1,115 @@
+"""
+ICGL Memory — Cycle Retrieval Cache
+===================================
+
+Cycle-scoped memoisation of memory searches and query embeddings.
+
+In one governance cycle every agent recalls lessons for its prompt, the
+Knowledge Steward recalls history, Sentinel checks drift and background
+analysis looks for a semantic echo. These are mostly the same ADR text.
+Within a `retrieval_scope`:
+
+- Queries are normalised (NFKC, Arabic variants, casefold, whitespace), so
+  near-identical queries share one key.
+- A search with the same store, query and options runs once. Concurrent
+  callers await the same task. Results are keyed by the store's write
+  version, so an upsert or delete during the cycle is never served stale.
+- Query embeddings are memoised per embedder. A search that differs only in
+  its options (limit, filter, hybrid) still embeds once.
+- Failures are not memoised.
+- `stats()` reports hits, misses and hit ratios. Callers attach it to the
+  cycle's trace (`SynthesizedResult.retrieval`, run logs).
+
+Usage:
+    with retrieval_scope(cycle_id="adr-42") as cache:
+        synthesis = await registry.run_and_synthesize(problem, kb)
+    trace["retrieval"] = cache.stats()
+"""
+
+import asyncio
+import contextvars
+import json
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional
+
+from src.core.memory.lexical import normalize_text
+
+_current_cache: contextvars.ContextVar[Optional["RetrievalCache"]] = contextvars.ContextVar(
+    "icgl_retrieval_cache", default=None
+)
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(normalize_text(query).split())
+
+
+class RetrievalCache:
+    """Memoises searches and query embeddings for one cycle."""
+
+    def __init__(self, cycle_id: Optional[str] = None):
+        self.cycle_id = cycle_id
+        self._searches: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._embeddings: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._stats: Dict[str, int] = {
+            "search_hits": 0,
+            "search_misses": 0,
+            "embedding_hits": 0,
+            "embedding_misses": 0,
+        }
+
+    async def _memoize(self, table: Dict[Hashable, Any], key: Hashable, kind: str, run: Callable[[], Awaitable[Any]]):
+        future = table.get(key)
+        if future is not None:
+            self._stats[f"{kind}_hits"] += 1
+        else:
+            self._stats[f"{kind}_misses"] += 1
+            future = asyncio.ensure_future(run())
+            table[key] = future
+        try:
+            # Shielded: a cancelled caller must not cancel the search the others are awaiting
+            return await asyncio.shield(future)
+        except Exception:
+            if table.get(key) is future:
+                del table[key]
+            raise
+
+    async def search(self, store: Any, query: str, options: Dict[str, Any], run: Callable[[], Awaitable[Any]]):
+        """Results of `run()` for (store, write version, normalised query, options)."""
+        key = (
+            id(store),
+            getattr(store, "version", 0),
+            normalize_query(query),
+            json.dumps(options, sort_keys=True, default=str),
+        )
+        return await self._memoize(self._searches, key, "search", run)
+
+    async def embedding(self, embedder: str, query: str, run: Callable[[], Awaitable[Any]]):
+        """Query vector of `run()` for (embedder, normalised query)."""
+        return await self._memoize(self._embeddings, (embedder, normalize_query(query)), "embedding", run)
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"cycle_id": self.cycle_id, **self._stats}
+        for kind in ("search", "embedding"):
+            total = self._stats[f"{kind}_hits"] + self._stats[f"{kind}_misses"]
+            stats[f"{kind}_hit_ratio"] = round(self._stats[f"{kind}_hits"] / total, 4) if total else 0.0
+        return stats
+
+
+def current_retrieval_cache() -> Optional[RetrievalCache]:
+    """The retrieval cache of the cycle running in this task, if any."""
+    return _current_cache.get()
+
+
+@contextmanager
+def retrieval_scope(cycle_id: Optional[str] = None) -> Iterator[RetrievalCache]:
+    """Opens a retrieval cache for the current task (or joins the enclosing one)."""
+    existing = _current_cache.get()
+    if existing is not None:
+        yield existing
+        return
+    cache = RetrievalCache(cycle_id=cycle_id)
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
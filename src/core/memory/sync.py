@@ -0,0 +1,206 @@
+"""
+ICGL Memory — Incremental KB Sync
+=================================
+
+Keeps the vector memory in step with the Knowledge Base by applying only
+what changed since the last sync.
+
+- The watermark (`<memory>/sync_state.json`) stores:
+  - the max rowid per KB table (policies, adrs);
+  - the byte offset reached in the interventions JSONL;
+  - the id of the index it was taken on.
+- Every save is `INSERT OR REPLACE`, which assigns a fresh rowid. Rows above
+  the watermark are therefore exactly the entities written since.
+- KB entities missing from memory are upserted as well, and memory documents
+  whose KB entity is gone are deleted.
+- Only complete JSONL lines past the stored offset are ingested. A file that
+  shrank (rotation) is re-read from the start; upserts make that harmless.
+- If the watermark belongs to another index (e.g. the index was rebuilt for
+  a new embedder), a full sync runs.
+- `sync(full=True)` resets the watermark and reconciles everything. The
+  script `scripts/reindex_memory.py --full` runs it.
+
+Restart cost is proportional to what changed, not to KB size.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.kb.schemas import ADR, Policy, now, uid
+from src.core.memory.interface import Document
+
+
+@dataclass
+class SyncWatermark:
+    index_id: Optional[str] = None
+    policies_rowid: int = 0
+    adrs_rowid: int = 0
+    lessons_offset: int = 0
+    synced_at: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: Optional[Path]) -> "SyncWatermark":
+        if path is None or not path.exists():
+            return cls()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        except (OSError, ValueError, TypeError):
+            return cls()
+
+    def save(self, path: Optional[Path]) -> None:
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+@dataclass
+class SyncReport:
+    full: bool = False
+    upserted: Dict[str, int] = field(default_factory=dict)
+    deleted: Dict[str, int] = field(default_factory=dict)
+    scanned: Dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def policy_document(policy: Policy) -> Document:
+    return Document(
+        id=policy.id,
+        content=f"Policy {policy.code}: {policy.title}. Rule: {policy.rule}. Severity: {policy.severity}",
+        metadata={"type": "policy", "title": policy.title, "code": policy.code, "source": "kb"},
+    )
+
+
+def adr_document(adr: ADR) -> Document:
+    return Document(
+        id=adr.id,
+        content=f"ADR {adr.title}. Status: {adr.status}. Decision: {adr.decision}. Context: {adr.context}",
+        metadata={"type": "adr", "adr_id": adr.id, "title": adr.title, "status": adr.status, "source": "kb"},
+    )
+
+
+def read_lessons(path: str, offset: int = 0) -> Tuple[List[Document], int]:
+    """Lesson documents from complete JSONL lines after `offset`; returns (documents, new offset)."""
+    lessons_path = Path(path)
+    if not lessons_path.exists():
+        return [], 0
+    if lessons_path.stat().st_size < offset:
+        offset = 0  # rotated or truncated
+    documents: List[Document] = []
+    with open(lessons_path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # partially written line: pick it up next time
+            offset += len(raw)
+            try:
+                data = json.loads(raw.decode("utf-8"))
+            except (UnicodeDecodeError, ValueError):
+                continue
+            documents.append(
+                Document(
+                    id=f"lesson-{data.get('id', uid())}",
+                    content=f"Human {data.get('human_action')} proposal: {data.get('original_recommendation')} Reason: {data.get('reason')}",
+                    metadata={"type": "lesson", "adr_id": data.get("adr_id")},
+                )
+            )
+    return documents, offset
+
+
+class MemorySync:
+    """Applies KB and intervention-log changes to a vector store (see module docstring)."""
+
+    TABLES = {
+        "policies": ("policy", policy_document, "policies_rowid"),
+        "adrs": ("adr", adr_document, "adrs_rowid"),
+    }
+
+    def __init__(
+        self,
+        storage,
+        memory,
+        state_path: Optional[str] = None,
+        lessons_path: str = "data/logs/interventions.jsonl",
+        batch_size: int = 256,
+    ):
+        self.storage = storage
+        self.memory = memory
+        if state_path is None and getattr(memory, "path", None) is not None:
+            state_path = os.path.join(str(memory.path), "sync_state.json")
+        self.state_path = Path(state_path) if state_path else None
+        self.lessons_path = lessons_path
+        self.batch_size = batch_size
+
+    def watermark(self) -> SyncWatermark:
+        return SyncWatermark.load(self.state_path)
+
+    async def _upsert(self, documents: List[Document], progress: Optional[Dict[str, Any]]) -> int:
+        written = 0
+        for start in range(0, len(documents), self.batch_size):
+            batch = documents[start : start + self.batch_size]
+            written += await self.memory.add_documents(batch)
+            if progress is not None:
+                progress["indexed"] = progress.get("indexed", 0) + len(batch)
+        return written
+
+    def _read_table(self, table: str, doc_type: str, since: int) -> Tuple[int, list, set]:
+        indexed = set(self.memory.ids({"type": doc_type, "source": "kb"}))
+        current = self.storage.load_entity_ids(table)
+        max_rowid, entities = self.storage.load_changes_since(table, since, ids=current - indexed)
+        if max_rowid < since:
+            # Rowids were renumbered (e.g. VACUUM): rescan the table once
+            max_rowid, entities = self.storage.load_changes_since(table, 0)
+        return max_rowid, entities, indexed - current
+
+    async def sync(self, full: bool = False, progress: Optional[Dict[str, Any]] = None) -> SyncReport:
+        """Brings memory up to date with the KB; `full` ignores the stored watermark."""
+        from src.core.core.executor import get_executor
+
+        executor = get_executor()
+        started = time.perf_counter()
+        self.memory.load()
+        watermark = self.watermark()
+        index_id = getattr(self.memory, "index_id", None)
+        if watermark.index_id != index_id:
+            full = True
+        if full:
+            watermark = SyncWatermark()
+        watermark.index_id = index_id
+        report = SyncReport(full=full)
+
+        for table, (doc_type, to_document, attr) in self.TABLES.items():
+            max_rowid, entities, removed = await executor.run_io(
+                self._read_table, table, doc_type, getattr(watermark, attr), timeout=300
+            )
+            documents = [to_document(entity) for entity in entities]
+            if progress is not None:
+                progress["total"] = progress.get("total", 0) + len(documents)
+            report.scanned[table] = len(documents)
+            report.upserted[table] = await self._upsert(documents, progress)
+            report.deleted[table] = await self.memory.delete(sorted(removed)) if removed else 0
+            setattr(watermark, attr, max_rowid)
+            watermark.save(self.state_path)
+
+        lessons, offset = await executor.run_io(
+            read_lessons, self.lessons_path, watermark.lessons_offset, timeout=300
+        )
+        if progress is not None:
+            progress["total"] = progress.get("total", 0) + len(lessons)
+        report.scanned["lessons"] = len(lessons)
+        report.upserted["lessons"] = await self._upsert(lessons, progress)
+        watermark.lessons_offset = offset
+        watermark.synced_at = now()
+        watermark.save(self.state_path)
+
+        report.seconds = round(time.perf_counter() - started, 4)
+        return report
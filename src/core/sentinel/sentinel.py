@@ -10,10 +10,10 @@ Manifesto Reference:
 - "Unknown risks cannot be eliminated — only contained and learned from."
 """
 
-from typing import List
+from typing import Any, Dict, List
 
 from src.core.kb.schemas import ADR
-from src.core.llm.client import LLMClient
+from src.core.llm.client import LLMClient, get_llm_client
 from src.core.sentinel.rules import Alert, AlertCategory, AlertSeverity, RuleRegistry, get_registry
 
 
@@ -39,7 +39,7 @@ class Sentinel:
         """
         self._registry = registry or get_registry()
         self.vector_store = vector_store
-        self.llm = llm_client or LLMClient()
+        self.llm = llm_client or get_llm_client()
 
     def scan_adr(self, adr: ADR, kb) -> List[str]:
         """
@@ -87,26 +87,38 @@ class Sentinel:
             return []
 
         query = f"{adr.title} {adr.context} {adr.decision}"
-        # Search for similar items
-        results = await self.vector_store.search(query, limit=3)
+        # Search for similar ADRs (filtered inside the index, hybrid lexical + vector when supported)
+        options: Dict[str, Any] = {"hybrid": True} if getattr(self.vector_store, "supports_hybrid", False) else {}
+        if getattr(self.vector_store, "supports_filters", False):
+            options["filter"] = {"type": "adr"}
+        # The ADR itself can be indexed twice (`id` and `adr-{id}`): fetch past both copies
+        limit = 3
+        results = await self.vector_store.search(query, limit=limit + 2, **options)
 
         drift_alerts = []
+        candidates = 0
         for res in results:
-            # Skip self
-            if res.document.id == adr.id:
+            # Skip self (KB sync indexes ADRs as `id`, signed cycles as `adr-{id}`)
+            doc = res.document
+            if doc.metadata.get("adr_id") == adr.id or doc.id in (adr.id, f"adr-{adr.id}"):
                 continue
+            candidates += 1
+            if candidates > limit:
+                break
 
             # Check Similarity
             if res.score > 0.88:  # High similarity threshold
                 # If existing is ACCEPTED, we have a potential duplication or conflict
                 drift_alerts.append(
                     Alert(
-                        signal_id="S-11",
+                        rule_id="S-11",
                         severity=AlertSeverity.WARNING,
-                        message=f"Semantic Drift Warning: Similar to existing item '{res.document.metadata.get('title', 'Unknown')}' (Score: {res.score:.2f}). Check for redundancy.",
+                        message=f"Semantic Drift Warning: Similar to existing item '{doc.metadata.get('title', 'Unknown')}' (Score: {res.score:.2f}). Check for redundancy.",
+                        category=AlertCategory.DRIFT,
+                        context={"similar_id": doc.id, "score": round(res.score, 4)},
                     )
                 )
-            elif res.score > 0.82 and "ACCEPTED" in res.document.content:
+            elif res.score > 0.82 and "ACCEPTED" in doc.content:
                 # Subtler drift or conflict
                 pass
 
@@ -137,7 +149,7 @@ Respond ONLY in JSON format:
         try:
             if getattr(self.llm, "mock_mode", False):
                 return []
-            res = await self.llm.generate_json(system_prompt, user_prompt)
+            res, _usage = await self.llm.generate_json(system_prompt, user_prompt)
             if res.get("violation_detected"):
                 severity_map = {
                     "CRITICAL": AlertSeverity.CRITICAL,
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from src.core.agents.core.base import AgentResult, AgentRole, MockAgent
+from src.core.agents.infrastructure.consultation import ConsultationLimits, consultation_scope
+from src.core.agents.infrastructure.registry import AgentRegistry
+from src.core.core.llm import MockProvider
+
+
+class ConsultingAgent(MockAgent):
+    def __init__(self, agent_id, role, peers=(), delay=0.01):
+        super().__init__(agent_id, role)
+        self.peers = list(peers)
+        self.delay = delay
+        self.runs = 0
+
+    async def _analyze(self, problem, kb):
+        self.runs += 1
+        await asyncio.sleep(self.delay)
+        for peer in self.peers:
+            await self.consult_peer(peer, title="History", context="shared question", kb=kb)
+        return AgentResult(agent_id=self.agent_id, role=self.role, analysis="ok", confidence=0.9)
+
+
+def _registry(monkeypatch, *agents):
+    monkeypatch.setattr(AgentRegistry, "_init_llm_provider", lambda self: MockProvider())
+    registry = AgentRegistry()
+    for agent in agents:
+        registry.register(agent)
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_identical_consultations_share_one_run(monkeypatch):
+    steward = ConsultingAgent("agent-steward", AgentRole.STEWARD)
+    registry = _registry(
+        monkeypatch,
+        ConsultingAgent("agent-architect", AgentRole.ARCHITECT, peers=[AgentRole.STEWARD]),
+        ConsultingAgent("agent-policy", AgentRole.POLICY, peers=[AgentRole.STEWARD]),
+        steward,
+    )
+
+    with consultation_scope("cycle-1") as coordinator:
+        await asyncio.gather(
+            registry.get_agent(AgentRole.ARCHITECT).analyze(_problem(), None),
+            registry.get_agent(AgentRole.POLICY).analyze(_problem(), None),
+        )
+
+    graph = coordinator.graph()
+    assert steward.runs == 1
+    assert graph["stats"]["executed"] == 1
+    assert graph["stats"]["deduplicated"] == 1
+    assert sorted(e["from"] for e in graph["edges"]) == ["architect", "policy"]
+
+
+@pytest.mark.asyncio
+async def test_cycles_are_refused(monkeypatch):
+    architect = ConsultingAgent("agent-architect", AgentRole.ARCHITECT, peers=[AgentRole.STEWARD])
+    steward = ConsultingAgent("agent-steward", AgentRole.STEWARD, peers=[AgentRole.ARCHITECT])
+    registry = _registry(monkeypatch, architect, steward)
+
+    with consultation_scope("cycle-2") as coordinator:
+        await registry.get_agent(AgentRole.ARCHITECT).analyze(_problem(), None)
+
+    graph = coordinator.graph()
+    assert architect.runs == 1
+    assert steward.runs == 1
+    cycle_edges = [e for e in graph["edges"] if e["status"] == "cycle"]
+    assert cycle_edges[0]["path"] == ["architect", "steward", "architect"]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_cap_and_nested_concurrency(monkeypatch):
+    leaves = [AgentRole.SECURITY, AgentRole.CHAOS, AgentRole.GUARDIAN]
+    agents = [ConsultingAgent(f"agent-{r.value}", r) for r in leaves]
+    # A single concurrency slot must not deadlock when a consultation consults further
+    hub = ConsultingAgent("agent-sentinel", AgentRole.SENTINEL, peers=leaves)
+    root = ConsultingAgent("agent-architect", AgentRole.ARCHITECT, peers=[AgentRole.SENTINEL])
+    _registry(monkeypatch, root, hub, *agents)
+
+    limits = ConsultationLimits(max_consultations=3, max_concurrency=1, max_depth=3)
+    with consultation_scope("cycle-3", limits=limits) as coordinator:
+        await asyncio.wait_for(root.analyze(_problem(), None), timeout=2.0)
+
+    stats = coordinator.graph()["stats"]
+    assert stats["executed"] == 3
+    assert stats["capped"] == 1
+    assert stats["peak_concurrency"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cross_path_join_that_would_deadlock_is_refused(monkeypatch):
+    # steward and security each consult the other with a question the other is already running
+    steward = ConsultingAgent("agent-steward", AgentRole.STEWARD, peers=[AgentRole.SECURITY])
+    security = ConsultingAgent("agent-security", AgentRole.SECURITY, peers=[AgentRole.STEWARD])
+    architect = ConsultingAgent("agent-architect", AgentRole.ARCHITECT, peers=[AgentRole.STEWARD], delay=0)
+    policy = ConsultingAgent("agent-policy", AgentRole.POLICY, peers=[AgentRole.SECURITY], delay=0)
+    _registry(monkeypatch, architect, policy, steward, security)
+
+    with consultation_scope("cycle-4") as coordinator:
+        await asyncio.wait_for(
+            asyncio.gather(architect.analyze(_problem(), None), policy.analyze(_problem(), None)), timeout=2.0
+        )
+
+    edges = coordinator.graph()["edges"]
+    assert steward.runs == security.runs == 1
+    assert [e["status"] for e in edges if e.get("wait_cycle")] == ["cycle"]
+    assert coordinator._waits == {}
+
+
+@pytest.mark.asyncio
+async def test_synthesis_carries_consultation_graph(monkeypatch):
+    registry = _registry(
+        monkeypatch,
+        ConsultingAgent("agent-architect", AgentRole.ARCHITECT, peers=[AgentRole.STEWARD]),
+        ConsultingAgent("agent-steward", AgentRole.STEWARD),
+    )
+
+    synthesis = await registry.run_and_synthesize(_problem(), None, allowed_agents=["architect"])
+
+    assert synthesis.consultation_graph["nodes"] == ["architect", "steward"]
+
+
+def _problem():
+    from src.core.agents.core.base import Problem
+
+    return Problem(title="ADR", context="ctx", metadata={"adr_id": "adr-1"})
@@ -0,0 +1,129 @@
+import pytest
+
+from src.core.agents.core.architect import ArchitectAgent
+from src.core.agents.core.base import AgentRole, MockAgent, Problem
+from src.core.core.llm import LLMProvider
+from src.core.llm.context_assembly import (
+    ContextAssembler,
+    estimate_tokens,
+    fit_text,
+    truncate_middle,
+)
+
+
+def _big_context(paragraphs: int = 400) -> str:
+    return "\n\n".join(
+        f"Paragraph {i} explains the migration step in detail. It also repeats background material."
+        for i in range(paragraphs)
+    )
+
+
+def test_estimator_scales_with_text():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("hello world") == 2
+    assert estimate_tokens("القرار المعماري") > 2
+    assert estimate_tokens(_big_context(100)) > estimate_tokens(_big_context(10))
+
+
+def test_truncate_middle_keeps_head_and_tail_deterministically():
+    text = " ".join(f"w{i}" for i in range(2000))
+
+    cut = truncate_middle(text, 200)
+
+    assert estimate_tokens(cut) <= 200
+    assert cut.startswith("w0 w1")
+    assert cut.endswith("w1999")
+    assert "tokens omitted" in cut
+    assert truncate_middle(text, 200) == cut
+
+
+def test_fit_text_prefers_extractive_summary():
+    text = "\n\n".join(f"Lead sentence {i}. " + "Filler detail. " * 30 for i in range(5))
+
+    fitted = fit_text(text, 60)
+
+    assert "Lead sentence 4." in fitted
+    assert "Filler" not in fitted
+
+
+def test_priorities_dedupe_and_budget():
+    context = _big_context()
+    assembler = ContextAssembler(budget=500)
+    assembler.add("context", context, priority=80, title="CONTEXT")
+    assembler.add(
+        "steward",
+        "Paragraph 0 explains the migration step in detail. It also repeats background material.\n\n"
+        "ADR-7 was rejected for coupling.",
+        priority=60,
+        title="MEMORY",
+    )
+    assembler.add("schema", "- field: value\n" * 300, priority=10, compressible=False)
+    assembler.add("references", "- ADR-7", priority=5)
+
+    assembled = assembler.assemble()
+
+    assert assembled.tokens <= 500
+    assert assembled.report["context"]["final"] < assembled.report["context"]["original"]
+    assert assembled.sections["steward"] == "ADR-7 was rejected for coupling."
+    assert assembled.dropped == ["schema"]
+    assert assembled.sections["references"] == "- ADR-7"
+    assert assembled.text.index("CONTEXT:") < assembled.text.index("MEMORY:")
+
+
+@pytest.mark.asyncio
+async def test_agent_requests_respect_input_budget(monkeypatch):
+    monkeypatch.setenv("ICGL_AGENT_INPUT_BUDGET_POLICY", "800")
+    agent = MockAgent(agent_id="agent-policy", role=AgentRole.POLICY)
+
+    request = await agent._build_llm_request(f"Audit this:\n{_big_context()}")
+
+    assert estimate_tokens(request.system_prompt) + estimate_tokens(request.prompt) <= 800
+    assert request.prompt.startswith("Audit this:")
+
+
+@pytest.mark.asyncio
+async def test_system_prompt_is_never_summarised(monkeypatch):
+    monkeypatch.setenv("ICGL_AGENT_INPUT_BUDGET_POLICY", "800")
+    agent = MockAgent(agent_id="agent-policy", role=AgentRole.POLICY)
+    rules = "\n\n".join(
+        f"Rule {i}: check the proposal against policy P-{i:02d}. Cite it when violated." for i in range(35)
+    )
+    system = f'{rules}\n\nOutput JSON only: {{"analysis": "...", "concerns": ["..."], "confidence": 0.0}}'
+    assert 800 - 100 < estimate_tokens(system) < 800
+
+    request = await agent._build_llm_request(f"Audit this:\n{_big_context()}", system_prompt=system)
+
+    assert request.system_prompt == system
+
+
+class CapturingProvider(LLMProvider):
+    def __init__(self):
+        self.requests = []
+
+    async def generate(self, request):
+        raise NotImplementedError
+
+    async def generate_stream(self, request):
+        self.requests.append(request)
+        yield '{"analysis": "ok", "confidence_score": 0.5}'
+
+
+@pytest.mark.asyncio
+async def test_architect_prompt_is_fitted_once_with_map_and_lessons_reserved(monkeypatch):
+    monkeypatch.setenv("ICGL_AGENT_INPUT_BUDGET_ARCHITECT", "1500")
+    architect = ArchitectAgent()
+    architect.llm = CapturingProvider()
+
+    async def arender(max_depth, token_budget):
+        return "\n".join(f"src/module_{i}/service_{i}.py" for i in range(120))
+
+    architect.context_builder.repo_map.arender = arender
+    problem = Problem(title="Split cache", context=_big_context(), metadata={"decision": "Split the cache"})
+
+    await architect.analyze(problem, kb=None)
+
+    request = architect.llm.requests[0]
+    assert "module_119" in request.system_prompt
+    assert request.prompt.rstrip().endswith("Output in JSON.")
+    assert "tokens omitted" not in request.prompt
+    assert estimate_tokens(request.system_prompt) + estimate_tokens(request.prompt) <= 1500
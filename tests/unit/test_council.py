@@ -0,0 +1,99 @@
+import json
+
+from src.core.agents.infrastructure.council import (
+    AdrFeatures,
+    AgentStats,
+    CouncilSelector,
+    replay_runs,
+    stats_from_rows,
+)
+from src.core.kb.schemas import AgentMetric
+from src.core.kb.storage import StorageBackend
+
+CANDIDATES = ["architect", "policy", "sentinel", "builder", "failure", "guardian", "security", "performance"]
+
+
+def test_selection_keeps_core_and_prefers_relevant_reliable_agents():
+    selector = CouncilSelector(core_roles=["architect", "policy"], epsilon=0.0, min_size=3)
+    features = AdrFeatures.from_text("Add a cache to cut API latency under load")
+    stats = {
+        "performance": AgentStats("performance", runs=20, success_rate=1.0, mean_confidence=0.9, mean_latency_ms=800),
+        "builder": AgentStats("builder", runs=20, success_rate=0.2, mean_confidence=0.3, mean_latency_ms=30000),
+    }
+
+    selection = selector.select(CANDIDATES, features, stats)
+
+    assert selection.agents[:2] == ["architect", "policy"]
+    assert "performance" in selection.agents
+    assert len(selection.agents) == 3
+    assert "builder" in selection.skipped
+
+
+def test_critical_alerts_grow_the_council_and_seat_matching_roles():
+    selector = CouncilSelector(core_roles=["architect"], epsilon=0.0, min_size=2)
+    calm = selector.select(CANDIDATES, AdrFeatures.from_text("Rename a field"))
+    alarmed = selector.select(
+        CANDIDATES,
+        AdrFeatures.from_text("Rename a field", [{"category": "Safety", "severity": "CRITICAL"}]),
+    )
+
+    assert len(alarmed.agents) == len(calm.agents) + 2
+    assert {"guardian", "security"} <= set(alarmed.agents)
+
+
+def test_exploration_adds_an_unselected_agent():
+    selector = CouncilSelector(core_roles=["architect"], epsilon=1.0, min_size=2, seed=7)
+    selection = selector.select(CANDIDATES, AdrFeatures.from_text("Rename a field"))
+
+    assert len(selection.explored) == 1
+    assert selection.reasons[selection.explored[0]] == "explore"
+    assert len(selection.agents) == 3
+    assert selector.select(CANDIDATES, AdrFeatures(), explore=False).explored == []
+
+
+def test_metric_summary_feeds_stats(tmp_path):
+    storage = StorageBackend(str(tmp_path / "kb.db"))
+    for latency, ok in ((100.0, True), (300.0, False)):
+        storage.save_agent_metric(
+            AgentMetric(
+                agent_id="agent-builder",
+                role="builder",
+                task_type="analysis",
+                latency_ms=latency,
+                confidence_score=0.8,
+                success=ok,
+            )
+        )
+
+    stats = stats_from_rows(storage.load_agent_metric_summary())
+
+    assert stats["builder"].runs == 2
+    assert stats["builder"].success_rate == 0.5
+    assert stats["builder"].mean_latency_ms == 200.0
+
+
+def test_replay_estimates_savings_against_consensus(tmp_path):
+    def result(role, recs, confidence=0.8):
+        return {"role": role, "analysis": "x " * 200, "recommendations": recs, "concerns": [], "confidence": confidence}
+
+    run = {
+        "adr": {"id": "ADR-1", "title": "Tune cache", "context": "latency", "decision": "cache", "sentinel_signals": []},
+        "synthesis": {
+            "agent_results": [
+                result("architect", ["Add cache"]),
+                result("performance", ["Add cache"]),
+                result("builder", ["Write code"]),
+                result("failure", ["Write code"]),
+            ]
+        },
+    }
+    (tmp_path / "run_0001_ADR-1.json").write_text(json.dumps(run), encoding="utf-8")
+
+    selector = CouncilSelector(core_roles=["architect"], epsilon=1.0, min_size=2)
+    report = replay_runs(str(tmp_path), selector=selector)
+
+    assert report.runs == 1
+    assert report.agents_selected == 2
+    assert report.tokens_saved > 0
+    # "Write code" was consensus only among the dropped agents
+    assert report.consensus_recall == 0.5
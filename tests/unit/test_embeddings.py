@@ -0,0 +1,57 @@
+import numpy as np
+
+from src.core.memory.embeddings import CachedEmbedder, EmbeddingCache, HashingEmbedder
+from src.core.memory.numpy_store import normalize_rows
+
+
+def _cosine(a, b):
+    a, b = normalize_rows(np.stack([a, b]))
+    return float(a @ b)
+
+
+def test_hashing_embedder_is_deterministic_and_morphology_aware():
+    embedder = HashingEmbedder(dim=256)
+    first = embedder.embed(["سياسة الحوكمة", "governance policy P-ARCH-04", "unrelated weather report"])
+    again = HashingEmbedder(dim=256).embed(["سياسة الحوكمة"])
+
+    assert first.shape == (3, 256) and first.dtype == np.float32
+    assert np.array_equal(first[0], again[0])
+    variant = embedder.embed(["السياسات والحوكمة"])[0]
+    assert _cosine(first[0], variant) > _cosine(first[0], first[2])
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dim=64)
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return super().embed(texts)
+
+
+async def test_cache_embeds_only_misses(tmp_path):
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(inner, EmbeddingCache(str(tmp_path / "embeddings.db")))
+
+    first = await embedder.aembed(["adr one", "adr two", "adr one"])
+    second = await embedder.aembed(["adr two", "adr three"])
+
+    assert inner.calls == [["adr one", "adr two"], ["adr three"]]
+    assert np.array_equal(first[1], second[0])
+    restarted = CachedEmbedder(CountingEmbedder(), EmbeddingCache(str(tmp_path / "embeddings.db")))
+    restarted.embed(["adr one", "adr two", "adr three"])
+    assert restarted.inner.calls == [] and restarted.stats()["cache_hit_ratio"] == 1.0
+
+
+async def test_queries_bypass_the_cache_and_the_table_is_capped(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embeddings.db"), max_rows=2)
+    embedder = CachedEmbedder(CountingEmbedder(), cache)
+
+    query = await embedder.aembed_query("what did we decide on caching?")
+    assert query.shape == (1, 64) and cache.count() == 0
+
+    await embedder.aembed(["adr one", "adr two", "adr three"])
+    assert cache.count() == 2
+    await embedder.aembed(["adr two", "adr three"])
+    assert embedder.inner.calls[-1] == ["adr one", "adr two", "adr three"]
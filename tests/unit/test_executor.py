@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.agents.core.builder import verify_output
+from src.core.core.executor import ExecutorSaturated, ExecutorTimeout, WorkExecutor
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+async def test_cpu_work_runs_in_worker_processes():
+    executor = WorkExecutor(cpu_workers=2, max_queue=4)
+    try:
+        changes = [{"path": "a.py", "content": "def f(:\n"}, {"path": "b.py", "content": "x = 1\n"}]
+        is_valid, issues = await executor.run_cpu(verify_output, changes)
+
+        assert not is_valid
+        assert issues[0].startswith("a.py: Syntax error at line 1")
+        metrics = executor.metrics()["cpu"]
+        assert metrics["completed"] == 1 and metrics["in_flight"] == 0
+    finally:
+        executor.shutdown(wait=True)
+
+
+async def test_queue_is_bounded_and_tasks_time_out():
+    executor = WorkExecutor(io_workers=1, max_queue=1, use_processes=False)
+    try:
+        first = asyncio.create_task(executor.run_io(_sleep, 0.2))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(executor.run_io(_sleep, 0.0))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(ExecutorSaturated):
+            await executor.run_io(_sleep, 0.0)
+        assert await asyncio.gather(first, queued) == [0.2, 0.0]
+
+        with pytest.raises(ExecutorTimeout):
+            await executor.run_io(_sleep, 0.2, timeout=0.05)
+
+        metrics = executor.metrics()["io"]
+        assert metrics["rejected"] == 1
+        assert metrics["timed_out"] == 1
+        assert metrics["peak_queued"] == 1
+        assert 0 < metrics["utilization"] <= 1
+    finally:
+        executor.shutdown(wait=True)
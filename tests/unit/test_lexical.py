@@ -0,0 +1,45 @@
+from src.core.memory.interface import Document
+from src.core.memory.lexical import BM25Index, normalize_text, reciprocal_rank_fusion, tokenize
+from src.core.memory.numpy_store import NumpyVectorStore
+
+
+def test_arabic_variants_normalize_to_the_same_terms():
+    assert normalize_text("إِدارَةُ المُــؤسسة ٤٢") == normalize_text("ادارة المؤسسه 42")
+    assert tokenize("والسياسات") == tokenize("السياسات")
+    assert tokenize("Policy P-ARCH-04")[:3] == ["policy", "p-arch-04", "p"]
+
+
+def test_bm25_updates_incrementally():
+    index = BM25Index()
+    index.add("a", "Occurrence must be immutable")
+    index.add("b", "Context is not authority P-ARCH-04")
+    assert [doc_id for doc_id, _ in index.search("p-arch-04", 5)] == ["b"]
+
+    index.add("b", "Context is only context")  # upsert replaces the old terms
+    index.remove("a")
+    assert index.search("p-arch-04", 5) == [] and index.search("immutable", 5) == []
+    assert len(index) == 1 and index.stats()["terms"] == 3
+
+
+def test_rrf_rewards_agreement_between_rankings():
+    fused = reciprocal_rank_fusion([["x", "y", "z"], ["y", "x"]])
+    assert [doc_id for doc_id, _ in fused] == ["x", "y", "z"]
+
+
+async def test_hybrid_search_finds_exact_codes_and_keeps_cosine_scores():
+    store = NumpyVectorStore(ann_min_docs=0)
+    await store.add_documents(
+        [
+            Document(id=f"p{i}", content=f"Policy P-GOV-{i:02d}: governance rule number {i}", metadata={"type": "policy"})
+            for i in range(30)
+        ]
+    )
+    vector = await store.search("P-GOV-17", limit=1)
+    hybrid = await store.search("P-GOV-17", limit=1, hybrid=True)
+    assert hybrid[0].document.id == "p17"
+    assert 0.0 < hybrid[0].score <= 1.0 and vector[0].score >= hybrid[0].score
+
+    await store.add_document(Document(id="p17", content="Policy P-GOV-17: renamed", metadata={"type": "adr"}))
+    assert (await store.search("P-GOV-17", limit=1, hybrid=True, filter={"type": "policy"}))[0].document.id != "p17"
+    await store.delete(["p17"])
+    assert store.stats()["lexical"]["documents"] == 29
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.core.agents.core.base import AgentRole, MockAgent
+from src.core.agents.infrastructure.registry import AgentRegistry
+from src.core.core.coalescing import CoalescingProvider
+from src.core.core.llm import LLMProvider, LLMProviderError, LLMRequest, LLMResponse
+
+
+class CountingProvider(LLMProvider):
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if request.prompt == "bad":
+                raise LLMProviderError("rejected", status_code=400)
+            return LLMResponse(content=f"re: {request.prompt}", provider="counting")
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_generate_many_preserves_order_and_isolates_errors():
+    provider = CountingProvider()
+    prompts = ["a", "bad", "c", "d", "e"]
+
+    results = await provider.generate_many([LLMRequest(prompt=p) for p in prompts], max_concurrency=2)
+
+    assert isinstance(results[1], LLMProviderError)
+    assert [r.content for i, r in enumerate(results) if i != 1] == ["re: a", "re: c", "re: d", "re: e"]
+    assert provider.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescing_dedupes_within_batch():
+    inner = CountingProvider()
+    provider = CoalescingProvider(inner)
+
+    results = await provider.generate_many([LLMRequest(prompt=p) for p in ["x", "y", "x", "x"]], max_concurrency=1)
+
+    assert inner.calls == 2
+    assert [r.content for r in results] == ["re: x", "re: y", "re: x", "re: x"]
+    assert provider.metrics()["coalescing"]["batch_deduplicated"] == 2
+
+
+@pytest.mark.asyncio
+async def test_registry_submits_council_as_one_batch(monkeypatch):
+    inner = CountingProvider()
+    monkeypatch.setattr(AgentRegistry, "_init_llm_provider", lambda self: inner)
+    registry = AgentRegistry()
+    registry.register(MockAgent("agent-architect", AgentRole.ARCHITECT))
+    registry.register(MockAgent("agent-policy", AgentRole.POLICY))
+
+    results = await registry.batch_generate({"agent-architect": "p1", "policy": "p2", "ghost": "p3"})
+
+    assert list(results) == ["agent-architect", "policy", "ghost"]
+    assert results["agent-architect"].content == "re: p1"
+    assert results["policy"].content == "re: p2"
+    assert isinstance(results["ghost"], KeyError)
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_registry_builds_batch_requests_concurrently(monkeypatch):
+    monkeypatch.setattr(AgentRegistry, "_init_llm_provider", lambda self: CountingProvider())
+    registry = AgentRegistry()
+    roles = [AgentRole.ARCHITECT, AgentRole.POLICY, AgentRole.FAILURE]
+    agents = [MockAgent(f"agent-{role.value}", role) for role in roles]
+    building = {"active": 0, "peak": 0}
+
+    async def slow_build(prompt):
+        building["active"] += 1
+        building["peak"] = max(building["peak"], building["active"])
+        await asyncio.sleep(0.01)
+        building["active"] -= 1
+        if prompt == "bad":
+            raise ValueError("no lessons")
+        return LLMRequest(prompt=prompt)
+
+    for agent in agents:
+        monkeypatch.setattr(agent, "_build_llm_request", slow_build)
+        registry.register(agent)
+
+    results = await registry.batch_generate({"architect": "p1", "policy": "bad", "failure": "p3"}, max_concurrency=2)
+
+    assert building["peak"] == 2
+    assert results["architect"].content == "re: p1"
+    assert isinstance(results["policy"], ValueError)
+    assert results["failure"].content == "re: p3"
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from src.core.core.coalescing import CoalescingProvider
+from src.core.core.llm import LLMProvider, LLMRequest, LLMResponse
+
+
+class SlowProvider(LLMProvider):
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return LLMResponse(content=f"answer: {request.prompt}", provider="slow")
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_call():
+    inner = SlowProvider()
+    provider = CoalescingProvider(inner)
+
+    results = await asyncio.gather(*[provider.generate(LLMRequest(prompt="same")) for _ in range(5)])
+
+    assert inner.calls == 1
+    assert all(r.content == "answer: same" for r in results)
+    stats = provider.metrics()["coalescing"]
+    assert stats["leaders"] == 1
+    assert stats["coalesced"] == 4
+    assert stats["max_waiters"] == 5
+    assert provider.in_flight() == {}
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_coalesced():
+    inner = SlowProvider()
+    provider = CoalescingProvider(inner)
+
+    await asyncio.gather(provider.generate(LLMRequest(prompt="a")), provider.generate(LLMRequest(prompt="b")))
+
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_leader_cancellation_does_not_cancel_followers():
+    inner = SlowProvider(delay=0.1)
+    provider = CoalescingProvider(inner)
+
+    leader = asyncio.ensure_future(provider.generate(LLMRequest(prompt="q")))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(provider.generate(LLMRequest(prompt="q")))
+    await asyncio.sleep(0.01)
+    assert list(provider.in_flight().values()) == [2]
+
+    leader.cancel()
+    result = await follower
+
+    assert leader.cancelled()
+    assert result.content == "answer: q"
+    assert inner.calls == 1
+    assert inner.cancelled == 0
+
+
+@pytest.mark.asyncio
+async def test_underlying_call_cancelled_when_all_waiters_leave():
+    inner = SlowProvider(delay=1.0)
+    provider = CoalescingProvider(inner)
+
+    waiters = [asyncio.ensure_future(provider.generate(LLMRequest(prompt="q"))) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    for w in waiters:
+        w.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert inner.cancelled == 1
+    assert provider.metrics()["coalescing"]["abandoned_flights"] == 1
+    assert provider.in_flight() == {}
+
+
+@pytest.mark.asyncio
+async def test_caller_arriving_as_last_waiter_leaves_starts_a_fresh_flight():
+    inner = SlowProvider(delay=0.05)
+    provider = CoalescingProvider(inner)
+
+    abandoned = asyncio.ensure_future(provider.generate(LLMRequest(prompt="q")))
+    await asyncio.sleep(0.01)
+    abandoned.cancel()
+    # Runs right after the last waiter leaves, before the cancelled flight's done callback
+    arriving = asyncio.ensure_future(provider.generate(LLMRequest(prompt="q")))
+    await asyncio.gather(abandoned, return_exceptions=True)
+    result = await arriving
+
+    assert result.content == "answer: q"
+    assert inner.calls == 2
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from src.core.core.llm import LLMProvider, LLMRequest, LLMResponse, OpenAIProvider
+from src.core.llm.client import LLMClient, LLMConfig, get_llm_client
+from src.core.llm.pool import LLMClientPool, PoolLimits
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_per_config_over_one_http_pool():
+    pool = LLMClientPool(PoolLimits(max_connections=4, max_keepalive=2))
+
+    a = pool.openai("sk-a")
+    assert pool.openai("sk-a") is a
+    b = pool.openai("sk-b")
+    assert b is not a
+    assert a._client is b._client is pool.http()
+
+    stats = pool.stats()
+    assert stats["clients_created"] == 2
+    assert stats["client_hits"] == 1
+    assert stats["http_clients"] == 1
+    assert "sk-a" not in str(stats)
+
+    await pool.shutdown()
+    assert pool.stats()["clients"] == 0
+
+
+def test_pool_rebuilds_for_a_new_event_loop():
+    pool = LLMClientPool(PoolLimits())
+
+    async def grab():
+        return pool.openai("sk-test")
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+
+    assert first is not second
+    assert pool.stats()["rebuilds"] == 1
+
+
+@pytest.mark.asyncio
+async def test_providers_and_agents_draw_from_shared_instances():
+    one = OpenAIProvider(model="gpt-4o", api_key="sk-shared")
+    two = OpenAIProvider(model="gpt-4o-mini", api_key="sk-shared")
+    assert one.client is two.client
+
+    assert get_llm_client() is get_llm_client()
+    assert get_llm_client(LLMConfig(temperature=0.1)) is not get_llm_client()
+
+
+class RecordingProvider(LLMProvider):
+    def __init__(self):
+        self.requests = []
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.requests.append(request)
+        return LLMResponse(content='{"ok": true}', usage={"total_tokens": 7}, provider="recording")
+
+
+@pytest.mark.asyncio
+async def test_llm_client_delegates_to_its_provider():
+    provider = RecordingProvider()
+    client = LLMClient(LLMConfig(temperature=0.2, max_tokens=300), provider=provider)
+
+    data, usage = await client.generate_json("Reply in JSON.", "status?")
+    text = await client.acomplete("hello")
+
+    assert (data, usage, text) == ({"ok": True}, {"total_tokens": 7}, '{"ok": true}')
+    first, second = provider.requests
+    assert (first.system_prompt, first.prompt, first.json_mode) == ("Reply in JSON.", "status?", True)
+    assert (first.temperature, first.max_tokens) == (0.2, 300)
+    assert second.json_mode is False
+
+
+def test_default_llm_client_uses_the_pooled_openai_provider(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-client")
+    client = LLMClient(LLMConfig(model="gpt-4o-mini"))
+
+    assert isinstance(client.provider, OpenAIProvider)
+    assert client.provider.model == "gpt-4o-mini"
+    assert client.provider.client is OpenAIProvider(api_key="sk-client").client
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from src.core.agents.core.base import AgentRole, MockAgent, Problem
+from src.core.core.llm import LLMProvider, LLMProviderError, LLMRequest, LLMResponse, classify_llm_error
+from src.core.core.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ResilientProvider,
+    RetryPolicy,
+)
+
+
+class FlakyProvider(LLMProvider):
+    def __init__(self, failures: int, status_code: int = 503):
+        self.failures = failures
+        self.status_code = status_code
+        self.calls = 0
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise LLMProviderError(
+                "provider brown-out",
+                retryable=self.status_code >= 500 or self.status_code == 429,
+                status_code=self.status_code,
+            )
+        return LLMResponse(content="ok", provider="flaky")
+
+
+def _provider(inner, threshold=5, cooldown=30.0, retries=3):
+    return ResilientProvider(
+        inner,
+        name="test",
+        retry_policy=RetryPolicy(max_retries=retries, base_delay=0.0, max_delay=0.0),
+        breaker=CircuitBreaker("test", failure_threshold=threshold, recovery_timeout=cooldown),
+    )
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    inner = FlakyProvider(failures=2)
+    provider = _provider(inner)
+
+    response = await provider.generate(LLMRequest(prompt="x"))
+
+    assert response.content == "ok"
+    assert inner.calls == 3
+    assert provider.metrics()["resilience"]["retries"] == 2
+    assert provider.breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_fail_immediately():
+    inner = FlakyProvider(failures=1, status_code=400)
+    provider = _provider(inner)
+
+    with pytest.raises(LLMProviderError):
+        await provider.generate(LLMRequest(prompt="x"))
+
+    assert inner.calls == 1
+    assert provider.breaker.snapshot()["failures"] == 0
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_and_fails_fast_then_probes():
+    inner = FlakyProvider(failures=2)
+    provider = _provider(inner, threshold=2, cooldown=0.05, retries=5)
+
+    with pytest.raises(LLMProviderError):
+        await provider.generate(LLMRequest(prompt="x"))
+    assert inner.calls == 2
+    assert provider.breaker.snapshot()["opened"] == 1
+
+    with pytest.raises(CircuitOpenError):
+        await provider.generate(LLMRequest(prompt="x"))
+
+    # After the cooldown the next call is admitted as a half-open probe and closes the circuit.
+    await asyncio.sleep(0.06)
+    assert provider.breaker.state == CircuitState.HALF_OPEN
+    response = await provider.generate(LLMRequest(prompt="x"))
+    assert response.content == "ok"
+    assert provider.breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_rejects_without_calling_provider():
+    inner = FlakyProvider(failures=10)
+    provider = _provider(inner, threshold=1, cooldown=60.0, retries=0)
+
+    with pytest.raises(LLMProviderError):
+        await provider.generate(LLMRequest(prompt="x"))
+    with pytest.raises(CircuitOpenError):
+        await provider.generate(LLMRequest(prompt="x"))
+
+    assert inner.calls == 1
+    assert provider.metrics()["resilience"]["fast_failed"] == 1
+
+
+def test_retry_after_is_respected():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.2, max_retry_after=10.0)
+    assert policy.delay(0, retry_after=3.0) == 3.0
+    assert policy.delay(0, retry_after=120.0) == 10.0
+    assert 0.0 <= policy.delay(5) <= 0.2
+
+
+def test_classify_plain_exceptions():
+    assert classify_llm_error(TimeoutError("slow")).retryable
+    assert not classify_llm_error(ValueError("bad prompt")).retryable
+
+
+@pytest.mark.asyncio
+async def test_shield_fallback_reports_open_circuit():
+    inner = FlakyProvider(failures=10)
+    provider = _provider(inner, threshold=1, cooldown=60.0, retries=0)
+
+    class LLMAgent(MockAgent):
+        async def _analyze(self, problem, kb):
+            await self._ask_llm(problem.context)
+
+    agent = LLMAgent(agent_id="llm-agent", role=AgentRole.ARCHITECT)
+    agent.llm = provider
+
+    await agent.analyze(Problem(title="t", context="c"), None)
+    result = await agent.analyze(Problem(title="t", context="c"), None)
+
+    assert result.confidence == 0.0
+    assert "circuit" in result.analysis
+    assert result.metadata["llm_circuits"][0]["state"] == "OPEN"
+    assert inner.calls == 1
@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+from src.core.core.llm import LLMProvider, LLMProviderError, LLMRequest, LLMResponse, MockProvider
+from src.core.core.llm_router import ModelRoute, RoutingProvider
+from src.core.core.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientProvider,
+    RetryPolicy,
+    find_circuit_breakers,
+)
+
+
+class FailingProvider(LLMProvider):
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        raise LLMProviderError("overloaded", retryable=True, status_code=503)
+
+
+class OpenCircuitProvider(LLMProvider):
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        raise CircuitOpenError("primary", retry_after=30.0)
+
+
+@pytest.mark.asyncio
+async def test_cheap_route_only_for_allowed_roles():
+    router = RoutingProvider(
+        [
+            ModelRoute("mini", MockProvider(fixed_response="mini"), cost=0.1, roles={"secretary"}),
+            ModelRoute("full", MockProvider(fixed_response="full"), cost=2.0),
+        ]
+    )
+
+    assert (await router.generate(LLMRequest(prompt="x", agent_role="secretary"))).content == "mini"
+    assert (await router.generate(LLMRequest(prompt="x", agent_role="architect"))).content == "full"
+
+
+@pytest.mark.asyncio
+async def test_prompt_size_and_json_mode_constraints():
+    router = RoutingProvider(
+        [
+            ModelRoute("small", MockProvider(fixed_response="small"), cost=0.1, max_prompt_tokens=10),
+            ModelRoute("nojson", MockProvider(fixed_response="nojson"), cost=0.5, supports_json=False),
+            ModelRoute("full", MockProvider(fixed_response="full"), cost=2.0),
+        ]
+    )
+
+    assert (await router.generate(LLMRequest(prompt="hi", system_prompt=""))).content == "small"
+    assert (await router.generate(LLMRequest(prompt="x" * 200))).content == "nojson"
+    assert (await router.generate(LLMRequest(prompt="x" * 200, json_mode=True))).content == "full"
+    assert router.decisions[-1]["rejected"] == {"small": "prompt_size", "nojson": "json_mode"}
+
+
+@pytest.mark.asyncio
+async def test_slow_route_is_demoted_by_live_p95():
+    router = RoutingProvider(
+        [
+            ModelRoute("slow", MockProvider(fixed_response="slow", latency=0.03), cost=0.1, max_p95_ms=10),
+            ModelRoute("fast", MockProvider(fixed_response="fast", latency=0.0), cost=1.0),
+        ],
+        min_samples=3,
+    )
+
+    served = [(await router.generate(LLMRequest(prompt="x"))).content for _ in range(5)]
+
+    assert served == ["slow", "slow", "slow", "fast", "fast"]
+    assert router.metrics()["routing"]["routes"]["slow"]["healthy"] is False
+
+
+@pytest.mark.asyncio
+async def test_failure_falls_back_and_is_logged(tmp_path):
+    failing = FailingProvider()
+    log_path = tmp_path / "routing.jsonl"
+    router = RoutingProvider(
+        [
+            ModelRoute("primary", failing, cost=0.1, fallbacks=["backup"]),
+            ModelRoute("other", MockProvider(fixed_response="other"), cost=5.0),
+            ModelRoute("backup", MockProvider(fixed_response="backup"), cost=9.0),
+        ],
+        decision_log=str(log_path),
+    )
+
+    response = await router.generate(LLMRequest(prompt="x", agent_role="policy"))
+    assert not log_path.exists()  # written off the event loop
+    await router.flush_log()
+
+    assert response.content == "backup"
+    entry = json.loads(log_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert entry["plan"] == ["primary", "backup", "other"]
+    assert entry["chosen"] == "backup"
+    assert [a["route"] for a in entry["attempts"]] == ["primary", "backup"]
+    assert router.metrics()["routing"]["fallbacks"] == 1
+
+
+def test_breakers_found_through_routes():
+    guarded = ResilientProvider(
+        MockProvider(),
+        name="r1",
+        retry_policy=RetryPolicy(max_retries=0),
+        breaker=CircuitBreaker("r1"),
+    )
+    router = RoutingProvider([ModelRoute("r1", guarded), ModelRoute("r2", MockProvider())])
+
+    assert [b.name for b in find_circuit_breakers(router)] == ["r1"]
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fast_fail_is_not_a_route_sample():
+    router = RoutingProvider(
+        [
+            ModelRoute("primary", OpenCircuitProvider(), cost=0.1),
+            ModelRoute("backup", MockProvider(fixed_response="backup"), cost=1.0),
+        ]
+    )
+
+    assert (await router.generate(LLMRequest(prompt="x"))).content == "backup"
+    assert router.stats["primary"].snapshot()["window"] == 0
+    assert router.decisions[-1]["attempts"][0]["error"] == "CircuitOpenError"
+
+
+@pytest.mark.asyncio
+async def test_json_agents_are_routed_by_role_and_json_mode():
+    from src.core.agents.support.secretary import SecretaryAgent
+
+    router = RoutingProvider(
+        [
+            ModelRoute("mini", MockProvider(fixed_response='{"technical_intent": "mini"}'), cost=0.1, roles={"secretary"}),
+            ModelRoute("nojson", MockProvider(fixed_response="prose"), cost=0.5, supports_json=False),
+            ModelRoute("full", MockProvider(fixed_response='{"technical_intent": "full"}'), cost=2.0),
+        ]
+    )
+    secretary = SecretaryAgent(llm_provider=router)
+
+    assert (await secretary._ask_llm_json("translate this", "system"))["technical_intent"] == "mini"
+    decision = router.decisions[-1]
+    assert decision["agent_role"] == "secretary" and decision["json_mode"] is True
+    assert decision["rejected"] == {"nojson": "json_mode"}
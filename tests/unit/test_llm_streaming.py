@@ -0,0 +1,112 @@
+import pytest
+
+from src.core.chat.schemas import ChatRequest
+from src.core.conversation import ConversationOrchestrator
+from src.core.core.llm import LLMProvider, LLMProviderError, LLMRequest, MockProvider
+from src.core.core.resilience import CircuitBreaker, ResilientProvider, RetryPolicy
+
+
+class FlakyStreamProvider(LLMProvider):
+    def __init__(self, fail_after: int, failures: int = 1):
+        self.fail_after = fail_after
+        self.failures = failures
+        self.calls = 0
+
+    async def generate(self, request):
+        raise NotImplementedError
+
+    async def generate_stream(self, request):
+        self.calls += 1
+        for i, token in enumerate(["a", "b", "c"]):
+            if i == self.fail_after and self.calls <= self.failures:
+                raise LLMProviderError("stream reset", retryable=True, status_code=503)
+            yield token
+
+
+def _resilient(inner):
+    return ResilientProvider(
+        inner,
+        name="stream-test",
+        retry_policy=RetryPolicy(max_retries=2, base_delay=0.0, max_delay=0.0),
+        breaker=CircuitBreaker("stream-test", failure_threshold=5),
+    )
+
+
+async def _collect(stream):
+    return [chunk async for chunk in stream]
+
+
+@pytest.mark.asyncio
+async def test_mock_stream_reassembles_to_full_response():
+    provider = MockProvider(fixed_response="Hello governed  world")
+    chunks = await _collect(provider.generate_stream(LLMRequest(prompt="x")))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == "Hello governed  world"
+
+
+@pytest.mark.asyncio
+async def test_stream_retried_before_first_chunk():
+    inner = FlakyStreamProvider(fail_after=0)
+    chunks = await _collect(_resilient(inner).generate_stream(LLMRequest(prompt="x")))
+
+    assert chunks == ["a", "b", "c"]
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_not_retried_after_partial_output():
+    inner = FlakyStreamProvider(fail_after=2)
+    received = []
+    with pytest.raises(LLMProviderError):
+        async for chunk in _resilient(inner).generate_stream(LLMRequest(prompt="x")):
+            received.append(chunk)
+
+    assert received == ["a", "b"]
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_from_registry_provider():
+    class Registry:
+        def get_llm_provider(self):
+            return MockProvider(fixed_response="streamed answer")
+
+    class Engine:
+        registry = Registry()
+
+    orchestrator = ConversationOrchestrator(lambda: Engine(), None)
+    chunks = await _collect(orchestrator.stream(ChatRequest(message="hi")))
+
+    assert "".join(chunks) == "streamed answer"
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_falls_back_without_provider():
+    def no_engine():
+        raise RuntimeError("engine not booted")
+
+    orchestrator = ConversationOrchestrator(no_engine, None)
+    chunks = await _collect(orchestrator.stream(ChatRequest(message="hi")))
+
+    assert chunks == ["System is recovering..."]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_fallback_yields_assistant_blocks_after_text():
+    from src.core.chat.schemas import ChatResponse
+
+    block = {"type": "table", "title": "ADRs", "data": [{"id": "adr-1"}]}
+
+    class Orchestrator(ConversationOrchestrator):
+        async def handle(self, request):
+            return ChatResponse(
+                messages=[
+                    {"role": "user", "content": "echo", "blocks": [{"type": "ignored"}]},
+                    {"role": "assistant", "content": "Here you go", "blocks": [block]},
+                ]
+            )
+
+    chunks = await _collect(Orchestrator(lambda: None, None).stream(ChatRequest(message="hi")))
+
+    assert chunks == ["Here you go", block]
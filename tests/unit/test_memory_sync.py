@@ -0,0 +1,91 @@
+import json
+import sqlite3
+from types import SimpleNamespace
+
+from src.core.governance.icgl import ICGL
+from src.core.kb.schemas import ADR, Policy
+from src.core.kb.storage import StorageBackend
+from src.core.memory.numpy_store import NumpyVectorStore
+from src.core.memory import sync as memory_sync
+from src.core.memory.sync import MemorySync
+
+
+def _adr(adr_id, title):
+    return ADR(
+        id=adr_id,
+        title=title,
+        status="DRAFT",
+        context="ctx",
+        decision="dec",
+        consequences=[],
+        related_policies=[],
+        sentinel_signals=[],
+        human_decision_id=None,
+    )
+
+
+def _sync(tmp_path, storage):
+    memory = NumpyVectorStore(path=str(tmp_path / "memory"))
+    return memory, MemorySync(storage, memory, lessons_path=str(tmp_path / "interventions.jsonl"))
+
+
+async def test_only_changes_since_the_watermark_are_applied(tmp_path):
+    storage = StorageBackend(str(tmp_path / "kb.db"))
+    storage.save_policy(
+        Policy(id="p1", code="P-ARCH-04", title="Health", rule="Expose health", severity="HIGH", enforced_by=[])
+    )
+    storage.save_adr(_adr("a1", "Cache reads"))
+    storage.save_adr(_adr("a2", "Shard writes"))
+    lessons = tmp_path / "interventions.jsonl"
+    lessons.write_text(json.dumps({"id": "i1", "human_action": "REJECT"}) + '\n{"id": "i2"', encoding="utf-8")
+
+    memory, sync = _sync(tmp_path, storage)
+    first = await sync.sync()
+    assert first.full and first.scanned == {"policies": 1, "adrs": 2, "lessons": 1}
+
+    storage.save_adr(_adr("a1", "Cache reads with TTL"))
+    with sqlite3.connect(str(tmp_path / "kb.db")) as conn:
+        conn.execute("DELETE FROM adrs WHERE id = 'a2'")
+    with open(lessons, "a", encoding="utf-8") as f:
+        f.write(', "human_action": "APPROVE"}\n')
+
+    # A restarted engine resumes from the persisted watermark
+    memory, sync = _sync(tmp_path, storage)
+    second = await sync.sync()
+
+    assert not second.full
+    assert second.scanned == {"policies": 0, "adrs": 1, "lessons": 1}
+    assert second.deleted["adrs"] == 1
+    assert sorted(memory.ids()) == ["a1", "lesson-i1", "lesson-i2", "p1"]
+    assert "TTL" in memory.get("a1").content
+
+    third = await sync.sync()
+    assert sum(third.scanned.values()) == 0
+
+    full = await sync.sync(full=True)
+    assert full.scanned == {"policies": 1, "adrs": 1, "lessons": 2} and sum(full.upserted.values()) == 0
+
+
+async def test_failed_warm_up_is_retried_on_the_next_bootstrap(tmp_path, monkeypatch):
+    real_sync = MemorySync.sync
+    calls = []
+
+    async def flaky_sync(self, full=False, progress=None):
+        calls.append(full)
+        if len(calls) == 1:
+            raise OSError("kb locked")
+        return await real_sync(self, full=full, progress=progress)
+
+    monkeypatch.setattr(memory_sync.MemorySync, "sync", flaky_sync)
+    engine = ICGL.__new__(ICGL)
+    engine.kb = SimpleNamespace(storage=StorageBackend(str(tmp_path / "kb.db")))
+    engine.memory = NumpyVectorStore(path=str(tmp_path / "memory"))
+    engine._memory_task = None
+    engine.memory_progress = {"status": "pending", "indexed": 0, "total": 0}
+
+    assert not await engine.wait_for_memory()
+    assert engine.memory_progress["status"] == "failed"
+
+    assert await engine.wait_for_memory()
+    ready = engine.start_memory_bootstrap()
+    assert ready is engine._memory_task and len(calls) == 2
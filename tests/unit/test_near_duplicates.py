@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+
+from src.api import background
+from src.core.core.llm import MockProvider
+from src.core.kb.schemas import ADR
+from src.core.memory.near_duplicates import NearDuplicateIndex, proposal_text
+
+CONTEXT = (
+    "Services read policies straight from SQLite on every request, which dominates latency under load "
+    "and couples the governance API to disk performance during audits."
+)
+DECISION = "Adopt a write-through Redis cache for policy reads with a five minute TTL and explicit invalidation."
+
+
+def test_edited_resubmission_is_found_and_unrelated_text_is_not():
+    index = NearDuplicateIndex(threshold=0.6)
+    index.add("adr-1", proposal_text("Cache policy reads", CONTEXT, DECISION))
+    index.add("adr-2", proposal_text("Shard the audit ledger", "Ledger writes contend on one file.", "Shard by month."))
+    index.add("adr-empty", "")
+
+    edited = proposal_text("Cache policy reads", CONTEXT, DECISION.replace("five minute", "ten minute"))
+    matches = index.find(edited)
+    assert [doc_id for doc_id, _ in matches] == ["adr-1"] and 0.6 <= matches[0][1] < 1.0
+    assert index.find(proposal_text("CACHE  policy reads", CONTEXT, DECISION)) == [("adr-1", 1.0)]
+    assert index.find("Introduce a design system for the dashboard") == []
+
+    index.remove("adr-1")
+    assert index.find(edited) == [] and len(index) == 2
+
+
+def test_arabic_spelling_variants_are_not_edits():
+    index = NearDuplicateIndex()
+    index.add("adr-ar", "تحويل الدفعة إلى كيان سياقي فقط وربط الضمان عبر سجل غير قابل للتعديل")
+    assert index.find("تحويل الدفعه الى كيان سياقي فقط وربط الضمان عبر سجل غير قابل للتعديل") == [("adr-ar", 1.0)]
+
+
+def _adr(adr_id, decision):
+    return ADR(
+        id=adr_id,
+        title="Cache policy reads",
+        status="DRAFT",
+        context=CONTEXT,
+        decision=decision,
+        consequences=[],
+        related_policies=[],
+        sentinel_signals=[],
+        human_decision_id=None,
+    )
+
+
+def _engine(base, provider=None):
+    states = {base.id: {"synthesis": {"consensus_recommendations": ["Cache with a TTL"], "all_concerns": []}}}
+    kb = SimpleNamespace(
+        get_adr=lambda adr_id: base if adr_id == base.id else None,
+        get_synthesis_state=states.get,
+        save_synthesis_state=states.__setitem__,
+    )
+    enforcer = SimpleNamespace(check_adr_compliance=lambda adr: SimpleNamespace(status="PASS"))
+    registry = SimpleNamespace(get_llm_provider=lambda: provider)
+    return SimpleNamespace(kb=kb, enforcer=enforcer, registry=registry), states
+
+
+async def _run_delta(adr, base, provider, monkeypatch):
+    full = []
+
+    async def run_analysis_task(adr, human_id, icgl, manager, scp_manager):
+        full.append(adr.id)
+
+    monkeypatch.setattr(background, "run_analysis_task", run_analysis_task)
+    icgl, states = _engine(base, provider)
+    await background.run_delta_analysis_task(adr, base.id, 0.9, "human", icgl, None, None)
+    return full, states
+
+
+async def test_edit_that_changes_the_decision_gets_the_full_council(monkeypatch):
+    base = _adr("adr-1", DECISION)
+    edited = _adr("adr-2", DECISION.replace("Adopt", "Do not adopt"))
+
+    full, states = await _run_delta(edited, base, MockProvider(fixed_response='{"material": false}'), monkeypatch)
+
+    assert full == ["adr-2"] and "adr-2" not in states
+
+
+async def test_material_or_unreviewable_context_edit_gets_the_full_council(monkeypatch):
+    base = _adr("adr-1", DECISION)
+    edited = _adr("adr-2", DECISION)
+    edited.context = CONTEXT + " Reads must never be cached."
+
+    verdict = '{"material": true, "summary": "Forbids caching", "concerns": ["Contradicts the decision"]}'
+    assert (await _run_delta(edited, base, MockProvider(fixed_response=verdict), monkeypatch))[0] == ["adr-2"]
+    assert (await _run_delta(edited, base, None, monkeypatch))[0] == ["adr-2"]
+    assert (await _run_delta(edited, base, MockProvider(fixed_response="Looks fine."), monkeypatch))[0] == ["adr-2"]
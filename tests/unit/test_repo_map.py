@@ -0,0 +1,92 @@
+from src.core.core.context import RepoMap
+from src.core.llm.context_assembly import estimate_tokens
+
+
+def _tree(tmp_path):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "README.md").write_text("readme\n")
+    (tmp_path / "node_modules").mkdir()
+    return tmp_path
+
+
+def test_render_matches_tree_and_ignores(tmp_path):
+    repo_map = RepoMap(str(_tree(tmp_path)), use_inotify=False)
+
+    text = repo_map.render(max_depth=3)
+
+    assert text.splitlines() == [
+        "PROJECT ROOT",
+        "  📂 src/",
+        "    📂 pkg/",
+        "      📄 mod.py",
+        "  📄 README.md",
+    ]
+
+
+def test_hot_cache_and_mtime_refresh(tmp_path):
+    repo_map = RepoMap(str(_tree(tmp_path)), refresh_interval=0.0, use_inotify=False)
+    first = repo_map.render(max_depth=3)
+    scans = repo_map.stats()["scans"]
+
+    assert repo_map.render(max_depth=3) == first
+    assert repo_map.stats()["scans"] == scans
+    assert repo_map.stats()["cache_hits"] == 1
+
+    (tmp_path / "src" / "pkg" / "new.py").write_text("y = 2\n")
+    updated = repo_map.render(max_depth=3)
+
+    assert "📄 new.py" in updated
+    # Only the changed directory was re-read
+    assert repo_map.stats()["scans"] == scans + 1
+
+
+def test_token_budget_prefers_shallower_map(tmp_path):
+    root = _tree(tmp_path)
+    for i in range(50):
+        (root / "src" / "pkg" / f"file_{i:02d}.py").write_text("")
+    repo_map = RepoMap(str(root), use_inotify=False)
+
+    text = repo_map.render(max_depth=3, token_budget=30)
+
+    assert "file_00.py" not in text
+    assert "📂 src/" in text
+    assert estimate_tokens(text) <= 30  # same estimate the prompt assembler fits it with
+
+
+def test_watches_of_removed_directories_are_dropped(tmp_path):
+    import shutil
+    from types import SimpleNamespace
+
+    class FakeINotify:
+        def __init__(self):
+            self.next_wd = 0
+            self.active = {}
+            self.events = []
+
+        def add_watch(self, path, mask):
+            self.next_wd += 1
+            self.active[self.next_wd] = path
+            return self.next_wd
+
+        def rm_watch(self, wd):
+            del self.active[wd]
+
+        def read(self, timeout=0):
+            events, self.events = self.events, []
+            return events
+
+    root = _tree(tmp_path)
+    repo_map = RepoMap(str(root), use_inotify=False)
+    inotify = repo_map._inotify = FakeINotify()
+    repo_map._inotify_mask, repo_map._gone_mask = 0, 0x400 | 0x8000  # DELETE_SELF | IGNORED
+    repo_map.render(max_depth=3)
+    assert len(repo_map._watches) == 3  # root, src, src/pkg
+
+    shutil.rmtree(root / "src")
+    inotify.events = [SimpleNamespace(wd=1, mask=0x200)]  # DELETE in the root
+    text = repo_map.render(max_depth=3)
+
+    assert "src/" not in text
+    assert list(repo_map._watches) == [1] and list(inotify.active) == [1]
+    assert repo_map.cached(3) == text
@@ -0,0 +1,40 @@
+import asyncio
+
+from src.core.memory.embeddings import HashingEmbedder
+from src.core.memory.interface import Document
+from src.core.memory.numpy_store import NumpyVectorStore
+from src.core.memory.retrieval_cache import current_retrieval_cache, retrieval_scope
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dim=64)
+        self.calls = 0
+
+    def embed(self, texts):
+        self.calls += 1
+        return super().embed(texts)
+
+
+async def test_cycle_scope_memoises_searches_and_embeddings():
+    embedder = CountingEmbedder()
+    store = NumpyVectorStore(embedder=embedder)
+    await store.add_documents([Document(id="l1", content="Reject caching without TTL", metadata={"type": "lesson"})])
+    embedder.calls = 0
+
+    with retrieval_scope(cycle_id="adr-1") as cache:
+        first, second = await asyncio.gather(
+            store.search("Caching  policy", limit=3), store.search("caching policy ", limit=3)
+        )
+        await store.search("CACHING policy", limit=3, filter={"type": "lesson"}, hybrid=True)
+        assert embedder.calls == 1 and first == second
+
+        await store.add_document(Document(id="l2", content="Caching policy needs owners", metadata={"type": "lesson"}))
+        embedder.calls = 0
+        assert len(await store.search("caching policy", limit=3)) == 2  # a write invalidates cached results
+        assert embedder.calls == 0
+
+    stats = cache.stats()
+    assert stats["search_hits"] == 1 and stats["search_misses"] == 3
+    assert stats["embedding_hits"] == 2 and stats["embedding_hit_ratio"] == 0.6667
+    assert current_retrieval_cache() is None
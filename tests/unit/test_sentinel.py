@@ -1,6 +1,11 @@
 from unittest.mock import MagicMock
 
+import pytest
+
+from src.core.core.llm import LLMProvider, LLMResponse
 from src.core.kb.schemas import ADR, uid
+from src.core.llm.client import LLMClient
+from src.core.memory.interface import Document, SearchResult
 from src.core.sentinel.sentinel import Sentinel
 
 
@@ -42,3 +47,65 @@ def test_sentinel_alert_detection():
     alerts = sentinel.scan_adr(adr, mock_kb)
     # S-06 should trigger for "bypass human"
     assert len(alerts) > 0
+
+
+class FixedStore:
+    def __init__(self, results):
+        self.results = results
+
+    async def search(self, query, limit=5, **options):
+        return self.results[:limit]
+
+
+@pytest.mark.asyncio
+async def test_drift_check_skips_the_adr_under_review_in_either_id_scheme():
+    adr = ADR(
+        id=uid(),
+        title="Cache layer",
+        status="DRAFT",
+        context="Add a cache",
+        decision="Use Redis",
+        consequences=[],
+        related_policies=[],
+        sentinel_signals=[],
+        human_decision_id=None,
+    )
+    store = FixedStore(
+        [
+            SearchResult(Document(id=f"adr-{adr.id}", content="signed", metadata={"type": "adr"}), 0.99),
+            SearchResult(Document(id=adr.id, content="synced", metadata={"type": "adr", "adr_id": adr.id}), 0.98),
+            SearchResult(Document(id="adr-other", content="other", metadata={"type": "adr", "title": "Old"}), 0.95),
+            SearchResult(Document(id="adr-b", content="b", metadata={"type": "adr"}), 0.94),
+            SearchResult(Document(id="adr-c", content="c", metadata={"type": "adr"}), 0.93),
+            SearchResult(Document(id="adr-d", content="d", metadata={"type": "adr"}), 0.92),
+        ]
+    )
+
+    alerts = await Sentinel(vector_store=store).check_drift(adr)
+
+    # Both self hits are skipped and three real candidates are still compared
+    assert [a.context["similar_id"] for a in alerts] == ["adr-other", "adr-b", "adr-c"]
+
+
+class ViolationProvider(LLMProvider):
+    async def generate(self, request):
+        return LLMResponse(content='{"violation_detected": true, "severity": "CRITICAL", "rationale": "bypasses HDAL"}')
+
+
+@pytest.mark.asyncio
+async def test_intent_check_reads_the_llm_verdict():
+    adr = ADR(
+        id=uid(),
+        title="Auto-approve",
+        status="DRAFT",
+        context="Humans are slow.",
+        decision="Agents sign their own ADRs.",
+        consequences=[],
+        related_policies=[],
+        sentinel_signals=[],
+        human_decision_id=None,
+    )
+
+    alerts = await Sentinel(llm_client=LLMClient(provider=ViolationProvider())).check_intent_async(adr)
+
+    assert [(a.rule_id, a.severity.value) for a in alerts] == [("S-12", "CRITICAL")]
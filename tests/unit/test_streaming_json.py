@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from src.core.agents.core.architect import ArchitectAgent
+from src.core.agents.core.base import Problem
+from src.core.agents.governance.executive_agent import ExecutiveAgent
+from src.core.agents.specialized.guardian import ConceptGuardian
+from src.core.core.llm import LLMProvider, LLMRequest, MockProvider
+from src.core.llm.prompts import JSONParser, SpecialistOutput
+from src.core.llm.streaming_json import IncrementalJSONParser, StreamingOutputParser, parse_json_stream
+
+class GatedStreamProvider(LLMProvider):
+    """Streams `head`, then holds the rest of the answer until `release` is set."""
+
+    def __init__(self, head: str, tail: str):
+        self.head = head
+        self.tail = tail
+        self.release = asyncio.Event()
+        self.requests = []
+
+    async def generate(self, request):
+        raise NotImplementedError
+
+    async def generate_stream(self, request):
+        self.requests.append(request)
+        yield self.head
+        await self.release.wait()
+        yield self.tail
+
+
+async def _until(predicate, ticks: int = 100):
+    for _ in range(ticks):
+        if predicate():
+            return True
+        await asyncio.sleep(0)
+    return False
+
+
+RESPONSE = (
+    "Sure, here is my review of {the proposal}:\n```json\n"
+    '{"analysis": "Braces } and \\"quotes\\" inside", "recommendations": ["Add cache", "Use [brackets]"], '
+    '"concerns": [], "confidence": 0.8, "metadata": {"nested": [1, {"deep": true}]}}\n'
+    "```\nLet me know {if} anything else is needed."
+)
+
+
+def test_fields_are_emitted_as_they_close_across_arbitrary_chunks():
+    for size in (1, 3, 17, len(RESPONSE)):
+        parser = IncrementalJSONParser()
+        emitted = []
+        for i in range(0, len(RESPONSE), size):
+            emitted.extend(parser.feed(RESPONSE[i : i + size]))
+
+        assert [name for name, _ in emitted] == ["analysis", "recommendations", "concerns", "confidence", "metadata"]
+        assert parser.complete
+        assert parser.fields["analysis"] == 'Braces } and "quotes" inside'
+        assert parser.fields["metadata"] == {"nested": [1, {"deep": True}]}
+
+
+def test_analysis_is_available_before_the_object_closes():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"analysis": "early"') == [("analysis", "early")]
+    assert parser.feed(', "confidence": 0.') == []
+    assert parser.feed("5}") == [("confidence", 0.5)]
+
+
+def test_typed_view_drops_fields_that_violate_the_schema():
+    parser = StreamingOutputParser(SpecialistOutput)
+    parser.feed('{"analysis": 42, "recommendations": ["ok"], "confidence": 0.9')
+    output = parser.finish()
+
+    assert isinstance(output, SpecialistOutput)
+    assert output.analysis == ""
+    assert output.recommendations == ["ok"]
+    assert output.confidence == 0.9
+    assert parser.errors and parser.errors[0].startswith("analysis")
+
+
+def test_json_parser_fallback_stops_at_the_object_end():
+    assert JSONParser.parse('Result: {"a": 1} and trailing {noise}') == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_stream_feeds_fields_to_callback_before_generation_ends():
+    provider = MockProvider(fixed_response=RESPONSE)
+    seen = []
+
+    async def on_field(name, value):
+        seen.append(name)
+
+    output, raw = await parse_json_stream(
+        provider.generate_stream(LLMRequest(prompt="review")), output_type=SpecialistOutput, on_field=on_field
+    )
+
+    assert raw == RESPONSE
+    assert seen[0] == "analysis"
+    assert output.recommendations == ["Add cache", "Use [brackets]"]
+
+
+@pytest.mark.asyncio
+async def test_agent_structured_helper_parses_streamed_json():
+    agent = ExecutiveAgent()
+    agent.llm = MockProvider(fixed_response='Ok.\n{"mirror": "You want X", "queue_summary": "X"}')
+
+    data, raw = await agent._ask_llm_structured("do X")
+
+    assert data == {"mirror": "You want X", "queue_summary": "X"}
+    assert raw.startswith("Ok.")
+
+
+@pytest.mark.asyncio
+async def test_specialist_hands_over_fields_before_the_stream_ends():
+    guardian = ConceptGuardian()
+    guardian.llm = GatedStreamProvider(
+        head='{"analysis": "Redefines Policy", "concerns": ["Definition drift"], ',
+        tail='"confidence": 0.6, "risk_pre_mortem": [{"risk": "drift"}]}',
+    )
+    problem = Problem(title="Rename policy", context="")
+
+    task = asyncio.create_task(guardian.analyze(problem, kb=None))
+    partial = problem.metadata.setdefault("partial_results", {}).setdefault(guardian.agent_id, {})
+    assert await _until(lambda: "concerns" in partial)
+
+    assert not task.done()
+    assert partial == {"analysis": "Redefines Policy", "concerns": ["Definition drift"]}
+    assert guardian.llm.requests[0].json_mode
+
+    guardian.llm.release.set()
+    result = await task
+
+    assert result.concerns == ["Definition drift"]
+    assert result.confidence == 0.6
+    assert result.risk_pre_mortem == [{"risk": "drift"}]
+
+
+@pytest.mark.asyncio
+async def test_architect_sets_the_intent_contract_while_still_streaming():
+    architect = ArchitectAgent()
+    architect.llm = GatedStreamProvider(
+        head='{"intent_contract": {"goal": "Split the cache layer", "risk_level": "low"}, ',
+        tail='"analysis": "Lower coupling", "risks": ["Migration"], "confidence_score": 0.7}',
+    )
+
+    async def arender(max_depth, token_budget):
+        return "src/"
+
+    architect.context_builder.repo_map.arender = arender
+    problem = Problem(title="Split cache", context="", metadata={"decision": "Split"})
+
+    task = asyncio.create_task(architect.analyze(problem, kb=None))
+    assert await _until(lambda: problem.intent is not None)
+
+    assert not task.done()
+    assert problem.intent.goal == "Split the cache layer"
+
+    architect.llm.release.set()
+    result = await task
+
+    assert result.intent.goal == "Split the cache layer"
+    assert result.concerns == ["Migration"]
+    assert result.confidence == 0.7
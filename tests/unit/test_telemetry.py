@@ -0,0 +1,58 @@
+import time
+
+from src.core.agents.operations.monitor import MonitorAgent
+from src.core.core.telemetry import SystemReading, SystemSampler
+
+
+def test_ring_buffer_keeps_the_most_recent_readings():
+    sampler = SystemSampler(interval=60, capacity=3)
+    for _ in range(5):
+        assert sampler.sample() is not None
+
+    assert sampler.stats()["readings"] == 3
+    assert not sampler.running
+
+
+def test_aggregate_summarizes_the_window():
+    sampler = SystemSampler(interval=60, capacity=10)
+    now_t = time.time()
+    for i, cpu in enumerate((10.0, 30.0, 50.0)):
+        sampler._readings.append(
+            SystemReading(
+                timestamp=now_t - 2 + i,
+                cpu_percent=cpu,
+                memory_percent=40.0,
+                disk_percent=70.0,
+                io_read_bytes=1000 * i,
+                io_write_bytes=0,
+            )
+        )
+    sampler.start = lambda: sampler  # keep the synthetic window untouched
+
+    summary = sampler.aggregate(10)
+
+    assert summary["samples"] == 3
+    assert summary["cpu_percent"] == {"avg": 30.0, "min": 10.0, "max": 50.0}
+    assert summary["io_read_bytes_per_s"] == 1000.0
+
+
+def test_background_thread_samples_and_stops():
+    sampler = SystemSampler(interval=0.05, capacity=50).start()
+    try:
+        time.sleep(0.3)
+        assert sampler.running
+        assert sampler.stats()["readings"] >= 3
+        assert sampler.snapshot()["age_seconds"] < 1
+    finally:
+        sampler.stop()
+    assert not sampler.running
+
+
+def test_monitor_health_check_does_not_block():
+    agent = MonitorAgent()
+    started = time.perf_counter()
+    health = agent._get_system_health()
+
+    assert time.perf_counter() - started < 0.5
+    assert health.status in {"healthy", "degraded", "critical"}
+    assert agent.get_metric_trends(60)["samples"] >= 1
@@ -0,0 +1,74 @@
+import math
+import time
+
+from src.core.agents.support.secretary import SecretaryAgent
+from src.core.core.timeseries import RingSeries, TimeSeriesStore
+
+
+def test_ring_overwrites_oldest_and_keeps_time_order():
+    ring = RingSeries(["v"], capacity=3)
+    for i in range(5):
+        ring.append(float(i), [i * 10.0])
+
+    t, v = ring.select("v")
+    assert list(t) == [2.0, 3.0, 4.0]
+    assert list(v) == [20.0, 30.0, 40.0]
+    assert ring.nbytes() == 2 * 3 * 8
+
+
+def test_memory_is_constant_and_buckets_downsample():
+    store = TimeSeriesStore("test", ["cpu"], capacities={"raw": 100, "1m": 10, "1h": 5})
+    before = store.stats()
+    base = 1_700_000_000.0 - (1_700_000_000.0 % 3600)
+    for i in range(3 * 3600):  # three hours at 1 Hz
+        store.record({"cpu": 50.0 + (i % 60)}, timestamp=base + i)
+
+    stats = store.stats()
+    assert stats["raw"]["points"] == 100
+    assert stats["1m"]["points"] == 10
+    assert stats["1h"]["points"] == 2  # third hour still accumulating
+    assert {k: v["bytes"] for k, v in stats.items()} == {k: v["bytes"] for k, v in before.items()}
+
+    t, means = store.query("cpu", resolution="1h")
+    _, maxes = store.query("cpu", resolution="1h", agg="max")
+    assert list(t) == [base, base + 3600]
+    assert all(math.isclose(m, 79.5) for m in means)
+    assert all(m == 109.0 for m in maxes)
+
+
+def test_trend_and_anomalies():
+    store = TimeSeriesStore("test", ["cpu"])
+    now_t = 1_000_000.0
+    for i in range(60):
+        store.record({"cpu": 10.0 + i * 0.5 + (90.0 if i == 30 else 0.0)}, timestamp=now_t + i * 60)
+
+    trend = store.trend("cpu")
+    assert trend["samples"] == 60
+    assert math.isclose(trend["slope_per_hour"], 30.0, rel_tol=0.15)
+
+    spikes = store.anomalies("cpu")
+    assert [a["timestamp"] for a in spikes] == [now_t + 30 * 60]
+
+
+def test_buckets_persist_and_reload(tmp_path):
+    db = str(tmp_path / "ts.db")
+    store = TimeSeriesStore("monitor", ["cpu"], db_path=db)
+    start = time.time() - 600
+    for i in range(6):
+        store.record({"cpu": float(i)}, timestamp=start + i * 60)
+
+    reloaded = TimeSeriesStore("monitor", ["cpu"], db_path=db)
+    t, v = reloaded.query("cpu", resolution="1m")
+    assert list(v) == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_secretary_relay_log_is_bounded(monkeypatch):
+    monkeypatch.setenv("ICGL_RELAY_LOG_SIZE", "5")
+    agent = SecretaryAgent()
+    for i in range(12):
+        agent._log_relay_event("EVENT", f"summary {i}", "details", ["Council"])
+
+    assert len(agent.relay_log) == 5
+    report = agent.get_executive_report(last_n_events=2)
+    assert report.index("summary 11") < report.index("summary 10")
+    assert "summary 9" not in report
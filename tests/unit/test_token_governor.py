@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from src.core.core.coalescing import CoalescingProvider
+from src.core.core.llm import LLMProvider, LLMRequest, LLMResponse
+from src.core.governance.budget import GovernedProvider, Priority, TokenGovernor, usage_scope
+from src.core.kb.storage import StorageBackend
+
+
+class UsageProvider(LLMProvider):
+    async def generate(self, request: LLMRequest) -> LLMResponse:
+        return LLMResponse(
+            content="ok",
+            usage={"prompt_tokens": 120, "completion_tokens": 30, "total_tokens": 150},
+            provider="openai",
+        )
+
+
+@pytest.mark.asyncio
+async def test_real_usage_is_recorded_and_persisted(tmp_path):
+    storage = StorageBackend(str(tmp_path / "kb.db"))
+    governor = TokenGovernor(tokens_per_minute=10_000, requests_per_minute=10, storage=storage)
+    provider = GovernedProvider(UsageProvider(), governor)
+
+    with usage_scope(adr_id="ADR-1") as scope:
+        await provider.generate(LLMRequest(prompt="x", max_tokens=2000, metadata={"agent_id": "agent-policy"}))
+
+    # The max_tokens reservation is replaced by the real usage
+    assert governor.headroom()["tokens"] == 10_000 - 150
+    assert scope.total_tokens == 150
+    today = governor.usage_today()
+    assert today["agent"]["agent-policy"]["prompt_tokens"] == 120
+    assert today["adr"]["ADR-1"]["completion_tokens"] == 30
+    assert today["provider"]["openai"]["requests"] == 1
+
+    governor.flush()
+    rows = {(r["scope"], r["key"]): r for r in storage.load_token_usage()}
+    assert rows[("adr", "ADR-1")]["prompt_tokens"] == 120
+
+    governor.flush()  # Nothing pending: aggregates are not double counted
+    assert storage.load_token_usage(scope="adr")[0]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_interactive_preempts_batch_when_saturated():
+    governor = TokenGovernor(tokens_per_minute=1_000, requests_per_minute=1, window_seconds=0.05)
+    first = await governor.acquire(100, Priority.COUNCIL)
+    governor.record(first, {"total_tokens": 100})
+
+    order = []
+
+    async def call(name, priority):
+        ticket = await governor.acquire(100, priority)
+        order.append(name)
+        governor.record(ticket, {"total_tokens": 100})
+
+    batch = asyncio.ensure_future(call("batch", Priority.BATCH))
+    await asyncio.sleep(0)
+    chat = asyncio.ensure_future(call("chat", Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+    assert governor.headroom()["queued"] == {"interactive": 1, "council": 0, "batch": 1}
+
+    await asyncio.wait_for(asyncio.gather(batch, chat), timeout=1.0)
+
+    assert order == ["chat", "batch"]
+
+
+@pytest.mark.asyncio
+async def test_failed_call_releases_its_reservation():
+    class Failing(LLMProvider):
+        async def generate(self, request):
+            raise RuntimeError("boom")
+
+    governor = TokenGovernor(tokens_per_minute=5_000, requests_per_minute=10)
+    provider = GovernedProvider(Failing(), governor)
+
+    with pytest.raises(RuntimeError):
+        await provider.generate(LLMRequest(prompt="x", max_tokens=4000))
+
+    headroom = governor.headroom()
+    assert headroom["tokens"] == 5_000
+    assert headroom["requests"] == 9
+
+
+@pytest.mark.asyncio
+async def test_missing_usage_books_the_prompt_estimate_only():
+    class NoUsage(LLMProvider):
+        async def generate(self, request):
+            return LLMResponse(content="ok", provider="local")
+
+    governor = TokenGovernor(tokens_per_minute=10_000, requests_per_minute=10)
+    provider = GovernedProvider(NoUsage(), governor)
+
+    await provider.generate(LLMRequest(prompt="x" * 400, system_prompt="", max_tokens=4000, metadata={"agent_id": "a"}))
+
+    booked = governor.usage_today()["agent"]["a"]["prompt_tokens"]
+    assert booked < 200  # ~100 prompt tokens, not the 4000-token max_tokens reservation
+    assert governor.metrics()["estimated_tokens"] == booked
+    assert governor.headroom()["tokens"] == 10_000 - booked
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_are_billed_to_their_own_agent_without_double_booking():
+    class SlowUsage(UsageProvider):
+        def __init__(self):
+            self.calls = 0
+
+        async def generate(self, request):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return await super().generate(request)
+
+    inner = SlowUsage()
+    governor = TokenGovernor(tokens_per_minute=10_000, requests_per_minute=10)
+    provider = GovernedProvider(CoalescingProvider(inner), governor)
+
+    def request(agent_id, priority):
+        return LLMRequest(prompt="same", metadata={"agent_id": agent_id, "priority": priority})
+
+    batch = asyncio.ensure_future(provider.generate(request("agent-batch", Priority.BATCH)))
+    await asyncio.sleep(0)
+    chat = await provider.generate(request("agent-chat", Priority.INTERACTIVE))
+    await batch
+
+    assert inner.calls == 1 and chat.coalesced
+    today = governor.usage_today()
+    assert today["agent"]["agent-batch"]["prompt_tokens"] == 120
+    assert today["agent"]["agent-chat"]["prompt_tokens"] == 120
+    assert today["provider"]["openai"]["requests"] == 1
+    assert governor.headroom()["tokens"] == 10_000 - 150
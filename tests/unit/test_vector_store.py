@@ -0,0 +1,215 @@
+import numpy as np
+
+from src.core.kb.schemas import ADR, uid
+from src.core.memory.interface import Document
+from src.core.memory.numpy_store import NumpyVectorStore
+from src.core.sentinel.sentinel import Sentinel
+
+DOCS = [
+    Document(id="p-1", content="Policy P-ARCH-04: every service must expose health checks", metadata={"type": "policy"}),
+    Document(id="adr-1", content="Adopt Redis caching for the knowledge base reads", metadata={"type": "adr"}),
+    Document(id="l-1", content="Human rejected caching without invalidation plan", metadata={"type": "lesson"}),
+]
+
+
+async def test_search_ranks_by_cosine_and_filters_metadata():
+    store = NumpyVectorStore()
+    for doc in DOCS:
+        await store.add_document(doc)
+
+    results = await store.search("redis caching for knowledge base", limit=2)
+    assert results[0].document.id == "adr-1"
+    assert results[0].score > results[1].score
+
+    lessons = await store.search("redis caching for knowledge base", limit=5, filter={"type": "lesson"})
+    assert [r.document.id for r in lessons] == ["l-1"]
+
+
+async def test_persisted_index_reloads_with_upserts(tmp_path):
+    store = NumpyVectorStore(path=str(tmp_path))
+    for doc in DOCS:
+        await store.add_document(doc)
+    await store.add_document(Document(id="adr-1", content="Adopt Postgres partitioning", metadata={"type": "adr"}))
+
+    reloaded = NumpyVectorStore(path=str(tmp_path))
+    await reloaded.initialize()
+
+    assert len(reloaded) == 3
+    assert reloaded.stats()["mmapped"]
+    top = (await reloaded.search("postgres partitioning", limit=1))[0]
+    assert top.document.id == "adr-1"
+    assert top.document.content == "Adopt Postgres partitioning"
+
+
+async def test_sentinel_drift_uses_the_store():
+    store = NumpyVectorStore()
+    text = "Cache KB reads. Reads are slow. Use Redis."
+    await store.add_document(Document(id="old", content=text, metadata={"type": "adr", "title": "Cache KB"}))
+    adr = ADR(
+        id=uid(),
+        title="Cache KB reads.",
+        status="DRAFT",
+        context="Reads are slow.",
+        decision="Use Redis.",
+        consequences=[],
+        related_policies=[],
+        sentinel_signals=[],
+        human_decision_id=None,
+    )
+
+    alerts = await Sentinel(vector_store=store).check_drift(adr)
+
+    assert alerts and "Cache KB" in alerts[0].message
+
+
+async def test_ivf_tier_matches_exact_search_when_probing_all_lists():
+    store = NumpyVectorStore(ann_min_docs=50, nprobe=1000)
+    topics = ["caching", "security", "billing", "governance", "latency"]
+    for i in range(120):
+        topic = topics[i % len(topics)]
+        await store.add_document(Document(id=f"d-{i}", content=f"{topic} decision {i} about {topic} rules"))
+    store.rebuild_index(wait=True)
+    assert store.stats()["ann"]["rows"] == 120
+
+    await store.add_document(Document(id="late", content="security audit of billing"))
+    approx = await store.search("security billing audit", limit=5)
+    exact = await store.search("security billing audit", limit=5, exact=True)
+
+    assert [r.document.id for r in approx] == [r.document.id for r in exact]
+    assert approx[0].document.id == "late"
+
+
+def test_ivf_benchmark_reports_recall_against_exact():
+    from src.core.memory.ann import benchmark
+    from src.core.memory.numpy_store import normalize_rows
+
+    rng = np.random.default_rng(0)
+    vectors = normalize_rows(rng.standard_normal((2000, 32)))
+    results = benchmark(vectors, vectors[:20], k=5, nprobes=(1, 1000), nlist=16)
+
+    assert results[0]["method"] == "exact"
+    assert results[1]["recall_at_k"] < results[2]["recall_at_k"] == 1.0
+
+
+async def test_batch_upsert_embeds_once_and_skips_unchanged(tmp_path):
+    from src.core.memory.embeddings import HashingEmbedder
+
+    class CountingEmbedder(HashingEmbedder):
+        calls = 0
+
+        def embed(self, texts):
+            CountingEmbedder.calls += 1
+            return super().embed(texts)
+
+    store = NumpyVectorStore(path=str(tmp_path), embedder=CountingEmbedder(dim=64))
+    assert await store.add_documents(DOCS) == 3
+    assert CountingEmbedder.calls == 1
+
+    edited = Document(id="l-1", content="Human approved caching with TTL invalidation", metadata={"type": "lesson"})
+    assert await store.add_documents(DOCS[:2] + [edited]) == 1
+
+    reloaded = NumpyVectorStore(path=str(tmp_path), embedder=HashingEmbedder(dim=64))
+    assert len(reloaded) == 3
+    assert reloaded.get("l-1").content.startswith("Human approved")
+
+
+async def test_delete_keeps_rows_dense_across_reload(tmp_path):
+    store = NumpyVectorStore(path=str(tmp_path), ann_min_docs=2, nprobe=100)
+    await store.add_documents([Document(id=f"d{i}", content=f"topic {i} notes {i}") for i in range(6)])
+    store.rebuild_index(wait=True)
+
+    assert await store.delete(["d1", "d4", "missing"]) == 2
+    assert [r.document.id for r in await store.search("topic 5 notes 5", limit=1)] == ["d5"]
+
+    reloaded = NumpyVectorStore(path=str(tmp_path))
+    assert sorted(reloaded.ids()) == ["d0", "d2", "d3", "d5"]
+    top = (await reloaded.search("topic 3 notes 3", limit=1))[0]
+    assert top.document.id == "d3" and top.score > 0.99
+
+
+async def test_filtered_search_returns_exact_top_k_when_other_types_dominate(tmp_path):
+    store = NumpyVectorStore(path=str(tmp_path), ann_min_docs=4, nprobe=1)
+    noise = [Document(id=f"a{i}", content=f"cache invalidation design {i}", metadata={"type": "adr"}) for i in range(40)]
+    lessons = [
+        Document(id=f"l{i}", content=f"lesson {i} about deploys", metadata={"type": "lesson", "adr_id": f"a{i}"})
+        for i in range(3)
+    ]
+    await store.add_documents(noise + lessons)
+    store.rebuild_index(wait=True)
+
+    hits = await store.search("cache invalidation design", limit=3, filter={"type": "lesson"})
+    assert sorted(h.document.id for h in hits) == ["l0", "l1", "l2"]
+    assert [h.document.id for h in await store.search("x", limit=5, filter={"type": "lesson", "adr_id": "a1"})] == ["l1"]
+
+    await store.delete(["l1", "a0"])  # moves the last rows into the freed slots
+    assert sorted(store.ids({"type": "lesson"})) == ["l0", "l2"]
+    reloaded = NumpyVectorStore(path=str(tmp_path))
+    assert sorted(reloaded.ids({"type": ["lesson", "missing"], "adr_id": ["a2"]})) == ["l2"]
+
+
+async def test_int8_shards_reload_across_shard_boundaries_and_migrate_legacy_file(tmp_path):
+    docs = [Document(id=f"d{i}", content=f"shard note {i} on topic {i % 3}") for i in range(11)]
+    store = NumpyVectorStore(path=str(tmp_path / "new"), shard_rows=4)
+    await store.add_documents(docs)
+    exact = NumpyVectorStore(quantization="none")
+    await exact.add_documents(docs)
+
+    hits = await store.search("shard note 7 on topic 1", limit=3, exact=True)
+    expected = await exact.search("shard note 7 on topic 1", limit=3, exact=True)
+    assert [(h.document.id, round(h.score, 5)) for h in hits] == [(h.document.id, round(h.score, 5)) for h in expected]
+    assert store.stats()["storage"]["shards"] == 3
+
+    await store.delete(["d9", "d10", "d8"])  # empties the third shard
+    assert store.stats()["storage"]["shards"] == 2
+    reloaded = NumpyVectorStore(path=str(tmp_path / "new"), shard_rows=64)  # the index keeps its own shard size
+    assert len(reloaded) == 8 and reloaded.shard_rows == 4
+    assert (await reloaded.search("shard note 5 on topic 2", limit=1))[0].document.id == "d5"
+
+    # An index written as a single float32 file is migrated into shards on load
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    for suffix in ("docs.jsonl", "meta.json"):
+        (legacy / f"icgl_memory.{suffix}").write_bytes((tmp_path / "new" / f"icgl_memory.{suffix}").read_bytes())
+    reloaded.vectors().tofile(legacy / "icgl_memory.f32")
+    migrated = NumpyVectorStore(path=str(legacy))
+    assert len(migrated) == 8 and not (legacy / "icgl_memory.f32").exists()
+    assert np.allclose(migrated.vectors(), reloaded.vectors())
+
+
+def test_int8_rescoring_keeps_recall_and_drift_decisions():
+    from src.core.memory.numpy_store import normalize_rows
+    from src.core.memory.quantized import quantization_benchmark
+
+    rng = np.random.default_rng(0)
+    vectors = normalize_rows(rng.standard_normal((2000, 64)))
+    queries = normalize_rows(vectors[:30] + 0.2 * rng.standard_normal((30, 64)))
+    bare, rescored = quantization_benchmark(vectors, queries, k=10, threshold=0.9)
+
+    assert rescored["recall_at_k"] == rescored["drift_agreement"] == 1.0
+    assert bare["max_score_error"] < 0.02 and rescored["max_score_error"] < 1e-5
+    assert rescored["memory_ratio"] > 3.5
+
+
+async def test_search_waits_for_the_store_lock_off_the_event_loop():
+    import asyncio
+    import threading
+
+    store = NumpyVectorStore()
+    for doc in DOCS:
+        await store.add_document(doc)
+    await store.search("warm up", limit=1)
+    held, release = threading.Event(), threading.Event()
+
+    def hold_lock():  # stands in for the ANN build reading rows
+        with store._lock:
+            held.set()
+            release.wait(5)
+
+    threading.Thread(target=hold_lock, daemon=True).start()
+    held.wait(5)
+    search = asyncio.create_task(store.search("redis caching", limit=1))
+    await asyncio.sleep(0.05)  # the loop keeps running while the search waits for the lock
+    assert not search.done()
+    release.set()
+
+    assert (await search)[0].document.id == "adr-1"